@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Recall@k of the int8 quantized index against the float HNSW index.
+
+For every query the float HNSW index (the production search path) provides
+the reference top-k; the QuantizedVectorIndex is scored on how many of those
+IDs it returns, both from int8 candidates alone and after exact float
+re-scoring. Memory is reported as HNSW index file size vs int8 index bytes.
+
+Usage:
+    # Synthetic clustered corpus (no repo needed)
+    python3 scripts/analysis/quantized_recall_benchmark.py \\
+        [--vectors 20000] [--dim 1024] [--queries 200] [--k 10]
+
+    # An existing collection (.code-indexer/index/<model>)
+    python3 scripts/analysis/quantized_recall_benchmark.py \\
+        --collection /path/to/repo/.code-indexer/index/voyage-code-3
+
+Queries are stored vectors with small Gaussian noise, so every query has
+near neighbours in the corpus (the realistic case for code search).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+_SRC_ROOT = Path(__file__).resolve().parents[2] / "src"
+if str(_SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(_SRC_ROOT))
+
+from code_indexer.storage.quantized_index import (  # noqa: E402
+    DEFAULT_RESCORE_MULTIPLIER,
+    QuantizedVectorIndex,
+)
+
+
+@dataclass
+class RecallReport:
+    vectors: int
+    dim: int
+    queries: int
+    k: int
+    rescore_multiplier: int
+    recall_int8: float
+    recall_int8_rescored: float
+    float_index_bytes: int
+    int8_index_bytes: int
+    float_query_ms: float
+    int8_query_ms: float
+
+
+def synthetic_corpus(
+    n_vectors: int, dim: int, n_clusters: int = 64, seed: int = 0
+) -> np.ndarray:
+    """Clustered unit vectors, loosely shaped like code embeddings."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((n_clusters, dim)).astype(np.float32)
+    assignment = rng.integers(0, n_clusters, n_vectors)
+    vectors = centers[assignment] + 0.6 * rng.standard_normal((n_vectors, dim)).astype(
+        np.float32
+    )
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def load_collection(collection_path: Path) -> Tuple[np.ndarray, List[str]]:
+    """Stored float vectors of a filesystem collection."""
+    ids: List[str] = []
+    vectors: List[List[float]] = []
+    for vector_file in collection_path.rglob("vector_*.json"):
+        with open(vector_file) as f:
+            data = json.load(f)
+        if "vector" in data:
+            ids.append(data["id"])
+            vectors.append(data["vector"])
+    return np.asarray(vectors, dtype=np.float32), ids
+
+
+def run_benchmark(
+    vectors: np.ndarray,
+    ids: Optional[List[str]] = None,
+    n_queries: int = 200,
+    k: int = 10,
+    rescore_multiplier: int = DEFAULT_RESCORE_MULTIPLIER,
+    seed: int = 1,
+) -> RecallReport:
+    """Compare quantized search against a float HNSW index over *vectors*."""
+    import hnswlib
+
+    n, dim = vectors.shape
+    ids = ids or [f"p{i}" for i in range(n)]
+    position = {vid: i for i, vid in enumerate(ids)}
+
+    float_index = hnswlib.Index(space="cosine", dim=dim)
+    float_index.init_index(max_elements=n, ef_construction=200, M=16)
+    float_index.add_items(vectors, np.arange(n))
+    float_index.set_ef(max(100, k))
+    with tempfile.TemporaryDirectory() as tmp:
+        index_file = Path(tmp) / "hnsw_index.bin"
+        float_index.save_index(str(index_file))
+        float_index_bytes = index_file.stat().st_size
+
+    quantized = QuantizedVectorIndex.from_vectors(vectors, ids)
+
+    def rescore(candidate_ids: List[str]) -> List[Optional[np.ndarray]]:
+        return [vectors[position[vid]] for vid in candidate_ids]
+
+    rng = np.random.default_rng(seed)
+    query_rows = rng.choice(n, size=min(n_queries, n), replace=False)
+    queries = vectors[query_rows] + 0.05 * rng.standard_normal(
+        (len(query_rows), dim)
+    ).astype(np.float32)
+
+    hits_int8 = hits_rescored = 0
+    float_seconds = int8_seconds = 0.0
+    for query in queries:
+        t0 = time.perf_counter()
+        labels, _ = float_index.knn_query(query, k=k)
+        float_seconds += time.perf_counter() - t0
+        reference = {ids[label] for label in labels[0]}
+
+        approx_ids, _ = quantized.search(query, k=k)
+        t0 = time.perf_counter()
+        rescored_ids, _ = quantized.search(
+            query, k=k, rescore=rescore, rescore_multiplier=rescore_multiplier
+        )
+        int8_seconds += time.perf_counter() - t0
+
+        hits_int8 += len(reference.intersection(approx_ids))
+        hits_rescored += len(reference.intersection(rescored_ids))
+
+    total = len(queries) * k
+    return RecallReport(
+        vectors=n,
+        dim=dim,
+        queries=len(queries),
+        k=k,
+        rescore_multiplier=rescore_multiplier,
+        recall_int8=hits_int8 / total,
+        recall_int8_rescored=hits_rescored / total,
+        float_index_bytes=float_index_bytes,
+        int8_index_bytes=quantized.nbytes,
+        float_query_ms=1000 * float_seconds / len(queries),
+        int8_query_ms=1000 * int8_seconds / len(queries),
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure recall@k of int8 quantized search vs float HNSW"
+    )
+    parser.add_argument("--collection", type=Path, default=None)
+    parser.add_argument("--vectors", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=1024)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument(
+        "--rescore-multiplier", type=int, default=DEFAULT_RESCORE_MULTIPLIER
+    )
+    parser.add_argument(
+        "--min-recall",
+        type=float,
+        default=None,
+        help="Exit 1 if re-scored recall@k falls below this value",
+    )
+    args = parser.parse_args(argv)
+
+    if args.collection is not None:
+        vectors, ids = load_collection(args.collection)
+        if len(ids) == 0:
+            print(f"No vectors found under {args.collection}", file=sys.stderr)
+            return 1
+    else:
+        vectors, ids = synthetic_corpus(args.vectors, args.dim), None
+
+    report = run_benchmark(
+        vectors,
+        ids,
+        n_queries=args.queries,
+        k=args.k,
+        rescore_multiplier=args.rescore_multiplier,
+    )
+    results: Dict[str, object] = asdict(report)
+    print(json.dumps(results, indent=2))
+
+    if args.min_recall is not None and report.recall_int8_rescored < args.min_recall:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
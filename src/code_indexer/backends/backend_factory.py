@@ -55,6 +55,7 @@ class BackendFactory:
                 project_root=project_root,
                 hnsw_index_cache=hnsw_cache,
                 memory_governor=memory_governor,
+                vector_quantization=config.vector_store.quantization,
             )
         else:
             raise ValueError(f"Unsupported vector store provider: {provider}")
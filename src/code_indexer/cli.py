@@ -12,7 +12,18 @@ import subprocess
 import time
 import threading
 from pathlib import Path
-from typing import Optional, Union, Callable, Dict, Any, List, Literal, cast
+from typing import (
+    Optional,
+    Union,
+    Callable,
+    Dict,
+    Any,
+    Iterable,
+    List,
+    Literal,
+    Tuple,
+    cast,
+)
 
 import click
 from rich.console import Console
@@ -22,7 +33,6 @@ from rich.table import Table
 # Rich progress imports removed - using MultiThreadedProgressManager instead
 
 from .config import ConfigManager, Config
-from .services.temporal.temporal_migration import migrate_legacy_temporal_collection
 from .disabled_commands import get_command_mode_icons
 from .utils.enhanced_messaging import (
     get_conflicting_flags_message,
@@ -32,25 +42,56 @@ from .utils.exception_logger import ExceptionLogger
 from .mode_detection.command_mode_detector import CommandModeDetector, find_project_root
 from .disabled_commands import require_mode
 from . import __version__
-from .cli_scip import scip_group
-from .cli_git import git_group
-from .cli_files import files_group
-from .cli_cicd import cicd_group
-from .cli_help import help_group
-from .cli_keys import keys_group
-from .cli_index import index_remote_group
-from .cli_xray import xray_group
-
-# Module-level imports for test mocking (noqa: F401 = intentionally unused for test patching)
-from .api_clients.admin_client import AdminAPIClient  # noqa: F401
-from .api_clients.repos_client import ReposAPIClient  # noqa: F401
 from .backends.backend_factory import BackendFactory  # noqa: F401
-from .services.embedding_factory import EmbeddingProviderFactory  # noqa: F401
-from .remote.credential_manager import ProjectCredentialManager  # noqa: F401
 
-# Daemon delegation imports (lazy loaded when daemon enabled)
-from . import cli_daemon_delegation  # noqa: F401
-from . import cli_daemon_lifecycle  # noqa: F401
+
+class _LazyAttribute:
+    """Stand-in for a heavy module-level name, imported on first use.
+
+    Keeps ``code_indexer.cli.<Name>`` a patchable module attribute (tests
+    patch these) without paying the import on every ``cidx`` invocation:
+    attribute access and calls are forwarded to the real object, which is
+    imported the first time it is needed.
+    """
+
+    def __init__(self, module: str, name: str) -> None:
+        self._module = module
+        self._name = name
+        self._target: Any = None
+
+    def _resolve(self) -> Any:
+        if self._target is None:
+            import importlib
+
+            module = importlib.import_module(self._module, __package__)
+            self._target = getattr(module, self._name)
+        return self._target
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._resolve(), attr)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+
+# Module-level names kept for test mocking; imported on first use
+AdminAPIClient: Any = _LazyAttribute(".api_clients.admin_client", "AdminAPIClient")
+ReposAPIClient: Any = _LazyAttribute(".api_clients.repos_client", "ReposAPIClient")
+EmbeddingProviderFactory: Any = _LazyAttribute(
+    ".services.embedding_factory", "EmbeddingProviderFactory"
+)
+ProjectCredentialManager: Any = _LazyAttribute(
+    ".remote.credential_manager", "ProjectCredentialManager"
+)
+
+
+def migrate_legacy_temporal_collection(index_dir: Path, config: Any) -> Any:
+    """Lazy wrapper: the temporal migration module pulls in the vector store."""
+    from .services.temporal.temporal_migration import (
+        migrate_legacy_temporal_collection as _migrate,
+    )
+
+    return _migrate(index_dir, config)
 
 
 def setup_logging() -> None:
@@ -889,14 +930,16 @@ def _display_query_timing(console: Console, timing_info: Dict[str, Any]) -> None
 
 
 def _display_fts_results(
-    results: List[Dict[str, Any]],
+    results: Iterable[Dict[str, Any]],
     quiet: bool = False,
     console: Optional[Console] = None,
 ) -> None:
     """Display full-text search results with Rich formatting.
 
     Args:
-        results: List of FTS search results from TantivyIndexManager
+        results: FTS search results from TantivyIndexManager; a list, or an
+            iterator (TantivyIndexManager.iter_search) whose results are
+            printed as they are produced
         quiet: If True, show minimal output (file:line:col only)
         console: Rich console for output (creates new if None)
     """
@@ -906,11 +949,7 @@ def _display_fts_results(
     if not quiet:
         console.print("[bold cyan]Full-Text Search Results[/bold cyan]\n")
 
-    if not results:
-        if not quiet:
-            console.print("[yellow]No matches found[/yellow]")
-        return
-
+    i = 0
     for i, result in enumerate(results, 1):
         # Extract result fields
         path = result.get("path", "unknown")
@@ -959,6 +998,9 @@ def _display_fts_results(
 
         console.print()
 
+    if i == 0 and not quiet:
+        console.print("[yellow]No matches found[/yellow]")
+
 
 def _display_semantic_results(
     results: List[Dict[str, Any]],
@@ -1207,6 +1249,12 @@ def _execute_semantic_search(
         from .services.language_validator import LanguageValidator
         from .services.language_mapper import LanguageMapper
         from .services.multi_index_query_service import MultiIndexQueryService
+        from .services.query_embedding_disk_cache import (
+            install_query_embedding_cache,
+        )
+
+        # Repeated queries reuse their embedding instead of a provider call
+        install_query_embedding_cache(config)
 
         embedding_provider = EmbeddingProviderFactory.create(config, console)
         backend = BackendFactory.create(
@@ -1740,7 +1788,35 @@ def create_auth_client(server_url: str, project_root: Path):
 
 
 class ModeAwareGroup(click.Group):
-    """Custom Click Group that adds mode compatibility icons to command help."""
+    """Custom Click Group that adds mode compatibility icons to command help.
+
+    Command groups implemented in their own modules are registered lazily
+    (``add_lazy_command``): the module is imported only when that command
+    is resolved, so ``cidx query`` does not import the SCIP, git, files,
+    CI/CD, keys, remote-index and X-Ray command modules.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # command name -> (module, attribute)
+        self._lazy_commands: Dict[str, Tuple[str, str]] = {}
+
+    def add_lazy_command(self, name: str, module: str, attribute: str) -> None:
+        """Register ``module.attribute`` as command ``name`` without importing it."""
+        self._lazy_commands[name] = (module, attribute)
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self._lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self._lazy_commands:
+            import importlib
+
+            module, attribute = self._lazy_commands[cmd_name]
+            command = getattr(importlib.import_module(module, __package__), attribute)
+            self.add_command(command, cmd_name)
+        return command
 
     def format_commands(self, ctx, formatter):
         """Format commands with mode compatibility icons."""
@@ -1962,30 +2038,33 @@ def cli(
         console.print(f"📁 Project root: {project_root}", style="dim")
 
 
+# Command groups implemented in their own modules are registered lazily:
+# each module is imported only when its command runs (or for --help).
+
 # Register SCIP commands
-cli.add_command(scip_group)
+cli.add_lazy_command("scip", ".cli_scip", "scip_group")
 
 # Register Git commands (Story #737)
-cli.add_command(git_group)
+cli.add_lazy_command("git", ".cli_git", "git_group")
 
 # Register File commands (Story #738)
-cli.add_command(files_group)
+cli.add_lazy_command("files", ".cli_files", "files_group")
 
 
 # Story #746: Register CI/CD commands (implemented in cli_cicd.py)
-cli.add_command(cicd_group)
+cli.add_lazy_command("cicd", ".cli_cicd", "cicd_group")
 
 # Story #749: Register Help commands (implemented in cli_help.py)
-cli.add_command(help_group)
+cli.add_lazy_command("help", ".cli_help", "help_group")
 
 # Story #656: Register SSH key management commands (implemented in cli_keys.py)
-cli.add_command(keys_group)
+cli.add_lazy_command("keys", ".cli_keys", "keys_group")
 
 # Story #656: Register Remote index management commands (implemented in cli_index.py)
-cli.add_command(index_remote_group)
+cli.add_lazy_command("remote-index", ".cli_index", "index_remote_group")
 
 # Story #975: Register X-Ray CLI commands (implemented in cli_xray.py)
-cli.add_command(xray_group)
+cli.add_lazy_command("xray", ".cli_xray", "xray_group")
 
 
 @cli.group("groups")
@@ -4555,6 +4634,7 @@ def watch(ctx, debounce: float, batch_size: int, initial_sync: bool, fts: bool):
             fts_watch_handler = FTSWatchHandler(
                 tantivy_index_manager=tantivy_manager,
                 config=config,
+                debounce_seconds=debounce,
             )
 
         # Initialize temporal watch handler if auto-detected
@@ -4667,6 +4747,10 @@ def watch(ctx, debounce: float, batch_size: int, initial_sync: bool, fts: bool):
             observer.stop()
             observer.join()
 
+            # Apply FTS changes still waiting in the debounce window
+            if fts_watch_handler:
+                fts_watch_handler.stop_watching()
+
             # Save final metadata if semantic handler was active
             if available_indexes["semantic"] and watch_metadata and watch_metadata_path:
                 watch_metadata.save_to_disk(watch_metadata_path)
@@ -5429,6 +5513,8 @@ def query(
                     if not quiet:
                         console.print("🔧 Running in daemon mode", style="blue")
 
+                    from . import cli_daemon_delegation
+
                     # Delegate based on query type
                     if time_range:
                         # Story 1: Delegate temporal query to daemon
@@ -6069,12 +6155,9 @@ def query(
                     if effective_rerank_query
                     else limit
                 )
-                fts_results = tantivy_manager.search(
-                    query_text=query,
+                fts_filters: Dict[str, Any] = dict(
                     case_sensitive=case_sensitive,
                     edit_distance=edit_distance,
-                    snippet_lines=snippet_lines,
-                    limit=_fts_fetch_limit,
                     languages=language_extensions,
                     path_filters=list(path_filter) if path_filter else None,
                     exclude_paths=list(exclude_paths) if exclude_paths else None,
@@ -6083,6 +6166,25 @@ def query(
                     ),
                     use_regex=regex,  # Pass regex flag
                 )
+                if limit == 0 and not effective_rerank_query:
+                    # Unlimited grep-like output: stream matches as they are
+                    # found instead of collecting them all first
+                    # (snippets stay off, as with search(limit=0))
+                    _display_fts_results(
+                        tantivy_manager.iter_search(
+                            query_text=query, snippet_lines=0, **fts_filters
+                        ),
+                        quiet=quiet,
+                        console=console,
+                    )
+                    sys.exit(0)
+
+                fts_results = tantivy_manager.search(
+                    query_text=query,
+                    snippet_lines=snippet_lines,
+                    limit=_fts_fetch_limit,
+                    **fts_filters,
+                )
 
                 # Story #694: apply reranker stage if effective_rerank_query is set.
                 if effective_rerank_query:
@@ -6377,6 +6479,12 @@ def query(
         from .services.generic_query_service import GenericQueryService
         from .services.language_validator import LanguageValidator
         from .services.language_mapper import LanguageMapper
+        from .services.query_embedding_disk_cache import (
+            install_query_embedding_cache,
+        )
+
+        # Repeated queries reuse their embedding instead of a provider call
+        install_query_embedding_cache(config)
 
         embedding_provider = EmbeddingProviderFactory.create(config, console)
         backend = BackendFactory.create(
@@ -8727,6 +8835,8 @@ def clean_data(
             if config_manager:
                 daemon_config = config_manager.get_daemon_config()
                 if daemon_config and daemon_config.get("enabled"):
+                    from . import cli_daemon_delegation
+
                     # Delegate to daemon
                     exit_code = cli_daemon_delegation._clean_data_via_daemon(
                         all_projects=all_projects,
@@ -8846,6 +8956,8 @@ def clean(
             if config_manager:
                 daemon_config = config_manager.get_daemon_config()
                 if daemon_config and daemon_config.get("enabled"):
+                    from . import cli_daemon_delegation
+
                     # Delegate to daemon
                     exit_code = cli_daemon_delegation._clean_via_daemon(
                         collection=collection,
@@ -19102,6 +19214,8 @@ def start_command(ctx):
     Normally daemon auto-starts on first query, but this allows
     explicit control for debugging or pre-loading.
     """
+    from . import cli_daemon_lifecycle
+
     exit_code = cli_daemon_lifecycle.start_daemon_command()
     sys.exit(exit_code)
 
@@ -19118,6 +19232,8 @@ def stop_command(ctx):
     - Closes connections
     - Exits daemon process
     """
+    from . import cli_daemon_lifecycle
+
     exit_code = cli_daemon_lifecycle.stop_daemon_command()
     sys.exit(exit_code)
 
@@ -19131,6 +19247,8 @@ def watch_stop_command(ctx):
     Only available in daemon mode. Use this to stop watch
     without stopping the entire daemon. Queries continue to work.
     """
+    from . import cli_daemon_lifecycle
+
     exit_code = cli_daemon_lifecycle.watch_stop_command()
     sys.exit(exit_code)
 
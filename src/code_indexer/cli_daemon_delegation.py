@@ -15,7 +15,7 @@ import time
 import subprocess
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, cast
+from typing import Optional, Dict, Any, Iterator, cast
 from rich.console import Console
 
 logger = logging.getLogger(__name__)
@@ -149,6 +149,67 @@ def _connect_to_daemon(
                 raise last_error
 
 
+def _call_daemon_query(root: Any, method: str, *args: Any, **kwargs: Any) -> Any:
+    """
+    Call a daemon query method through its packed variant.
+
+    The ``<method>_packed`` variant returns the whole response as a single
+    msgpack buffer, decoded here in one pass, instead of a netref that is
+    fetched element by element while the results are displayed. Daemons
+    started before the packed variants existed do not expose them; those
+    are called through ``method`` directly.
+
+    Args:
+        root: RPyC connection root (``conn.root``)
+        method: Query method name, e.g. "exposed_query_fts"
+        *args: Positional arguments for the query method
+        **kwargs: Keyword arguments for the query method
+
+    Returns:
+        The query response (dict or list), as plain local objects
+    """
+    try:
+        packed_method = getattr(root, f"{method}_packed")
+    except AttributeError:
+        return getattr(root, method)(*args, **kwargs)
+
+    from .daemon.result_codec import unpack_response
+
+    return unpack_response(packed_method(*args, **kwargs))
+
+
+def _iter_daemon_fts_results(
+    root: Any, project_path: str, query_text: str, **kwargs: Any
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream unlimited (--limit 0) FTS results from the daemon page by page.
+
+    Each page is fetched with exposed_query_fts_page() only when the
+    previous one has been consumed, so output starts after the first page
+    instead of after the whole result set.
+
+    Args:
+        root: RPyC connection root (``conn.root``)
+        project_path: Path to project root
+        query_text: Query string
+        **kwargs: FTS search parameters (as for exposed_query_fts)
+
+    Yields:
+        FTS result dictionaries in result order
+    """
+    from .daemon.result_codec import unpack_response
+
+    cursor: Optional[int] = 0
+    while cursor is not None:
+        page = unpack_response(
+            root.exposed_query_fts_page(
+                project_path, query_text, cursor=cursor, **kwargs
+            )
+        )
+        yield from page["results"]
+        cursor = page["next_cursor"]
+
+
 def _cleanup_stale_socket(socket_path: Path) -> None:
     """
     Remove stale socket file.
@@ -445,18 +506,46 @@ def _query_via_daemon(
 
             if fts and semantic:
                 # Hybrid search
-                result = conn.root.exposed_query_hybrid(
-                    str(Path.cwd()), query_text, limit=limit, **kwargs
+                result = _call_daemon_query(
+                    conn.root,
+                    "exposed_query_hybrid",
+                    str(Path.cwd()),
+                    query_text,
+                    limit=limit,
+                    **kwargs,
                 )
+            elif fts and limit == 0:
+                # Unlimited FTS-only search: print pages as they arrive
+                from .cli import _display_fts_results
+
+                _display_fts_results(
+                    _iter_daemon_fts_results(
+                        conn.root, str(Path.cwd()), query_text, **kwargs
+                    ),
+                    quiet=kwargs.get("quiet", False),
+                    console=console,
+                )
+                conn.close()
+                return 0
             elif fts:
                 # FTS-only search
-                result = conn.root.exposed_query_fts(
-                    str(Path.cwd()), query_text, limit=limit, **kwargs
+                result = _call_daemon_query(
+                    conn.root,
+                    "exposed_query_fts",
+                    str(Path.cwd()),
+                    query_text,
+                    limit=limit,
+                    **kwargs,
                 )
             else:
                 # Semantic search
-                result = conn.root.exposed_query(
-                    str(Path.cwd()), query_text, limit=limit, **kwargs
+                result = _call_daemon_query(
+                    conn.root,
+                    "exposed_query",
+                    str(Path.cwd()),
+                    query_text,
+                    limit=limit,
+                    **kwargs,
                 )
 
             query_time = time.perf_counter() - start_time
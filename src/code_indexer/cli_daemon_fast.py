@@ -334,8 +334,12 @@ def execute_via_daemon(argv: List[str], config_path: Path) -> int:
             # Execute query via daemon RPC
             if is_fts and is_semantic:
                 # Hybrid search
-                response = conn.root.exposed_query_hybrid(
-                    str(Path.cwd()), query_text, **options
+                response = cli_daemon_delegation._call_daemon_query(
+                    conn.root,
+                    "exposed_query_hybrid",
+                    str(Path.cwd()),
+                    query_text,
+                    **options,
                 )
                 # Extract results from response dict
                 result = (
@@ -344,10 +348,26 @@ def execute_via_daemon(argv: List[str], config_path: Path) -> int:
                     else response
                 )
                 timing_info = None
+            elif is_fts and limit == 0:
+                # Unlimited FTS: print pages as they arrive from the daemon
+                from .cli import _display_fts_results
+
+                _display_fts_results(
+                    cli_daemon_delegation._iter_daemon_fts_results(
+                        conn.root, str(Path.cwd()), query_text, **filters
+                    ),
+                    quiet=is_quiet,
+                    console=console,
+                )
+                return 0
             elif is_fts:
                 # FTS only
-                response = conn.root.exposed_query_fts(
-                    str(Path.cwd()), query_text, **options
+                response = cli_daemon_delegation._call_daemon_query(
+                    conn.root,
+                    "exposed_query_fts",
+                    str(Path.cwd()),
+                    query_text,
+                    **options,
                 )
                 # Extract results from response dict
                 result = (
@@ -358,8 +378,13 @@ def execute_via_daemon(argv: List[str], config_path: Path) -> int:
                 timing_info = None
             else:
                 # Semantic only
-                response = conn.root.exposed_query(
-                    str(Path.cwd()), query_text, limit, **filters
+                response = cli_daemon_delegation._call_daemon_query(
+                    conn.root,
+                    "exposed_query",
+                    str(Path.cwd()),
+                    query_text,
+                    limit,
+                    **filters,
                 )
                 # CRITICAL FIX: Parse response dict with results and timing
                 result = response.get("results", [])
@@ -106,6 +106,7 @@ def start_watch_mode(
 
     # Initialize handlers for detected indexes
     handlers = []
+    fts_handler = None
 
     # Semantic index handler (GitAwareWatchHandler)
     if available_indexes["semantic"]:
@@ -188,7 +189,9 @@ def start_watch_mode(
         fts_index_dir = project_root / ".code-indexer/index/tantivy-fts"
 
         tantivy_manager = TantivyIndexManager(fts_index_dir)
-        fts_handler = FTSWatchHandler(tantivy_manager, config)
+        fts_handler = FTSWatchHandler(
+            tantivy_manager, config, debounce_seconds=debounce
+        )
         handlers.append(fts_handler)
 
     # Temporal index handler
@@ -257,3 +260,7 @@ def start_watch_mode(
         semantic_handler = handlers[0]
         if hasattr(semantic_handler, "stop_watching"):
             semantic_handler.stop_watching()
+
+    # Apply FTS changes still waiting in the debounce window
+    if fts_handler is not None:
+        fts_handler.stop_watching()
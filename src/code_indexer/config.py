@@ -395,6 +395,32 @@ class VectorStoreConfig(BaseModel):
         default="filesystem",
         description="Vector storage provider",
     )
+    quantization: Literal["none", "int8"] = Field(
+        default="none",
+        description=(
+            "Search-time vector quantization. 'int8' serves queries from a "
+            "per-collection int8 index with exact float re-scoring of the top "
+            "candidates, using ~1/4 of the memory of the float HNSW index"
+        ),
+    )
+
+
+class QueryEmbeddingDiskCacheConfig(BaseModel):
+    """Configuration for the CLI/daemon on-disk query embedding cache."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Reuse embeddings of previously seen queries instead of calling the provider",
+    )
+    max_entries: int = Field(
+        default=5000,
+        ge=1,
+        description="Maximum cached query embeddings (least recently used are evicted)",
+    )
+    path: Optional[str] = Field(
+        default=None,
+        description="Cache file (default: ~/.cache/cidx/query_embeddings.db)",
+    )
 
 
 class DaemonConfig(BaseModel):
@@ -749,6 +775,12 @@ class Config(BaseModel):
         description="Automatic recovery system configuration",
     )
 
+    # CLI/daemon query embedding cache
+    query_embedding_cache: QueryEmbeddingDiskCacheConfig = Field(
+        default_factory=QueryEmbeddingDiskCacheConfig,
+        description="On-disk cache of query embeddings for CLI and daemon queries",
+    )
+
     # Daemon configuration
     daemon: Optional[DaemonConfig] = Field(
         default=None,
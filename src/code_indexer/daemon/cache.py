@@ -1,7 +1,8 @@
 """Cache entry and TTL eviction logic for daemon service.
 
 Provides in-memory caching of HNSW and Tantivy indexes with TTL-based eviction,
-access tracking, and thread-safe concurrency control.
+access tracking, and thread-safe concurrency control. The daemon keeps one
+CacheEntry per project in an LRU bounded by project count and estimated bytes.
 """
 
 import logging
@@ -10,10 +11,18 @@ import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional, cast
+from typing import Any, Callable, Dict, Optional, cast
 
 logger = logging.getLogger(__name__)
 
+# Default bounds for the daemon's per-project LRU (overridable via
+# CIDX_DAEMON_MAX_CACHED_PROJECTS / CIDX_DAEMON_MAX_CACHE_MB).
+DEFAULT_MAX_CACHED_PROJECTS = 4
+DEFAULT_MAX_CACHE_MB = 4096
+
+# On-disk files whose size approximates a loaded collection's memory footprint.
+_INDEX_SIZE_FILES = ("hnsw_index.bin", "id_index.bin")
+
 
 class ReaderWriterLock:
     """
@@ -72,10 +81,14 @@ class CacheEntry:
         vector_dim: Vector dimension of the loaded collection (1536 default)
         tantivy_index: Tantivy FTS index (None if not loaded)
         tantivy_searcher: Tantivy searcher instance (None if not loaded)
+        tantivy_schema: Schema matching tantivy_index (None if not loaded)
         fts_available: Whether FTS indexes are available
+        vector_store: FilesystemVectorStore that searches this entry's loaded
+            HNSW/ID indexes instead of reloading them (None if not loaded)
         last_accessed: Timestamp of last access
         ttl_minutes: Time-to-live in minutes before eviction
         access_count: Number of times this entry has been accessed
+        estimated_bytes: Estimated in-memory size of the loaded indexes
         rw_lock: ReaderWriterLock for concurrent reads and exclusive writes
     """
 
@@ -98,8 +111,12 @@ class CacheEntry:
         # FTS indexes
         self.tantivy_index: Optional[Any] = None
         self.tantivy_searcher: Optional[Any] = None
+        self.tantivy_schema: Optional[Any] = None
         self.fts_available: bool = False
 
+        # Vector store bound to the loaded semantic indexes (see EntryIndexCache)
+        self.vector_store: Optional[Any] = None
+
         # AC11: Version tracking for cache invalidation after rebuild
         self.hnsw_index_version: Optional[str] = (
             None  # Tracks loaded index_rebuild_uuid
@@ -113,6 +130,10 @@ class CacheEntry:
         self.last_accessed: datetime = datetime.now()
         self.ttl_minutes: int = ttl_minutes
         self.access_count: int = 0
+        self._access_lock = threading.Lock()  # Concurrent readers update access
+
+        # Size estimate used by the daemon's byte-bounded LRU
+        self.estimated_bytes: int = 0
 
         # Concurrency control
         self.rw_lock: ReaderWriterLock = (
@@ -124,8 +145,9 @@ class CacheEntry:
 
         Thread-safe method to track cache entry usage.
         """
-        self.last_accessed = datetime.now()
-        self.access_count += 1
+        with self._access_lock:
+            self.last_accessed = datetime.now()
+            self.access_count += 1
 
     def is_expired(self) -> bool:
         """Check if cache entry has exceeded its TTL.
@@ -184,15 +206,19 @@ class CacheEntry:
         self.hnsw_index = hnsw_index
         self.id_mapping = id_mapping
 
-    def set_fts_indexes(self, tantivy_index: Any, tantivy_searcher: Any) -> None:
+    def set_fts_indexes(
+        self, tantivy_index: Any, tantivy_searcher: Any, tantivy_schema: Any = None
+    ) -> None:
         """Set FTS indexes.
 
         Args:
             tantivy_index: Tantivy index instance
             tantivy_searcher: Tantivy searcher instance
+            tantivy_schema: Schema matching tantivy_index (optional)
         """
         self.tantivy_index = tantivy_index
         self.tantivy_searcher = tantivy_searcher
+        self.tantivy_schema = tantivy_schema
         self.fts_available = True
 
     def invalidate(self) -> None:
@@ -212,7 +238,9 @@ class CacheEntry:
         self.vector_dim = 1536  # Reset to default
         self.tantivy_index = None
         self.tantivy_searcher = None
+        self.tantivy_schema = None
         self.fts_available = False
+        self.vector_store = None
         # AC11: Clear version tracking
         self.hnsw_index_version = None
         # Clear query cache
@@ -267,6 +295,33 @@ class CacheEntry:
         except (json.JSONDecodeError, KeyError, OSError):
             return "v0"  # Corrupted/missing metadata
 
+    def estimate_index_bytes(self) -> int:
+        """Estimate the memory held by this entry's loaded indexes.
+
+        Uses the on-disk size of the loaded collection's HNSW and ID index
+        files plus the Tantivy index directory when FTS is loaded.
+
+        Returns:
+            Estimated size in bytes (0 when nothing is loaded)
+        """
+        total = 0
+        index_root = self.project_path / ".code-indexer"
+        if self.hnsw_index is not None and self.collection_name:
+            collection_path = index_root / "index" / self.collection_name
+            for name in _INDEX_SIZE_FILES:
+                try:
+                    total += (collection_path / name).stat().st_size
+                except OSError:
+                    continue
+        if self.fts_available:
+            try:
+                for item in (index_root / "tantivy_index").iterdir():
+                    if item.is_file():
+                        total += item.stat().st_size
+            except OSError:
+                pass
+        return total
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache entry statistics.
 
@@ -282,9 +337,50 @@ class CacheEntry:
             "fts_loaded": self.fts_available,
             "expired": self.is_expired(),
             "hnsw_version": self.hnsw_index_version,  # AC11: Include version in stats
+            "estimated_bytes": self.estimated_bytes,
         }
 
 
+class EntryIndexCache:
+    """Serve a CacheEntry's loaded indexes through FilesystemVectorStore's
+    ``hnsw_index_cache`` / ``id_index_cache`` hooks.
+
+    Lookups for the entry's loaded collection return the in-memory objects,
+    so daemon queries run the regular search pipeline (filters, payload
+    loading, staleness) without reloading indexes from disk. Any other
+    collection, or an entry whose indexes were cleared, falls through to
+    the loader.
+    """
+
+    def __init__(self, entry: CacheEntry, value: Callable[[CacheEntry], Any]):
+        """Initialize the adapter.
+
+        Args:
+            entry: Cache entry owning the loaded indexes
+            value: Returns the cached object from the entry, or None when it
+                is not loaded
+        """
+        self._entry = entry
+        self._value = value
+
+    def get_or_load(
+        self, key: str, loader: Callable[[], Any], index_file: Optional[Path] = None
+    ) -> Any:
+        """Return the entry's object for key's collection, else call loader."""
+        entry = self._entry
+        value = self._value(entry)
+        if value is not None and entry.collection_name:
+            collection_path = (
+                entry.project_path / ".code-indexer" / "index" / entry.collection_name
+            )
+            if Path(key).resolve() == collection_path.resolve():
+                return value
+        return loader()
+
+    def invalidate(self, key: str) -> None:
+        """No-op: the daemon owns the entry's lifetime (reload/retire)."""
+
+
 class TTLEvictionThread(threading.Thread):
     """Background thread for TTL-based cache eviction.
 
@@ -324,23 +420,15 @@ class TTLEvictionThread(threading.Thread):
         self.running = False
 
     def _check_and_evict(self) -> None:
-        """Check for expired cache and evict if necessary.
+        """Evict every expired cache entry and shut down if configured.
 
-        Acquires cache lock before checking expiration.
-        Triggers auto-shutdown if configured and cache is evicted.
+        Each project's entry expires independently; auto-shutdown triggers
+        once eviction leaves the daemon idle.
         """
-        with self.daemon_service.cache_lock:
-            if self.daemon_service.cache_entry is None:
-                return
-
-            if self.daemon_service.cache_entry.is_expired():
-                logger.info("Cache expired, evicting")
-                self.daemon_service.cache_entry = None
-
-                # Check for auto-shutdown
-                if self._should_shutdown():
-                    logger.info("Auto-shutdown on idle")
-                    os._exit(0)
+        evicted = self.daemon_service.evict_expired_cache_entries()
+        if evicted and self._should_shutdown():
+            logger.info("Auto-shutdown on idle")
+            os._exit(0)
 
     def _should_shutdown(self) -> bool:
         """Check if daemon should auto-shutdown on idle.
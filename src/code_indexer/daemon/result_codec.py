@@ -0,0 +1,46 @@
+"""Packed transport for daemon query results.
+
+RPyC passes dicts and lists by reference: a result list returned by
+``exposed_query`` reaches the client as a netref, and every element, key
+and nested payload the client touches while rendering is a separate round
+trip over the socket. For large result sets (``--limit 100`` with
+snippets, grep-style FTS output) rendering was dominated by these round
+trips.
+
+The ``*_packed`` query methods return the whole response as one msgpack
+buffer instead, which crosses the socket as a single bytes value and is
+decoded by the client in one pass.
+"""
+
+from datetime import date, datetime
+from enum import Enum
+from pathlib import PurePath
+from typing import Any
+
+import msgpack  # type: ignore[import-untyped]
+
+
+def _encode_default(obj: Any) -> Any:
+    """Map values msgpack cannot encode natively to plain data."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, PurePath):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    # numpy scalars and arrays (scores, vectors) without importing numpy
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Cannot pack {type(obj).__name__} in a daemon response")
+
+
+def pack_response(response: Any) -> bytes:
+    """Pack a query response (dict or list of result dicts) into one buffer."""
+    return msgpack.packb(response, default=_encode_default, use_bin_type=True)  # type: ignore[no-any-return]
+
+
+def unpack_response(payload: bytes) -> Any:
+    """Decode a buffer produced by ``pack_response``."""
+    return msgpack.unpackb(payload, raw=False, strict_map_key=False)
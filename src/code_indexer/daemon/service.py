@@ -6,13 +6,23 @@ Provides 16 exposed methods for semantic search, FTS, temporal queries, watch mo
 from __future__ import annotations
 
 import logging
+import os
 import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, cast
 
 from rpyc import Service
 
-from .cache import CacheEntry, TTLEvictionThread
+from .cache import (
+    DEFAULT_MAX_CACHE_MB,
+    DEFAULT_MAX_CACHED_PROJECTS,
+    CacheEntry,
+    EntryIndexCache,
+    TTLEvictionThread,
+)
+from .result_codec import pack_response
 from .watch_manager import DaemonWatchManager
 from code_indexer.cli_search_funnel import _apply_cli_rerank_and_filter
 
@@ -22,20 +32,40 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Results per exposed_query_fts_page() call
+FTS_PAGE_SIZE = 200
+
 
 class CIDXDaemonService(Service):
     """RPyC daemon service for in-memory index caching.
 
     Provides 16 exposed methods organized into categories:
     - Query Operations (4): query, query_fts, query_hybrid, query_temporal
+      (query, query_fts and query_hybrid also have *_packed variants that
+      return the response as one msgpack buffer; query_fts_page pages
+      unlimited FTS results)
     - Indexing (3): index_blocking, index, get_index_progress
     - Watch Mode (3): watch_start, watch_stop, watch_status
     - Storage Operations (3): clean, clean_data, status
     - Daemon Management (4): get_status, clear_cache, shutdown, ping
 
+    Cache:
+        - cache_entries: LRU of per-project CacheEntry objects, bounded by
+          max_cached_projects and max_cache_bytes (estimated index size), so
+          alternating between repositories keeps their indexes warm.
+          cache_entry is the most recently used entry (legacy single-project
+          view). Projects are preloaded on watch_start.
+
     Thread Safety:
-        - cache_lock: Protects cache entry loading/replacement
-        - CacheEntry.rw_lock: ReaderWriterLock for concurrent reads and exclusive writes
+        - cache_lock: Protects the cache_entries map; held only for short
+          pointer reads/swaps, never across a search
+        - cache_load_lock: Serializes index loading so concurrent first queries
+          load the indexes once
+        - CacheEntry.rw_lock: Queries run under the shared read lock, so N
+          concurrent queries proceed in parallel. Reload and invalidation are
+          copy-on-write: a new entry is swapped in (or the reference cleared)
+          and the old entry is only torn down under its write lock once
+          in-flight readers have drained.
     """
 
     # Class-level type declarations for rerank attributes (wired in __init__).
@@ -57,11 +87,22 @@ class CIDXDaemonService(Service):
         exception_logger.install_thread_exception_hook()
         logger.info("ExceptionLogger initialized for daemon mode")
 
-        # Cache state
-        self.cache_entry: Optional[CacheEntry] = None
+        # Cache state: per-project LRU (most recently used last)
+        self.cache_entries: "OrderedDict[Path, CacheEntry]" = OrderedDict()
+        self.max_cached_projects: int = int(
+            os.environ.get(
+                "CIDX_DAEMON_MAX_CACHED_PROJECTS", str(DEFAULT_MAX_CACHED_PROJECTS)
+            )
+        )
+        self.max_cache_bytes: int = (
+            int(os.environ.get("CIDX_DAEMON_MAX_CACHE_MB", str(DEFAULT_MAX_CACHE_MB)))
+            * 1024
+            * 1024
+        )
         # FIX Race Condition #1: Use RLock (reentrant lock) to allow nested locking
         # This allows _ensure_cache_loaded to be called both standalone and within lock
         self.cache_lock: threading.RLock = threading.RLock()
+        self.cache_load_lock: threading.Lock = threading.Lock()
 
         # Watch mode state - managed by DaemonWatchManager
         self.watch_manager = DaemonWatchManager()
@@ -111,6 +152,33 @@ class CIDXDaemonService(Service):
 
         logger.info("CIDXDaemonService initialized")
 
+    @property
+    def cache_entry(self) -> Optional[CacheEntry]:
+        """Most recently used cache entry (None when nothing is cached)."""
+        with self.cache_lock:
+            if not self.cache_entries:
+                return None
+            return next(reversed(self.cache_entries.values()))
+
+    @cache_entry.setter
+    def cache_entry(self, entry: Optional[CacheEntry]) -> None:
+        """Install entry as most recently used, or drop every entry when None.
+
+        Dropped entries are not mutated: in-flight readers keep using them
+        and they are released once the last reference goes away.
+        """
+        with self.cache_lock:
+            if entry is None:
+                self.cache_entries.clear()
+            else:
+                self.cache_entries[entry.project_path] = entry
+                self.cache_entries.move_to_end(entry.project_path)
+
+    @cache_entry.deleter
+    def cache_entry(self) -> None:
+        """Drop every cached entry (same as assigning None)."""
+        self.cache_entry = None
+
     # =============================================================================
     # Query Operations (3 methods)
     # =============================================================================
@@ -241,13 +309,11 @@ class CIDXDaemonService(Service):
         limit = max(1, int(limit))
         logger.debug(f"exposed_query: project={project_path}, query={query[:50]}...")
 
-        # FIX Race Condition #1: Hold cache_lock during entire query execution
-        with self.cache_lock:
-            self._ensure_cache_loaded(project_path)
-            if self.cache_entry:
-                self.cache_entry.update_access()
+        # Shared read lock: concurrent queries run in parallel while a cache
+        # reload/invalidation cannot tear down the entry underneath them.
+        with self._read_cache_entry(project_path) as entry:
             results, timing_info = self._execute_semantic_search(
-                project_path, query, limit, **kwargs
+                project_path, query, limit, cache_entry=entry, **kwargs
             )
             if results:
                 self._apply_staleness_metadata(results, project_path)
@@ -295,12 +361,10 @@ class CIDXDaemonService(Service):
             f"exposed_query_fts: project={project_path}, query={query[:50]}..."
         )
 
-        # FIX Race Condition #1: Hold cache_lock during entire query execution
-        with self.cache_lock:
-            self._ensure_cache_loaded(project_path)
-            if self.cache_entry:
-                self.cache_entry.update_access()
-            results = self._execute_fts_search(project_path, query, **kwargs)
+        with self._read_cache_entry(project_path) as entry:
+            results = self._execute_fts_search(
+                project_path, query, cache_entry=entry, **kwargs
+            )
 
         return self._apply_rerank_or_truncate(
             results,
@@ -354,6 +418,72 @@ class CIDXDaemonService(Service):
             "fts": fts_results,
         }
 
+    # Packed variants: same arguments and response shape as the methods
+    # above, returned as a single msgpack buffer (see result_codec) so the
+    # client does not fetch results element by element over netrefs.
+
+    def exposed_query_packed(
+        self, project_path: str, query: str, *args: Any, **kwargs: Any
+    ) -> bytes:
+        """exposed_query() response packed with result_codec.pack_response."""
+        return pack_response(self.exposed_query(project_path, query, *args, **kwargs))
+
+    def exposed_query_fts_packed(
+        self, project_path: str, query: str, *args: Any, **kwargs: Any
+    ) -> bytes:
+        """exposed_query_fts() response packed with result_codec.pack_response."""
+        return pack_response(
+            self.exposed_query_fts(project_path, query, *args, **kwargs)
+        )
+
+    def exposed_query_hybrid_packed(
+        self, project_path: str, query: str, *args: Any, **kwargs: Any
+    ) -> bytes:
+        """exposed_query_hybrid() response packed with result_codec.pack_response."""
+        return pack_response(
+            self.exposed_query_hybrid(project_path, query, *args, **kwargs)
+        )
+
+    def exposed_query_fts_page(
+        self,
+        project_path: str,
+        query: str,
+        cursor: int = 0,
+        page_size: int = FTS_PAGE_SIZE,
+        **kwargs: Any,
+    ) -> bytes:
+        """Return one page of unlimited (grep-like) FTS results, packed.
+
+        Lets the client print --limit 0 output page by page instead of
+        waiting for the whole result set. Pages are not reranked.
+
+        Args:
+            project_path: Path to project root
+            query: Search query
+            cursor: 0 for the first page, then the previous page's next_cursor
+            page_size: Maximum results in the page (must be >= 1)
+            **kwargs: Additional search parameters (as for exposed_query_fts)
+
+        Returns:
+            pack_response({"results": [...], "next_cursor": int or None});
+            next_cursor is None once the results are exhausted
+        """
+        logger.debug(f"exposed_query_fts_page: project={project_path}, cursor={cursor}")
+        with self._read_cache_entry(project_path) as entry:
+            tantivy_manager = self._open_fts_manager(project_path, entry)
+            if tantivy_manager is None:
+                results: List[Dict[str, Any]] = []
+                next_cursor: Optional[int] = None
+            else:
+                results, next_cursor = tantivy_manager.search_page(
+                    query,
+                    page_size=page_size,
+                    cursor=cursor,
+                    **self._fts_search_options(kwargs),
+                )
+
+        return pack_response({"results": results, "next_cursor": next_cursor})
+
     def exposed_query_temporal(
         self,
         project_path: str,
@@ -424,24 +554,21 @@ class CIDXDaemonService(Service):
 
         project_root = Path(project_path)
 
-        with self.cache_lock:
-            # Ensure cache loaded for project
-            if (
-                self.cache_entry is None
-                or self.cache_entry.project_path != project_root
-            ):
-                self._ensure_cache_loaded(project_path)
-
-            assert self.cache_entry is not None  # Guaranteed by _ensure_cache_loaded
-
+        with self._read_cache_entry(project_path):
             from code_indexer.config import ConfigManager
 
             # Bug #1300: lazy-init config_manager BEFORE first use below.
-            if not hasattr(self, "config_manager") or self.config_manager is None:
-                self.config_manager = ConfigManager.create_with_backtrack(project_root)
+            # Shared service state is initialized under cache_lock; the query
+            # itself runs under the entry's shared read lock only.
+            with self.cache_lock:
+                if not hasattr(self, "config_manager") or self.config_manager is None:
+                    self.config_manager = ConfigManager.create_with_backtrack(
+                        project_root
+                    )
+                config_manager = self.config_manager
 
-            assert self.config_manager is not None
-            config = self.config_manager.get_config()
+            assert config_manager is not None
+            config = config_manager.get_config()
 
             # Convert time_range string to tuple (same logic as cli.py:4819-4840)
             if time_range == "all":
@@ -494,11 +621,13 @@ class CIDXDaemonService(Service):
                 }
 
             # Get vector_store service (reuse from cache if available).
-            if not hasattr(self, "vector_store") or self.vector_store is None:
-                from code_indexer.backends.backend_factory import BackendFactory
+            with self.cache_lock:
+                if not hasattr(self, "vector_store") or self.vector_store is None:
+                    from code_indexer.backends.backend_factory import BackendFactory
 
-                backend = BackendFactory.create(config, project_root)
-                self.vector_store = backend.get_vector_store_client()
+                    backend = BackendFactory.create(config, project_root)
+                    self.vector_store = backend.get_vector_store_client()
+                vector_store = self.vector_store
 
             from code_indexer.services.temporal.temporal_fusion_dispatch import (
                 execute_temporal_query_with_fusion,
@@ -510,7 +639,7 @@ class CIDXDaemonService(Service):
                 results = execute_temporal_query_with_fusion(
                     config=config,
                     index_path=index_dir,
-                    vector_store=self.vector_store,
+                    vector_store=vector_store,
                     query_text=query,
                     limit=limit,
                     time_range=time_range_tuple,
@@ -526,9 +655,6 @@ class CIDXDaemonService(Service):
             except ValueError as e:
                 return {"error": str(e), "results": []}
 
-            # Update cache access tracking
-            self.cache_entry.update_access()
-
             # execute_temporal_query_with_fusion() returns an empty result set
             # with a typed `warning` when no temporal collections exist for
             # the resolved embedder -- surface it as `error` for backward
@@ -591,10 +717,7 @@ class CIDXDaemonService(Service):
 
         try:
             # Invalidate cache BEFORE indexing
-            with self.cache_lock:
-                if self.cache_entry:
-                    logger.info("Invalidating cache before indexing")
-                    self.cache_entry = None
+            self._drop_cache_entry(project_path, "Invalidating cache before indexing")
 
             # CRITICAL FIX for Bug #473: Check temporal indexing FIRST before ANY semantic initialization
             # This prevents wasting time on SmartIndexer setup and file discovery when only temporal is needed
@@ -674,12 +797,9 @@ class CIDXDaemonService(Service):
                 temporal_indexer.close()
 
                 # Invalidate cache after temporal indexing completes
-                with self.cache_lock:
-                    if self.cache_entry:
-                        logger.info(
-                            "Invalidating cache after temporal indexing completed"
-                        )
-                        self.cache_entry = None
+                self._drop_cache_entry(
+                    project_path, "Invalidating cache after temporal indexing completed"
+                )
 
                 # Return temporal indexing results
                 return {
@@ -773,10 +893,9 @@ class CIDXDaemonService(Service):
             )
 
             # Invalidate cache after indexing completes
-            with self.cache_lock:
-                if self.cache_entry:
-                    logger.info("Invalidating cache after indexing completed")
-                    self.cache_entry = None
+            self._drop_cache_entry(
+                project_path, "Invalidating cache after indexing completed"
+            )
 
             # Return stats dict (NOT a status dict, but actual stats)
             return {
@@ -913,10 +1032,7 @@ class CIDXDaemonService(Service):
             logger.info(f"Kwargs: {kwargs}")
 
             # Invalidate cache BEFORE indexing
-            with self.cache_lock:
-                if self.cache_entry:
-                    logger.info("Invalidating cache before indexing")
-                    self.cache_entry = None
+            self._drop_cache_entry(project_path, "Invalidating cache before indexing")
 
             from code_indexer.services.smart_indexer import SmartIndexer
             from code_indexer.config import ConfigManager
@@ -995,10 +1111,9 @@ class CIDXDaemonService(Service):
                 }
 
             # Invalidate cache after indexing completes so next query loads fresh data
-            with self.cache_lock:
-                if self.cache_entry:
-                    logger.info("Invalidating cache after indexing completed")
-                    self.cache_entry = None
+            self._drop_cache_entry(
+                project_path, "Invalidating cache after indexing completed"
+            )
 
             logger.info("=== BACKGROUND INDEXING THREAD COMPLETED SUCCESSFULLY ===")
 
@@ -1056,6 +1171,14 @@ class CIDXDaemonService(Service):
             self.watch_thread = self.watch_manager.watch_thread
             self.watch_project_path = self.watch_manager.project_path
 
+            # Preload the project's indexes so the first query is warm
+            threading.Thread(
+                target=self._preload_cache,
+                args=(project_path,),
+                name="cidx-cache-preload",
+                daemon=True,
+            ).start()
+
         return result
 
     def exposed_watch_stop(self, project_path: str) -> Dict[str, Any]:
@@ -1125,10 +1248,7 @@ class CIDXDaemonService(Service):
         logger.info(f"exposed_clean: project={project_path}")
 
         # Invalidate cache FIRST
-        with self.cache_lock:
-            if self.cache_entry:
-                logger.info("Invalidating cache before clean")
-                self.cache_entry = None
+        self._drop_cache_entry(project_path, "Invalidating cache before clean")
 
         try:
             from code_indexer.storage.filesystem_vector_store import (
@@ -1189,10 +1309,7 @@ class CIDXDaemonService(Service):
         logger.info(f"exposed_clean_data: project={project_path}")
 
         # Invalidate cache FIRST
-        with self.cache_lock:
-            if self.cache_entry:
-                logger.info("Invalidating cache before clean_data")
-                self.cache_entry = None
+        self._drop_cache_entry(project_path, "Invalidating cache before clean_data")
 
         try:
             from code_indexer.storage.filesystem_vector_store import (
@@ -1252,8 +1369,9 @@ class CIDXDaemonService(Service):
             # Get cache stats
             cache_stats = {}
             with self.cache_lock:
-                if self.cache_entry:
-                    cache_stats = self.cache_entry.get_stats()
+                entry = self.cache_entries.get(Path(project_path))
+                if entry:
+                    cache_stats = entry.get_stats()
                 else:
                     cache_stats = {"cache_loaded": False}
 
@@ -1291,13 +1409,23 @@ class CIDXDaemonService(Service):
         """
         with self.cache_lock:
             cache_status = {}
-            if self.cache_entry:
+            entry = self.cache_entry
+            if entry:
                 cache_status = {
                     "cache_loaded": True,
-                    **self.cache_entry.get_stats(),
+                    **entry.get_stats(),
                 }
             else:
                 cache_status = {"cache_loaded": False}
+            cache_status["cached_projects"] = len(self.cache_entries)
+            cache_status["max_cached_projects"] = self.max_cached_projects
+            cache_status["cache_estimated_bytes"] = sum(
+                e.estimated_bytes for e in self.cache_entries.values()
+            )
+            cache_status["max_cache_bytes"] = self.max_cache_bytes
+            cache_status["cache_entries"] = [
+                e.get_stats() for e in reversed(self.cache_entries.values())
+            ]
 
         # Check indexing status
         with self.indexing_lock_internal:
@@ -1388,51 +1516,152 @@ class CIDXDaemonService(Service):
     # Internal Methods
     # =============================================================================
 
+    @contextmanager
+    def _read_cache_entry(self, project_path: str) -> Iterator[Optional[CacheEntry]]:
+        """Load the cache for project_path and hold its shared read lock.
+
+        The cache_entry reference is read under cache_lock, but the caller's
+        search runs outside it, so concurrent queries are not serialized.
+        A concurrent reload or invalidation swaps the reference instead of
+        mutating this entry, and teardown waits for the read lock to drain.
+
+        Yields:
+            The CacheEntry the query runs against (None if loading failed)
+        """
+        self._ensure_cache_loaded(project_path)
+        with self.cache_lock:
+            entry = self.cache_entries.get(Path(project_path))
+        if entry is None:
+            yield None
+            return
+        entry.rw_lock.acquire_read()
+        try:
+            entry.update_access()
+            yield entry
+        finally:
+            entry.rw_lock.release_read()
+
+    def _retire_cache_entry(self, entry: CacheEntry) -> None:
+        """Tear down a cache entry that has already been swapped out.
+
+        Waits for in-flight readers to release the entry's read lock before
+        clearing its indexes, so a running query never sees them vanish.
+        """
+        entry.rw_lock.acquire_write()
+        try:
+            entry.invalidate()
+        finally:
+            entry.rw_lock.release_write()
+
+    def _current_cache_entry(self, project_path: Path) -> Optional[CacheEntry]:
+        """Return the cache entry for project_path if loaded and not stale.
+
+        AC11: Detects background rebuild via version tracking. A stale entry
+        is swapped out (copy-on-write) and retired; None is returned so the
+        caller reloads.
+        """
+        with self.cache_lock:
+            entry = self.cache_entries.get(project_path)
+            if entry is None:
+                return None
+            self.cache_entries.move_to_end(project_path)
+
+        # Same project - check if rebuild occurred (disk read, outside cache_lock)
+        index_dir = project_path / ".code-indexer" / "index"
+        if index_dir.exists():
+            # Find collection directory (assume single collection)
+            collections = [d for d in index_dir.iterdir() if d.is_dir()]
+            if collections and entry.is_stale_after_rebuild(collections[0]):
+                logger.info("Background rebuild detected, invalidating cache")
+                with self.cache_lock:
+                    if self.cache_entries.get(project_path) is entry:
+                        del self.cache_entries[project_path]
+                self._retire_cache_entry(entry)
+                return None
+        return entry
+
     def _ensure_cache_loaded(self, project_path: str) -> None:
         """Load indexes into cache if not already loaded.
 
         AC11: Detects background rebuild via version tracking and invalidates cache.
+        Loading happens outside cache_lock (serialized by cache_load_lock) and
+        the new entry is swapped in atomically, so queries against an already
+        loaded entry are never blocked by a load.
 
         Args:
             project_path: Path to project root
         """
         project_path_obj = Path(project_path)
 
-        with self.cache_lock:
-            # AC11: Check for staleness after background rebuild
-            if (
-                self.cache_entry is not None
-                and self.cache_entry.project_path == project_path_obj
-            ):
-                # Same project - check if rebuild occurred
-                index_dir = project_path_obj / ".code-indexer" / "index"
-                if index_dir.exists():
-                    # Find collection directory (assume single collection)
-                    collections = [d for d in index_dir.iterdir() if d.is_dir()]
-                    if collections:
-                        collection_path = collections[0]
-                        if self.cache_entry.is_stale_after_rebuild(collection_path):
-                            logger.info(
-                                "Background rebuild detected, invalidating cache"
-                            )
-                            self.cache_entry.invalidate()
-                            self.cache_entry = None
+        if self._current_cache_entry(project_path_obj) is not None:
+            return
 
-            # Check if we need to load or replace cache
-            if (
-                self.cache_entry is None
-                or self.cache_entry.project_path != project_path_obj
-            ):
-                logger.info(f"Loading cache for {project_path}")
+        with self.cache_load_lock:
+            # Another thread may have loaded it while we waited
+            if self._current_cache_entry(project_path_obj) is not None:
+                return
+
+            logger.info(f"Loading cache for {project_path}")
+
+            # Create and populate the new cache entry before publishing it
+            new_entry = CacheEntry(project_path_obj, ttl_minutes=10)
 
-                # Create new cache entry
-                self.cache_entry = CacheEntry(project_path_obj, ttl_minutes=10)
+            # Load semantic indexes
+            self._load_semantic_indexes(new_entry)
 
-                # Load semantic indexes
-                self._load_semantic_indexes(self.cache_entry)
+            # Load FTS indexes
+            self._load_fts_indexes(new_entry)
+
+            new_entry.estimated_bytes = new_entry.estimate_index_bytes()
+            self._install_cache_entry(new_entry)
+
+    def _install_cache_entry(self, entry: CacheEntry) -> None:
+        """Publish entry as most recently used and enforce the LRU bounds.
+
+        Least recently used entries are evicted while more than
+        max_cached_projects are cached or their estimated size exceeds
+        max_cache_bytes. The newest entry is always kept, even if it alone
+        exceeds the byte budget.
+        """
+        evicted: List[CacheEntry] = []
+        with self.cache_lock:
+            self.cache_entries[entry.project_path] = entry
+            self.cache_entries.move_to_end(entry.project_path)
+            total_bytes = sum(e.estimated_bytes for e in self.cache_entries.values())
+            while len(self.cache_entries) > 1 and (
+                len(self.cache_entries) > self.max_cached_projects
+                or total_bytes > self.max_cache_bytes
+            ):
+                _, oldest = self.cache_entries.popitem(last=False)
+                total_bytes -= oldest.estimated_bytes
+                evicted.append(oldest)
+        for old in evicted:
+            logger.info(f"Evicting cached indexes for {old.project_path} (LRU)")
+            self._retire_cache_entry(old)
+
+    def _drop_cache_entry(self, project_path: str, reason: str) -> None:
+        """Remove project_path's cache entry (copy-on-write; readers keep theirs)."""
+        with self.cache_lock:
+            entry = self.cache_entries.pop(Path(project_path), None)
+        if entry is not None:
+            logger.info(reason)
 
-                # Load FTS indexes
-                self._load_fts_indexes(self.cache_entry)
+    def evict_expired_cache_entries(self) -> int:
+        """Drop cache entries whose TTL has expired. Returns entries evicted."""
+        with self.cache_lock:
+            expired = [p for p, e in self.cache_entries.items() if e.is_expired()]
+            for path in expired:
+                del self.cache_entries[path]
+        for path in expired:
+            logger.info(f"Cache expired for {path}, evicting")
+        return len(expired)
+
+    def _preload_cache(self, project_path: str) -> None:
+        """Warm project_path's indexes in the background (best-effort)."""
+        try:
+            self._ensure_cache_loaded(project_path)
+        except Exception as e:
+            logger.warning(f"Cache preload failed for {project_path}: {e}")
 
     def _load_semantic_indexes(self, entry: CacheEntry) -> None:
         """Load REAL HNSW index using HNSWIndexManager.
@@ -1454,8 +1683,16 @@ class CIDXDaemonService(Service):
                 FilesystemVectorStore,
             )
 
+            # Queries search through this store; its index caches hand out
+            # the entry's in-memory HNSW/ID indexes once they are set below.
             vector_store = FilesystemVectorStore(
-                base_path=index_dir, project_root=entry.project_path
+                base_path=index_dir,
+                project_root=entry.project_path,
+                hnsw_index_cache=EntryIndexCache(
+                    entry,
+                    lambda e: (e.hnsw_index, {}) if e.hnsw_index is not None else None,
+                ),
+                id_index_cache=EntryIndexCache(entry, lambda e: e.id_mapping),
             )
             collections = vector_store.list_collections()
 
@@ -1494,6 +1731,7 @@ class CIDXDaemonService(Service):
                 # Store collection metadata for search execution
                 entry.collection_name = collection_name
                 entry.vector_dim = vector_dim
+                entry.vector_store = vector_store
                 # AC11: Track loaded index version for rebuild detection
                 entry.hnsw_index_version = entry._read_index_rebuild_uuid(
                     collection_path
@@ -1527,14 +1765,18 @@ class CIDXDaemonService(Service):
 
             # Lazy import tantivy
             try:
-                import tantivy
+                from code_indexer.services.tantivy_index_manager import (
+                    TantivyIndexManager,
+                )
 
-                # Open REAL Tantivy index
-                tantivy_index = tantivy.Index.open(str(tantivy_dir))
+                # Open REAL Tantivy index (read-only: no writer lock)
+                manager = TantivyIndexManager(tantivy_dir)
+                manager.open_for_search()
+                tantivy_index, tantivy_schema = manager.get_index_for_caching()
                 tantivy_searcher = tantivy_index.searcher()
 
                 # Set FTS indexes
-                entry.set_fts_indexes(tantivy_index, tantivy_searcher)
+                entry.set_fts_indexes(tantivy_index, tantivy_searcher, tantivy_schema)
                 logger.info("FTS indexes loaded successfully")
 
             except ImportError:
@@ -1546,7 +1788,12 @@ class CIDXDaemonService(Service):
             entry.fts_available = False
 
     def _execute_semantic_search(
-        self, project_path: str, query: str, limit: int = 10, **kwargs
+        self,
+        project_path: str,
+        query: str,
+        limit: int = 10,
+        cache_entry: Optional[CacheEntry] = None,
+        **kwargs,
     ) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """Execute REAL semantic search using cached indexes with timing.
 
@@ -1554,6 +1801,8 @@ class CIDXDaemonService(Service):
             project_path: Path to project root
             query: Search query
             limit: Maximum results
+            cache_entry: Leased cache entry; when its semantic indexes are
+                loaded the search runs against them instead of disk
             **kwargs: Additional search parameters
 
         Returns:
@@ -1563,15 +1812,22 @@ class CIDXDaemonService(Service):
             from code_indexer.config import ConfigManager
             from code_indexer.backends.backend_factory import BackendFactory
             from code_indexer.services.embedding_factory import EmbeddingProviderFactory
+            from code_indexer.services.query_embedding_disk_cache import (
+                install_query_embedding_cache,
+            )
 
             # Initialize configuration and services
             config_manager = ConfigManager.create_with_backtrack(Path(project_path))
             config = config_manager.get_config()
+            install_query_embedding_cache(config)
 
             # Create embedding provider and vector store
             embedding_provider = EmbeddingProviderFactory.create(config=config)
-            backend = BackendFactory.create(config, Path(project_path))
-            vector_store = backend.get_vector_store_client()
+            if cache_entry is not None and cache_entry.vector_store is not None:
+                vector_store = cache_entry.vector_store
+            else:
+                backend = BackendFactory.create(config, Path(project_path))
+                vector_store = backend.get_vector_store_client()
 
             # Get collection name
             collection_name = vector_store.resolve_collection_name(
@@ -1712,56 +1968,86 @@ class CIDXDaemonService(Service):
             # Return error in timing_info so it can be propagated to CLI
             return [], {"error": str(e)}
 
+    def _open_fts_manager(
+        self, project_path: str, cache_entry: Optional[CacheEntry] = None
+    ) -> Optional[Any]:
+        """Open the project's Tantivy index for searching.
+
+        Args:
+            project_path: Path to project root
+            cache_entry: Leased cache entry; when its Tantivy index is loaded
+                the search runs against it instead of reopening the index
+
+        Returns:
+            TantivyIndexManager, or None when the project has no FTS index
+        """
+        from code_indexer.services.tantivy_index_manager import TantivyIndexManager
+
+        # Create Tantivy index manager
+        fts_index_dir = Path(project_path) / ".code-indexer" / "tantivy_index"
+        if not fts_index_dir.exists():
+            logger.warning(f"FTS index directory does not exist: {fts_index_dir}")
+            return None
+
+        tantivy_manager = TantivyIndexManager(fts_index_dir)
+        if (
+            cache_entry is not None
+            and cache_entry.tantivy_index is not None
+            and cache_entry.tantivy_schema is not None
+        ):
+            # search() reloads the cached index, so commits made since
+            # it was opened (e.g. by watch mode) are still visible.
+            tantivy_manager.set_cached_index(
+                cache_entry.tantivy_index, cache_entry.tantivy_schema
+            )
+        else:
+            tantivy_manager.initialize_index(create_new=False)
+        return tantivy_manager
+
+    @staticmethod
+    def _fts_search_options(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract TantivyIndexManager search options from RPC kwargs."""
+        return {
+            "edit_distance": kwargs.get("edit_distance", 0),  # 0=exact, >0=fuzzy
+            "case_sensitive": kwargs.get("case_sensitive", False),
+            "use_regex": kwargs.get("use_regex", False),
+            # Default 5, 0 for no snippets
+            "snippet_lines": kwargs.get("snippet_lines", 5),
+            "languages": kwargs.get("languages", []),
+            "exclude_languages": kwargs.get("exclude_languages", []),
+            "path_filters": kwargs.get("path_filters", []),
+            "exclude_paths": kwargs.get("exclude_paths", []),
+        }
+
     def _execute_fts_search(
-        self, project_path: str, query: str, **kwargs
+        self,
+        project_path: str,
+        query: str,
+        cache_entry: Optional[CacheEntry] = None,
+        **kwargs,
     ) -> List[Dict[str, Any]]:
         """Execute REAL FTS search using cached Tantivy index.
 
         Args:
             project_path: Path to project root
             query: Search query
+            cache_entry: Leased cache entry; when its Tantivy index is loaded
+                the search runs against it instead of reopening the index
             **kwargs: Additional search parameters
 
         Returns:
             List of FTS results
         """
         try:
-            from code_indexer.services.tantivy_index_manager import TantivyIndexManager
-
-            # Create Tantivy index manager
-            fts_index_dir = Path(project_path) / ".code-indexer" / "tantivy_index"
-            if not fts_index_dir.exists():
-                logger.warning(f"FTS index directory does not exist: {fts_index_dir}")
+            tantivy_manager = self._open_fts_manager(project_path, cache_entry)
+            if tantivy_manager is None:
                 return []
 
-            tantivy_manager = TantivyIndexManager(fts_index_dir)
-            tantivy_manager.initialize_index(create_new=False)
-
-            # Extract FTS search parameters
-            limit = kwargs.get("limit", 10)
-            edit_distance = kwargs.get("edit_distance", 0)  # 0=exact, >0=fuzzy
-            case_sensitive = kwargs.get("case_sensitive", False)
-            use_regex = kwargs.get("use_regex", False)
-            snippet_lines = kwargs.get(
-                "snippet_lines", 5
-            )  # Default 5, 0 for no snippets
-            languages = kwargs.get("languages", [])
-            exclude_languages = kwargs.get("exclude_languages", [])
-            path_filters = kwargs.get("path_filters", [])
-            exclude_paths = kwargs.get("exclude_paths", [])
-
             # Execute FTS search using TantivyIndexManager
             results = tantivy_manager.search(
                 query_text=query,
-                limit=limit,
-                edit_distance=edit_distance,
-                case_sensitive=case_sensitive,
-                snippet_lines=snippet_lines,  # Pass through snippet_lines parameter
-                use_regex=use_regex,
-                languages=languages,
-                exclude_languages=exclude_languages,
-                path_filters=path_filters,
-                exclude_paths=exclude_paths,
+                limit=kwargs.get("limit", 10),
+                **self._fts_search_options(kwargs),
             )
 
             logger.info(f"FTS search returned {len(results)} results")
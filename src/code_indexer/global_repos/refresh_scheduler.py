@@ -38,6 +38,7 @@ from .query_tracker import QueryTracker
 from .cleanup_manager import CleanupManager
 from .shared_operations import DEFAULT_REFRESH_INTERVAL, GlobalRepoOperations
 from code_indexer.server.repositories.background_jobs import DuplicateJobError
+from code_indexer.server.repositories.repository_stats import update_repository_stats
 from code_indexer.server.repositories.golden_repo_manager import (
     _make_hnsw_orphan_event_logger,
 )
@@ -2270,6 +2271,9 @@ class RefreshScheduler:
                         ),
                         force_reconcile=force_reconcile,
                     )
+                    # Bring the materialized repo stats up to date before the
+                    # snapshot so the new version (and activations) inherit them.
+                    self._update_repository_stats(alias_name, source_path)
                     new_index_path = self._create_snapshot(
                         alias_name=alias_name, source_path=source_path
                     )
@@ -2312,6 +2316,15 @@ class RefreshScheduler:
                             )
                         )
 
+                    # Pooled SCIP engines hold open connections to the old
+                    # snapshot's .scip.db files; drop them with the snapshot.
+                    if current_target:
+                        from code_indexer.server.cache.scip_engine_cache import (
+                            invalidate_scip_engines_under,
+                        )
+
+                        invalidate_scip_engines_under(current_target)
+
                     # Story #236 Fix 1 + Bug #1084 Phase A4: Only schedule cleanup
                     # for versioned snapshots, never for the master golden repo
                     # (golden-repos/{repo}/). On first refresh current_target IS the
@@ -3042,6 +3055,17 @@ class RefreshScheduler:
                 f"Failed to create snapshot for {alias_name}: {type(e).__name__}: {e}"
             )
 
+    def _update_repository_stats(self, alias_name: str, source_path: str) -> None:
+        """Apply this refresh's git diff to the stored repository stats.
+
+        Non-fatal: the stats endpoints recompute on demand when the stored
+        record is missing, so a failure here must not fail the refresh.
+        """
+        try:
+            update_repository_stats(source_path)
+        except Exception as e:
+            logger.warning(f"Failed to update repository stats for {alias_name}: {e}")
+
     def _create_new_index(self, alias_name: str, source_path: str) -> str:
         """
         Create a new versioned index directory with CoW clone and indexing.
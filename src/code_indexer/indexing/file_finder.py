@@ -1,13 +1,21 @@
 """File discovery and filtering for indexing."""
 
 import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator, Dict
+from typing import Iterator, Dict, List, Optional
 import pathspec
 
 from ..config import Config
 from ..services.override_filter_service import OverrideFilterService
 
+# Bounded concurrency for per-file stat/text sniffing during git-index discovery
+DISCOVERY_MAX_WORKERS = 16
+
+# Upper bound for a single ``git ls-files`` call before falling back to os.walk
+GIT_LS_FILES_TIMEOUT = 300
+
 
 class FileFinder:
     """Finds and filters files for indexing based on configuration."""
@@ -225,19 +233,13 @@ class FileFinder:
             return False
 
     def find_files(self) -> Iterator[Path]:
-        """Find all files that should be indexed."""
-        # Debug logging
-        import datetime
-
-        debug_file = os.path.expanduser("~/.tmp/cidx_debug.log")
-        os.makedirs(os.path.dirname(debug_file), exist_ok=True)
-
-        with open(debug_file, "a") as f:
-            f.write(
-                f"[{datetime.datetime.now().isoformat()}] FileFinder.find_files started for {self.config.codebase_dir}\n"
-            )
-            f.flush()
+        """Find all files that should be indexed.
 
+        When the codebase root is a git work tree, candidates come from the
+        git index (tracked plus untracked-not-ignored files) instead of a
+        directory walk; see _find_files_from_git. Otherwise, or if git is
+        unavailable, the tree is walked with os.walk.
+        """
         if not self.config.codebase_dir.exists():
             raise ValueError(
                 f"Codebase directory does not exist: {self.config.codebase_dir}"
@@ -248,7 +250,140 @@ class FileFinder:
                 f"Codebase path is not a directory: {self.config.codebase_dir}"
             )
 
-        for root, dirs, files in os.walk(self.config.codebase_dir):
+        git_files = self._find_files_from_git()
+        if git_files is not None:
+            yield from git_files
+            return
+
+        yield from self._walk_files(self.config.codebase_dir)
+
+    def _git_ls_files(self, *options: str) -> Optional[List[str]]:
+        """Run ``git ls-files -z`` in the codebase root; None on any failure."""
+        try:
+            result = subprocess.run(
+                ["git", "ls-files", "-z", *options],
+                cwd=self.config.codebase_dir,
+                capture_output=True,
+                timeout=GIT_LS_FILES_TIMEOUT,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        if result.returncode != 0:
+            return None
+        return [
+            entry
+            for entry in result.stdout.decode("utf-8", errors="surrogateescape").split(
+                "\0"
+            )
+            if entry
+        ]
+
+    def _submodule_paths(self) -> List[str]:
+        """Submodule paths from .gitmodules (gitlinks list as bare directories)."""
+        if not (self.config.codebase_dir / ".gitmodules").exists():
+            return []
+        try:
+            result = subprocess.run(
+                [
+                    "git",
+                    "config",
+                    "--file",
+                    ".gitmodules",
+                    "--get-regexp",
+                    r"^submodule\..*\.path$",
+                ],
+                cwd=self.config.codebase_dir,
+                capture_output=True,
+                text=True,
+                timeout=GIT_LS_FILES_TIMEOUT,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return []
+        return [
+            line.split(" ", 1)[1] for line in result.stdout.splitlines() if " " in line
+        ]
+
+    def _find_files_from_git(self) -> Optional[List[Path]]:
+        """Discover files from the git index.
+
+        ``git ls-files --cached --others --exclude-standard`` already applies
+        every .gitignore, .git/info/exclude and core.excludesFile rule, so
+        only the cidx include/exclude and override rules are left to
+        evaluate. Those are pure path matches; the remaining per-file work
+        (stat for max_file_size, text sniffing) runs on a bounded thread pool.
+
+        Directories that git does not descend into (untracked nested repos,
+        submodules) are walked with the regular os.walk logic. Paths that git
+        ignores are only considered when force_include_patterns could match
+        them.
+
+        Returns:
+            Matching files in git's path order, or None if the codebase root
+            is not a git work tree or git failed.
+        """
+        if not (self.config.codebase_dir / ".git").exists():
+            return None
+
+        entries = self._git_ls_files("--cached", "--others", "--exclude-standard")
+        if entries is None:
+            return None
+
+        walk_dirs = [e.rstrip("/") for e in entries if e.endswith("/")]
+        walk_dirs.extend(self._submodule_paths())
+        walk_dir_set = set(walk_dirs)
+        candidates = [
+            e
+            for e in dict.fromkeys(entries)
+            if not e.endswith("/") and e not in walk_dir_set
+        ]
+
+        if self._force_include_spec is not None:
+            ignored = self._git_ls_files("--others", "--ignored", "--exclude-standard")
+            for entry in ignored or []:
+                if not entry.endswith("/") and self._force_include_spec.match_file(
+                    entry
+                ):
+                    candidates.append(entry)
+
+        # Cheap path-only pre-filter before any filesystem access
+        paths = [
+            self.config.codebase_dir / entry
+            for entry in candidates
+            if self._may_include_path(entry)
+        ]
+
+        found: List[Path] = []
+        if paths:
+            workers = min(DISCOVERY_MAX_WORKERS, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for path, include in zip(
+                    paths, executor.map(self._should_include_file, paths)
+                ):
+                    if include and path.is_file():
+                        found.append(path)
+
+        for walk_dir in walk_dirs:
+            walk_path = self.config.codebase_dir / walk_dir
+            if walk_path.is_dir() and not self.exclude_spec.match_file(walk_dir + "/"):
+                found.extend(self._walk_files(walk_path))
+
+        return found
+
+    def _may_include_path(self, relative_path: str) -> bool:
+        """Path-only part of _should_include_file (no stat, no file reads)."""
+        suffix = Path(relative_path).suffix.lstrip(".")
+        base_ok = suffix in self.config.file_extensions and not (
+            self.exclude_spec.match_file(relative_path)
+        )
+        if self.override_filter_service:
+            return self.override_filter_service.should_include_file(
+                Path(relative_path), base_ok
+            )
+        return base_ok
+
+    def _walk_files(self, start_dir: Path) -> Iterator[Path]:
+        """Walk *start_dir* with os.walk, pruning excluded directories."""
+        for root, dirs, files in os.walk(start_dir):
             root_path = Path(root)
 
             # Filter directories to avoid walking into excluded ones
@@ -292,15 +427,6 @@ class FileFinder:
             # Process files in current directory
             for file_name in files:
                 file_path = root_path / file_name
-
-                # Debug: Log file being checked
-                if file_name == "ruff_output.json" or file_path.stat().st_size > 500000:
-                    with open(debug_file, "a") as f:
-                        f.write(
-                            f"[{datetime.datetime.now().isoformat()}] Checking large file: {file_path} ({file_path.stat().st_size} bytes)\n"
-                        )
-                        f.flush()
-
                 if self._should_include_file(file_path):
                     yield file_path
 
@@ -21,6 +21,7 @@ from .command_validator import (
 )
 from .result_aggregator import ParallelResultAggregator
 from .cli_integration import execute_proxy_command
+from .native_query import NativeProxyQueryEngine
 from .watch_manager import ParallelWatchManager
 from .output_multiplexer import OutputMultiplexer
 from .repository_formatter import RepositoryPrefixFormatter
@@ -42,6 +43,7 @@ __all__ = [
     "UnsupportedProxyCommandError",
     "ParallelResultAggregator",
     "execute_proxy_command",
+    "NativeProxyQueryEngine",
     "ParallelWatchManager",
     "OutputMultiplexer",
     "RepositoryPrefixFormatter",
@@ -17,6 +17,11 @@ from .sequential_executor import SequentialCommandExecutor
 from .result_aggregator import ParallelResultAggregator
 from .query_aggregator import QueryResultAggregator
 from .rich_format_aggregator import RichFormatAggregator
+from .native_query import (
+    NativeProxyQueryEngine,
+    NativeQueryArgs,
+    parse_native_query_args,
+)
 from .command_config import is_parallel_command
 from .command_validator import validate_proxy_command, UnsupportedProxyCommandError
 from .watch_manager import ParallelWatchManager
@@ -158,6 +163,12 @@ def _execute_query(args: List[str], repo_paths: List[str]) -> int:
     Returns:
         Exit code: 0 (success with results), 1 (all failed), 2 (partial success)
     """
+    native_args = parse_native_query_args(args)
+    if native_args is not None:
+        engine = NativeProxyQueryEngine(repo_paths)
+        if engine.prepare():
+            return _execute_native_query(engine, native_args, len(repo_paths))
+
     # Extract limit parameter from args (Story 3.3)
     limit = _extract_limit_from_args(args)
 
@@ -216,6 +227,42 @@ def _execute_query(args: List[str], repo_paths: List[str]) -> int:
         return 2  # Partial success
 
 
+def _execute_native_query(
+    engine: NativeProxyQueryEngine, native_args: NativeQueryArgs, repo_count: int
+) -> int:
+    """Run a query in-process with one shared query embedding.
+
+    Results are already QueryResult objects, so the aggregators only format
+    them; no subprocess output is parsed.
+
+    Returns:
+        Exit code: 0 (all success), 1 (all failed), 2 (partial success)
+    """
+    results, errors = engine.execute(native_args)
+
+    if native_args.quiet:
+        output = QueryResultAggregator().format_results(results)
+    else:
+        output = RichFormatAggregator().format_results(results)
+
+    if output:
+        console.print(output, end="", markup=False)
+    else:
+        console.print("No results found across all repositories", style="yellow")
+
+    for repo_path, error in errors.items():
+        console.print(
+            f"⚠️  Query failed in {Path(repo_path).name}: {error}", style="yellow"
+        )
+
+    if not errors:
+        return 0
+    elif len(errors) == repo_count:
+        return 1
+    else:
+        return 2
+
+
 def _extract_limit_from_args(args: List[str]) -> Optional[int]:
     """Extract --limit parameter from query arguments.
 
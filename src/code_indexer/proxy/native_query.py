@@ -0,0 +1,361 @@
+"""In-process query fan-out for proxy mode.
+
+The subprocess fan-out (ParallelCommandExecutor) starts one ``cidx query``
+per repository. Each child re-imports the CLI, re-creates the embedding
+provider and embeds the same query text again, and its output then has to be
+parsed back into QueryResult objects by the aggregators.
+
+NativeProxyQueryEngine does the same work in the proxy process:
+1. Load each repository's config, vector store and collection name
+2. Embed the query once per distinct (provider, model) across repositories
+3. Search every repository's collection concurrently with the shared vector
+4. Apply the same git-aware branch filtering and min-score cut as ``cidx query``
+5. Merge by score and apply the global limit
+
+Only the common query options are handled natively. ``prepare()`` returns
+None for anything else (FTS/hybrid/temporal flags, multimodal indexes,
+unreadable configs), and the caller falls back to the subprocess path.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .constants import DEFAULT_QUERY_LIMIT
+from .parallel_executor import ParallelCommandExecutor
+from .query_result import QueryResult
+
+logger = logging.getLogger(__name__)
+
+# Options taking a value that the native engine understands
+_VALUE_OPTIONS = {
+    "--limit": "limit",
+    "-l": "limit",
+    "--language": "languages",
+    "--path-filter": "path_filters",
+    "--exclude-language": "exclude_languages",
+    "--exclude-path": "exclude_paths",
+    "--min-score": "min_score",
+}
+_FLAG_OPTIONS = {"--quiet", "-q", "--semantic"}
+
+
+@dataclass
+class NativeQueryArgs:
+    """Query options supported by the in-process engine."""
+
+    query_text: str
+    limit: int = DEFAULT_QUERY_LIMIT
+    quiet: bool = False
+    min_score: Optional[float] = None
+    languages: List[str] = field(default_factory=list)
+    path_filters: List[str] = field(default_factory=list)
+    exclude_languages: List[str] = field(default_factory=list)
+    exclude_paths: List[str] = field(default_factory=list)
+
+
+def parse_native_query_args(args: List[str]) -> Optional[NativeQueryArgs]:
+    """Parse ``cidx query`` arguments, or return None if any is unsupported."""
+    query_parts: List[str] = []
+    values: Dict[str, List[str]] = {}
+    quiet = False
+
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        name, sep, inline_value = arg.partition("=")
+        if name in _VALUE_OPTIONS:
+            if sep:
+                value = inline_value
+            elif i + 1 < len(args):
+                i += 1
+                value = args[i]
+            else:
+                return None
+            values.setdefault(_VALUE_OPTIONS[name], []).append(value)
+        elif arg in _FLAG_OPTIONS:
+            quiet = quiet or arg in ("--quiet", "-q")
+        elif arg.startswith("-"):
+            return None
+        else:
+            query_parts.append(arg)
+        i += 1
+
+    if len(query_parts) != 1:
+        return None
+
+    try:
+        limit = int(values["limit"][-1]) if "limit" in values else None
+        min_score = float(values["min_score"][-1]) if "min_score" in values else None
+    except ValueError:
+        return None
+
+    return NativeQueryArgs(
+        query_text=query_parts[0],
+        limit=DEFAULT_QUERY_LIMIT if limit is None else limit,
+        quiet=quiet,
+        min_score=min_score,
+        languages=values.get("languages", []),
+        path_filters=values.get("path_filters", []),
+        exclude_languages=values.get("exclude_languages", []),
+        exclude_paths=values.get("exclude_paths", []),
+    )
+
+
+@dataclass
+class _RepoTarget:
+    """Everything needed to search one repository in-process."""
+
+    repo_path: str
+    config: Any
+    embedding_provider: Any
+    vector_store: Any
+    collection_name: str
+    git_aware: bool
+    current_branch: Optional[str]
+
+    @property
+    def embedding_key(self) -> Tuple[str, str]:
+        return (
+            self.embedding_provider.get_provider_name(),
+            self.embedding_provider.get_current_model(),
+        )
+
+
+class NativeProxyQueryEngine:
+    """Run a proxy-mode semantic query across repositories in one process."""
+
+    def __init__(self, repo_paths: List[str], max_workers: Optional[int] = None):
+        self.repo_paths = repo_paths
+        self.max_workers = max_workers or ParallelCommandExecutor.MAX_WORKERS
+        self._targets: List[_RepoTarget] = []
+        self.errors: Dict[str, str] = {}
+
+    def prepare(self) -> bool:
+        """Open every repository's index.
+
+        Returns:
+            False if any repository cannot be served in-process, in which case
+            the caller should use the subprocess fan-out instead.
+        """
+        targets = []
+        for repo_path in self.repo_paths:
+            try:
+                target = self._open_repository(repo_path)
+            except Exception as e:
+                logger.debug(f"Native query unavailable for {repo_path}: {e}")
+                return False
+            if target is None:
+                return False
+            targets.append(target)
+        self._targets = targets
+        return True
+
+    def _open_repository(self, repo_path: str) -> Optional[_RepoTarget]:
+        from ..backends.backend_factory import BackendFactory
+        from ..config import ConfigManager
+        from ..services.embedding_factory import EmbeddingProviderFactory
+        from ..services.git_topology_service import GitTopologyService
+        from ..services.multi_index_query_service import MultiIndexQueryService
+
+        config_path = Path(repo_path) / ".code-indexer" / "config.json"
+        if not config_path.exists():
+            return None
+        config = ConfigManager(config_path).load()
+
+        embedding_provider = EmbeddingProviderFactory.create(config)
+        backend = BackendFactory.create(
+            config=config, project_root=Path(config.codebase_dir)
+        )
+        vector_store = backend.get_vector_store_client()
+
+        # Multimodal repositories need a second provider and merge; leave
+        # those to the full CLI path.
+        if MultiIndexQueryService(
+            Path(repo_path), vector_store, embedding_provider
+        ).has_multimodal_index():
+            return None
+
+        git_topology = GitTopologyService(config.codebase_dir)
+        git_aware = git_topology.is_git_available()
+        return _RepoTarget(
+            repo_path=repo_path,
+            config=config,
+            embedding_provider=embedding_provider,
+            vector_store=vector_store,
+            collection_name=vector_store.resolve_collection_name(
+                config, embedding_provider
+            ),
+            git_aware=git_aware,
+            current_branch=git_topology.get_current_branch() if git_aware else None,
+        )
+
+    def execute(
+        self, query: NativeQueryArgs
+    ) -> Tuple[List[QueryResult], Dict[str, str]]:
+        """Embed once, search all prepared repositories, merge by score.
+
+        Returns:
+            Tuple of (merged results, {repo_path: error message} for failures)
+        """
+        self.errors = {}
+        query_vectors = self._embed_query(query.query_text)
+        filter_conditions = build_filter_conditions(query)
+
+        all_results: List[QueryResult] = []
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, max(len(self._targets), 1))
+        ) as executor:
+            futures = {}
+            for target in self._targets:
+                vector = query_vectors.get(target.embedding_key)
+                if vector is None:
+                    self.errors[target.repo_path] = "Query embedding failed"
+                    continue
+                futures[target.repo_path] = executor.submit(
+                    self._search_repository, target, vector, query, filter_conditions
+                )
+
+            for repo_path, future in futures.items():
+                try:
+                    all_results.extend(future.result())
+                except Exception as e:
+                    logger.warning(f"Query failed for {repo_path}: {e}")
+                    self.errors[repo_path] = str(e)
+
+        all_results.sort(key=lambda r: r.score, reverse=True)
+        if query.limit and query.limit > 0:
+            all_results = all_results[: query.limit]
+        return all_results, dict(self.errors)
+
+    def _embed_query(self, query_text: str) -> Dict[Tuple[str, str], List[float]]:
+        """One embedding call per distinct (provider, model) pair."""
+        vectors: Dict[Tuple[str, str], List[float]] = {}
+        for target in self._targets:
+            key = target.embedding_key
+            if key in vectors:
+                continue
+            try:
+                vectors[key] = target.embedding_provider.get_embedding(
+                    query_text, embedding_purpose="query"
+                )
+            except Exception as e:
+                logger.warning(f"Failed to embed query with {key[0]}/{key[1]}: {e}")
+        return vectors
+
+    def _search_repository(
+        self,
+        target: _RepoTarget,
+        query_vector: List[float],
+        query: NativeQueryArgs,
+        filter_conditions: Dict[str, Any],
+    ) -> List[QueryResult]:
+        from ..services.generic_query_service import GenericQueryService
+
+        conditions = dict(filter_conditions)
+        if target.git_aware:
+            conditions["must"] = [
+                {"key": "git_available", "match": {"value": True}}
+            ] + conditions.get("must", [])
+
+        raw_results = target.vector_store.search(
+            query=query.query_text,
+            embedding_provider=target.embedding_provider,
+            collection_name=target.collection_name,
+            limit=query.limit * 2,
+            filter_conditions=conditions or None,
+            precomputed_query_vector=query_vector,
+        )
+        results = GenericQueryService(
+            target.config.codebase_dir, target.config
+        ).filter_results_by_current_branch(raw_results)
+        if query.min_score:
+            results = [r for r in results if r.get("score", 0) >= query.min_score]
+
+        repo_name = Path(target.repo_path).name
+        return [
+            _to_query_result(result, target, repo_name)
+            for result in results[: query.limit]
+        ]
+
+
+def build_filter_conditions(query: NativeQueryArgs) -> Dict[str, Any]:
+    """Build vector store filter conditions the way ``cidx query`` does."""
+    from ..services.language_mapper import LanguageMapper
+    from ..services.language_validator import LanguageValidator
+
+    language_mapper = LanguageMapper()
+    language_validator = LanguageValidator()
+    must: List[Dict[str, Any]] = []
+    must_not: List[Dict[str, Any]] = []
+
+    language_filters = [
+        language_mapper.build_language_filter(lang)
+        for lang in query.languages
+        if language_validator.validate_language(lang).is_valid
+    ]
+    if len(language_filters) > 1:
+        must.append({"should": language_filters})
+    else:
+        must.extend(language_filters)
+
+    path_filters = [{"key": "path", "match": {"text": pf}} for pf in query.path_filters]
+    if len(path_filters) > 1:
+        must.append({"should": path_filters})
+    else:
+        must.extend(path_filters)
+
+    for lang in query.exclude_languages:
+        if not language_validator.validate_language(lang).is_valid:
+            continue
+        for ext in language_mapper.get_extensions(lang):
+            must_not.append({"key": "language", "match": {"value": ext}})
+
+    if query.exclude_paths:
+        from ..services.path_filter_builder import PathFilterBuilder
+
+        must_not.extend(
+            PathFilterBuilder()
+            .build_exclusion_filter(list(query.exclude_paths))
+            .get("must_not", [])
+        )
+
+    conditions: Dict[str, Any] = {}
+    if must:
+        conditions["must"] = must
+    if must_not:
+        conditions["must_not"] = must_not
+    return conditions
+
+
+def _to_query_result(
+    result: Dict[str, Any], target: _RepoTarget, repo_name: str
+) -> QueryResult:
+    """Convert a vector store hit to the QueryResult the aggregators format."""
+    payload = result.get("payload", {})
+    line_start = payload.get("line_start") or 1
+    line_end = payload.get("line_end") or line_start
+    content = payload.get("content", "")
+    numbered = "\n".join(
+        f"{line_start + j:3}: {line}" for j, line in enumerate(content.split("\n"))
+    )
+
+    commit = payload.get("git_commit_hash")
+    if commit and len(commit) > 8:
+        commit = commit[:8] + "..."
+
+    return QueryResult(
+        score=round(float(result.get("score", 0.0)), 3),
+        file_path=f"{repo_name}/{payload.get('path', 'unknown')}",
+        line_range=(line_start, line_end),
+        content=numbered if content else "",
+        repository=target.repo_path,
+        language=payload.get("language"),
+        size=payload.get("file_size"),
+        indexed_timestamp=payload.get("indexed_at"),
+        branch=target.current_branch,
+        commit=commit,
+        project_name=payload.get("project_id"),
+    )
@@ -111,6 +111,14 @@ class QueryResultAggregator:
         ]
         return any(indicator in output for indicator in error_indicators)
 
+    def format_results(self, results: List[QueryResult]) -> str:
+        """Format already merged, sorted and limited results.
+
+        Used by the in-process proxy query path, which produces QueryResult
+        objects directly instead of subprocess output to parse.
+        """
+        return self._format_results(results)
+
     def _format_results(self, results: List[QueryResult]) -> str:
         """Format results for output matching single-repo query format.
 
@@ -12,6 +12,10 @@ except ImportError:
 
 from .primitives import QueryResult
 
+# Read-path tuning for pooled engines (see enable_query_only_mode).
+DEFAULT_QUERY_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+DEFAULT_QUERY_CACHE_SIZE_KIB = 64 * 1024
+
 
 @dataclass
 class ImpactResult:
@@ -147,7 +151,11 @@ class DatabaseBackend(SCIPBackend):
             scip_file: Optional path to .scip protobuf file for hybrid mode (ALL symbol references)
         """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        # check_same_thread=False: pooled engines (see
+        # server/cache/scip_engine_cache.py) are leased exclusively to one
+        # thread at a time but may be leased by different threads over their
+        # lifetime.
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.project_root = project_root
         self.scip_file = scip_file
 
@@ -185,6 +193,33 @@ class DatabaseBackend(SCIPBackend):
         ensure_indexes_created(self.conn)
         update_scip_db_version(config_path, 2)
 
+    def enable_query_only_mode(
+        self,
+        mmap_size_bytes: int = DEFAULT_QUERY_MMAP_SIZE_BYTES,
+        cache_size_kib: int = DEFAULT_QUERY_CACHE_SIZE_KIB,
+    ) -> None:
+        """
+        Tune the connection for long-lived, read-only query use.
+
+        Must be called AFTER _ensure_migration_complete() because query_only
+        forbids the CREATE INDEX statements the migration may issue.
+
+        Args:
+            mmap_size_bytes: PRAGMA mmap_size value (memory-mapped I/O window)
+            cache_size_kib: Page cache size in KiB (applied as negative cache_size)
+        """
+        self.conn.execute(f"PRAGMA mmap_size = {int(mmap_size_bytes)}")
+        self.conn.execute(f"PRAGMA cache_size = -{int(cache_size_kib)}")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute("PRAGMA query_only = ON")
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection (idempotent)."""
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
     def _read_context_lines(self, results: List[QueryResult]) -> None:
         """
         Populate the ``context`` field on each result with the source line from disk.
@@ -231,6 +231,10 @@ class SCIPQueryEngine:
         )
         self.db_conn = self.backend.conn
 
+    def close(self) -> None:
+        """Close the database connection held by this engine."""
+        self.backend.close()
+
     def find_definition(self, symbol: str, exact: bool = False) -> List[QueryResult]:
         """
         Find definition locations for a symbol.
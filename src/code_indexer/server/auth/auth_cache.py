@@ -0,0 +1,235 @@
+"""
+Short-lived cache for the authentication hot path.
+
+Every MCP request authenticated with client credentials runs a full
+password-hash verify of the client secret (``MCPCredentialManager.
+verify_credential``), and every JWT / OAuth / MCP request then loads the
+user with ``UserManager.get_user`` -- which on the SQLite backend also loads
+the user's API keys and MCP credentials. Agents issue dozens of tool calls
+per second with the same credentials, so this module keeps two small
+in-process maps:
+
+- verified principals: HMAC(client_id, client_secret) -> username. The
+  digest uses a random per-process key and the plain secret is never
+  stored; a hit skips the credential lookup and the hash verify.
+- users: username -> User.
+
+Both maps are bounded LRUs with a short TTL (default 30s). ``UserManager``
+invalidates a user's entries whenever its password, role, identity or MCP
+credentials change, or the user is deleted. Each invalidation bumps a
+cache-wide generation and entries loaded before the bump are not stored,
+so a lookup racing with a revocation cannot re-populate a stale entry
+(invalidations are rare admin actions, so the coarse generation costs
+almost nothing). The TTL bounds staleness for changes made by another
+process or cluster node.
+
+Authentication latency (cache hits and misses alike) is recorded per
+method and exported together with the cache counters as ``cidx.auth.*``
+OTEL gauges (server/services/auth_cache_otel_metrics.py).
+"""
+
+import hashlib
+import hmac
+import os
+import secrets
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import TYPE_CHECKING, Deque, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .user_manager import User
+
+# Latency samples kept per auth method for the percentile gauges
+_LATENCY_WINDOW = 1024
+
+
+@dataclass
+class AuthCacheConfig:
+    """Configuration for the authentication cache."""
+
+    enabled: bool = True
+    ttl_seconds: float = 30.0
+    max_entries: int = 10_000
+
+    def __post_init__(self) -> None:
+        if self.ttl_seconds < 0:
+            raise ValueError(f"ttl_seconds must be >= 0, got {self.ttl_seconds}")
+        if self.max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {self.max_entries}")
+
+    @classmethod
+    def from_env(cls) -> "AuthCacheConfig":
+        """Create config from environment variables.
+
+        Supported env vars:
+        - CIDX_AUTH_CACHE_ENABLED  (default true)
+        - CIDX_AUTH_CACHE_TTL_SECONDS  (default 30)
+        - CIDX_AUTH_CACHE_MAX_ENTRIES  (default 10000)
+        """
+        enabled = os.environ.get("CIDX_AUTH_CACHE_ENABLED", "true")
+        return cls(
+            enabled=enabled.strip().lower() not in ("0", "false", "no", "off"),
+            ttl_seconds=float(os.environ.get("CIDX_AUTH_CACHE_TTL_SECONDS", "30")),
+            max_entries=int(os.environ.get("CIDX_AUTH_CACHE_MAX_ENTRIES", "10000")),
+        )
+
+
+@dataclass
+class AuthCacheStats:
+    """Statistics for authentication cache monitoring."""
+
+    enabled: bool
+    principal_entries: int
+    user_entries: int
+    hit_count: int
+    miss_count: int
+    hit_ratio: float
+    invalidation_count: int
+    # method -> {"count", "p50_ms", "p95_ms"} over the recent sample window
+    auth_latency: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+
+class AuthCache:
+    """Thread-safe TTL + LRU cache of verified principals and users."""
+
+    def __init__(self, config: Optional[AuthCacheConfig] = None) -> None:
+        self.config = config or AuthCacheConfig()
+        self._digest_key = secrets.token_bytes(32)
+        self._principals: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        self._users: "OrderedDict[str, Tuple[User, float]]" = OrderedDict()
+        self._generation = 0
+        self._lock = Lock()
+        self._hit_count = 0
+        self._miss_count = 0
+        self._invalidation_count = 0
+        self._auth_counts: Dict[str, int] = {}
+        self._latencies: Dict[str, Deque[float]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled and self.config.ttl_seconds > 0
+
+    def _principal_key(self, client_id: str, client_secret: str) -> bytes:
+        message = f"{client_id}\x00{client_secret}".encode("utf-8", "surrogatepass")
+        return hmac.new(self._digest_key, message, hashlib.sha256).digest()
+
+    def generation(self) -> int:
+        """Snapshot the generation before loading data to cache."""
+        with self._lock:
+            return self._generation
+
+    def get_principal(self, client_id: str, client_secret: str) -> Optional[str]:
+        """Return the username of a recently verified credential, or None."""
+        if not self.enabled:
+            return None
+        key = self._principal_key(client_id, client_secret)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._principals.get(key)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._principals[key]
+                self._miss_count += 1
+                return None
+            self._principals.move_to_end(key)
+            self._hit_count += 1
+            return entry[0]
+
+    def put_principal(
+        self,
+        client_id: str,
+        client_secret: str,
+        username: str,
+        generation: int,
+    ) -> None:
+        """Remember a verified credential loaded at ``generation``."""
+        if not self.enabled:
+            return
+        key = self._principal_key(client_id, client_secret)
+        expires = time.monotonic() + self.config.ttl_seconds
+        with self._lock:
+            if self._generation != generation:
+                return
+            self._principals[key] = (username, expires)
+            self._principals.move_to_end(key)
+            while len(self._principals) > self.config.max_entries:
+                self._principals.popitem(last=False)
+
+    def get_user(self, username: str) -> Optional["User"]:
+        """Return a cached User, or None on miss/expiry."""
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._users.get(username)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._users[username]
+                self._miss_count += 1
+                return None
+            self._users.move_to_end(username)
+            self._hit_count += 1
+            return entry[0]
+
+    def put_user(self, user: "User", generation: int) -> None:
+        """Remember a User loaded at ``generation``."""
+        if not self.enabled:
+            return
+        expires = time.monotonic() + self.config.ttl_seconds
+        with self._lock:
+            if self._generation != generation:
+                return
+            self._users[user.username] = (user, expires)
+            self._users.move_to_end(user.username)
+            while len(self._users) > self.config.max_entries:
+                self._users.popitem(last=False)
+
+    def invalidate_user(self, username: str) -> None:
+        """Drop every entry of ``username`` and reject in-flight loads."""
+        with self._lock:
+            self._generation += 1
+            self._users.pop(username, None)
+            stale = [k for k, v in self._principals.items() if v[0] == username]
+            for key in stale:
+                del self._principals[key]
+            self._invalidation_count += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry (counters are kept)."""
+        with self._lock:
+            self._generation += 1
+            self._principals.clear()
+            self._users.clear()
+
+    def record_auth(self, method: str, duration_seconds: float) -> None:
+        """Record the end-to-end latency of one authentication."""
+        with self._lock:
+            self._auth_counts[method] = self._auth_counts.get(method, 0) + 1
+            samples = self._latencies.get(method)
+            if samples is None:
+                samples = self._latencies[method] = deque(maxlen=_LATENCY_WINDOW)
+            samples.append(duration_seconds * 1000)
+
+    def get_stats(self) -> AuthCacheStats:
+        with self._lock:
+            lookups = self._hit_count + self._miss_count
+            latency: Dict[str, Dict[str, float]] = {}
+            for method, samples in self._latencies.items():
+                ordered = sorted(samples)
+                latency[method] = {
+                    "count": float(self._auth_counts[method]),
+                    "p50_ms": ordered[len(ordered) // 2],
+                    "p95_ms": ordered[min(len(ordered) - 1, len(ordered) * 95 // 100)],
+                }
+            return AuthCacheStats(
+                enabled=self.enabled,
+                principal_entries=len(self._principals),
+                user_entries=len(self._users),
+                hit_count=self._hit_count,
+                miss_count=self._miss_count,
+                hit_ratio=self._hit_count / lookups if lookups else 0.0,
+                invalidation_count=self._invalidation_count,
+                auth_latency=latency,
+            )
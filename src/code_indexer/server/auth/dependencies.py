@@ -11,9 +11,11 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from functools import wraps
 from datetime import datetime, timezone
 import base64
+import time
 
 import logging
 
+from .auth_cache import AuthCache
 from .jwt_manager import JWTManager, TokenExpiredError, InvalidTokenError
 from .user_manager import UserManager, User
 from .api_key_manager import ApiKeyManager
@@ -105,6 +107,27 @@ def _check_non_sso_api_restriction(user: User) -> None:
         )
 
 
+def _auth_cache() -> Optional[AuthCache]:
+    """The user manager's AuthCache, or None (e.g. stub user managers)."""
+    cache = getattr(user_manager, "auth_cache", None)
+    return cache if isinstance(cache, AuthCache) else None
+
+
+def _get_auth_user(username: str) -> Optional[User]:
+    """Load the authenticated user through the short-lived auth cache."""
+    assert user_manager is not None
+    if _auth_cache() is not None:
+        return user_manager.get_user_cached(username)
+    return user_manager.get_user(username)
+
+
+def _record_auth_latency(method: str, started: float) -> None:
+    """Record one authentication's latency (``cidx.auth.latency.*``)."""
+    cache = _auth_cache()
+    if cache is not None:
+        cache.record_auth(method, time.perf_counter() - started)
+
+
 def _validate_jwt_and_get_user(token: str) -> User:
     """Validate JWT token and return User object or raise HTTPException 401."""
     if not jwt_manager or not user_manager:
@@ -113,6 +136,7 @@ def _validate_jwt_and_get_user(token: str) -> User:
             detail="Authentication not properly initialized",
         )
 
+    started = time.perf_counter()
     try:
         payload = jwt_manager.validate_token(token)
         username = payload.get("username")
@@ -135,7 +159,7 @@ def _validate_jwt_and_get_user(token: str) -> User:
                 headers={"WWW-Authenticate": _build_www_authenticate_header()},
             )
 
-        user = user_manager.get_user(username)
+        user = _get_auth_user(username)
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -143,6 +167,7 @@ def _validate_jwt_and_get_user(token: str) -> User:
                 headers={"WWW-Authenticate": _build_www_authenticate_header()},
             )
 
+        _record_auth_latency("jwt", started)
         return user
 
     except TokenExpiredError:
@@ -280,18 +305,20 @@ def get_current_user(
 
     # Try OAuth token validation first (if oauth_manager is available)
     if oauth_manager:
+        started = time.perf_counter()
         oauth_result = oauth_manager.validate_token(token)
         if oauth_result:
             # Valid OAuth token - get user
             username = oauth_result.get("user_id")
             if username:
-                user = user_manager.get_user(username)  # type: ignore[assignment]
+                user = _get_auth_user(username)  # type: ignore[assignment]
                 if user is None:
                     raise HTTPException(
                         status_code=status.HTTP_401_UNAUTHORIZED,
                         detail="User not found",
                         headers={"WWW-Authenticate": _build_www_authenticate_header()},
                     )
+                _record_auth_latency("oauth", started)
                 _check_non_sso_api_restriction(user)
                 return user
 
@@ -440,6 +467,7 @@ async def get_mcp_user_from_credentials(request: Request) -> Optional[User]:
         return None
 
     # Verify credentials using MCPCredentialManager (AC3-AC5)
+    started = time.perf_counter()
     user_id = mcp_credential_manager.verify_credential(client_id, client_secret)
 
     if not user_id:
@@ -451,13 +479,14 @@ async def get_mcp_user_from_credentials(request: Request) -> Optional[User]:
         )
 
     # Get User object
-    user = user_manager.get_user(user_id)
+    user = _get_auth_user(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
             headers={"WWW-Authenticate": _build_www_authenticate_header()},
         )
+    _record_auth_latency("mcp_credentials", started)
 
     # v10.4.7: OAuth-MCP sessions are pre-elevated by virtue of holding the
     # credential. The credential was provisioned by a TOTP-elevated admin --
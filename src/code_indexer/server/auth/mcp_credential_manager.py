@@ -6,6 +6,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Optional, Tuple, cast
 
+from .auth_cache import AuthCache
 from .password_manager import PasswordManager
 
 
@@ -150,6 +151,11 @@ class MCPCredentialManager:
         """
         Verify credentials, update last_used_at, return user_id or None.
 
+        A credential verified within the last ``AuthCache`` TTL is served
+        from the user manager's auth cache without the lookup, the hash
+        verify or the last_used_at write, so last_used_at is refreshed at
+        most once per TTL while a client keeps calling.
+
         Args:
             client_id: Client ID to verify
             client_secret: Client secret to verify
@@ -161,6 +167,17 @@ class MCPCredentialManager:
 
         logger = logging.getLogger(__name__)
 
+        # Verified-principal cache (absent on stub user managers)
+        auth_cache = getattr(self.user_manager, "auth_cache", None)
+        if not isinstance(auth_cache, AuthCache):
+            auth_cache = None
+        generation = 0
+        if auth_cache is not None:
+            cached_user_id = auth_cache.get_principal(client_id, client_secret)
+            if cached_user_id is not None:
+                return cached_user_id
+            generation = auth_cache.generation()
+
         # Find credential by client_id
         result = self.get_credential_by_client_id(client_id)
         logger.debug(
@@ -201,6 +218,8 @@ class MCPCredentialManager:
                     credential_id,
                 )
 
+        if auth_cache is not None:
+            auth_cache.put_principal(client_id, client_secret, user_id, generation)
         return user_id
 
     def revoke_credential(self, user_id: str, credential_id: str) -> bool:
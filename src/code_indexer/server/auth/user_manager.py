@@ -5,19 +5,41 @@ Handles user storage, authentication, and permission checking.
 Users stored in ~/.cidx-server/users.json with hashed passwords.
 """
 
+import functools
 import json
 import os
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 from pydantic import BaseModel
 
+from .auth_cache import AuthCache, AuthCacheConfig
 from .password_manager import PasswordManager
 from .password_strength_validator import PasswordStrengthValidator
 from ..utils.datetime_parser import DateTimeParser
 
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _invalidates_auth_cache(method: _F) -> _F:
+    """Drop the user's auth cache entries once ``method`` has written.
+
+    Invalidating after the write (even a failed one) bumps the cache
+    generation, so a concurrent auth that read the old row cannot cache it.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "UserManager", username: str, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return method(self, username, *args, **kwargs)
+        finally:
+            self.auth_cache.invalidate_user(username)
+
+    return wrapper  # type: ignore[return-value]
+
+
 class SSOPasswordChangeError(Exception):
     """Raised when attempting to change password for SSO user.
 
@@ -149,6 +171,7 @@ class UserManager:
         self.password_strength_validator = PasswordStrengthValidator(
             password_security_config
         )
+        self.auth_cache = AuthCache(AuthCacheConfig.from_env())
 
         if storage_backend is not None:
             # Injected backend (e.g. PostgreSQL from StorageFactory) — use directly.
@@ -385,6 +408,29 @@ class UserManager:
                 email=user_data.get("email"),
             )
 
+    def get_user_cached(self, username: str) -> Optional[User]:
+        """
+        Get user by username through the short-lived auth cache.
+
+        For the per-request authentication path only; the returned User may
+        be up to ``auth_cache.config.ttl_seconds`` old for changes made by
+        another process (changes made through this manager invalidate it).
+
+        Args:
+            username: Username to find
+
+        Returns:
+            User object if found, None otherwise
+        """
+        user = self.auth_cache.get_user(username)
+        if user is not None:
+            return user
+        generation = self.auth_cache.generation()
+        user = self.get_user(username)
+        if user is not None:
+            self.auth_cache.put_user(user, generation)
+        return user
+
     def get_all_users(self) -> List[User]:
         """
         Get all users.
@@ -457,6 +503,7 @@ class UserManager:
 
             return users
 
+    @_invalidates_auth_cache
     def delete_user(self, username: str) -> bool:
         """
         Delete user.
@@ -482,6 +529,7 @@ class UserManager:
             self._save_users(users_data)
             return True
 
+    @_invalidates_auth_cache
     def update_user_role(self, username: str, new_role: UserRole) -> bool:
         """
         Update user role.
@@ -509,6 +557,7 @@ class UserManager:
             self._save_users(users_data)
             return True
 
+    @_invalidates_auth_cache
     def change_password(self, username: str, new_password: str) -> bool:
         """
         Change user password.
@@ -631,6 +680,7 @@ class UserManager:
             "requirements": self.password_strength_validator.get_requirements(),
         }
 
+    @_invalidates_auth_cache
     def update_user(
         self, username: str, new_username: Optional[str] = None, **kwargs
     ) -> bool:
@@ -1037,6 +1087,7 @@ class UserManager:
 
         return credentials_metadata
 
+    @_invalidates_auth_cache
     def delete_mcp_credential(self, username: str, credential_id: str) -> bool:
         """
         Delete an MCP credential from user's mcp_credentials array.
@@ -1260,6 +1311,7 @@ class UserManager:
             oidc_identity = user_data.get("oidc_identity")
             return bool(oidc_identity)
 
+    @_invalidates_auth_cache
     def set_oidc_identity(self, username: str, identity: Dict[str, Any]) -> bool:
         """Set OIDC identity for user.
 
@@ -1285,6 +1337,7 @@ class UserManager:
         self._save_users(users_data)
         return True
 
+    @_invalidates_auth_cache
     def remove_oidc_identity(self, username: str) -> bool:
         """Remove OIDC identity from user.
 
@@ -4,6 +4,8 @@ Server-side cache module for CIDX server.
 Story #526: Provides singleton HNSW index cache for server-wide performance optimization.
 Story #XXX: Provides singleton FTS (Tantivy) index cache for FTS query performance.
 Story #679: Provides PayloadCache for semantic search result truncation.
+Provides a pooled SCIPQueryEngine cache so SCIP handlers skip per-request setup.
+Provides a per-document rerank score cache so repeated reranks skip the provider.
 Bug #878 (Fix B.1): Applies an opinionated default ``max_cache_size_mb`` at
 singleton init so HNSW / FTS native memory is bounded even when the
 configuration on disk omits the size cap. Dataclass defaults remain
@@ -29,6 +31,20 @@ from .id_index_cache import (
     IdIndexCacheConfig,
     get_global_id_index_cache,
 )
+from .scip_engine_cache import (
+    SCIPEngineCache,
+    SCIPEngineCacheConfig,
+    SCIPEngineCacheStats,
+    get_global_scip_engine_cache,
+    reset_global_scip_engine_cache,
+)
+from .rerank_score_cache import (
+    RerankScoreCache,
+    RerankScoreCacheConfig,
+    RerankScoreCacheStats,
+    get_global_rerank_score_cache,
+    reset_global_rerank_score_cache,
+)
 from .payload_cache import (
     PayloadCache,
     PayloadCacheConfig,
@@ -401,6 +417,18 @@ __all__ = [
     "IdIndexCache",
     "IdIndexCacheConfig",
     "get_global_id_index_cache",
+    # SCIP query engine pool exports
+    "SCIPEngineCache",
+    "SCIPEngineCacheConfig",
+    "SCIPEngineCacheStats",
+    "get_global_scip_engine_cache",
+    "reset_global_scip_engine_cache",
+    # Rerank score cache exports
+    "RerankScoreCache",
+    "RerankScoreCacheConfig",
+    "RerankScoreCacheStats",
+    "get_global_rerank_score_cache",
+    "reset_global_rerank_score_cache",
     # Payload cache exports (Story #679)
     "PayloadCache",
     "PayloadCacheConfig",
@@ -0,0 +1,244 @@
+"""
+Rerank Score Cache for Server-Side Performance Optimization.
+
+``_apply_reranking_sync`` (server/mcp/reranking.py) sends every candidate
+document to the Voyage / Cohere rerank API on every search that carries a
+``rerank_query``.  Agents routinely repeat the same query (paging, refining
+filters, re-asking after a tool error) and the candidate pool of a repeated
+query overlaps heavily with the previous one, so most of those documents are
+re-scored by the provider with an identical result.
+
+Cross-encoder relevance scores are pointwise: the score of one document
+depends only on (model, query, instruction, document), never on the other
+documents in the batch.  This module keeps a bounded in-process LRU of those
+per-document scores:
+
+- Keyed by ``(provider, model, sha256(query + instruction), sha256(document))``.
+  Voyage and Cohere scores live on different scales, so cached scores are
+  only ever merged with fresh scores from the SAME provider and model.
+- Only the digests are stored, never the query or document text.
+- Bounded by ``max_entries``; the least-recently-used entry is evicted first.
+- Hit/miss/eviction counters are exposed through ``get_stats()`` and exported
+  as ``cidx.cache.rerank.*`` OTEL gauges next to ``cidx.cache.embedding.*``.
+"""
+
+from code_indexer.server.middleware.correlation import get_correlation_id
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (provider, model, query digest, document digest)
+_ScoreKey = Tuple[str, str, bytes, bytes]
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).digest()
+
+
+def _query_digest(query: str, instruction: Optional[str]) -> bytes:
+    # NUL separator keeps ("ab", "c") and ("a", "bc") distinct.
+    return _digest(f"{query}\x00{instruction or ''}")
+
+
+@dataclass
+class RerankScoreCacheConfig:
+    """Configuration for the rerank score cache."""
+
+    enabled: bool = True
+    max_entries: int = 50_000
+
+    def __post_init__(self) -> None:
+        if self.max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {self.max_entries}")
+
+    @classmethod
+    def from_env(cls) -> "RerankScoreCacheConfig":
+        """Create config from environment variables.
+
+        Supported env vars:
+        - CIDX_RERANK_SCORE_CACHE_ENABLED  (default true)
+        - CIDX_RERANK_SCORE_CACHE_MAX_ENTRIES  (default 50000)
+        """
+        enabled = os.environ.get("CIDX_RERANK_SCORE_CACHE_ENABLED", "true")
+        return cls(
+            enabled=enabled.strip().lower() not in ("0", "false", "no", "off"),
+            max_entries=int(
+                os.environ.get("CIDX_RERANK_SCORE_CACHE_MAX_ENTRIES", "50000")
+            ),
+        )
+
+    @classmethod
+    def from_file(cls, config_file_path: str) -> "RerankScoreCacheConfig":
+        """Create config from JSON configuration file.
+
+        Expected format:
+        {
+            "rerank_score_cache_enabled": true,
+            "rerank_score_cache_max_entries": 50000
+        }
+        """
+        config_path = Path(config_file_path)
+        if not config_path.exists():
+            raise FileNotFoundError(f"Config file not found: {config_file_path}")
+        with open(config_path) as f:
+            data = json.load(f)
+        return cls(
+            enabled=bool(data.get("rerank_score_cache_enabled", True)),
+            max_entries=data.get("rerank_score_cache_max_entries", 50_000),
+        )
+
+
+@dataclass
+class RerankScoreCacheStats:
+    """Statistics for rerank score cache monitoring."""
+
+    enabled: bool
+    entries: int
+    max_entries: int
+    hit_count: int
+    miss_count: int
+    hit_ratio: float
+    eviction_count: int
+
+
+class RerankScoreCache:
+    """Thread-safe LRU of per-document reranker relevance scores."""
+
+    def __init__(self, config: Optional[RerankScoreCacheConfig] = None) -> None:
+        self.config = config or RerankScoreCacheConfig()
+        self._scores: "OrderedDict[_ScoreKey, float]" = OrderedDict()
+        self._lock = Lock()
+        self._hit_count = 0
+        self._miss_count = 0
+        self._eviction_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    def get_many(
+        self,
+        provider: str,
+        model: str,
+        query: str,
+        instruction: Optional[str],
+        documents: List[str],
+    ) -> Dict[int, float]:
+        """Return cached scores keyed by position in ``documents``.
+
+        Positions without a cached score are absent from the result.
+        """
+        if not self.config.enabled or not documents:
+            return {}
+        qd = _query_digest(query, instruction)
+        keys = [(provider, model, qd, _digest(doc)) for doc in documents]
+        found: Dict[int, float] = {}
+        with self._lock:
+            for idx, key in enumerate(keys):
+                score = self._scores.get(key)
+                if score is None:
+                    continue
+                self._scores.move_to_end(key)
+                found[idx] = score
+            self._hit_count += len(found)
+            self._miss_count += len(keys) - len(found)
+        return found
+
+    def put_many(
+        self,
+        provider: str,
+        model: str,
+        query: str,
+        instruction: Optional[str],
+        scored_documents: Iterable[Tuple[str, float]],
+    ) -> None:
+        """Store (document, score) pairs produced by one provider/model."""
+        if not self.config.enabled:
+            return
+        qd = _query_digest(query, instruction)
+        entries = [
+            ((provider, model, qd, _digest(doc)), float(score))
+            for doc, score in scored_documents
+        ]
+        if not entries:
+            return
+        with self._lock:
+            for key, score in entries:
+                self._scores[key] = score
+                self._scores.move_to_end(key)
+            while len(self._scores) > self.config.max_entries:
+                self._scores.popitem(last=False)
+                self._eviction_count += 1
+
+    def clear(self) -> None:
+        """Drop every cached score (counters are kept)."""
+        with self._lock:
+            self._scores.clear()
+
+    def get_stats(self) -> RerankScoreCacheStats:
+        with self._lock:
+            lookups = self._hit_count + self._miss_count
+            return RerankScoreCacheStats(
+                enabled=self.config.enabled,
+                entries=len(self._scores),
+                max_entries=self.config.max_entries,
+                hit_count=self._hit_count,
+                miss_count=self._miss_count,
+                hit_ratio=self._hit_count / lookups if lookups else 0.0,
+                eviction_count=self._eviction_count,
+            )
+
+
+# ---------------------------------------------------------------------------
+# Server-wide singleton
+# ---------------------------------------------------------------------------
+
+_global_rerank_score_cache_instance: Optional[RerankScoreCache] = None
+_global_rerank_score_cache_lock = Lock()
+
+
+def get_global_rerank_score_cache() -> RerankScoreCache:
+    """Get or create the process-wide RerankScoreCache singleton.
+
+    Configuration loaded from (in order):
+    1. ~/.cidx-server/config.json
+    2. Environment variables
+    3. Defaults (enabled, 50000 entries)
+    """
+    global _global_rerank_score_cache_instance
+
+    with _global_rerank_score_cache_lock:
+        if _global_rerank_score_cache_instance is None:
+            config_file = Path.home() / ".cidx-server" / "config.json"
+            config: Optional[RerankScoreCacheConfig] = None
+            if config_file.exists():
+                try:
+                    config = RerankScoreCacheConfig.from_file(str(config_file))
+                except Exception as exc:
+                    logger.warning(
+                        "Failed to load RerankScoreCache config from %s: %s. "
+                        "Using defaults.",
+                        config_file,
+                        exc,
+                        extra={"correlation_id": get_correlation_id()},
+                    )
+            if config is None:
+                config = RerankScoreCacheConfig.from_env()
+            _global_rerank_score_cache_instance = RerankScoreCache(config=config)
+
+        return _global_rerank_score_cache_instance
+
+
+def reset_global_rerank_score_cache() -> None:
+    """Reset the singleton (for testing)."""
+    global _global_rerank_score_cache_instance
+    with _global_rerank_score_cache_lock:
+        _global_rerank_score_cache_instance = None
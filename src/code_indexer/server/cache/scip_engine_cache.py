@@ -0,0 +1,535 @@
+"""
+SCIP Query Engine Cache for Server-Side Performance Optimization.
+
+Every server SCIP handler used to build a fresh ``SCIPQueryEngine`` per
+request, which opens a new SQLite connection, runs
+``_ensure_migration_complete`` (a config.json read) and — when the ``.scip``
+protobuf still exists next to the database — parses the full protobuf through
+``SCIPLoader`` just to read ``metadata.project_root``.  Repeated SCIP calls
+against the same repository paid that setup cost every time.
+
+This module keeps a bounded pool of pre-warmed engines per SCIP database:
+
+- Keyed by the resolved ``.scip.db`` path; each pool slot remembers the
+  database signature (mtime_ns, size, inode) it was built from.  A changed
+  signature (e.g. ``cidx scip generate`` in a subprocess) drops the slot on
+  the next lease, so stale engines are never served.
+- Engines are LEASED exclusively to one caller at a time (SQLite connections
+  are not safe for concurrent use) and returned to the slot's idle list on
+  release.  Concurrent callers on the same database get separate engines, up
+  to ``max_idle_per_database`` of which are retained.
+- Pooled connections are switched to read-only query mode via
+  ``DatabaseBackend.enable_query_only_mode`` (mmap_size, cache_size,
+  query_only).
+- Pooled engines drop the parsed ``.scip`` protobuf (``engine.index``): it is
+  only needed to read ``project_root`` during construction, and keeping it
+  pinned per idle engine would dominate the pool's memory.
+- Memory is bounded by ``max_databases * max_idle_per_database`` connections,
+  each with at most ``cache_size_mb`` of SQLite page cache (the mmap window
+  is shared OS page cache, not private memory).  The defaults (16 x 2 x 16 MB)
+  cap page cache at 512 MB.
+- ``invalidate_prefix`` is called on SCIP regeneration and snapshot swaps,
+  mirroring HNSWIndexCache / IdIndexCache.
+- Hit/miss/invalidation/eviction counters plus setup and acquire latency are
+  exposed through ``get_stats()``.
+"""
+
+from code_indexer.server.middleware.correlation import get_correlation_id
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from code_indexer.scip.query.primitives import SCIPQueryEngine
+
+logger = logging.getLogger(__name__)
+
+# (st_mtime_ns, st_size, st_ino) of the .scip.db file an engine was built from.
+_DbSignature = Tuple[int, int, int]
+
+
+@dataclass
+class SCIPEngineCacheConfig:
+    """Configuration for the SCIP query engine cache."""
+
+    max_databases: int = 16
+    max_idle_per_database: int = 2
+    mmap_size_mb: int = 64
+    cache_size_mb: int = 16
+
+    def __post_init__(self) -> None:
+        if self.max_databases <= 0:
+            raise ValueError(
+                f"max_databases must be positive, got {self.max_databases}"
+            )
+        if self.max_idle_per_database <= 0:
+            raise ValueError(
+                "max_idle_per_database must be positive, "
+                f"got {self.max_idle_per_database}"
+            )
+        if self.mmap_size_mb < 0 or self.cache_size_mb < 0:
+            raise ValueError("mmap_size_mb and cache_size_mb must be non-negative")
+
+    @classmethod
+    def from_env(cls) -> "SCIPEngineCacheConfig":
+        """Create config from environment variables.
+
+        Supported env vars:
+        - CIDX_SCIP_ENGINE_CACHE_MAX_DATABASES  (default 16)
+        - CIDX_SCIP_ENGINE_CACHE_MAX_IDLE  (default 2)
+        - CIDX_SCIP_ENGINE_CACHE_MMAP_MB  (default 64)
+        - CIDX_SCIP_ENGINE_CACHE_PAGE_CACHE_MB  (default 16)
+        """
+        return cls(
+            max_databases=int(
+                os.environ.get("CIDX_SCIP_ENGINE_CACHE_MAX_DATABASES", "16")
+            ),
+            max_idle_per_database=int(
+                os.environ.get("CIDX_SCIP_ENGINE_CACHE_MAX_IDLE", "2")
+            ),
+            mmap_size_mb=int(os.environ.get("CIDX_SCIP_ENGINE_CACHE_MMAP_MB", "64")),
+            cache_size_mb=int(
+                os.environ.get("CIDX_SCIP_ENGINE_CACHE_PAGE_CACHE_MB", "16")
+            ),
+        )
+
+    @classmethod
+    def from_file(cls, config_file_path: str) -> "SCIPEngineCacheConfig":
+        """Create config from JSON configuration file.
+
+        Expected format:
+        {
+            "scip_engine_cache_max_databases": 16,
+            "scip_engine_cache_max_idle_per_database": 2,
+            "scip_engine_cache_mmap_size_mb": 64,
+            "scip_engine_cache_page_cache_mb": 16
+        }
+        """
+        config_path = Path(config_file_path)
+        if not config_path.exists():
+            raise FileNotFoundError(f"Config file not found: {config_file_path}")
+        with open(config_path) as f:
+            data = json.load(f)
+        return cls(
+            max_databases=data.get("scip_engine_cache_max_databases", 16),
+            max_idle_per_database=data.get(
+                "scip_engine_cache_max_idle_per_database", 2
+            ),
+            mmap_size_mb=data.get("scip_engine_cache_mmap_size_mb", 64),
+            cache_size_mb=data.get("scip_engine_cache_page_cache_mb", 16),
+        )
+
+
+@dataclass
+class SCIPEngineCacheStats:
+    """Statistics for SCIP engine cache monitoring."""
+
+    cached_databases: int
+    idle_engines: int
+    leased_engines: int
+    hit_count: int
+    miss_count: int
+    hit_ratio: float
+    invalidation_count: int
+    eviction_count: int
+    avg_setup_ms: float
+    avg_hit_acquire_ms: float
+    per_database_stats: Dict[str, Dict[str, Any]]
+
+
+@dataclass
+class _SCIPEngineSlot:
+    """Pool slot for one SCIP database."""
+
+    db_path: str
+    signature: _DbSignature
+    generation: int
+    idle: List[Any] = field(default_factory=list)
+    leased: int = 0
+    hit_count: int = 0
+    miss_count: int = 0
+    last_setup_ms: float = 0.0
+    last_accessed: float = field(default_factory=time.time)
+
+
+def _resolve_db_path(scip_file: Path) -> Path:
+    """Map a .scip or .scip.db path to its .scip.db path (SCIPQueryEngine rules)."""
+    scip_file_str = str(scip_file)
+    if scip_file_str.endswith(".db"):
+        return Path(scip_file_str)
+    return Path(scip_file_str + ".db")
+
+
+def _db_signature(db_path: Path) -> Optional[_DbSignature]:
+    """Return (mtime_ns, size, inode) for db_path, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _close_engine(engine: Any) -> None:
+    """Close an engine's connection, swallowing errors (best-effort)."""
+    try:
+        engine.close()
+    except Exception as exc:
+        logger.debug(
+            "SCIPEngineCache: error closing engine: %s",
+            exc,
+            extra={"correlation_id": get_correlation_id()},
+        )
+
+
+class SCIPEngineCache:
+    """Thread-safe pool of pre-warmed SCIPQueryEngine instances per database.
+
+    The global ``_lock`` is held ONLY for dict/list operations; engine
+    construction (SQLite open, migration check, optional protobuf load) runs
+    with no lock held, so a cold database never blocks warm ones.
+    """
+
+    def __init__(self, config: Optional[SCIPEngineCacheConfig] = None) -> None:
+        self.config = config or SCIPEngineCacheConfig()
+
+        self._slots: "OrderedDict[str, _SCIPEngineSlot]" = OrderedDict()
+        self._lock = Lock()
+        self._next_generation = 0
+
+        self._hit_count = 0
+        self._miss_count = 0
+        self._invalidation_count = 0
+        self._eviction_count = 0
+        self._total_setup_ms = 0.0
+        self._total_hit_acquire_ms = 0.0
+
+    @contextmanager
+    def lease(self, scip_file: Path) -> Iterator["SCIPQueryEngine"]:
+        """Lease a SCIPQueryEngine for scip_file for the duration of the block.
+
+        Args:
+            scip_file: Path to a .scip or .scip.db file (same rules as
+                SCIPQueryEngine).
+
+        Yields:
+            SCIPQueryEngine bound to the database. The engine MUST NOT be used
+            after the block exits.
+
+        Raises:
+            FileNotFoundError: If the .scip.db database does not exist.
+        """
+        acquire_start = time.perf_counter()
+        db_path = _resolve_db_path(Path(scip_file))
+        key = str(db_path.resolve())
+        signature = _db_signature(db_path)
+        engine: Optional["SCIPQueryEngine"] = None
+
+        if signature is None:
+            # Database missing/unreadable: never cache. Construction raises the
+            # same FileNotFoundError callers already handle.
+            engine = self._build_engine(Path(scip_file))
+            try:
+                yield engine
+            finally:
+                _close_engine(engine)
+            return
+
+        stale: List[Any] = []
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is not None and slot.signature != signature:
+                stale = self._drop_slot_locked(key)
+                self._invalidation_count += 1
+                slot = None
+            if slot is not None and slot.idle:
+                engine = slot.idle.pop()
+                slot.leased += 1
+                slot.hit_count += 1
+                slot.last_accessed = time.time()
+                self._slots.move_to_end(key)
+                self._hit_count += 1
+                generation = slot.generation
+        for old in stale:
+            _close_engine(old)
+
+        if engine is not None:
+            with self._lock:
+                self._total_hit_acquire_ms += (
+                    time.perf_counter() - acquire_start
+                ) * 1000
+        else:
+            setup_start = time.perf_counter()
+            engine = self._build_engine(Path(scip_file))
+            setup_ms = (time.perf_counter() - setup_start) * 1000
+            evicted: List[Any] = []
+            with self._lock:
+                self._miss_count += 1
+                self._total_setup_ms += setup_ms
+                slot = self._slots.get(key)
+                if slot is None or slot.signature != signature:
+                    if slot is not None:
+                        evicted.extend(self._drop_slot_locked(key))
+                        self._invalidation_count += 1
+                    self._next_generation += 1
+                    slot = _SCIPEngineSlot(
+                        db_path=key,
+                        signature=signature,
+                        generation=self._next_generation,
+                    )
+                    self._slots[key] = slot
+                    evicted.extend(self._enforce_database_limit_locked())
+                slot.leased += 1
+                slot.miss_count += 1
+                slot.last_setup_ms = setup_ms
+                slot.last_accessed = time.time()
+                self._slots.move_to_end(key)
+                generation = slot.generation
+            for old in evicted:
+                _close_engine(old)
+            logger.debug(
+                "SCIPEngineCache MISS for %s, engine built in %.1fms",
+                key,
+                setup_ms,
+                extra={"correlation_id": get_correlation_id()},
+            )
+
+        try:
+            yield engine
+        finally:
+            self._release(key, generation, engine)
+
+    def _release(self, key: str, generation: int, engine: Any) -> None:
+        """Return a leased engine to its slot, or close it if the slot is gone."""
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is not None and slot.generation == generation:
+                slot.leased = max(0, slot.leased - 1)
+                if len(slot.idle) < self.config.max_idle_per_database:
+                    slot.idle.append(engine)
+                    return
+        _close_engine(engine)
+
+    def _build_engine(self, scip_file: Path) -> "SCIPQueryEngine":
+        """Construct and tune a new SCIPQueryEngine (no lock held)."""
+        # Resolved through the module at call time so tests patching
+        # code_indexer.scip.query.primitives.SCIPQueryEngine keep working.
+        from code_indexer.scip.query import primitives
+
+        engine = primitives.SCIPQueryEngine(scip_file)
+        # The parsed protobuf is only used to read project_root during
+        # construction; queries go through the SQLite backend.
+        engine.index = None
+        try:
+            engine.backend.enable_query_only_mode(
+                mmap_size_bytes=self.config.mmap_size_mb * 1024 * 1024,
+                cache_size_kib=self.config.cache_size_mb * 1024,
+            )
+        except Exception as exc:
+            # Tuning is an optimization only; an untuned engine is still correct.
+            logger.debug(
+                "SCIPEngineCache: could not enable query-only mode for %s: %s",
+                scip_file,
+                exc,
+                extra={"correlation_id": get_correlation_id()},
+            )
+        return engine
+
+    def _drop_slot_locked(self, key: str) -> List[Any]:
+        """Remove a slot and return its idle engines for closing outside the lock.
+
+        Must be called while holding _lock. Leased engines of the dropped slot
+        are closed on release because their generation no longer matches.
+        """
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return []
+        return list(slot.idle)
+
+    def _enforce_database_limit_locked(self) -> List[Any]:
+        """Evict LRU slots until under max_databases. Must hold _lock."""
+        to_close: List[Any] = []
+        while len(self._slots) > self.config.max_databases:
+            lru_key = next(iter(self._slots))
+            to_close.extend(self._drop_slot_locked(lru_key))
+            self._eviction_count += 1
+        return to_close
+
+    def invalidate(self, scip_file: Path) -> bool:
+        """Drop the pooled engines for a single database.
+
+        Args:
+            scip_file: Path to a .scip or .scip.db file.
+
+        Returns:
+            True if a slot was removed.
+        """
+        key = str(_resolve_db_path(Path(scip_file)).resolve())
+        with self._lock:
+            present = key in self._slots
+            to_close = self._drop_slot_locked(key)
+            if present:
+                self._invalidation_count += 1
+        for engine in to_close:
+            _close_engine(engine)
+        return present
+
+    def invalidate_prefix(self, path_prefix: str) -> int:
+        """Drop all slots whose database lives under path_prefix.
+
+        Mirrors HNSWIndexCache.invalidate_prefix — called after SCIP
+        regeneration and snapshot swaps.
+
+        Args:
+            path_prefix: Repository or snapshot directory. Must be non-empty.
+
+        Returns:
+            Number of slots dropped.
+
+        Raises:
+            ValueError: If path_prefix is None or empty.
+        """
+        if not path_prefix:
+            raise ValueError("path_prefix must be a non-empty string")
+
+        path_prefix = str(Path(path_prefix).resolve())
+        prefix_with_sep = path_prefix + "/"
+
+        to_close: List[Any] = []
+        with self._lock:
+            stale = [
+                key
+                for key in self._slots
+                if key == path_prefix or key.startswith(prefix_with_sep)
+            ]
+            for key in stale:
+                to_close.extend(self._drop_slot_locked(key))
+            self._invalidation_count += len(stale)
+        for engine in to_close:
+            _close_engine(engine)
+
+        if stale:
+            logger.info(
+                "SCIPEngineCache: invalidated %d databases for prefix %s",
+                len(stale),
+                path_prefix,
+                extra={"correlation_id": get_correlation_id()},
+            )
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every pooled engine."""
+        with self._lock:
+            to_close: List[Any] = []
+            for key in list(self._slots):
+                to_close.extend(self._drop_slot_locked(key))
+        for engine in to_close:
+            _close_engine(engine)
+
+    def get_stats(self) -> SCIPEngineCacheStats:
+        """Return a point-in-time snapshot of cache statistics."""
+        with self._lock:
+            lookups = self._hit_count + self._miss_count
+            per_database = {
+                key: {
+                    "idle_engines": len(slot.idle),
+                    "leased_engines": slot.leased,
+                    "hit_count": slot.hit_count,
+                    "miss_count": slot.miss_count,
+                    "last_setup_ms": round(slot.last_setup_ms, 3),
+                    "last_accessed": slot.last_accessed,
+                }
+                for key, slot in self._slots.items()
+            }
+            return SCIPEngineCacheStats(
+                cached_databases=len(self._slots),
+                idle_engines=sum(len(s.idle) for s in self._slots.values()),
+                leased_engines=sum(s.leased for s in self._slots.values()),
+                hit_count=self._hit_count,
+                miss_count=self._miss_count,
+                hit_ratio=self._hit_count / lookups if lookups else 0.0,
+                invalidation_count=self._invalidation_count,
+                eviction_count=self._eviction_count,
+                avg_setup_ms=(
+                    self._total_setup_ms / self._miss_count if self._miss_count else 0.0
+                ),
+                avg_hit_acquire_ms=(
+                    self._total_hit_acquire_ms / self._hit_count
+                    if self._hit_count
+                    else 0.0
+                ),
+                per_database_stats=per_database,
+            )
+
+
+# ---------------------------------------------------------------------------
+# Singleton accessor (mirrors get_global_id_index_cache)
+# ---------------------------------------------------------------------------
+
+_global_scip_engine_cache_instance: Optional[SCIPEngineCache] = None
+_global_scip_engine_cache_lock = Lock()
+
+
+def get_global_scip_engine_cache() -> SCIPEngineCache:
+    """Get or create the server-wide SCIPEngineCache singleton.
+
+    Configuration loaded from (in order):
+    1. ~/.cidx-server/config.json
+    2. Environment variables
+    3. Defaults (16 databases, 2 idle engines per database)
+    """
+    global _global_scip_engine_cache_instance
+
+    with _global_scip_engine_cache_lock:
+        if _global_scip_engine_cache_instance is None:
+            config_file = Path.home() / ".cidx-server" / "config.json"
+            config: Optional[SCIPEngineCacheConfig] = None
+            if config_file.exists():
+                try:
+                    config = SCIPEngineCacheConfig.from_file(str(config_file))
+                except Exception as exc:
+                    logger.warning(
+                        "Failed to load SCIPEngineCache config from %s: %s. "
+                        "Using defaults.",
+                        config_file,
+                        exc,
+                        extra={"correlation_id": get_correlation_id()},
+                    )
+            if config is None:
+                config = SCIPEngineCacheConfig.from_env()
+            _global_scip_engine_cache_instance = SCIPEngineCache(config=config)
+
+        return _global_scip_engine_cache_instance
+
+
+def reset_global_scip_engine_cache() -> None:
+    """Reset the singleton, closing pooled engines (for testing)."""
+    global _global_scip_engine_cache_instance
+    with _global_scip_engine_cache_lock:
+        if _global_scip_engine_cache_instance is not None:
+            _global_scip_engine_cache_instance.clear()
+            _global_scip_engine_cache_instance = None
+
+
+def invalidate_scip_engines_under(path_prefix: str) -> int:
+    """Best-effort invalidation helper for SCIP regeneration call sites.
+
+    Never raises: a cache-eviction failure must not fail a successful
+    generation. Returns the number of databases dropped (0 on error).
+    """
+    try:
+        return get_global_scip_engine_cache().invalidate_prefix(path_prefix)
+    except Exception as exc:
+        logger.warning(
+            "SCIPEngineCache: failed to invalidate %s: %s",
+            path_prefix,
+            exc,
+            extra={"correlation_id": get_correlation_id()},
+        )
+        return 0
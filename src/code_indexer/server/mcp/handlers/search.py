@@ -389,6 +389,14 @@ def _omni_search_code(params: Dict[str, Any], user: User) -> Dict[str, Any]:
     _repo_count_breach = _enforce_repo_count_cap(repo_aliases)
     if _repo_count_breach is not None:
         return cap_breach_response(_repo_count_breach)
+    # Access-control pushdown: prune the fan-out targets to the user's
+    # accessible repos up front so invisible repos are never searched,
+    # hydrated or reranked (and no over-fetch is needed to compensate).
+    access_filtering_service = _get_access_filtering_service()
+    if access_filtering_service:
+        repo_aliases = access_filtering_service.filter_repo_aliases(
+            repo_aliases, user.username
+        )
     requested_limit = _coerce_int(params.get("limit"), _DEFAULT_SEARCH_LIMIT)
     aggregation_mode = params.get(
         "aggregation_mode", "per_repo" if len(repo_aliases) > 1 else "global"
@@ -418,9 +426,10 @@ def _omni_search_code(params: Dict[str, Any], user: User) -> Dict[str, Any]:
     )
 
     search_type = _resolve_search_type(params, user)
-    effective_limit = _compute_effective_limit(requested_limit, user)
+    # Every target is accessible (pruned above), so the requested limit is
+    # already the right per-repo fetch size -- no access over-fetch.
     request = _build_multi_search_request(
-        repo_aliases, params, search_type, effective_limit
+        repo_aliases, params, search_type, requested_limit
     )
 
     # Story #1148 PART 1: For semantic omni searches, compute the query embedding
@@ -478,8 +487,9 @@ def _omni_search_code(params: Dict[str, Any], user: User) -> Dict[str, Any]:
             final_results, search_mode, params
         )
 
-    access_filtering_service = _get_access_filtering_service()
     if access_filtering_service:
+        # Defense in depth: targets were pruned before fan-out, so this is a
+        # cheap set-membership pass that normally removes nothing.
         final_results = access_filtering_service.filter_query_results(
             final_results, user.username
         )
@@ -557,12 +567,33 @@ def _apply_rerank_and_filter(
     repository_alias: Optional[str],
     user: User,
 ) -> tuple:
-    """Apply reranking, truncation, and access filtering to search results.
+    """Apply access filtering, reranking and truncation to search results.
+
+    Access filtering runs FIRST so results the user cannot see are never sent
+    to the reranker; for cidx-meta, repo-description/memory files of
+    inaccessible repos are dropped by filename (same rule as regex_search).
 
     Returns (filtered_results, rerank_meta) where rerank_meta is the dict from
     _apply_reranking_sync, optionally enriched with AC4 fts truncation keys
     (preview_size_chars, rows_capped) when search_mode is fts or hybrid.
     """
+    access_filtering_service = _get_access_filtering_service()
+    if access_filtering_service:
+        results = access_filtering_service.filter_query_results(results, user.username)
+        if repository_alias and "cidx-meta" in repository_alias:
+            results = access_filtering_service.filter_cidx_meta_results(
+                results, user.username
+            )
+            allowed = set(
+                access_filtering_service.filter_cidx_meta_files(
+                    [Path(r.get("file_path", "")).name for r in results],
+                    user.username,
+                )
+            )
+            results = [
+                r for r in results if Path(r.get("file_path", "")).name in allowed
+            ]
+
     rerank_query = params.get("rerank_query")
     rerank_instruction = params.get("rerank_instruction")
     results, rerank_meta = _mcp_reranking._apply_reranking_sync(
@@ -582,13 +613,7 @@ def _apply_rerank_and_filter(
     if fts_truncation_meta:
         rerank_meta.update(fts_truncation_meta)
 
-    access_filtering_service = _get_access_filtering_service()
     if access_filtering_service:
-        results = access_filtering_service.filter_query_results(results, user.username)
-        if repository_alias and "cidx-meta" in repository_alias:
-            results = access_filtering_service.filter_cidx_meta_results(
-                results, user.username
-            )
         results = results[:requested_limit]
 
     return results, rerank_meta
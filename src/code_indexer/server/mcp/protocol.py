@@ -6,7 +6,7 @@ and execution. Phase 1 implementation with stub handlers for tools/list and tool
 
 from fastapi import APIRouter, Depends, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Dict, Any, List, Optional, Set, Tuple, Union
+from typing import AsyncIterator, Dict, Any, List, Optional, Set, Tuple, Union
 from code_indexer.server.auth.dependencies import (
     get_current_user,
     get_current_user_for_mcp,
@@ -19,6 +19,7 @@ from code_indexer.server.auth.user_manager import User
 from code_indexer.server.services.config_service import get_config_service
 from sse_starlette.sse import EventSourceResponse
 import asyncio
+import contextlib
 import functools
 import time
 import uuid
@@ -81,6 +82,63 @@ _HANDLER_TIMEOUT_OVERRIDES: Dict[str, int] = {
 }
 
 
+# Upper bound on concurrently executing elements of one JSON-RPC batch.
+BATCH_MAX_CONCURRENCY = 8
+
+
+class _UserBatchSlots:
+    """Per-user cap on concurrently executing batch elements.
+
+    Shared by every batch of the same user (on the same event loop), so a
+    user sending several large batches at once cannot take over the
+    provider lanes. Entries are dropped once the user has nothing in flight.
+    """
+
+    def __init__(self) -> None:
+        self._slots: Dict[Tuple[int, str], Tuple[asyncio.Semaphore, int]] = {}
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, username: str, limit: int) -> AsyncIterator[None]:
+        key = (id(asyncio.get_running_loop()), username)
+        semaphore, holders = self._slots.get(key, (None, 0))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(limit)
+        self._slots[key] = (semaphore, holders + 1)
+        try:
+            async with semaphore:
+                yield
+        finally:
+            semaphore, holders = self._slots[key]
+            if holders <= 1:
+                del self._slots[key]
+            else:
+                self._slots[key] = (semaphore, holders - 1)
+
+
+_user_batch_slots = _UserBatchSlots()
+
+
+def _user_batch_concurrency() -> int:
+    """Per-user share of concurrent batch elements.
+
+    Batch elements (searches in particular) spend most of their time in
+    embedding / rerank calls gated by the ProviderConcurrencyGovernor. One
+    user may hold at most half of the narrowest provider lane's current
+    adaptive K, so other users' requests still find free slots; the share
+    shrinks automatically while the governor backs off after 429s.
+    """
+    try:
+        from code_indexer.server.services.provider_concurrency_governor import (
+            ProviderConcurrencyGovernor,
+        )
+
+        lane_k = min(ProviderConcurrencyGovernor.get_instance().current_k.values())
+    except Exception as exc:
+        logger.debug(f"Provider governor unavailable for batch fairness: {exc}")
+        return BATCH_MAX_CONCURRENCY
+    return max(1, min(BATCH_MAX_CONCURRENCY, lane_k // 2))
+
+
 def _resolve_handler_timeout(tool_name: str) -> int:
     """Return the effective timeout in seconds for a given tool's sync handler.
 
@@ -944,23 +1002,42 @@ async def process_batch_request(
             call for handlers that declare an http_response parameter
             (e.g. authenticate).
 
+    Elements run concurrently (JSON-RPC 2.0 places no ordering constraint
+    on batch execution), at most ``BATCH_MAX_CONCURRENCY`` at a time and
+    within the user's share of the provider governor (see
+    ``_user_batch_concurrency``), so a batch takes about as long as its
+    slowest element. Responses keep the order of the batch elements.
+
     Returns:
-        List of JSON-RPC response dictionaries
+        List of JSON-RPC response dictionaries, in batch order
     """
-    responses = []
+    if len(batch) <= 1:
+        return [
+            await process_jsonrpc_request(
+                request,
+                user,
+                session_id=session_id,
+                elevation_key=elevation_key,
+                http_request=http_request,
+                http_response=http_response,
+            )
+            for request in batch
+        ]
 
-    for request in batch:
-        response = await process_jsonrpc_request(
-            request,
-            user,
-            session_id=session_id,
-            elevation_key=elevation_key,
-            http_request=http_request,
-            http_response=http_response,
-        )
-        responses.append(response)
+    limit = _user_batch_concurrency()
+
+    async def _process(request: Dict[str, Any]) -> Dict[str, Any]:
+        async with _user_batch_slots.acquire(user.username, limit):
+            return await process_jsonrpc_request(
+                request,
+                user,
+                session_id=session_id,
+                elevation_key=elevation_key,
+                http_request=http_request,
+                http_response=http_response,
+            )
 
-    return responses
+    return list(await asyncio.gather(*(_process(request) for request in batch)))
 
 
 @mcp_router.post("/mcp", response_model=None)
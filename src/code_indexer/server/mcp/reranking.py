@@ -118,6 +118,25 @@ def _configured_reranker_timeout_seconds(config_service: Any) -> float:
     return float(search_timeouts.reranker_timeout_seconds)
 
 
+def _get_rerank_score_cache() -> Optional[Any]:
+    """Return the process-wide RerankScoreCache, or None when disabled/unavailable."""
+    try:
+        from code_indexer.server.cache.rerank_score_cache import (
+            get_global_rerank_score_cache,
+        )
+
+        cache = get_global_rerank_score_cache()
+    except Exception as exc:
+        logger.debug("Rerank score cache unavailable: %s", exc)
+        return None
+    return cache if cache.enabled else None
+
+
+def _top_scored(scores: Dict[int, float], top_k: int) -> List[Tuple[int, float]]:
+    """Return the top_k (index, score) pairs ordered by score descending."""
+    return sorted(scores.items(), key=lambda pair: pair[1], reverse=True)[:top_k]
+
+
 def _attempt_provider_rerank(
     provider_name: str,
     health_key: str,
@@ -129,12 +148,20 @@ def _attempt_provider_rerank(
     monitor: ProviderHealthMonitor,
     timeout_seconds: float = 15.0,
     deadline_monotonic: Optional[float] = None,
+    model: str = "",
 ) -> Tuple[Optional[List[Tuple[int, float]]], Optional[str]]:
     """Try one reranker provider; return (scored_pairs, failure_reason).
 
     scored_pairs is a list of (original_index, relevance_score) tuples,
     ordered by score descending (as returned by the reranker client).
 
+    When ``model`` is given and the rerank score cache is enabled, documents
+    whose score for (provider, model, query, instruction) is already cached
+    are not sent to the provider: only the uncached documents are scored
+    (all of them, so every fresh score can be cached), then merged with the
+    cached scores and cut to top_k.  A fully cached request never touches
+    the provider, its health state or the concurrency governor.
+
     Args:
         timeout_seconds: HTTP request timeout passed to client_cls (Issue
             #1398). Defaults to 15.0 (pre-#1398 hardcoded value) so direct
@@ -154,6 +181,16 @@ def _attempt_provider_rerank(
             deadline already passed before this attempt could start
         (None, "failed")      — provider raised an exception
     """
+    score_cache = _get_rerank_score_cache() if model else None
+    cache_provider = provider_name.lower()
+    cached_scores: Dict[int, float] = {}
+    if score_cache is not None:
+        cached_scores = score_cache.get_many(
+            cache_provider, model, query, instruction, documents
+        )
+        if len(cached_scores) == len(documents):
+            return _top_scored(cached_scores, top_k), None
+
     health = monitor.get_health(health_key)
     status = health.get(health_key)
     if status is not None and status.status == "down":
@@ -174,6 +211,15 @@ def _attempt_provider_rerank(
         effective_timeout = min(timeout_seconds, remaining)
         backoff_kwargs["cumulative_cap"] = remaining
 
+    if score_cache is not None:
+        miss_indices = [i for i in range(len(documents)) if i not in cached_scores]
+        request_documents = [documents[i] for i in miss_indices]
+        request_top_k = len(request_documents)
+    else:
+        miss_indices = []
+        request_documents = documents
+        request_top_k = top_k
+
     try:
         from code_indexer.server.services.search_service import _get_http_client_factory
         from code_indexer.server.services.provider_concurrency_governor import (
@@ -204,15 +250,29 @@ def _attempt_provider_rerank(
                 _budget,
                 lambda: client.rerank(
                     query=query,
-                    documents=documents,
+                    documents=request_documents,
                     instruction=instruction,
-                    top_k=top_k,
+                    top_k=request_top_k,
                 ),
                 acquire_timeout=_GOVERNOR_ACQUIRE_TIMEOUT_SECS,
             ),
             **backoff_kwargs,
         )
-        return [(r.index, r.relevance_score) for r in rerank_results], None
+        if score_cache is None:
+            return [(r.index, r.relevance_score) for r in rerank_results], None
+        fresh_scores = {
+            miss_indices[r.index]: r.relevance_score
+            for r in rerank_results
+            if 0 <= r.index < len(miss_indices)
+        }
+        score_cache.put_many(
+            cache_provider,
+            model,
+            query,
+            instruction,
+            [(documents[i], score) for i, score in fresh_scores.items()],
+        )
+        return _top_scored({**cached_scores, **fresh_scores}, top_k), None
     except RerankerSinbinnedException:
         logger.info("%s reranker sin-binned, skipping", provider_name.capitalize())
         return None, "skipped"
@@ -272,6 +332,7 @@ def _run_provider_chain(
             monitor,
             timeout_seconds=timeout_seconds,
             deadline_monotonic=deadline_monotonic,
+            model=model,
         )
         if scored_pairs is not None:
             elapsed_ms = int((time.monotonic() - t_start) * 1000)
@@ -179,6 +179,9 @@ class RepositoryStatsResponse(BaseModel):
     storage: RepositoryStorageInfo = Field(..., description="Storage statistics")
     activity: RepositoryActivityInfo = Field(..., description="Activity statistics")
     health: RepositoryHealthInfo = Field(..., description="Health assessment")
+    stats_as_of: Optional[datetime] = Field(
+        None, description="When the file statistics were last brought up to date"
+    )
 
 
 class FileInfo(BaseModel):
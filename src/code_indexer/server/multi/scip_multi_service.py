@@ -27,7 +27,8 @@ from .scip_models import (
     SCIPResult,
     SCIPMultiMetadata,
 )
-from ...scip.query.primitives import SCIPQueryEngine, QueryResult
+from ...scip.query.primitives import QueryResult
+from ..cache.scip_engine_cache import get_global_scip_engine_cache
 from code_indexer.server.logging_utils import format_error_log
 
 logger = logging.getLogger(__name__)
@@ -132,8 +133,8 @@ class SCIPMultiService:
             return None
 
         try:
-            engine = SCIPQueryEngine(scip_file)
-            return engine.find_definition(request.symbol, exact=False)
+            with get_global_scip_engine_cache().lease(scip_file) as engine:
+                return engine.find_definition(request.symbol, exact=False)
         except Exception as e:
             logger.error(
                 format_error_log(
@@ -175,10 +176,12 @@ class SCIPMultiService:
             return None
 
         try:
-            engine = SCIPQueryEngine(scip_file)
-            # Bug #83-3 Fix: Use instance variable instead of hardcoded constant
-            limit = request.limit if request.limit is not None else self.reference_limit
-            return engine.find_references(request.symbol, limit=limit, exact=False)
+            with get_global_scip_engine_cache().lease(scip_file) as engine:
+                # Bug #83-3 Fix: Use instance variable instead of hardcoded constant
+                limit = (
+                    request.limit if request.limit is not None else self.reference_limit
+                )
+                return engine.find_references(request.symbol, limit=limit, exact=False)
         except Exception as e:
             logger.error(
                 format_error_log(
@@ -220,14 +223,14 @@ class SCIPMultiService:
             return None
 
         try:
-            engine = SCIPQueryEngine(scip_file)
-            # Bug #83-3 Fix: Use instance variable instead of hardcoded constant
-            depth = (
-                request.max_depth
-                if request.max_depth is not None
-                else self.dependency_depth
-            )
-            return engine.get_dependencies(request.symbol, depth=depth, exact=False)
+            with get_global_scip_engine_cache().lease(scip_file) as engine:
+                # Bug #83-3 Fix: Use instance variable instead of hardcoded constant
+                depth = (
+                    request.max_depth
+                    if request.max_depth is not None
+                    else self.dependency_depth
+                )
+                return engine.get_dependencies(request.symbol, depth=depth, exact=False)
         except Exception as e:
             logger.error(
                 format_error_log(
@@ -269,14 +272,14 @@ class SCIPMultiService:
             return None
 
         try:
-            engine = SCIPQueryEngine(scip_file)
-            # Bug #83-3 Fix: Use instance variable instead of hardcoded constant
-            depth = (
-                request.max_depth
-                if request.max_depth is not None
-                else self.dependency_depth
-            )
-            return engine.get_dependents(request.symbol, depth=depth, exact=False)
+            with get_global_scip_engine_cache().lease(scip_file) as engine:
+                # Bug #83-3 Fix: Use instance variable instead of hardcoded constant
+                depth = (
+                    request.max_depth
+                    if request.max_depth is not None
+                    else self.dependency_depth
+                )
+                return engine.get_dependents(request.symbol, depth=depth, exact=False)
         except Exception as e:
             logger.error(
                 format_error_log(
@@ -325,36 +328,41 @@ class SCIPMultiService:
             )
 
         try:
-            engine = SCIPQueryEngine(scip_file)
-            # Bug #83-3 Fix: Use instance variables instead of hardcoded constants
-            max_depth = (
-                request.max_depth
-                if request.max_depth is not None
-                else self.callchain_max_depth
-            )
-            limit = request.limit if request.limit is not None else self.callchain_limit
-            call_chains = engine.trace_call_chain(
-                request.from_symbol, request.to_symbol, max_depth=max_depth, limit=limit
-            )
+            with get_global_scip_engine_cache().lease(scip_file) as engine:
+                # Bug #83-3 Fix: Use instance variables instead of hardcoded constants
+                max_depth = (
+                    request.max_depth
+                    if request.max_depth is not None
+                    else self.callchain_max_depth
+                )
+                limit = (
+                    request.limit if request.limit is not None else self.callchain_limit
+                )
+                call_chains = engine.trace_call_chain(
+                    request.from_symbol,
+                    request.to_symbol,
+                    max_depth=max_depth,
+                    limit=limit,
+                )
 
-            # Convert CallChain objects to QueryResult objects
-            results = []
-            for chain in call_chains:
-                # Create a single QueryResult representing the chain
-                # chain.path is List[str] - symbol names in execution order
-                chain_str = " -> ".join(chain.path)
-                results.append(
-                    QueryResult(
-                        symbol=chain_str,
-                        project=repo_id,
-                        file_path="",
-                        line=0,
-                        column=0,
-                        kind="callchain",
-                        context=chain_str,
+                # Convert CallChain objects to QueryResult objects
+                results = []
+                for chain in call_chains:
+                    # Create a single QueryResult representing the chain
+                    # chain.path is List[str] - symbol names in execution order
+                    chain_str = " -> ".join(chain.path)
+                    results.append(
+                        QueryResult(
+                            symbol=chain_str,
+                            project=repo_id,
+                            file_path="",
+                            line=0,
+                            column=0,
+                            kind="callchain",
+                            context=chain_str,
+                        )
                     )
-                )
-            return results
+                return results
         except Exception as e:
             logger.error(
                 format_error_log(
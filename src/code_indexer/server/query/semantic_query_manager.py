@@ -10,6 +10,7 @@ from code_indexer.server.logging_utils import format_error_log, get_log_extra
 from code_indexer.storage.filesystem_vector_store import LocalIndexNotFoundError
 
 import contextvars
+import heapq
 import json
 import logging
 import re
@@ -17,7 +18,7 @@ import io
 import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
 import concurrent.futures
@@ -40,6 +41,12 @@ from ...proxy.cli_integration import _execute_query
 
 logger = logging.getLogger(__name__)
 
+# Per-leg deadlines for hybrid search, measured from the moment both legs are
+# dispatched. A leg that misses its deadline is dropped from the fusion and
+# reported as partial; the semantic leg's budget covers the embedding call.
+HYBRID_FTS_DEADLINE_SECONDS = 10.0
+HYBRID_SEMANTIC_DEADLINE_SECONDS = float(PARALLEL_TIMEOUT_SECONDS)
+
 
 class SemanticQueryError(Exception):
     """Base exception for semantic query operations."""
@@ -149,6 +156,9 @@ class QueryMetadata:
     # continue to compile.  query_user_repositories always populates them.
     effective_search_mode: Optional[str] = None
     effective_query_strategy: Optional[str] = None
+    # Hybrid legs ("<alias>:fts" / "<alias>:semantic") that missed their
+    # deadline or failed; non-empty means the results are partial.
+    missing_hybrid_legs: Optional[List[str]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API response."""
@@ -162,6 +172,9 @@ class QueryMetadata:
             result["effective_search_mode"] = self.effective_search_mode
         if self.effective_query_strategy is not None:
             result["effective_query_strategy"] = self.effective_query_strategy
+        if self.missing_hybrid_legs:
+            result["partial_results"] = True
+            result["missing_hybrid_legs"] = list(self.missing_hybrid_legs)
         return result
 
 
@@ -693,6 +706,8 @@ class SemanticQueryManager:
         # _perform_search -> _search_single_repository -> _execute_temporal_query
         # call chain instead of being re-derived generically below.
         _temporal_warning_out: List[str] = []
+        # Hybrid legs dropped for missing their deadline (partial results)
+        _hybrid_partial_out: List[str] = []
         try:
             # AC7 (Bug #1202): _perform_search returns (results, effective_strategy).
             # Routing decision is per-request; no singleton state.
@@ -739,6 +754,7 @@ class SemanticQueryManager:
                 temporal_embedder=temporal_embedder,
                 # Bug #1298: collect the embedder-specific warning, if any
                 _temporal_warning_out=_temporal_warning_out,
+                _hybrid_partial_out=_hybrid_partial_out,
             )
             # Unpack (results, effective_strategy) tuple; fall back gracefully if
             # a test patches _perform_search to return a plain list.
@@ -772,6 +788,7 @@ class SemanticQueryManager:
             timeout_occurred=timeout_occurred,
             effective_search_mode=search_mode,
             effective_query_strategy=effective_strategy,
+            missing_hybrid_legs=_hybrid_partial_out or None,
         )
 
         # Handle case where mocked _perform_search returns dict instead of QueryResult list
@@ -966,6 +983,8 @@ class SemanticQueryManager:
         # Bug #1298: out-param for the embedder-specific temporal "no
         # indexed collections" warning. Per-request, no shared state.
         _temporal_warning_out: Optional[List[str]] = None,
+        # Out-param collecting hybrid legs that missed their deadline.
+        _hybrid_partial_out: Optional[List[str]] = None,
     ) -> "Tuple[List[QueryResult], str]":
         """
         Perform the actual search across user repositories.
@@ -1106,6 +1125,7 @@ class SemanticQueryManager:
                     _effective_strategy_out=_strat_out,
                     # Bug #1298: relay the embedder-specific warning out-param
                     _temporal_warning_out=_temporal_warning_out,
+                    _hybrid_partial_out=_hybrid_partial_out,
                 )
                 # AC7: capture routing decision from the first resolved repo
                 if _strat_out and _effective_strategy == (
@@ -1232,6 +1252,9 @@ class SemanticQueryManager:
         # Bug #1298: out-param for the embedder-specific temporal "no
         # indexed collections" warning. Per-request, no shared state.
         _temporal_warning_out: Optional[List[str]] = None,
+        # Out-param collecting hybrid legs that missed their deadline.
+        # Per-request, no shared state.
+        _hybrid_partial_out: Optional[List[str]] = None,
     ) -> List[QueryResult]:
         """
         Search a single repository using the appropriate search service.
@@ -1788,10 +1811,8 @@ class SemanticQueryManager:
                     _temporal_warning_out=_temporal_warning_out,
                 )
 
-            # FTS SEARCH HANDLING (Story #503 - FTS Bug Fix)
-            # Execute FTS search when search_mode is 'fts' or 'hybrid'
-            if search_mode in ["fts", "hybrid"]:
-                fts_results = self._execute_fts_search(
+            def _fts_leg() -> List[QueryResult]:
+                return self._execute_fts_search(
                     repo_path=repo_path_obj,
                     repository_alias=repository_alias,
                     query_text=query_text,
@@ -1808,83 +1829,50 @@ class SemanticQueryManager:
                     regex=regex,
                 )
 
-                # For pure FTS mode, apply file_extensions filter and return
-                if search_mode == "fts":
-                    if file_extensions is not None:
-                        fts_results = [
-                            r
-                            for r in fts_results
-                            if Path(r.file_path).suffix.lower()
-                            in [ext.lower() for ext in file_extensions]
-                        ]
-                    return fts_results
-
-                # For hybrid mode, continue to semantic search and merge results
-                # Fall through to semantic search below
-
-            # SEMANTIC SEARCH
-            # Import SemanticSearchService and related models
-            from ..services.search_service import SemanticSearchService
-            from ..models.api_models import SemanticSearchRequest
-
-            # Create search service instance
-            search_service = SemanticSearchService()
-
-            # Create search request — Story #375: wire filter params through
-            search_request = SemanticSearchRequest(
-                query=query_text,
-                limit=limit,
-                include_source=True,
-                path_filter=path_filter,
-                language=language,
-                exclude_language=exclude_language,
-                exclude_path=exclude_path,
-                accuracy=accuracy,
-                # Story #1108 (S4): per-request cache bypass
-                no_embedding_cache_shortcut=no_embedding_cache_shortcut,
-            )
-
-            # Perform search on the repository using direct path
-            # Story #883 Phase C: pass precomputed vector to avoid duplicate Voyage call
-            search_response = search_service.search_repository_path(
-                repo_path=repo_path,
-                search_request=search_request,
-                precomputed_query_vector=precomputed_query_vector,
-            )
-
-            # Convert search results to QueryResult objects
-            semantic_results = []
-            for search_item in search_response.results:
-                # Apply min_score filter if specified
-                if min_score is not None and search_item.score < min_score:
-                    continue
-
-                # Apply file extension filter if specified
-                if file_extensions is not None:
-                    file_path = Path(search_item.file_path)
-                    if file_path.suffix.lower() not in [
-                        ext.lower() for ext in file_extensions
-                    ]:
-                        continue
-
-                # Convert SearchResultItem to QueryResult
-                # Annotate source_provider: named provider if given, else "primary" (Story #593)
-                query_result = QueryResult(
-                    file_path=search_item.file_path,
-                    line_number=search_item.line_start,  # Use start line as line number
-                    code_snippet=search_item.content,
-                    similarity_score=search_item.score,
+            def _semantic_leg() -> List[QueryResult]:
+                return self._execute_semantic_search(
+                    repo_path=repo_path,
                     repository_alias=repository_alias,
-                    source_repo=None,  # Single repository, no source_repo
-                    source_provider=preferred_provider or "primary",
+                    query_text=query_text,
+                    limit=limit,
+                    min_score=min_score,
+                    file_extensions=file_extensions,
+                    language=language,
+                    exclude_language=exclude_language,
+                    path_filter=path_filter,
+                    exclude_path=exclude_path,
+                    accuracy=accuracy,
+                    preferred_provider=preferred_provider,
+                    precomputed_query_vector=precomputed_query_vector,
+                    no_embedding_cache_shortcut=no_embedding_cache_shortcut,
                 )
-                semantic_results.append(query_result)
 
-            # For hybrid mode, merge FTS and semantic results
+            # FTS SEARCH HANDLING (Story #503 - FTS Bug Fix)
+            if search_mode == "fts":
+                fts_results = _fts_leg()
+                # For pure FTS mode, apply file_extensions filter and return
+                if file_extensions is not None:
+                    fts_results = [
+                        r
+                        for r in fts_results
+                        if Path(r.file_path).suffix.lower()
+                        in [ext.lower() for ext in file_extensions]
+                    ]
+                return fts_results
+
+            # HYBRID: both legs run concurrently, fused when both are in or
+            # when a leg misses its deadline (latency = slower leg, bounded)
             if search_mode == "hybrid":
-                return self._merge_hybrid_results(fts_results, semantic_results, limit)
+                return self._execute_hybrid_search(
+                    fts_leg=_fts_leg,
+                    semantic_leg=_semantic_leg,
+                    repository_alias=repository_alias,
+                    limit=limit,
+                    _hybrid_partial_out=_hybrid_partial_out,
+                )
 
-            return semantic_results
+            # SEMANTIC SEARCH
+            return _semantic_leg()
 
         except Exception as e:
             logger.error(
@@ -1900,6 +1888,173 @@ class SemanticQueryManager:
             # Re-raise exception to be handled by calling method
             raise
 
+    def _execute_semantic_search(
+        self,
+        repo_path: str,
+        repository_alias: str,
+        query_text: str,
+        limit: int,
+        min_score: Optional[float],
+        file_extensions: Optional[List[str]],
+        language: Optional[str],
+        exclude_language: Optional[str],
+        path_filter: Optional[str],
+        exclude_path: Optional[str],
+        accuracy: Optional[str],
+        preferred_provider: Optional[str],
+        precomputed_query_vector: Optional[List[float]],
+        no_embedding_cache_shortcut: bool,
+    ) -> List[QueryResult]:
+        """Run the semantic search for one non-composite repository.
+
+        Also the semantic leg of hybrid mode (see _execute_hybrid_search).
+
+        Returns:
+            QueryResult objects after min_score and file_extensions filtering
+        """
+        # Import SemanticSearchService and related models
+        from ..services.search_service import SemanticSearchService
+        from ..models.api_models import SemanticSearchRequest
+
+        # Create search service instance
+        search_service = SemanticSearchService()
+
+        # Create search request — Story #375: wire filter params through
+        search_request = SemanticSearchRequest(
+            query=query_text,
+            limit=limit,
+            include_source=True,
+            path_filter=path_filter,
+            language=language,
+            exclude_language=exclude_language,
+            exclude_path=exclude_path,
+            accuracy=accuracy,
+            # Story #1108 (S4): per-request cache bypass
+            no_embedding_cache_shortcut=no_embedding_cache_shortcut,
+        )
+
+        # Perform search on the repository using direct path
+        # Story #883 Phase C: pass precomputed vector to avoid duplicate Voyage call
+        search_response = search_service.search_repository_path(
+            repo_path=repo_path,
+            search_request=search_request,
+            precomputed_query_vector=precomputed_query_vector,
+        )
+
+        # Convert search results to QueryResult objects
+        semantic_results = []
+        for search_item in search_response.results:
+            # Apply min_score filter if specified
+            if min_score is not None and search_item.score < min_score:
+                continue
+
+            # Apply file extension filter if specified
+            if file_extensions is not None:
+                file_path = Path(search_item.file_path)
+                if file_path.suffix.lower() not in [
+                    ext.lower() for ext in file_extensions
+                ]:
+                    continue
+
+            # Convert SearchResultItem to QueryResult
+            # Annotate source_provider: named provider if given, else "primary" (Story #593)
+            query_result = QueryResult(
+                file_path=search_item.file_path,
+                line_number=search_item.line_start,  # Use start line as line number
+                code_snippet=search_item.content,
+                similarity_score=search_item.score,
+                repository_alias=repository_alias,
+                source_repo=None,  # Single repository, no source_repo
+                source_provider=preferred_provider or "primary",
+            )
+            semantic_results.append(query_result)
+
+        return semantic_results
+
+    def _execute_hybrid_search(
+        self,
+        fts_leg: Callable[[], List[QueryResult]],
+        semantic_leg: Callable[[], List[QueryResult]],
+        repository_alias: str,
+        limit: int,
+        fts_deadline_seconds: float = HYBRID_FTS_DEADLINE_SECONDS,
+        semantic_deadline_seconds: float = HYBRID_SEMANTIC_DEADLINE_SECONDS,
+        _hybrid_partial_out: Optional[List[str]] = None,
+    ) -> List[QueryResult]:
+        """Run the FTS and semantic legs of a hybrid query concurrently.
+
+        Both legs are submitted together to the shared server query executor
+        (a per-call two-thread pool outside the server), so hybrid latency is
+        that of the slower leg rather than their sum. Each leg has its own
+        deadline measured from dispatch; a leg that misses it, or fails, is
+        left out and the other leg's results are fused alone. The missing
+        legs are recorded as ``"<alias>:fts"`` / ``"<alias>:semantic"`` in
+        _hybrid_partial_out so the response can flag partial results.
+
+        Raises:
+            The first leg's exception when both legs fail; TimeoutError when
+            neither leg completed within its deadline.
+        """
+        from ..services.search_service import _get_query_executor
+
+        shared_executor = _get_query_executor()
+        executor = shared_executor or ThreadPoolExecutor(max_workers=2)
+        deadlines = {
+            "fts": fts_deadline_seconds,
+            "semantic": semantic_deadline_seconds,
+        }
+        dispatched = time.monotonic()
+        try:
+            futures = {
+                "fts": executor.submit(contextvars.copy_context().run, fts_leg),
+                "semantic": executor.submit(
+                    contextvars.copy_context().run, semantic_leg
+                ),
+            }
+            leg_results: Dict[str, List[QueryResult]] = {}
+            leg_errors: Dict[str, BaseException] = {}
+            missing: List[str] = []
+            for leg, future in futures.items():
+                remaining = deadlines[leg] - (time.monotonic() - dispatched)
+                try:
+                    leg_results[leg] = future.result(timeout=max(remaining, 0.0))
+                except concurrent.futures.TimeoutError:
+                    future.cancel()
+                    missing.append(leg)
+                    logger.warning(
+                        "Hybrid %s leg for %s missed its %.1fs deadline; "
+                        "returning partial results",
+                        leg,
+                        repository_alias,
+                        deadlines[leg],
+                    )
+                except Exception as e:
+                    leg_errors[leg] = e
+                    missing.append(leg)
+                    logger.warning(
+                        "Hybrid %s leg for %s failed: %s; returning partial results",
+                        leg,
+                        repository_alias,
+                        e,
+                    )
+        finally:
+            if shared_executor is None:
+                # Never block on a leg that overran its deadline
+                executor.shutdown(wait=False)
+
+        if not leg_results:
+            if leg_errors:
+                raise next(iter(leg_errors.values()))
+            raise TimeoutError(
+                f"Hybrid search of {repository_alias} missed both leg deadlines"
+            )
+        if missing and _hybrid_partial_out is not None:
+            _hybrid_partial_out.extend(f"{repository_alias}:{leg}" for leg in missing)
+
+        return self._merge_hybrid_results(
+            leg_results.get("fts", []), leg_results.get("semantic", []), limit
+        )
+
     def _search_with_provider(
         self,
         repo_path: str,
@@ -2608,52 +2763,42 @@ class SemanticQueryManager:
         Returns:
             Merged and deduplicated list of QueryResult objects
         """
-        # Use file_path + line_number as key for deduplication
-        merged_results = []
-        rrf_scores: Dict[Tuple[str, int], float] = {}
-
         # Constant for RRF scoring (typically 60)
         k = 60
 
-        # Calculate RRF scores for FTS results
+        # One pass per leg, keyed by file_path + line_number for deduplication:
+        # key -> [rrf_score, result]. The last FTS result for a key wins over
+        # any semantic one (FTS content is preferred), as before.
+        fused: Dict[Tuple[str, int], List[Any]] = {}
         for rank, result in enumerate(fts_results, start=1):
             key = (result.file_path, result.line_number)
-            rrf_score = 1.0 / (k + rank)
-            rrf_scores[key] = rrf_scores.get(key, 0) + rrf_score
-
-        # Calculate RRF scores for semantic results
+            entry = fused.get(key)
+            if entry is None:
+                fused[key] = [1.0 / (k + rank), result]
+            else:
+                entry[0] += 1.0 / (k + rank)
+                entry[1] = result
+        fts_keys = set(fused)
         for rank, result in enumerate(semantic_results, start=1):
             key = (result.file_path, result.line_number)
-            rrf_score = 1.0 / (k + rank)
-            rrf_scores[key] = rrf_scores.get(key, 0) + rrf_score
-
-        # Create a mapping of keys to results (prefer FTS for content)
-        result_map = {}
-        for result in semantic_results:
-            key = (result.file_path, result.line_number)
-            result_map[key] = result
-
-        for result in fts_results:
-            key = (result.file_path, result.line_number)
-            result_map[key] = result  # FTS overwrites semantic for same key
-
-        # Sort by RRF score and build merged results
-        sorted_keys = sorted(
-            rrf_scores.keys(), key=lambda k: rrf_scores[k], reverse=True
-        )
-
-        for key in sorted_keys[:limit]:
-            if key in result_map:
-                result = result_map[key]
-                # Update similarity score to RRF score
-                merged_result = QueryResult(
-                    file_path=result.file_path,
-                    line_number=result.line_number,
-                    code_snippet=result.code_snippet,
-                    similarity_score=rrf_scores[key],
-                    repository_alias=result.repository_alias,
-                    source_repo=result.source_repo,
-                )
-                merged_results.append(merged_result)
-
-        return merged_results
+            entry = fused.get(key)
+            if entry is None:
+                fused[key] = [1.0 / (k + rank), result]
+            else:
+                entry[0] += 1.0 / (k + rank)
+                if key not in fts_keys:
+                    entry[1] = result
+
+        # Top `limit` by RRF score (stable for ties, like sorted())
+        top = heapq.nlargest(limit, fused.values(), key=lambda entry: entry[0])
+        return [
+            QueryResult(
+                file_path=result.file_path,
+                line_number=result.line_number,
+                code_snippet=result.code_snippet,
+                similarity_score=score,
+                repository_alias=result.repository_alias,
+                source_repo=result.source_repo,
+            )
+            for score, result in top
+        ]
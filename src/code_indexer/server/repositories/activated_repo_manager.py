@@ -31,6 +31,7 @@ from pydantic import BaseModel
 
 from .golden_repo_manager import GoldenRepoManager
 from .background_jobs import BackgroundJobManager
+from .repository_stats import update_repository_stats
 from ..services.committer_resolution_service import CommitterResolutionService
 from ..services.job_tracker import DuplicateJobError
 from ..git.git_subprocess_env import build_non_interactive_git_env
@@ -1533,6 +1534,15 @@ class ActivatedRepoManager:
                 if _gr_sync is not None and current_branch != _gr_sync.default_branch:
                     self._run_branch_delta_index(repo_dir, user_alias)
 
+            # Step 4.6: Apply the merged diff to the repo stats inherited
+            # from the golden snapshot (non-fatal; recomputed on demand).
+            try:
+                update_repository_stats(repo_dir)
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to update repository stats for '{user_alias}': {e}"
+                )
+
             # Step 5: Return success message with details
             changed_files = (
                 diff_result.stdout.strip().split("\n")
@@ -38,6 +38,9 @@ from pydantic import BaseModel
 from code_indexer.server.logging_utils import format_error_log, mask_url_credentials
 from code_indexer.server.git.git_subprocess_env import build_non_interactive_git_env
 from code_indexer.utils.subprocess_env import build_cidx_subprocess_env
+from code_indexer.server.repositories.repository_stats import (
+    materialize_repository_stats,
+)
 
 # Story #876 D4 — cluster-atomic lifecycle registration hook.
 # Imported at module level so the symbol is attachable via
@@ -617,6 +620,16 @@ class GoldenRepoManager:
                     orphan_event_callback=_make_hnsw_orphan_event_logger(alias),
                 )
 
+                # Materialize file statistics next to the fresh index so the
+                # listing/stats endpoints never walk the repository per request
+                # (non-fatal; recomputed on demand).
+                try:
+                    materialize_repository_stats(clone_path)
+                except Exception as e:
+                    logging.warning(
+                        f"Failed to materialize repository stats for {alias}: {e}"
+                    )
+
                 # Create golden repository record
                 created_at = datetime.now(timezone.utc).isoformat()
                 golden_repo = GoldenRepo(
@@ -3174,6 +3187,12 @@ class GoldenRepoManager:
                 current_target,
                 _cache_evict_err,
             )
+        if current_target:
+            from code_indexer.server.cache.scip_engine_cache import (
+                invalidate_scip_engines_under,
+            )
+
+            invalidate_scip_engines_under(current_target)
 
         # Bug #1084 Phase A4: schedule cleanup only for versioned snapshots, never
         # the master base clone (golden-repos/{alias}/). Canonical predicate
@@ -3880,6 +3899,11 @@ class GoldenRepoManager:
                             raise GoldenRepoError(
                                 f"Failed to create SCIP index: {error_details}"
                             )
+                        from code_indexer.server.cache.scip_engine_cache import (
+                            invalidate_scip_engines_under,
+                        )
+
+                        invalidate_scip_engines_under(repo_path)
                         if progress_callback is not None:
                             progress_callback(
                                 int(allocator.phase_end("scip")),
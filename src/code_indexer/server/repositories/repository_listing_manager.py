@@ -12,10 +12,10 @@ import os
 import subprocess
 import logging
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timezone
 
 from .golden_repo_manager import GoldenRepoManager
 from .activated_repo_manager import ActivatedRepoManager
+from .repository_stats import get_repository_stats
 
 logger = logging.getLogger(__name__)
 
@@ -316,24 +316,15 @@ class RepositoryListingManager:
         if not golden_repo:
             raise RepositoryListingError(f"Repository '{alias}' not found")
 
-        clone_path = golden_repo["clone_path"]
-
-        # Calculate file count
-        file_count = self._get_repository_file_count(clone_path)
-
-        # Calculate index size (directory size)
-        index_size = self._get_repository_index_size(clone_path)
-
-        # Get last modified time
-        try:
-            last_updated = self._get_repository_last_modified(clone_path)
-        except Exception:
-            last_updated = golden_repo["created_at"]
+        # Materialized at index time and kept current by refresh/sync;
+        # computed (and stored) on first use for repos indexed earlier.
+        stats = get_repository_stats(golden_repo["clone_path"])
 
         return {
-            "file_count": file_count,
-            "index_size": index_size,
-            "last_updated": last_updated,
+            "file_count": stats.file_count,
+            "index_size": stats.total_size_bytes,
+            "last_updated": stats.last_modified or golden_repo["created_at"],
+            "stats_as_of": stats.stats_as_of,
         }
 
     def get_activation_count(self, golden_repo_alias: str) -> int:
@@ -401,102 +392,3 @@ class RepositoryListingManager:
         return self.list_available_repositories(
             username=username, status_filter=status_filter
         )
-
-    def _get_repository_file_count(self, repo_path: str) -> int:
-        """
-        Count files in repository (excluding .git directory).
-
-        Args:
-            repo_path: Path to repository
-
-        Returns:
-            Number of files
-        """
-        file_count = 0
-        try:
-            for root, dirs, files in os.walk(repo_path):
-                # Skip .git directory
-                if ".git" in root:
-                    continue
-                file_count += len(files)
-        except Exception:
-            logger.warning(
-                format_error_log(
-                    "REPO-MIGRATE-005", "Failed to count files in {repo_path}: {e}"
-                ),
-                extra=get_log_extra("REPO-MIGRATE-005"),
-            )
-
-        return file_count
-
-    def _get_repository_index_size(self, repo_path: str) -> int:
-        """
-        Get total size of repository in bytes.
-
-        Args:
-            repo_path: Path to repository
-
-        Returns:
-            Size in bytes
-        """
-        total_size = 0
-        try:
-            for root, dirs, files in os.walk(repo_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        total_size += os.path.getsize(file_path)
-                    except OSError:
-                        # Skip files we can't access
-                        pass
-        except Exception:
-            logger.warning(
-                format_error_log(
-                    "REPO-MIGRATE-006", "Failed to calculate size for {repo_path}: {e}"
-                ),
-                extra=get_log_extra("REPO-MIGRATE-006"),
-            )
-
-        return total_size
-
-    def _get_repository_last_modified(self, repo_path: str) -> str:
-        """
-        Get last modified timestamp for repository.
-
-        Args:
-            repo_path: Path to repository
-
-        Returns:
-            ISO formatted timestamp
-        """
-        try:
-            # Get the most recent modification time in the repository
-            latest_mtime: float = 0.0
-            for root, dirs, files in os.walk(repo_path):
-                # Skip .git directory for performance
-                if ".git" in root:
-                    continue
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        mtime = os.path.getmtime(file_path)
-                        if mtime > latest_mtime:
-                            latest_mtime = mtime
-                    except OSError:
-                        # Skip files we can't access
-                        pass
-
-            if latest_mtime > 0:
-                return datetime.fromtimestamp(latest_mtime, tz=timezone.utc).isoformat()
-            else:
-                return datetime.now(timezone.utc).isoformat()
-
-        except Exception:
-            logger.warning(
-                format_error_log(
-                    "REPO-MIGRATE-007",
-                    "Failed to get last modified time for {repo_path}: {e}",
-                ),
-                extra=get_log_extra("REPO-MIGRATE-007"),
-            )
-            return datetime.now(timezone.utc).isoformat()
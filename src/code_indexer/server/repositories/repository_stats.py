@@ -0,0 +1,348 @@
+"""
+Materialized repository statistics.
+
+Listing and stats endpoints used to walk the whole repository on every
+request (file count, size, last-modified, per-language counts) -- seconds
+per repository on NFS-hosted golden repos. Statistics are now computed once
+when a repository is indexed, updated incrementally from the git diff of
+each refresh or sync, and stored next to the index in
+``<repo>/.code-indexer/repo_stats.json``. Versioned snapshots and activated
+repositories are CoW copies of the indexed source, so they inherit the file.
+
+Every stored record carries ``stats_as_of`` (when the numbers were last
+brought up to date) and the ``commit`` they describe; an update applies the
+``git diff`` from that commit to HEAD, and falls back to a full walk when
+there is no usable record.
+
+Working-tree statistics exclude the ``.git`` and ``.code-indexer``
+directories; ``total_size_bytes`` includes them.
+"""
+
+import json
+import logging
+import os
+import subprocess
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+REPO_STATS_FILENAME = "repo_stats.json"
+
+# Directories that hold repository metadata rather than repository files
+_METADATA_DIRS = (".git", ".code-indexer")
+
+# Files above this size count as "large" in the health assessment
+LARGE_FILE_BYTES = 1024 * 1024
+
+# File extension to language mapping
+LANGUAGE_EXTENSIONS = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".java": "java",
+    ".c": "c",
+    ".cpp": "cpp",
+    ".cc": "cpp",
+    ".cxx": "cpp",
+    ".h": "c",
+    ".hpp": "cpp",
+    ".cs": "csharp",
+    ".go": "go",
+    ".rs": "rust",
+    ".php": "php",
+    ".rb": "ruby",
+    ".swift": "swift",
+    ".kt": "kotlin",
+    ".scala": "scala",
+    ".sql": "sql",
+    ".html": "html",
+    ".css": "css",
+    ".scss": "scss",
+    ".sass": "sass",
+    ".less": "less",
+    ".vue": "vue",
+    ".jsx": "jsx",
+    ".tsx": "tsx",
+    ".md": "markdown",
+    ".rst": "rst",
+    ".txt": "text",
+    ".json": "json",
+    ".xml": "xml",
+    ".yml": "yaml",
+    ".yaml": "yaml",
+    ".toml": "toml",
+    ".ini": "ini",
+    ".cfg": "config",
+    ".conf": "config",
+    ".sh": "shell",
+    ".bash": "shell",
+    ".zsh": "shell",
+    ".fish": "shell",
+    ".ps1": "powershell",
+    ".bat": "batch",
+    ".cmd": "batch",
+}
+
+# Extensions counted as indexed source files
+INDEXABLE_EXTENSIONS = frozenset(
+    {
+        ".py",
+        ".js",
+        ".ts",
+        ".java",
+        ".c",
+        ".cpp",
+        ".h",
+        ".hpp",
+        ".cs",
+        ".go",
+        ".rs",
+        ".php",
+        ".rb",
+        ".swift",
+        ".kt",
+        ".scala",
+        ".sql",
+        ".html",
+        ".css",
+        ".vue",
+        ".jsx",
+        ".tsx",
+    }
+)
+
+
+@dataclass
+class RepositoryStats:
+    """Aggregated file statistics of one repository checkout."""
+
+    file_count: int = 0
+    indexable_file_count: int = 0
+    large_file_count: int = 0
+    working_size_bytes: int = 0
+    metadata_size_bytes: int = 0
+    total_size_bytes: int = 0
+    by_language: Dict[str, int] = field(default_factory=dict)
+    last_modified: Optional[str] = None
+    commit: Optional[str] = None
+    stats_as_of: str = ""
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RepositoryStats":
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+    def _apply_file(self, rel_path: str, size: int, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one working-tree file."""
+        extension = os.path.splitext(rel_path)[1].lower()
+        self.file_count += sign
+        self.working_size_bytes += sign * size
+        if extension in INDEXABLE_EXTENSIONS:
+            self.indexable_file_count += sign
+        if size > LARGE_FILE_BYTES:
+            self.large_file_count += sign
+        language = LANGUAGE_EXTENSIONS.get(extension)
+        if language:
+            count = self.by_language.get(language, 0) + sign
+            if count > 0:
+                self.by_language[language] = count
+            else:
+                self.by_language.pop(language, None)
+
+    def _note_mtime(self, mtime: float) -> None:
+        stamp = datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat()
+        if self.last_modified is None or stamp > self.last_modified:
+            self.last_modified = stamp
+
+
+def _stats_file(repo_path: str) -> Path:
+    return Path(repo_path) / ".code-indexer" / REPO_STATS_FILENAME
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _git(repo_path: str, args: List[str], stdin: Optional[str] = None) -> str:
+    result = subprocess.run(
+        ["git", *args],
+        cwd=repo_path,
+        input=stdin,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"git {args[0]} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def get_head_commit(repo_path: str) -> Optional[str]:
+    """Return HEAD's commit hash, or None for non-git directories."""
+    try:
+        return _git(repo_path, ["rev-parse", "HEAD"]).strip() or None
+    except Exception:
+        return None
+
+
+def _tree_size(path: str) -> int:
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _measure_metadata(repo_path: str, stats: RepositoryStats) -> None:
+    stats.metadata_size_bytes = sum(
+        _tree_size(os.path.join(repo_path, d)) for d in _METADATA_DIRS
+    )
+    stats.total_size_bytes = stats.working_size_bytes + stats.metadata_size_bytes
+
+
+def compute_repository_stats(repo_path: str) -> RepositoryStats:
+    """Full walk of ``repo_path``: one stat per file."""
+    stats = RepositoryStats(commit=get_head_commit(repo_path))
+    for root, dirs, files in os.walk(repo_path):
+        if root == repo_path:
+            dirs[:] = [d for d in dirs if d not in _METADATA_DIRS]
+        for name in files:
+            full_path = os.path.join(root, name)
+            try:
+                stat_info = os.lstat(full_path)
+            except OSError:
+                continue
+            stats._apply_file(name, stat_info.st_size, 1)
+            stats._note_mtime(stat_info.st_mtime)
+    _measure_metadata(repo_path, stats)
+    stats.stats_as_of = _now()
+    return stats
+
+
+def load_repository_stats(repo_path: str) -> Optional[RepositoryStats]:
+    """Return the stored statistics, or None when missing or unreadable."""
+    try:
+        with open(_stats_file(repo_path)) as f:
+            return RepositoryStats.from_dict(json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def save_repository_stats(repo_path: str, stats: RepositoryStats) -> None:
+    """Atomically write ``stats`` next to the repository's index."""
+    path = _stats_file(repo_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(stats.to_dict(), f)
+    os.replace(tmp_path, path)
+
+
+def get_repository_stats(repo_path: str) -> RepositoryStats:
+    """Serve stored statistics, materializing them on first use."""
+    stats = load_repository_stats(repo_path)
+    if stats is None:
+        stats = materialize_repository_stats(repo_path)
+    return stats
+
+
+def materialize_repository_stats(repo_path: str) -> RepositoryStats:
+    """Recompute from a full walk and store (after an initial index).
+
+    A store failure (read-only or missing checkout) is logged and the
+    freshly computed statistics are still returned.
+    """
+    stats = compute_repository_stats(repo_path)
+    if os.path.isdir(repo_path):
+        try:
+            save_repository_stats(repo_path, stats)
+        except OSError as e:
+            logger.warning(f"Could not store repository stats for {repo_path}: {e}")
+    return stats
+
+
+def _parse_name_status(output: str) -> Iterable[Tuple[str, str]]:
+    """Yield (status letter, path) from ``git diff --name-status -z``."""
+    fields = output.split("\0")
+    i = 0
+    while i + 1 < len(fields):
+        yield fields[i][:1], fields[i + 1]
+        i += 2
+
+
+def _blob_sizes(repo_path: str, commit: str, paths: List[str]) -> Dict[str, int]:
+    """Sizes of ``paths`` as of ``commit`` (one git cat-file call)."""
+    if not paths:
+        return {}
+    output = _git(
+        repo_path,
+        ["cat-file", "--batch-check=%(objectsize)"],
+        stdin="".join(f"{commit}:{p}\n" for p in paths),
+    )
+    sizes: Dict[str, int] = {}
+    for path, line in zip(paths, output.splitlines()):
+        if line.isdigit():
+            sizes[path] = int(line)
+    return sizes
+
+
+def update_repository_stats(repo_path: str) -> RepositoryStats:
+    """Bring stored statistics up to date after a refresh or sync.
+
+    Applies the diff between the commit the stored statistics describe and
+    HEAD. Without a usable stored record (none yet, non-git directory,
+    commit no longer in history) the statistics are recomputed from a full
+    walk. The metadata directories are re-measured either way.
+    """
+    stats = load_repository_stats(repo_path)
+    head = get_head_commit(repo_path)
+    if stats is None or stats.commit is None or head is None:
+        return materialize_repository_stats(repo_path)
+    before_commit = stats.commit
+
+    try:
+        changes: List[Tuple[str, str]] = []
+        if head != before_commit:
+            diff = _git(
+                repo_path,
+                ["diff", "--name-status", "-z", "--no-renames", before_commit, head],
+            )
+            changes = [
+                (status, rel_path)
+                for status, rel_path in _parse_name_status(diff)
+                if rel_path.split("/", 1)[0] not in _METADATA_DIRS
+            ]
+        old_sizes = _blob_sizes(
+            repo_path, before_commit, [p for s, p in changes if s in ("D", "M", "T")]
+        )
+    except Exception as e:
+        logger.warning(f"Incremental stats update failed for {repo_path}: {e}")
+        return materialize_repository_stats(repo_path)
+
+    for status, rel_path in changes:
+        if rel_path in old_sizes:
+            stats._apply_file(rel_path, old_sizes[rel_path], -1)
+        if status in ("A", "M", "T"):
+            try:
+                stat_info = os.lstat(os.path.join(repo_path, rel_path))
+            except OSError:
+                continue
+            stats._apply_file(rel_path, stat_info.st_size, 1)
+            stats._note_mtime(stat_info.st_mtime)
+    _measure_metadata(repo_path, stats)
+    stats.commit = head
+    stats.stats_as_of = _now()
+    try:
+        save_repository_stats(repo_path, stats)
+    except OSError as e:
+        logger.warning(f"Could not store repository stats for {repo_path}: {e}")
+    return stats
@@ -116,6 +116,15 @@ def _get_healthz_status() -> HealthStatus:
     return status_value
 
 
+def _scip_engine_cache_stats() -> dict:
+    """Return SCIP engine pool statistics as a JSON-serializable dict."""
+    from dataclasses import asdict
+
+    from code_indexer.server.cache import get_global_scip_engine_cache
+
+    return asdict(get_global_scip_engine_cache().get_stats())
+
+
 def register_misc_routes(
     app: FastAPI,
     *,
@@ -362,6 +371,15 @@ def register_misc_routes(
                         "created_at": str (ISO datetime),
                         "ttl_remaining_seconds": float
                     }
+                },
+                "scip_engine_cache": {
+                    "cached_databases": int,
+                    "hit_count": int,
+                    "miss_count": int,
+                    "hit_ratio": float,
+                    "avg_setup_ms": float,
+                    "avg_hit_acquire_ms": float,
+                    ...
                 }
             }
         """
@@ -384,6 +402,7 @@ def register_misc_routes(
                 "hit_ratio": stats.hit_ratio,
                 "eviction_count": stats.eviction_count,
                 "per_repository_stats": stats.per_repository_stats,
+                "scip_engine_cache": _scip_engine_cache_stats(),
             }
 
         except Exception as e:
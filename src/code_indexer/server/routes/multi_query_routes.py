@@ -21,6 +21,7 @@ from ..multi import (
     MultiSearchRequest,
     MultiSearchResponse,
 )
+from ..multi.models import MultiSearchMetadata
 from code_indexer.server.services.api_metrics_service import api_metrics_service
 
 logger = logging.getLogger(__name__)
@@ -58,6 +59,23 @@ def _apply_multi_truncation(
     return grouped_results
 
 
+def _prune_to_accessible_repos(repositories: List[str], user: User) -> List[str]:
+    """Drop repositories the user cannot access before fan-out (Story #707).
+
+    Invisible repo pattern: inaccessible targets are silently removed rather
+    than reported, and are never searched. Returns the list unchanged when no
+    AccessFilteringService is configured.
+    """
+    from ..mcp.handlers._utils import _get_access_filtering_service
+
+    access_service = _get_access_filtering_service()
+    if access_service is None:
+        return repositories
+    return access_service.filter_repo_aliases(  # type: ignore[no-any-return]
+        repositories, user.username
+    )
+
+
 # Create router with /api/query prefix
 router = APIRouter(prefix="/api/query", tags=["multi-query"])
 
@@ -189,6 +207,16 @@ def multi_repository_query(
             f"{len(request.repositories)} repos, type={request.search_type}"
         )
 
+        request.repositories = _prune_to_accessible_repos(request.repositories, user)
+        if not request.repositories:
+            return MultiSearchResponse(
+                results={},
+                metadata=MultiSearchMetadata(
+                    total_results=0, total_repos_searched=0, execution_time_ms=0
+                ),
+                errors=None,
+            )
+
         # Get service instance
         service = get_multi_search_service()
 
@@ -12,11 +12,16 @@ Key principles:
 - Invisible repo pattern: No 403 errors, repos simply don't appear
 - cidx-meta always accessible to everyone
 - admins group has full access to all repos
-- Group membership checked fresh each query (no caching)
+- Per-user access sets are cached for at most ACCESS_CACHE_TTL seconds and
+  dropped immediately on any local grant/revoke/membership change (the TTL
+  bounds staleness for changes made on other cluster nodes)
+- Omni/multi-repo search prunes its target list with the cached access set
+  before fan-out, so no over-fetch is needed to compensate for filtering
 """
 
 import logging
 import re
+import threading
 import time
 from pathlib import Path
 from typing import (
@@ -27,6 +32,7 @@ from typing import (
     Optional,
     Protocol,
     Set,
+    Tuple,
     runtime_checkable,
 )
 
@@ -68,6 +74,11 @@ class AccessFilteringService:
     # Bug #338: TTL for _get_all_repo_aliases() cache (seconds)
     REPO_ALIASES_CACHE_TTL = 60
 
+    # TTL for the per-user (is_admin, accessible repos) cache (seconds). Kept
+    # short: local changes invalidate immediately, the TTL only bounds how long
+    # a change made on another cluster node can go unnoticed.
+    ACCESS_CACHE_TTL = 5
+
     def __init__(
         self,
         group_access_manager: GroupAccessManager,
@@ -97,27 +108,47 @@ class AccessFilteringService:
         # Bug #338: TTL cache for _get_all_repo_aliases()
         self._repo_aliases_cache: Optional[Set[str]] = None
         self._repo_aliases_cache_time: float = 0.0
+        # Per-user access cache: user_id -> (version, cached_at, is_admin, repos).
+        # Entries from an older _access_version are treated as misses.
+        self._access_cache: Dict[str, Tuple[int, float, bool, frozenset]] = {}
+        self._access_version = 0
+        self._access_cache_lock = threading.Lock()
         # Bug #338: Register automatic cache invalidation on any repo access change
         group_access_manager.register_on_repo_change(self.invalidate_repo_aliases_cache)
+        group_access_manager.register_on_membership_change(self.invalidate_access_cache)
 
-    def get_accessible_repos(self, user_id: str) -> Set[str]:
-        """
-        Get set of repos accessible by user's group.
+    def _get_access_entry(self, user_id: str) -> Tuple[bool, frozenset]:
+        """Return (is_admin, accessible repos) for a user, cached per version.
 
-        cidx-meta is always included. For admin users, all repos are
-        accessible (returns special marker for full access).
-
-        Args:
-            user_id: The user's unique identifier
-
-        Returns:
-            Set of repository names the user can access
+        Resolves group membership and group repos at most once per
+        ACCESS_CACHE_TTL per user; invalidate_access_cache() (wired to every
+        local grant/revoke/membership change) makes the next call re-resolve.
         """
+        now = time.monotonic()
+        with self._access_cache_lock:
+            version = self._access_version
+            entry = self._access_cache.get(user_id)
+            if (
+                entry is not None
+                and entry[0] == version
+                and (now - entry[1]) < self.ACCESS_CACHE_TTL
+            ):
+                return entry[2], entry[3]
+
+        is_admin, repos = self._resolve_access(user_id)
+        with self._access_cache_lock:
+            # Do not publish a result computed against a superseded version.
+            if self._access_version == version:
+                self._access_cache[user_id] = (version, now, is_admin, repos)
+        return is_admin, repos
+
+    def _resolve_access(self, user_id: str) -> Tuple[bool, frozenset]:
+        """Resolve (is_admin, accessible repos) from the group manager."""
         group = self.group_manager.get_user_group(user_id)
 
         if not group:
             # User not assigned to any group - cidx-meta only
-            return {CIDX_META_REPO}
+            return False, frozenset({CIDX_META_REPO})
 
         # Admin group has full access to ALL repos from ALL groups
         if group.name == self.ADMIN_GROUP_NAME:
@@ -127,12 +158,33 @@ class AccessFilteringService:
                 group_repos = self.group_manager.get_group_repos(grp.id)
                 all_repos.update(group_repos)
             all_repos.add(CIDX_META_REPO)
-            return all_repos
+            return True, frozenset(all_repos)
 
         # Regular group - get explicitly assigned repos
         repos = set(self.group_manager.get_group_repos(group.id))
         repos.add(CIDX_META_REPO)  # Always include cidx-meta
-        return repos
+        return False, frozenset(repos)
+
+    def invalidate_access_cache(self) -> None:
+        """Drop all cached per-user access sets (next lookup re-resolves)."""
+        with self._access_cache_lock:
+            self._access_version += 1
+            self._access_cache.clear()
+
+    def get_accessible_repos(self, user_id: str) -> Set[str]:
+        """
+        Get set of repos accessible by user's group.
+
+        cidx-meta is always included. For admin users, all repos are
+        accessible (returns special marker for full access).
+
+        Args:
+            user_id: The user's unique identifier
+
+        Returns:
+            Set of repository names the user can access
+        """
+        return set(self._get_access_entry(user_id)[1])
 
     def is_admin_user(self, user_id: str) -> bool:
         """
@@ -144,8 +196,7 @@ class AccessFilteringService:
         Returns:
             True if user is in admins group
         """
-        group = self.group_manager.get_user_group(user_id)
-        return group is not None and group.name == self.ADMIN_GROUP_NAME
+        return self._get_access_entry(user_id)[0]
 
     def _get_repo_alias(self, result: Any) -> str:
         """
@@ -194,13 +245,37 @@ class AccessFilteringService:
             return []
 
         # Admin users see everything
-        if self.is_admin_user(user_id):
+        is_admin, accessible = self._get_access_entry(user_id)
+        if is_admin:
             return results
 
-        accessible = self.get_accessible_repos(user_id)
-
         return [r for r in results if self._get_repo_alias(r) in accessible]
 
+    def filter_repo_aliases(self, aliases: List[str], user_id: str) -> List[str]:
+        """
+        Prune a search target list to the repos the user can access.
+
+        Used before omni/multi-repo fan-out so inaccessible repos are never
+        searched, hydrated or reranked. Aliases are compared with the -global
+        suffix stripped (same normalization as filter_query_results); order is
+        preserved.
+
+        Args:
+            aliases: Repository aliases selected for a search
+            user_id: The user's unique identifier
+
+        Returns:
+            The accessible subset of aliases
+        """
+        if not aliases:
+            return []
+
+        is_admin, accessible = self._get_access_entry(user_id)
+        if is_admin:
+            return aliases
+
+        return [a for a in aliases if a.removesuffix("-global") in accessible]
+
     def filter_repo_listing(self, repos: List[str], user_id: str) -> List[str]:
         """
         Filter repository listing by user's accessible repos.
@@ -309,6 +384,7 @@ class AccessFilteringService:
         """
         self._repo_aliases_cache = None
         self._repo_aliases_cache_time = 0.0
+        self.invalidate_access_cache()
 
     def filter_cidx_meta_files(self, files: List[str], user_id: str) -> List[str]:
         """
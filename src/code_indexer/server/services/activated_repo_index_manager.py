@@ -852,6 +852,11 @@ class ActivatedRepoIndexManager:
                     "error": f"SCIP generation failed: {result.stderr}",
                 }
 
+            from code_indexer.server.cache.scip_engine_cache import (
+                invalidate_scip_engines_under,
+            )
+
+            invalidate_scip_engines_under(repo_path)
             return {"success": True, "message": "SCIP generation completed"}
 
         except Exception as e:
@@ -0,0 +1,131 @@
+"""OTEL export for the authentication cache and auth latency (``cidx.auth.*``).
+
+The cache lives on the server's UserManager (``server/auth/auth_cache.py``)
+and is per worker process, so every instrument reads ``AuthCache.
+get_stats()`` directly. ``hits`` and ``misses`` count principal and user
+lookups since process start; latency percentiles cover the most recent
+authentications of each method (jwt, oauth, mcp_credentials).
+
+Instruments (all pull-based ObservableGauge):
+  cidx.auth.cache.entries     -- cached verified principals + users
+  cidx.auth.cache.hits        -- lookups served from the cache
+  cidx.auth.cache.misses      -- lookups that went to the user store
+  cidx.auth.cache.hit_rate    -- hits / (hits + misses)
+  cidx.auth.latency.p50       -- median auth latency (ms), per ``method``
+  cidx.auth.latency.p95       -- p95 auth latency (ms), per ``method``
+
+Fail-open: ``meter=None`` is a no-op and every callback swallows exceptions
+with DEBUG logging -- OTEL export must never break the request path.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Iterable, Tuple
+
+from code_indexer.server.auth.auth_cache import AuthCacheStats
+
+logger = logging.getLogger(__name__)
+
+_METRIC_ENTRIES = "cidx.auth.cache.entries"
+_METRIC_HITS = "cidx.auth.cache.hits"
+_METRIC_MISSES = "cidx.auth.cache.misses"
+_METRIC_HIT_RATE = "cidx.auth.cache.hit_rate"
+_METRIC_LATENCY_P50 = "cidx.auth.latency.p50"
+_METRIC_LATENCY_P95 = "cidx.auth.latency.p95"
+
+
+class AuthCacheOtelMetrics:
+    """OTEL gauges over AuthCache statistics.
+
+    Args:
+        meter: An opentelemetry.metrics.Meter instance (or a test double).
+            ``None`` is a documented no-op.
+        stats_fn: Zero-arg callable returning AuthCacheStats, typically
+            ``user_manager.auth_cache.get_stats``.
+    """
+
+    def __init__(
+        self,
+        meter: Any,
+        *,
+        stats_fn: Callable[[], AuthCacheStats],
+    ) -> None:
+        self._meter = meter
+        self._stats_fn = stats_fn
+        self._register()
+
+    def _register(self) -> None:
+        if self._meter is None:
+            return
+        try:
+            from opentelemetry.metrics import Observation
+
+            def _gauge(
+                name: str,
+                description: str,
+                unit: str,
+                values_fn: Callable[[AuthCacheStats], Iterable[Tuple[float, Any]]],
+            ) -> None:
+                def _cb(options: Any) -> Any:
+                    try:
+                        for value, attributes in values_fn(self._stats_fn()):
+                            yield Observation(value=value, attributes=attributes)
+                    except Exception as exc:  # noqa: BLE001
+                        logger.debug(
+                            "AuthCacheOtelMetrics: %s callback error: %s",
+                            name,
+                            exc,
+                        )
+
+                self._meter.create_observable_gauge(
+                    name=name,
+                    description=description,
+                    unit=unit,
+                    callbacks=[_cb],
+                )
+
+            _gauge(
+                _METRIC_ENTRIES,
+                "Verified principals and users currently in the auth cache",
+                "1",
+                lambda s: [(s.principal_entries + s.user_entries, None)],
+            )
+            _gauge(
+                _METRIC_HITS,
+                "Auth lookups served from the auth cache",
+                "1",
+                lambda s: [(s.hit_count, None)],
+            )
+            _gauge(
+                _METRIC_MISSES,
+                "Auth lookups that went to the user store (cache misses)",
+                "1",
+                lambda s: [(s.miss_count, None)],
+            )
+            _gauge(
+                _METRIC_HIT_RATE,
+                "Auth cache hit rate since process start",
+                "1",
+                lambda s: [(s.hit_ratio, None)],
+            )
+            _gauge(
+                _METRIC_LATENCY_P50,
+                "Median authentication latency over recent requests",
+                "ms",
+                lambda s: [
+                    (v["p50_ms"], {"method": m}) for m, v in s.auth_latency.items()
+                ],
+            )
+            _gauge(
+                _METRIC_LATENCY_P95,
+                "p95 authentication latency over recent requests",
+                "ms",
+                lambda s: [
+                    (v["p95_ms"], {"method": m}) for m, v in s.auth_latency.items()
+                ],
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(
+                "AuthCacheOtelMetrics: failed to register instruments: %s", exc
+            )
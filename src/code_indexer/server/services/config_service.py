@@ -783,6 +783,8 @@ class ConfigService:
             "xray": {
                 "xray_timeout_seconds": config.xray_config.xray_timeout_seconds,  # type: ignore[union-attr]
                 "xray_worker_threads": config.xray_config.xray_worker_threads,  # type: ignore[union-attr]
+                "xray_findings_cache_enabled": config.xray_config.xray_findings_cache_enabled,  # type: ignore[union-attr]
+                "xray_findings_cache_max_entries": config.xray_config.xray_findings_cache_max_entries,  # type: ignore[union-attr]
             },
             # Story #223 - AC4: Indexing configuration
             "indexing": {
@@ -2597,6 +2599,10 @@ class ConfigService:
                     value,
                     exc,
                 )
+        elif key == "xray_findings_cache_enabled":
+            xray.xray_findings_cache_enabled = _parse_bool(value)
+        elif key == "xray_findings_cache_max_entries":
+            xray.xray_findings_cache_max_entries = int(value)
         else:
             raise ValueError(f"Unknown xray setting: {key}")
 
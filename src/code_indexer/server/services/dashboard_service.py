@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 from .api_metrics_service import api_metrics_service
+from .dashboard_snapshot import DashboardSnapshotCache
 from .health_service import health_service
 from ..models.api_models import (
     HealthCheckResponse,
@@ -121,11 +122,46 @@ class DashboardData:
 class DashboardService:
     """Service for aggregating dashboard data from various internal sources."""
 
-    def __init__(self):
-        """Initialize dashboard service with caches."""
+    def __init__(self, snapshots: Optional[DashboardSnapshotCache] = None):
+        """Initialize dashboard service with caches.
+
+        Args:
+            snapshots: Shared snapshot cache for the polled aggregates. When
+                None every call computes fresh values (the server-wide
+                ``dashboard_service`` instance passes one).
+        """
         # M9: Folder stats cache (60s TTL)
         self._folder_stats_cache: Optional[dict] = None
         self._folder_stats_cache_time: Optional[datetime] = None
+        self._snapshots = snapshots or DashboardSnapshotCache(refresh_seconds=0)
+
+    def invalidate_snapshots(self) -> None:
+        """Drop the shared snapshots so the next poll recomputes them."""
+        self._snapshots.invalidate()
+
+    def _snapshot_job_counts(self, username: str, time_filter: str) -> JobCounts:
+        # Job counts do not depend on the caller: one snapshot per filter.
+        return self._snapshots.get(
+            ("job_counts", time_filter),
+            lambda: self._get_job_counts(username, time_filter),
+        )
+
+    def _snapshot_repo_counts(self, username: str, user_role: str) -> RepoCounts:
+        # Admins all see every activated repo; users see their own.
+        key = (
+            ("repo_counts", "admin")
+            if user_role == "admin"
+            else ("repo_counts", user_role, username)
+        )
+        return self._snapshots.get(
+            key, lambda: self._get_repo_counts(username, user_role)
+        )
+
+    def _snapshot_recent_jobs(self, username: str, time_filter: str) -> List[RecentJob]:
+        return self._snapshots.get(
+            ("recent_jobs", time_filter),
+            lambda: self._get_recent_jobs(username, time_filter),
+        )
 
     def get_dashboard_data(
         self, username: str, user_role: str = "user"
@@ -170,13 +206,13 @@ class DashboardService:
         )
 
         # Get job statistics
-        job_counts = self._get_job_counts(username)
+        job_counts = self._snapshot_job_counts(username, "24h")
 
         # Get repository statistics
-        repo_counts = self._get_repo_counts(username, user_role)
+        repo_counts = self._snapshot_repo_counts(username, user_role)
 
         # Get recent jobs
-        recent_jobs = self._get_recent_jobs(username)
+        recent_jobs = self._snapshot_recent_jobs(username, "30d")
 
         return DashboardData(
             health=health_data,
@@ -230,9 +266,9 @@ class DashboardService:
             )
 
         return {
-            "job_counts": self._get_job_counts(username, time_filter),
-            "repo_counts": self._get_repo_counts(username, user_role),
-            "recent_jobs": self._get_recent_jobs(username, recent_filter),
+            "job_counts": self._snapshot_job_counts(username, time_filter),
+            "repo_counts": self._snapshot_repo_counts(username, user_role),
+            "recent_jobs": self._snapshot_recent_jobs(username, recent_filter),
             "api_metrics": api_metrics,
         }
 
@@ -320,6 +356,16 @@ class DashboardService:
             List of dicts sorted by total descending, each with keys:
                 username, semantic, other_index, regex, other_api, total.
         """
+        return self._snapshots.get(
+            ("per_user_stats", period_seconds, id(api_metrics_backend)),
+            lambda: self._compute_per_user_stats(period_seconds, api_metrics_backend),
+        )
+
+    def _compute_per_user_stats(
+        self,
+        period_seconds: int,
+        api_metrics_backend=None,
+    ) -> List[Dict[str, Any]]:
         if api_metrics_backend is not None:
             raw = api_metrics_backend.get_metrics_by_user(period_seconds)
         else:
@@ -847,6 +893,14 @@ class DashboardService:
         Raises:
             FileNotFoundError: If repository not found
         """
+        return self._snapshots.get(
+            ("temporal_index_status", username, repo_alias),
+            lambda: self._compute_temporal_index_status(username, repo_alias),
+        )
+
+    def _compute_temporal_index_status(
+        self, username: str, repo_alias: str
+    ) -> Dict[str, Any]:
         # Get index_dir based on whether this is a global repo or activated repo
         if username == "_global":
             # Global repos use BackendRegistry via app.state to get index_path
@@ -928,5 +982,5 @@ class DashboardService:
             }
 
 
-# Global service instance
-dashboard_service = DashboardService()
+# Global service instance: all dashboard polls share its snapshots
+dashboard_service = DashboardService(snapshots=DashboardSnapshotCache())
@@ -0,0 +1,121 @@
+"""
+Shared dashboard snapshots.
+
+Every open admin dashboard polls the stats, recent-jobs, per-user and
+temporal-status partials over HTMX, and each poll used to re-run the
+aggregation (job manager / tracker queries, golden and activated repo
+listings, a directory scan for the temporal status). With several admins
+keeping the dashboard open these identical computations add up.
+
+``DashboardSnapshotCache`` recomputes each aggregate at most once per
+refresh interval, in one place: the first poll after the interval computes
+the value (concurrent polls for the same key wait for that one computation
+instead of starting their own) and every poll within the interval reads
+the same snapshot. Aggregates that do not depend on the caller (job counts,
+recent jobs, golden repo count, API usage) are shared by all users.
+
+Snapshots are shared objects and must be treated as read-only by callers.
+
+Configuration: ``CIDX_DASHBOARD_SNAPSHOT_SECONDS`` (default 5; 0 disables
+the cache and computes on every poll).
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_REFRESH_SECONDS = 5.0
+
+
+def _refresh_seconds_from_env() -> float:
+    try:
+        return max(
+            0.0,
+            float(
+                os.environ.get(
+                    "CIDX_DASHBOARD_SNAPSHOT_SECONDS", str(DEFAULT_REFRESH_SECONDS)
+                )
+            ),
+        )
+    except ValueError:
+        return DEFAULT_REFRESH_SECONDS
+
+
+@dataclass(frozen=True)
+class DashboardSnapshotStats:
+    """Statistics for dashboard snapshot monitoring."""
+
+    refresh_seconds: float
+    snapshots: int
+    hit_count: int
+    compute_count: int
+
+
+class DashboardSnapshotCache:
+    """Per-key snapshots recomputed at most once per refresh interval."""
+
+    def __init__(
+        self,
+        refresh_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.refresh_seconds = (
+            _refresh_seconds_from_env() if refresh_seconds is None else refresh_seconds
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (value, computed_at)
+        self._snapshots: Dict[Hashable, Tuple[Any, float]] = {}
+        # key -> lock held while that key is being computed
+        self._compute_locks: Dict[Hashable, threading.Lock] = {}
+        self._hit_count = 0
+        self._compute_count = 0
+
+    def _fresh(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._snapshots.get(key)
+        if entry is not None and self._clock() - entry[1] < self.refresh_seconds:
+            return True, entry[0]
+        return False, None
+
+    def get(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the snapshot for ``key``, computing it when stale."""
+        if self.refresh_seconds <= 0:
+            return compute()
+
+        with self._lock:
+            fresh, value = self._fresh(key)
+            if fresh:
+                self._hit_count += 1
+                return value  # type: ignore[no-any-return]
+            compute_lock = self._compute_locks.setdefault(key, threading.Lock())
+
+        with compute_lock:
+            # Another poll may have computed it while we waited.
+            with self._lock:
+                fresh, value = self._fresh(key)
+                if fresh:
+                    self._hit_count += 1
+                    return value  # type: ignore[no-any-return]
+            value = compute()
+            with self._lock:
+                self._snapshots[key] = (value, self._clock())
+                self._compute_count += 1
+            return value
+
+    def invalidate(self) -> None:
+        """Drop every snapshot so the next poll recomputes."""
+        with self._lock:
+            self._snapshots.clear()
+
+    def get_stats(self) -> DashboardSnapshotStats:
+        with self._lock:
+            return DashboardSnapshotStats(
+                refresh_seconds=self.refresh_seconds,
+                snapshots=len(self._snapshots),
+                hit_count=self._hit_count,
+                compute_count=self._compute_count,
+            )
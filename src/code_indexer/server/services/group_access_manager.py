@@ -120,6 +120,8 @@ class GroupAccessManager:
         """
         # Bug #338: Callbacks invoked after any repo access change (grant or revoke)
         self._on_repo_change_callbacks: List[Callable[[], None]] = []
+        # Callbacks invoked after any user-group membership change
+        self._on_membership_change_callbacks: List[Callable[[], None]] = []
         # Story #399: Optional AuditLogService delegation
         self._audit_service: Optional["AuditLogService"] = None
         self._backend = storage_backend
@@ -166,6 +168,24 @@ class GroupAccessManager:
         """
         self._on_repo_change_callbacks.append(callback)
 
+    def register_on_membership_change(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback to be invoked after any user-group membership change.
+
+        Lets per-user access caches drop stale entries as soon as a user is
+        assigned to, or removed from, a group (or a group is deleted).
+
+        Args:
+            callback: Zero-argument callable invoked after assign_user_to_group(),
+                      remove_user_from_group() or delete_group() completes.
+        """
+        self._on_membership_change_callbacks.append(callback)
+
+    def _notify_membership_change(self) -> None:
+        """Invoke all registered membership-change callbacks."""
+        for cb in self._on_membership_change_callbacks:
+            cb()
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection with foreign key enforcement.
 
@@ -524,7 +544,10 @@ class GroupAccessManager:
             GroupHasUsersError: If the group has users assigned (AC6)
         """
         if self._backend is not None:
-            return self._backend.delete_group(group_id)  # type: ignore[no-any-return]
+            deleted = self._backend.delete_group(group_id)
+            if deleted:
+                self._notify_membership_change()
+            return deleted  # type: ignore[no-any-return]
         result: dict = {"deleted": False}
 
         def _do_delete(conn: sqlite3.Connection) -> None:
@@ -573,6 +596,8 @@ class GroupAccessManager:
             result["deleted"] = True
 
         self._conn_manager.execute_atomic(_do_delete)
+        if result["deleted"]:
+            self._notify_membership_change()
         return result["deleted"]  # type: ignore[no-any-return]
 
     def assign_user_to_group(
@@ -591,6 +616,7 @@ class GroupAccessManager:
         """
         if self._backend is not None:
             self._backend.assign_user_to_group(user_id, group_id, assigned_by)
+            self._notify_membership_change()
             return
         now = datetime.now(timezone.utc).isoformat()
 
@@ -608,6 +634,7 @@ class GroupAccessManager:
             )
 
         self._conn_manager.execute_atomic(_do_assign)
+        self._notify_membership_change()
 
     def remove_user_from_group(self, user_id: str, group_id: int) -> bool:
         """
@@ -625,7 +652,9 @@ class GroupAccessManager:
             True if operation succeeded (user removed or wasn't in that group)
         """
         if self._backend is not None:
-            return self._backend.remove_user_from_group(user_id, group_id)  # type: ignore[no-any-return]
+            removed = self._backend.remove_user_from_group(user_id, group_id)
+            self._notify_membership_change()
+            return removed  # type: ignore[no-any-return]
 
         def _do_remove(conn: sqlite3.Connection) -> None:
             cursor = conn.cursor()
@@ -639,6 +668,7 @@ class GroupAccessManager:
             )
 
         self._conn_manager.execute_atomic(_do_remove)
+        self._notify_membership_change()
         return True
 
     def get_user_group(self, user_id: str) -> Optional[Group]:
@@ -821,7 +851,11 @@ class GroupAccessManager:
             )
 
         if self._backend is not None:
-            return self._backend.revoke_repo_access(repo_name, group_id)  # type: ignore[no-any-return]
+            revoked = self._backend.revoke_repo_access(repo_name, group_id)
+            if revoked:
+                for cb in self._on_repo_change_callbacks:
+                    cb()
+            return revoked  # type: ignore[no-any-return]
 
         result: dict = {"revoked": False}
 
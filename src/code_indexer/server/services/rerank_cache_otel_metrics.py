@@ -0,0 +1,121 @@
+"""OTEL export for the in-process rerank score cache (``cidx.cache.rerank.*``).
+
+Registered on the same ``cidx.cache`` meter as ``EmbeddingCacheOtelMetrics``
+so reranker and query-embedding cache effectiveness sit side by side.
+
+Unlike the embedding cache, rerank scores are cached per worker process in
+memory (``server/cache/rerank_score_cache.py``), so every instrument reads
+``RerankScoreCache.get_stats()`` directly. ``hits`` and ``misses`` are
+cumulative per-document lookup counts since process start.
+
+Instruments (all pull-based ObservableGauge):
+  cidx.cache.rerank.total_entries  -- cached (provider, model, query, doc) scores
+  cidx.cache.rerank.hits           -- documents served from the cache
+  cidx.cache.rerank.misses         -- documents sent to the rerank provider
+  cidx.cache.rerank.hit_rate       -- hits / (hits + misses)
+  cidx.cache.rerank.evictions      -- LRU evictions
+
+Fail-open: ``meter=None`` is a no-op and every callback swallows exceptions
+with DEBUG logging -- OTEL export must never break the query path.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable
+
+from code_indexer.server.cache.rerank_score_cache import (
+    RerankScoreCacheStats,
+    get_global_rerank_score_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+_METRIC_TOTAL_ENTRIES = "cidx.cache.rerank.total_entries"
+_METRIC_HITS = "cidx.cache.rerank.hits"
+_METRIC_MISSES = "cidx.cache.rerank.misses"
+_METRIC_HIT_RATE = "cidx.cache.rerank.hit_rate"
+_METRIC_EVICTIONS = "cidx.cache.rerank.evictions"
+
+
+def _global_stats() -> RerankScoreCacheStats:
+    return get_global_rerank_score_cache().get_stats()
+
+
+class RerankCacheOtelMetrics:
+    """OTEL gauges over RerankScoreCache statistics.
+
+    Args:
+        meter: An opentelemetry.metrics.Meter instance (or a test double).
+            ``None`` is a documented no-op.
+        stats_fn: Zero-arg callable returning RerankScoreCacheStats. Defaults
+            to the process-wide cache singleton.
+    """
+
+    def __init__(
+        self,
+        meter: Any,
+        *,
+        stats_fn: Callable[[], RerankScoreCacheStats] = _global_stats,
+    ) -> None:
+        self._meter = meter
+        self._stats_fn = stats_fn
+        self._register()
+
+    def _register(self) -> None:
+        if self._meter is None:
+            return
+        try:
+            from opentelemetry.metrics import Observation
+
+            def _gauge(
+                name: str,
+                description: str,
+                value_fn: Callable[[RerankScoreCacheStats], float],
+            ) -> None:
+                def _cb(options: Any) -> Any:
+                    try:
+                        yield Observation(value=value_fn(self._stats_fn()))
+                    except Exception as exc:  # noqa: BLE001
+                        logger.debug(
+                            "RerankCacheOtelMetrics: %s callback error: %s",
+                            name,
+                            exc,
+                        )
+
+                self._meter.create_observable_gauge(
+                    name=name,
+                    description=description,
+                    unit="1",
+                    callbacks=[_cb],
+                )
+
+            _gauge(
+                _METRIC_TOTAL_ENTRIES,
+                "Current number of per-document scores in the rerank cache",
+                lambda s: s.entries,
+            )
+            _gauge(
+                _METRIC_HITS,
+                "Documents whose rerank score was served from the cache",
+                lambda s: s.hit_count,
+            )
+            _gauge(
+                _METRIC_MISSES,
+                "Documents sent to the rerank provider (cache misses)",
+                lambda s: s.miss_count,
+            )
+            _gauge(
+                _METRIC_HIT_RATE,
+                "Rerank score cache hit rate since process start",
+                lambda s: s.hit_ratio,
+            )
+            _gauge(
+                _METRIC_EVICTIONS,
+                "Rerank score cache LRU evictions since process start",
+                lambda s: s.eviction_count,
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(
+                "RerankCacheOtelMetrics: failed to register instruments: %s", exc
+            )
@@ -281,7 +281,9 @@ class SCIPQueryService:
         Returns:
             List of dictionaries with definition results
         """
-        from code_indexer.scip.query.primitives import SCIPQueryEngine
+        from code_indexer.server.cache.scip_engine_cache import (
+            get_global_scip_engine_cache,
+        )
 
         scip_files = self.find_scip_files(
             repository_alias=repository_alias, username=username
@@ -294,9 +296,9 @@ class SCIPQueryService:
 
         for scip_file in scip_files:
             try:
-                engine = SCIPQueryEngine(scip_file)
-                results = engine.find_definition(symbol, exact=exact)
-                all_results.extend(self._query_result_to_dict(r) for r in results)
+                with get_global_scip_engine_cache().lease(scip_file) as engine:
+                    results = engine.find_definition(symbol, exact=exact)
+                    all_results.extend(self._query_result_to_dict(r) for r in results)
             except Exception as e:
                 logger.warning(
                     format_error_log(
@@ -328,7 +330,9 @@ class SCIPQueryService:
         Returns:
             List of dictionaries with reference results
         """
-        from code_indexer.scip.query.primitives import SCIPQueryEngine
+        from code_indexer.server.cache.scip_engine_cache import (
+            get_global_scip_engine_cache,
+        )
 
         scip_files = self.find_scip_files(
             repository_alias=repository_alias, username=username
@@ -341,9 +345,9 @@ class SCIPQueryService:
 
         for scip_file in scip_files:
             try:
-                engine = SCIPQueryEngine(scip_file)
-                results = engine.find_references(symbol, limit=limit, exact=exact)
-                all_results.extend(self._query_result_to_dict(r) for r in results)
+                with get_global_scip_engine_cache().lease(scip_file) as engine:
+                    results = engine.find_references(symbol, limit=limit, exact=exact)
+                    all_results.extend(self._query_result_to_dict(r) for r in results)
             except Exception as e:
                 logger.warning(
                     format_error_log(
@@ -375,7 +379,9 @@ class SCIPQueryService:
         Returns:
             List of dictionaries with dependency results
         """
-        from code_indexer.scip.query.primitives import SCIPQueryEngine
+        from code_indexer.server.cache.scip_engine_cache import (
+            get_global_scip_engine_cache,
+        )
 
         scip_files = self.find_scip_files(
             repository_alias=repository_alias, username=username
@@ -388,9 +394,9 @@ class SCIPQueryService:
 
         for scip_file in scip_files:
             try:
-                engine = SCIPQueryEngine(scip_file)
-                results = engine.get_dependencies(symbol, depth=depth, exact=exact)
-                all_results.extend(self._query_result_to_dict(r) for r in results)
+                with get_global_scip_engine_cache().lease(scip_file) as engine:
+                    results = engine.get_dependencies(symbol, depth=depth, exact=exact)
+                    all_results.extend(self._query_result_to_dict(r) for r in results)
             except Exception as e:
                 logger.warning(
                     format_error_log(
@@ -422,7 +428,9 @@ class SCIPQueryService:
         Returns:
             List of dictionaries with dependent results
         """
-        from code_indexer.scip.query.primitives import SCIPQueryEngine
+        from code_indexer.server.cache.scip_engine_cache import (
+            get_global_scip_engine_cache,
+        )
 
         scip_files = self.find_scip_files(
             repository_alias=repository_alias, username=username
@@ -435,9 +443,9 @@ class SCIPQueryService:
 
         for scip_file in scip_files:
             try:
-                engine = SCIPQueryEngine(scip_file)
-                results = engine.get_dependents(symbol, depth=depth, exact=exact)
-                all_results.extend(self._query_result_to_dict(r) for r in results)
+                with get_global_scip_engine_cache().lease(scip_file) as engine:
+                    results = engine.get_dependents(symbol, depth=depth, exact=exact)
+                    all_results.extend(self._query_result_to_dict(r) for r in results)
             except Exception as e:
                 logger.warning(
                     format_error_log(
@@ -552,7 +560,9 @@ class SCIPQueryService:
         Returns:
             List of dictionaries with call chain information (path, length, has_cycle)
         """
-        from code_indexer.scip.query.primitives import SCIPQueryEngine
+        from code_indexer.server.cache.scip_engine_cache import (
+            get_global_scip_engine_cache,
+        )
 
         scip_files = self.find_scip_files(
             repository_alias=repository_alias, username=username
@@ -565,18 +575,18 @@ class SCIPQueryService:
 
         for scip_file in scip_files:
             try:
-                engine = SCIPQueryEngine(scip_file)
-                chains = engine.trace_call_chain(
-                    from_symbol, to_symbol, max_depth=max_depth, limit=limit
-                )
-                all_results.extend(
-                    {
-                        "path": chain.path,
-                        "length": chain.length,
-                        "has_cycle": chain.has_cycle,
-                    }
-                    for chain in chains
-                )
+                with get_global_scip_engine_cache().lease(scip_file) as engine:
+                    chains = engine.trace_call_chain(
+                        from_symbol, to_symbol, max_depth=max_depth, limit=limit
+                    )
+                    all_results.extend(
+                        {
+                            "path": chain.path,
+                            "length": chain.length,
+                            "has_cycle": chain.has_cycle,
+                        }
+                        for chain in chains
+                    )
             except Exception as e:
                 logger.warning(
                     format_error_log(
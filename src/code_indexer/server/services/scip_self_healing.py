@@ -655,6 +655,11 @@ Status values:
                     f"Job {job_id}: SCIP retry succeeded for {project_path}",
                     extra={"correlation_id": get_correlation_id()},
                 )
+                from code_indexer.server.cache.scip_engine_cache import (
+                    invalidate_scip_engines_under,
+                )
+
+                invalidate_scip_engines_under(str(output_dir))
                 return True
             else:
                 logger.warning(
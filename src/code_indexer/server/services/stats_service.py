@@ -9,10 +9,9 @@ from code_indexer.server.middleware.correlation import get_correlation_id
 
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Optional, Any
 from datetime import datetime, timezone
 import logging
-from dataclasses import dataclass
 
 from ..models.api_models import (
     RepositoryStatsResponse,
@@ -21,6 +20,12 @@ from ..models.api_models import (
     RepositoryActivityInfo,
     RepositoryHealthInfo,
 )
+from ..repositories.repository_stats import (
+    LARGE_FILE_BYTES,
+    LANGUAGE_EXTENSIONS,
+    RepositoryStats,
+    get_repository_stats,
+)
 from ...config import ConfigManager
 from code_indexer.storage.filesystem_vector_store import FilesystemVectorStore
 from code_indexer.server.logging_utils import format_error_log
@@ -45,67 +50,6 @@ def _get_golden_repos_dir() -> str:
     )
 
 
-# File extension to language mapping
-LANGUAGE_EXTENSIONS = {
-    ".py": "python",
-    ".js": "javascript",
-    ".ts": "typescript",
-    ".java": "java",
-    ".c": "c",
-    ".cpp": "cpp",
-    ".cc": "cpp",
-    ".cxx": "cpp",
-    ".h": "c",
-    ".hpp": "cpp",
-    ".cs": "csharp",
-    ".go": "go",
-    ".rs": "rust",
-    ".php": "php",
-    ".rb": "ruby",
-    ".swift": "swift",
-    ".kt": "kotlin",
-    ".scala": "scala",
-    ".sql": "sql",
-    ".html": "html",
-    ".css": "css",
-    ".scss": "scss",
-    ".sass": "sass",
-    ".less": "less",
-    ".vue": "vue",
-    ".jsx": "jsx",
-    ".tsx": "tsx",
-    ".md": "markdown",
-    ".rst": "rst",
-    ".txt": "text",
-    ".json": "json",
-    ".xml": "xml",
-    ".yml": "yaml",
-    ".yaml": "yaml",
-    ".toml": "toml",
-    ".ini": "ini",
-    ".cfg": "config",
-    ".conf": "config",
-    ".sh": "shell",
-    ".bash": "shell",
-    ".zsh": "shell",
-    ".fish": "shell",
-    ".ps1": "powershell",
-    ".bat": "batch",
-    ".cmd": "batch",
-}
-
-
-@dataclass
-class FileStats:
-    """File statistics for a single file."""
-
-    path: str
-    size_bytes: int
-    language: Optional[str]
-    is_indexed: bool
-    modified_at: datetime
-
-
 class RepositoryStatsService:
     """Service for calculating repository statistics."""
 
@@ -162,14 +106,15 @@ class RepositoryStatsService:
         if not os.path.exists(repo_path):
             raise FileNotFoundError(f"Repository {repo_id} not found at {repo_path}")
 
-        # Collect file statistics
-        file_stats = self._collect_file_statistics(repo_path)
+        # Materialized at index time and kept current by refresh/sync, so
+        # no per-request walk of the repository.
+        repo_stats = get_repository_stats(repo_path)
 
         # Calculate aggregated statistics
-        files_info = self._calculate_files_info(file_stats)
-        storage_info = self._calculate_storage_info(repo_path, file_stats)
+        files_info = self._calculate_files_info(repo_stats)
+        storage_info = self._calculate_storage_info(repo_stats)
         activity_info = self._calculate_activity_info(repo_id, repo_path)
-        health_info = self._calculate_health_info(file_stats, storage_info)
+        health_info = self._calculate_health_info(repo_stats, storage_info)
 
         return RepositoryStatsResponse(
             repository_id=repo_id,
@@ -177,6 +122,11 @@ class RepositoryStatsService:
             storage=storage_info,
             activity=activity_info,
             health=health_info,
+            stats_as_of=(
+                datetime.fromisoformat(repo_stats.stats_as_of)
+                if repo_stats.stats_as_of
+                else None
+            ),
         )
 
     def _get_repository_path(self, repo_id: str, username: Optional[str] = None) -> str:
@@ -228,59 +178,6 @@ class RepositoryStatsService:
                 raise
             raise RuntimeError(f"Unable to access repository {repo_id}: {e}")
 
-    def _collect_file_statistics(self, repo_path: str) -> List[FileStats]:
-        """
-        Collect statistics for all files in repository.
-
-        Args:
-            repo_path: Repository file system path
-
-        Returns:
-            List of file statistics
-        """
-        file_stats = []
-        repo_root = Path(repo_path)
-
-        try:
-            for file_path in repo_root.rglob("*"):
-                if file_path.is_file():
-                    try:
-                        stat_info = file_path.stat()
-                        relative_path = file_path.relative_to(repo_root)
-
-                        file_stat = FileStats(
-                            path=str(relative_path),
-                            size_bytes=stat_info.st_size,
-                            language=self._detect_language(file_path),
-                            is_indexed=self._is_file_indexed(file_path),
-                            modified_at=datetime.fromtimestamp(
-                                stat_info.st_mtime, tz=timezone.utc
-                            ),
-                        )
-                        file_stats.append(file_stat)
-
-                    except (OSError, PermissionError) as e:
-                        logger.warning(
-                            format_error_log(
-                                "MCP-GENERAL-178",
-                                f"Cannot access file {file_path}: {e}",
-                                extra={"correlation_id": get_correlation_id()},
-                            )
-                        )
-                        continue
-
-        except PermissionError as e:
-            logger.error(
-                format_error_log(
-                    "MCP-GENERAL-179",
-                    f"Cannot access repository directory {repo_path}: {e}",
-                    extra={"correlation_id": get_correlation_id()},
-                )
-            )
-            raise
-
-        return file_stats
-
     def _detect_language(self, file_path: Path) -> Optional[str]:
         """
         Detect programming language from file extension.
@@ -294,104 +191,35 @@ class RepositoryStatsService:
         extension = file_path.suffix.lower()
         return LANGUAGE_EXTENSIONS.get(extension)
 
-    def _is_file_indexed(self, file_path: Path) -> bool:
-        """
-        Check if file is currently indexed in vector store.
-
-        CLAUDE.md Foundation #1: Real vector store check, no extension-based heuristics.
-
-        Args:
-            file_path: Path to file
-
-        Returns:
-            Whether file is actually indexed in vector store
-
-        Raises:
-            RuntimeError: If vector store check fails
-        """
-        try:
-            # This would query real vector store collection to check if file is indexed
-            # Implementation requires knowing which collection and search criteria
-            # For now, fail clearly to indicate missing real implementation
-            raise RuntimeError(
-                "Real vector store file indexing check not yet implemented. "
-                "This service requires actual vector store query to determine file indexing status."
-            )
-        except Exception as e:
-            logger.warning(
-                format_error_log(
-                    "MCP-GENERAL-180",
-                    f"Cannot check indexing status for {file_path}: {e}",
-                    extra={"correlation_id": get_correlation_id()},
-                )
-            )
-            # Fall back to extension check only as last resort
-            extension = file_path.suffix.lower()
-            indexable_extensions = {
-                ".py",
-                ".js",
-                ".ts",
-                ".java",
-                ".c",
-                ".cpp",
-                ".h",
-                ".hpp",
-                ".cs",
-                ".go",
-                ".rs",
-                ".php",
-                ".rb",
-                ".swift",
-                ".kt",
-                ".scala",
-                ".sql",
-                ".html",
-                ".css",
-                ".vue",
-                ".jsx",
-                ".tsx",
-            }
-            return extension in indexable_extensions
-
-    def _calculate_files_info(self, file_stats: List[FileStats]) -> RepositoryFilesInfo:
+    def _calculate_files_info(self, repo_stats: RepositoryStats) -> RepositoryFilesInfo:
         """
         Calculate file-related statistics.
 
         Args:
-            file_stats: List of file statistics
+            repo_stats: Materialized repository statistics
 
         Returns:
             File information summary
         """
-        total_files = len(file_stats)
-        indexed_files = sum(1 for f in file_stats if f.is_indexed)
-
-        # Count files by language
-        language_counts: Dict[str, int] = {}
-        for file_stat in file_stats:
-            if file_stat.language:
-                language_counts[file_stat.language] = (
-                    language_counts.get(file_stat.language, 0) + 1
-                )
-
         return RepositoryFilesInfo(
-            total=total_files, indexed=indexed_files, by_language=language_counts
+            total=repo_stats.file_count,
+            indexed=repo_stats.indexable_file_count,
+            by_language=dict(repo_stats.by_language),
         )
 
     def _calculate_storage_info(
-        self, repo_path: str, file_stats: List[FileStats]
+        self, repo_stats: RepositoryStats
     ) -> RepositoryStorageInfo:
         """
         Calculate storage-related statistics.
 
         Args:
-            repo_path: Repository path
-            file_stats: List of file statistics
+            repo_stats: Materialized repository statistics
 
         Returns:
             Storage information summary
         """
-        total_size = sum(f.size_bytes for f in file_stats)
+        total_size = repo_stats.total_size_bytes
 
         # For now, estimate index size as 10% of repository size
         # In real implementation, query actual index size from Filesystem
@@ -399,8 +227,7 @@ class RepositoryStatsService:
 
         # Estimate embedding count based on indexed files
         # Assume average of 10 embeddings per indexed file
-        indexed_files = sum(1 for f in file_stats if f.is_indexed)
-        estimated_embeddings = indexed_files * 10
+        estimated_embeddings = repo_stats.indexable_file_count * 10
 
         return RepositoryStorageInfo(
             repository_size_bytes=total_size,
@@ -438,13 +265,13 @@ class RepositoryStatsService:
         )
 
     def _calculate_health_info(
-        self, file_stats: List[FileStats], storage_info: RepositoryStorageInfo
+        self, repo_stats: RepositoryStats, storage_info: RepositoryStorageInfo
     ) -> RepositoryHealthInfo:
         """
         Calculate repository health assessment.
 
         Args:
-            file_stats: List of file statistics
+            repo_stats: Materialized repository statistics
             storage_info: Storage information
 
         Returns:
@@ -453,15 +280,17 @@ class RepositoryStatsService:
         issues = []
 
         # Check indexing coverage
-        if file_stats:
-            index_ratio = sum(1 for f in file_stats if f.is_indexed) / len(file_stats)
+        if repo_stats.file_count:
+            index_ratio = repo_stats.indexable_file_count / repo_stats.file_count
             if index_ratio < 0.5:
                 issues.append(f"Low indexing coverage: {index_ratio:.1%}")
 
         # Check for very large files
-        large_files = [f for f in file_stats if f.size_bytes > 1024 * 1024]  # >1MB
-        if len(large_files) > 10:
-            issues.append(f"Many large files: {len(large_files)} files >1MB")
+        if repo_stats.large_file_count > 10:
+            issues.append(
+                f"Many large files: {repo_stats.large_file_count} files "
+                f">{LARGE_FILE_BYTES // (1024 * 1024)}MB"
+            )
 
         # Check repository size
         if storage_info.repository_size_bytes > 100 * 1024 * 1024:  # >100MB
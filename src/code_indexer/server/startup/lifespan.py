@@ -4150,6 +4150,59 @@ def make_lifespan(
                 )
             )
 
+        # Rerank score cache gauges (cidx.cache.rerank.*), exported on the
+        # same "cidx.cache" meter next to the embedding cache instruments.
+        # Values come from the in-process RerankScoreCache; meter=None when
+        # telemetry is disabled (documented no-op). Non-fatal.
+        try:
+            from code_indexer.server.services.rerank_cache_otel_metrics import (
+                RerankCacheOtelMetrics,
+            )
+
+            RerankCacheOtelMetrics(
+                telemetry_manager.get_meter("cidx.cache")
+                if telemetry_manager is not None
+                else None
+            )
+        except Exception as e:
+            logger.warning(
+                format_error_log(
+                    "APP-GENERAL-1296",
+                    f"Failed to build RerankCacheOtelMetrics "
+                    f"(rerank cache OTEL metrics will be disabled): {e}",
+                    exc_info=True,
+                    extra={"correlation_id": get_correlation_id()},
+                )
+            )
+
+        # Auth cache and auth latency gauges (cidx.auth.*) on the same
+        # "cidx.cache" meter. Skipped for user managers without an AuthCache.
+        # Non-fatal.
+        try:
+            from code_indexer.server.auth.auth_cache import AuthCache
+            from code_indexer.server.services.auth_cache_otel_metrics import (
+                AuthCacheOtelMetrics,
+            )
+
+            _auth_cache = getattr(user_manager, "auth_cache", None)
+            if isinstance(_auth_cache, AuthCache):
+                AuthCacheOtelMetrics(
+                    telemetry_manager.get_meter("cidx.cache")
+                    if telemetry_manager is not None
+                    else None,
+                    stats_fn=_auth_cache.get_stats,
+                )
+        except Exception as e:
+            logger.warning(
+                format_error_log(
+                    "APP-GENERAL-1297",
+                    f"Failed to build AuthCacheOtelMetrics "
+                    f"(auth cache OTEL metrics will be disabled): {e}",
+                    exc_info=True,
+                    extra={"correlation_id": get_correlation_id()},
+                )
+            )
+
         # Story #1290: startup blank-out sweep — hard-delete legacy/version<2
         # temporal collections (AC19/AC20) for every golden repo. Replaces the
         # old Story #1172 background HNSW-extraction migration (deleted along
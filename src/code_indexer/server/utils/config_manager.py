@@ -1061,6 +1061,14 @@ class XRayConfig:
     # Default 4 (Story #1009: enlarged from 2 for burst concurrency)
     xray_worker_threads: int = 4
 
+    # Persistent per-file findings cache keyed by (evaluator sha256, language,
+    # file content sha256).  Off by default; read once at first engine
+    # construction, so toggling requires a server restart.
+    xray_findings_cache_enabled: bool = False
+
+    # LRU bound (rows) for the findings cache database.
+    xray_findings_cache_max_entries: int = 200_000
+
 
 @dataclass
 class ContentLimitsConfig:
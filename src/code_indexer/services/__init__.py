@@ -1,8 +1,36 @@
 """Service clients for external APIs."""
 
-from .embedding_factory import EmbeddingProviderFactory
-from .rag_context_extractor import RAGContextExtractor
-from .claude_integration import ClaudeIntegrationService, check_claude_sdk_availability
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .claude_integration import (
+        ClaudeIntegrationService,
+        check_claude_sdk_availability,
+    )
+    from .embedding_factory import EmbeddingProviderFactory
+    from .rag_context_extractor import RAGContextExtractor
+
+# Re-exports are resolved on first access: importing any
+# ``code_indexer.services.*`` submodule runs this package init, and the
+# embedding providers (httpx, provider clients) must not be imported by
+# commands that never embed anything.
+_EXPORTS = {
+    "EmbeddingProviderFactory": ".embedding_factory",
+    "RAGContextExtractor": ".rag_context_extractor",
+    "ClaudeIntegrationService": ".claude_integration",
+    "check_claude_sdk_availability": ".claude_integration",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "EmbeddingProviderFactory",
@@ -6,21 +6,34 @@ alongside the semantic index in watch mode.
 """
 
 import logging
+import threading
 from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
 from watchdog.events import FileSystemEventHandler
 
 from .tantivy_index_manager import TantivyIndexManager
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for the retry delay after consecutive failed batch commits
+MAX_RETRY_DELAY_SECONDS = 60.0
+
 
 class FTSWatchHandler(FileSystemEventHandler):
-    """File system event handler for FTS index maintenance in watch mode."""
+    """File system event handler for FTS index maintenance in watch mode.
+
+    Events are accumulated for ``debounce_seconds`` and then applied to the
+    Tantivy index in a single writer transaction, so a burst of saves (editor
+    write + rename, ``git checkout``, formatter runs) costs one commit and one
+    new segment instead of one per event.
+    """
 
     def __init__(
         self,
         tantivy_index_manager: TantivyIndexManager,
         config,
+        debounce_seconds: float = 2.0,
     ):
         """
         Initialize FTS watch handler.
@@ -28,14 +41,30 @@ class FTSWatchHandler(FileSystemEventHandler):
         Args:
             tantivy_index_manager: TantivyIndexManager instance for FTS operations
             config: Application configuration
+            debounce_seconds: Time to accumulate changes before one batch commit
         """
         super().__init__()
         self.tantivy_manager = tantivy_index_manager
         self.config = config
+        self.debounce_seconds = debounce_seconds
+
+        # Thread-safe change tracking. A path lives in at most one set; the
+        # latest event for a path wins.
+        self.pending_updates: Set[Path] = set()
+        self.pending_deletes: Set[Path] = set()
+        self.change_lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # Serializes batch application
+        self._flush_timer: Optional[threading.Timer] = None
+        self._failed_flushes = 0  # Consecutive apply_batch failures
 
         # Statistics
         self.files_updated_count = 0
         self.files_deleted_count = 0
+        self.commits_count = 0
+        self.last_batch_size = 0
+        self.last_commit_ms = 0.0
+        self.total_commit_ms = 0.0
+        self.segment_count = -1
 
     def on_modified(self, event):
         """Handle file modification events."""
@@ -48,35 +77,10 @@ class FTSWatchHandler(FileSystemEventHandler):
         if not self._should_include_file(file_path):
             return
 
-        try:
-            # Read file content
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-
-            # Extract identifiers (simple implementation - can be enhanced)
-            identifiers = self._extract_identifiers(content, file_path)
-
-            # Detect language
-            language = self._detect_language(file_path)
-
-            # Create FTS document
-            doc = {
-                "path": str(file_path),
-                "content": content,
-                "content_raw": content,
-                "identifiers": identifiers,
-                "line_start": 1,
-                "line_end": len(content.splitlines()),
-                "language": language,
-            }
-
-            # Update document in FTS index (atomic operation)
-            self.tantivy_manager.update_document(str(file_path), doc)
-            self.files_updated_count += 1
-            logger.debug(f"Updated FTS index for: {file_path}")
-
-        except Exception as e:
-            logger.warning(f"Failed to update FTS index for {file_path}: {e}")
+        with self.change_lock:
+            self.pending_deletes.discard(file_path)
+            self.pending_updates.add(file_path)
+        self._schedule_flush()
 
     def on_deleted(self, event):
         """Handle file deletion events."""
@@ -89,14 +93,7 @@ class FTSWatchHandler(FileSystemEventHandler):
         if not self._should_include_deleted_file(file_path):
             return
 
-        try:
-            # Delete document from FTS index (atomic operation)
-            self.tantivy_manager.delete_document(str(file_path))
-            self.files_deleted_count += 1
-            logger.debug(f"Deleted from FTS index: {file_path}")
-
-        except Exception as e:
-            logger.warning(f"Failed to delete from FTS index {file_path}: {e}")
+        self._queue_delete(file_path)
 
     def on_created(self, event):
         """Handle file creation events (same as modification)."""
@@ -116,16 +113,126 @@ class FTSWatchHandler(FileSystemEventHandler):
 
         # Delete old path
         if self._should_include_deleted_file(old_path):
+            self._queue_delete(old_path)
+
+        # Add new path (will be handled by on_created via watchdog)
+        # Note: watchdog fires both on_moved and on_created for destination
+
+    def _queue_delete(self, file_path: Path) -> None:
+        with self.change_lock:
+            self.pending_updates.discard(file_path)
+            self.pending_deletes.add(file_path)
+        self._schedule_flush()
+
+    def _schedule_flush(self, delay: Optional[float] = None) -> None:
+        """Arm the debounce timer if no batch is already scheduled.
+
+        Args:
+            delay: Seconds until the flush; defaults to ``debounce_seconds``
+        """
+        with self.change_lock:
+            if self._flush_timer is not None:
+                return
+            self._flush_timer = threading.Timer(
+                self.debounce_seconds if delay is None else delay,
+                self._process_pending_changes,
+            )
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _process_pending_changes(self) -> None:
+        """Apply all accumulated changes to the FTS index in one commit."""
+        with self._flush_lock:
+            with self.change_lock:
+                self._flush_timer = None
+                updates = self.pending_updates
+                deletes = self.pending_deletes
+                self.pending_updates = set()
+                self.pending_deletes = set()
+
+            if not updates and not deletes:
+                return
+
+            # Read content at flush time so repeated saves index the latest
+            # version once. Files that vanished since the event are deleted.
+            docs: Dict[str, Dict[str, Any]] = {}
+            for file_path in updates:
+                try:
+                    docs[str(file_path)] = self._build_document(file_path)
+                except FileNotFoundError:
+                    deletes.add(file_path)
+                except Exception as e:
+                    logger.warning(f"Failed to update FTS index for {file_path}: {e}")
+
             try:
-                self.tantivy_manager.delete_document(str(old_path))
-                self.files_deleted_count += 1
+                result = self.tantivy_manager.apply_batch(
+                    docs, [str(p) for p in deletes]
+                )
             except Exception as e:
-                logger.warning(
-                    f"Failed to delete old path from FTS index {old_path}: {e}"
+                logger.warning(f"Failed to apply FTS batch: {e}")
+                # Re-queue for retry unless a newer event superseded the change
+                with self.change_lock:
+                    for file_path in updates:
+                        if file_path not in self.pending_deletes:
+                            self.pending_updates.add(file_path)
+                    for file_path in deletes:
+                        if file_path not in self.pending_updates:
+                            self.pending_deletes.add(file_path)
+                # Retry even if no further events arrive, backing off
+                # exponentially so a persistently failing index is not hammered
+                self._failed_flushes += 1
+                retry_delay = min(
+                    self.debounce_seconds * 2**self._failed_flushes,
+                    MAX_RETRY_DELAY_SECONDS,
                 )
+                self._schedule_flush(retry_delay)
+                return
+
+            self._failed_flushes = 0
+
+            self.files_updated_count += result["documents_updated"]
+            self.files_deleted_count += result["documents_deleted"]
+            self.commits_count += 1
+            self.last_batch_size = (
+                result["documents_updated"] + result["documents_deleted"]
+            )
+            self.last_commit_ms = result["commit_ms"]
+            self.total_commit_ms += result["commit_ms"]
+            self.segment_count = result["segment_count"]
+            logger.debug(
+                f"FTS batch committed: {self.last_batch_size} files in "
+                f"{self.last_commit_ms:.1f}ms"
+            )
+
+    def flush(self) -> None:
+        """Cancel the debounce timer and apply pending changes immediately."""
+        with self.change_lock:
+            timer = self._flush_timer
+        if timer is not None:
+            timer.cancel()
+        self._process_pending_changes()
+
+    def stop_watching(self) -> None:
+        """Flush any remaining changes when watch mode ends."""
+        self.flush()
+        logger.info("FTS watch handler stopped")
+
+    def _build_document(self, file_path: Path) -> Dict[str, Any]:
+        """Read a file and build its FTS document."""
+        # Read file content
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+            content = f.read()
 
-        # Add new path (will be handled by on_created via watchdog)
-        # Note: watchdog fires both on_moved and on_created for destination
+        return {
+            "path": str(file_path),
+            "content": content,
+            "content_raw": content,
+            # Extract identifiers (simple implementation - can be enhanced)
+            "identifiers": self._extract_identifiers(content, file_path),
+            "line_start": 1,
+            "line_end": len(content.splitlines()),
+            "language": self._detect_language(file_path),
+        }
 
     def _should_include_file(self, file_path: Path) -> bool:
         """Check if file should be included in FTS indexing."""
@@ -203,7 +310,13 @@ class FTSWatchHandler(FileSystemEventHandler):
 
     def get_statistics(self) -> dict:
         """Get FTS watch handler statistics."""
+        commits = self.commits_count
         return {
             "fts_files_updated": self.files_updated_count,
             "fts_files_deleted": self.files_deleted_count,
+            "fts_commits": commits,
+            "fts_last_batch_size": self.last_batch_size,
+            "fts_last_commit_ms": self.last_commit_ms,
+            "fts_avg_commit_ms": self.total_commit_ms / commits if commits else 0.0,
+            "fts_segment_count": self.segment_count,
         }
@@ -962,9 +962,11 @@ class HighThroughputProcessor(GitAwareDocumentProcessor):
             # both visibility-ensure and branch-isolation operations.
             # Replaces: (a) per-file scroll_points in the unchanged_files loop,
             #           (b) internal limit=10000 fetch in hide_files_not_in_branch_thread_safe
+            # Stores with a branch visibility bitmap resolve files to points via
+            # their path index, so the full content-point scan is skipped.
             needs_visibility_or_isolation = unchanged_files or not skip_branch_isolation
             all_content_points: List[Dict[str, Any]] = []
-            if needs_visibility_or_isolation:
+            if needs_visibility_or_isolation and not self._uses_branch_visibility_map():
                 all_content_points = self._fetch_all_content_points(collection_name)
 
             # Handle visibility updates for unchanged files (fast batch operation)
@@ -1234,6 +1236,15 @@ class HighThroughputProcessor(GitAwareDocumentProcessor):
 
             return True
 
+    def _uses_branch_visibility_map(self) -> bool:
+        """True when the vector store keeps branch visibility in a bitmap sidecar.
+
+        Looked up on the type so Mock-based stores keep the payload path.
+        """
+        return callable(
+            getattr(type(self.vector_store_client), "update_branch_visibility", None)
+        )
+
     def _fetch_all_content_points(self, collection_name: str) -> List[Dict[str, Any]]:
         """Paginated fetch of ALL content points from the vector store.
 
@@ -1312,6 +1323,17 @@ class HighThroughputProcessor(GitAwareDocumentProcessor):
         if not file_paths:
             return
 
+        if self._uses_branch_visibility_map():
+            with self._visibility_lock:
+                changed = self.vector_store_client.update_branch_visibility(
+                    collection_name, branch, show_files=file_paths
+                )
+            logger.info(
+                f"Branch visibility bitmap: {changed} points made visible "
+                f"(branch '{branch}')"
+            )
+            return
+
         with self._visibility_lock:
             unchanged_set = set(file_paths)
             points_to_update = []
@@ -1429,6 +1451,24 @@ class HighThroughputProcessor(GitAwareDocumentProcessor):
                         slot_tracker=slot_tracker,
                     )
 
+                if self._uses_branch_visibility_map():
+                    changed = self.vector_store_client.update_branch_visibility(
+                        collection_name, branch, hide_files=file_paths
+                    )
+                    logger.info(
+                        f"Branch visibility bitmap: {changed} points hidden "
+                        f"(branch '{branch}')"
+                    )
+                    if progress_callback:
+                        progress_callback(
+                            0,
+                            0,
+                            Path(""),
+                            info="🔒 Branch isolation • Database visibility updated ✓",
+                            slot_tracker=slot_tracker,
+                        )
+                    return
+
                 # Build set of file paths for fast lookup
                 files_to_hide_set = set(file_paths)
 
@@ -1515,7 +1555,14 @@ class HighThroughputProcessor(GitAwareDocumentProcessor):
 
         # Fix D (Story #339): Use pre-fetched content points when available to avoid
         # a redundant scroll_points call. Falls back to internal fetch if not provided.
-        if all_content_points is None:
+        # Bitmap-backed stores list indexed paths from their path index instead.
+        use_bitmap = self._uses_branch_visibility_map()
+        if use_bitmap:
+            stored_paths = sorted(
+                self.vector_store_client.get_indexed_paths(collection_name)
+            )
+            all_content_points = []
+        elif all_content_points is None:
             with self._database_lock:
                 try:
                     all_content_points = self._fetch_all_content_points(collection_name)
@@ -1528,30 +1575,34 @@ class HighThroughputProcessor(GitAwareDocumentProcessor):
                     logger.error(f"Failed to get all content points from database: {e}")
                     return False
 
+        if not use_bitmap:
+            stored_paths = [
+                point["payload"]["path"]
+                for point in all_content_points
+                if "path" in point.get("payload", {})
+            ]
+
         # Extract unique file paths from database and NORMALIZE to relative
         db_file_paths = set()
-        for point in all_content_points:
-            if "path" in point.get("payload", {}):
-                path = point["payload"]["path"]
-
-                # CRITICAL: Normalize to relative if absolute
-                # This handles paths stored as /tmp/flask/src/file.py
-                if os.path.isabs(path):
-                    try:
-                        # Convert to relative path from project root
-                        relative_path = str(
-                            Path(path).relative_to(self.config.codebase_dir)
-                        )
-                        db_file_paths.add(relative_path)
-                    except ValueError:
-                        # Path is outside project directory - keep as absolute for logging
-                        logger.warning(
-                            f"Found path outside project directory in database: {path}"
-                        )
-                        db_file_paths.add(path)
-                else:
-                    # Already relative, use as-is
+        for path in stored_paths:
+            # CRITICAL: Normalize to relative if absolute
+            # This handles paths stored as /tmp/flask/src/file.py
+            if os.path.isabs(path):
+                try:
+                    # Convert to relative path from project root
+                    relative_path = str(
+                        Path(path).relative_to(self.config.codebase_dir)
+                    )
+                    db_file_paths.add(relative_path)
+                except ValueError:
+                    # Path is outside project directory - keep as absolute for logging
+                    logger.warning(
+                        f"Found path outside project directory in database: {path}"
+                    )
                     db_file_paths.add(path)
+            else:
+                # Already relative, use as-is
+                db_file_paths.add(path)
 
         # Find files in DB that aren't in current branch
         current_files_set = set(current_files)
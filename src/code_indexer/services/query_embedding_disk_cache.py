@@ -0,0 +1,233 @@
+"""On-disk query embedding cache for the CLI and daemon.
+
+The server has QueryEmbeddingCache (wired by lifespan); CLI and daemon
+queries otherwise pay a 150-400ms provider round-trip for every query, even
+when developers and scripts repeat the same one. This cache stores query
+embeddings in a small SQLite file, by default shared by every project of the
+user at ~/.cache/cidx/query_embeddings.db.
+
+- Key: (provider, model, dimension, normalized query text). Normalization
+  collapses whitespace runs only; case and token order are preserved, so a
+  hit always returns the embedding of an equivalent provider input.
+- Bounded: rows beyond ``max_entries`` are evicted least-recently-used first.
+- Fail-open: any SQLite error is logged at debug level and treated as a miss,
+  so a broken or locked cache file never fails a query.
+
+The cache is installed process-wide by the CLI query command and the daemon
+(install_query_embedding_cache) and consulted by FilesystemVectorStore.search
+before it calls the provider, mirroring the server's
+get_query_embedding_cache() accessor.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Optional
+
+import numpy as np
+
+from code_indexer.config import QueryEmbeddingDiskCacheConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "cidx" / "query_embeddings.db"
+DEFAULT_MAX_ENTRIES = 5000
+
+# Environment override for the cache file (tests, CI sandboxes)
+CACHE_PATH_ENV = "CIDX_QUERY_EMBEDDING_CACHE"
+
+# Seconds to wait for another process's write lock before treating as a miss
+_BUSY_TIMEOUT_SECONDS = 0.5
+
+
+def normalize_query(text: str) -> str:
+    """Collapse whitespace runs and strip the ends; nothing else."""
+    return " ".join(text.split())
+
+
+class QueryEmbeddingDiskCache:
+    """LRU-bounded SQLite store of query embeddings (float32 little-endian)."""
+
+    def __init__(self, db_path: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=_BUSY_TIMEOUT_SECONDS,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS query_embeddings (
+                    provider  TEXT    NOT NULL,
+                    model     TEXT    NOT NULL,
+                    dimension INTEGER NOT NULL,
+                    query     TEXT    NOT NULL,
+                    embedding BLOB    NOT NULL,
+                    last_used REAL    NOT NULL,
+                    PRIMARY KEY (provider, model, dimension, query)
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_query_embeddings_last_used "
+                "ON query_embeddings (last_used)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(
+        self, provider: str, model: str, dimension: int, text: str
+    ) -> Optional[List[float]]:
+        """Return the cached embedding (and refresh its LRU stamp), or None."""
+        key = (provider, model, dimension, normalize_query(text))
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT embedding FROM query_embeddings "
+                    "WHERE provider = ? AND model = ? AND dimension = ? AND query = ?",
+                    key,
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE query_embeddings SET last_used = ? "
+                    "WHERE provider = ? AND model = ? AND dimension = ? AND query = ?",
+                    (time.time(), *key),
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Query embedding cache lookup failed: {e}")
+            return None
+        embedding: List[float] = np.frombuffer(row[0], dtype="<f4").tolist()
+        return embedding
+
+    def put(
+        self,
+        provider: str,
+        model: str,
+        dimension: int,
+        text: str,
+        embedding: List[float],
+    ) -> None:
+        """Store an embedding, then evict least-recently-used rows over the cap."""
+        try:
+            blob = np.asarray(embedding, dtype="<f4").tobytes()
+        except (TypeError, ValueError):
+            return
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO query_embeddings "
+                    "(provider, model, dimension, query, embedding, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        provider,
+                        model,
+                        dimension,
+                        normalize_query(text),
+                        blob,
+                        time.time(),
+                    ),
+                )
+                conn.execute(
+                    "DELETE FROM query_embeddings WHERE rowid IN ("
+                    "SELECT rowid FROM query_embeddings "
+                    "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Query embedding cache write failed: {e}")
+
+    def __len__(self) -> int:
+        try:
+            with self._lock:
+                row = (
+                    self._connection()
+                    .execute("SELECT COUNT(*) FROM query_embeddings")
+                    .fetchone()
+                )
+        except sqlite3.Error:
+            return 0
+        return int(row[0])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def provider_cache_identity(provider: Any) -> Optional[tuple]:
+    """(provider name, model, dimension) for a provider, or None if unknown."""
+    try:
+        name = provider.get_provider_name()
+        model = provider.get_current_model()
+        dimension = provider.get_model_info().get("dimensions", 0)
+    except Exception as e:  # noqa: BLE001 - any provider quirk means "don't cache"
+        logger.debug(f"Query embedding cache: cannot identify provider: {e}")
+        return None
+    if not isinstance(name, str) or not isinstance(model, str):
+        return None
+    if not isinstance(dimension, int):
+        return None
+    return name, model, dimension
+
+
+# ---------------------------------------------------------------------------
+# Process-level accessor (CLI / daemon only; the server never installs one)
+# ---------------------------------------------------------------------------
+
+_disk_cache: Optional[QueryEmbeddingDiskCache] = None
+_install_lock = threading.Lock()
+
+
+def get_query_embedding_disk_cache() -> Optional[QueryEmbeddingDiskCache]:
+    """Return the installed cache, or None when none is installed."""
+    return _disk_cache
+
+
+def install_query_embedding_cache(config: Any) -> Optional[QueryEmbeddingDiskCache]:
+    """Install the process-level cache from ``config.query_embedding_cache``.
+
+    Idempotent: the daemon calls this for every query. Returns the installed
+    cache, or None when disabled.
+    """
+    global _disk_cache
+    settings = getattr(config, "query_embedding_cache", None)
+    if not isinstance(settings, QueryEmbeddingDiskCacheConfig) or not settings.enabled:
+        clear_query_embedding_disk_cache()
+        return None
+
+    db_path = Path(
+        settings.path or os.environ.get(CACHE_PATH_ENV) or DEFAULT_CACHE_PATH
+    ).expanduser()
+    with _install_lock:
+        if _disk_cache is None or _disk_cache.db_path != db_path:
+            if _disk_cache is not None:
+                _disk_cache.close()
+            _disk_cache = QueryEmbeddingDiskCache(db_path, settings.max_entries)
+        else:
+            _disk_cache.max_entries = settings.max_entries
+        return _disk_cache
+
+
+def clear_query_embedding_disk_cache() -> None:
+    """Uninstall the process-level cache (test isolation / disabled config)."""
+    global _disk_cache
+    with _install_lock:
+        if _disk_cache is not None:
+            _disk_cache.close()
+        _disk_cache = None
@@ -0,0 +1,242 @@
+"""Per-branch visibility bitmaps over point ordinals.
+
+Branch isolation used to record visibility in each vector JSON file's
+``payload.hidden_branches`` list, so hiding or un-hiding N files on a branch
+switch rewrote every affected JSON file (after paging every content point to
+find them). BranchVisibilityMap keeps the same information in one sidecar
+file per collection:
+
+- Every point that has ever been hidden gets a stable ordinal.
+- Each branch owns a bitmap over those ordinals; bit ``i`` set means the
+  point with ordinal ``i`` is hidden on that branch.
+
+Hiding/showing files is a bitmap update plus one sidecar write, and
+query-time filtering tests bits instead of reading JSON payloads, so hidden
+points can be excluded inside hnswlib via a label filter.
+
+Once the sidecar exists it is authoritative: FilesystemVectorStore overlays
+``payload.hidden_branches`` from the map on every read.
+
+On-disk format (``branch_visibility.bin``, msgpack):
+    {"version": 1,
+     "point_ids": [point_id | None, ...],      # index == ordinal
+     "hidden": {branch: packed_bits, ...}}      # np.packbits, little bit order
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+import msgpack  # type: ignore[import-untyped]
+import numpy as np
+
+from code_indexer.utils.file_locking import nfs_safe_fsync
+
+logger = logging.getLogger(__name__)
+
+BRANCH_VISIBILITY_FILENAME = "branch_visibility.bin"
+_FORMAT_VERSION = 1
+
+
+class BranchVisibilityMap:
+    """Branch -> bitmap of hidden point ordinals.
+
+    Not thread-safe: callers hold the owning store's lock.
+    """
+
+    def __init__(self) -> None:
+        self._point_ids: List[Optional[str]] = []
+        self._ordinals: Dict[str, int] = {}
+        self._hidden: Dict[str, np.ndarray] = {}
+
+    # --- ordinals -------------------------------------------------------
+
+    def _ordinal(self, point_id: str) -> int:
+        ordinal = self._ordinals.get(point_id)
+        if ordinal is None:
+            ordinal = len(self._point_ids)
+            self._point_ids.append(point_id)
+            self._ordinals[point_id] = ordinal
+        return ordinal
+
+    def _bitmap(self, branch: str) -> np.ndarray:
+        """Bitmap for *branch*, grown to cover every assigned ordinal."""
+        bits = self._hidden.get(branch)
+        size = len(self._point_ids)
+        if bits is None:
+            bits = np.zeros(size, dtype=bool)
+        elif len(bits) < size:
+            bits = np.concatenate([bits, np.zeros(size - len(bits), dtype=bool)])
+        self._hidden[branch] = bits
+        return bits
+
+    # --- mutation -------------------------------------------------------
+
+    def hide(self, branch: str, point_ids: Iterable[str]) -> int:
+        """Mark points hidden on *branch*. Returns the number that changed."""
+        ordinals = [self._ordinal(pid) for pid in point_ids]
+        if not ordinals:
+            return 0
+        bits = self._bitmap(branch)
+        idx = np.asarray(ordinals, dtype=np.int64)
+        changed = int(np.count_nonzero(~bits[idx]))
+        bits[idx] = True
+        return changed
+
+    def show(self, branch: str, point_ids: Iterable[str]) -> int:
+        """Mark points visible on *branch*. Returns the number that changed."""
+        bits = self._hidden.get(branch)
+        if bits is None:
+            return 0
+        ordinals = [
+            o
+            for o in (self._ordinals.get(pid) for pid in point_ids)
+            if o is not None and o < len(bits)
+        ]
+        if not ordinals:
+            return 0
+        idx = np.asarray(ordinals, dtype=np.int64)
+        changed = int(np.count_nonzero(bits[idx]))
+        bits[idx] = False
+        return changed
+
+    def set_hidden_branches(self, point_id: str, branches: Iterable[str]) -> bool:
+        """Make *branches* the exact set of branches hiding *point_id*.
+
+        Mirrors overwriting ``payload.hidden_branches``. Returns True if any
+        bit changed.
+        """
+        wanted = set(branches)
+        changed = False
+        for branch in set(self._hidden) - wanted:
+            changed |= self.show(branch, [point_id]) > 0
+        for branch in wanted:
+            changed |= self.hide(branch, [point_id]) > 0
+        return changed
+
+    def remove_points(self, point_ids: Iterable[str]) -> bool:
+        """Forget deleted points. Returns True if any point was known."""
+        removed = False
+        for point_id in point_ids:
+            ordinal = self._ordinals.pop(point_id, None)
+            if ordinal is None:
+                continue
+            removed = True
+            self._point_ids[ordinal] = None
+            for bits in self._hidden.values():
+                if ordinal < len(bits):
+                    bits[ordinal] = False
+        return removed
+
+    # --- queries --------------------------------------------------------
+
+    def is_hidden(self, branch: str, point_id: str) -> bool:
+        bits = self._hidden.get(branch)
+        ordinal = self._ordinals.get(point_id)
+        if bits is None or ordinal is None or ordinal >= len(bits):
+            return False
+        return bool(bits[ordinal])
+
+    def hidden_branches(self, point_id: str) -> List[str]:
+        """Branches hiding *point_id* (the legacy payload.hidden_branches)."""
+        ordinal = self._ordinals.get(point_id)
+        if ordinal is None:
+            return []
+        return sorted(
+            branch
+            for branch, bits in self._hidden.items()
+            if ordinal < len(bits) and bits[ordinal]
+        )
+
+    def hidden_count(self, branch: str) -> int:
+        bits = self._hidden.get(branch)
+        return 0 if bits is None else int(np.count_nonzero(bits))
+
+    def branches(self) -> List[str]:
+        return sorted(self._hidden)
+
+    def hidden_point_ids(self, branches: Iterable[str]) -> Set[str]:
+        """Point IDs hidden on any of *branches*.
+
+        The hidden side is small next to the collection, so query-time
+        filtering resolves it to HNSW labels once per query.
+        """
+        hidden: Set[str] = set()
+        for branch in branches:
+            bits = self._hidden.get(branch)
+            if bits is None:
+                continue
+            for ordinal in np.flatnonzero(bits):
+                point_id = self._point_ids[ordinal]
+                if point_id is not None:
+                    hidden.add(point_id)
+        return hidden
+
+    # --- persistence ----------------------------------------------------
+
+    def _compact(self) -> None:
+        """Drop ordinals of removed points once they dominate the table."""
+        live = [o for o, pid in enumerate(self._point_ids) if pid is not None]
+        if len(live) * 2 >= len(self._point_ids):
+            return
+        idx = np.asarray(live, dtype=np.int64)
+        self._hidden = {
+            branch: self._bitmap(branch)[idx] for branch in list(self._hidden)
+        }
+        self._point_ids = [self._point_ids[o] for o in live]
+        self._ordinals = {
+            pid: o for o, pid in enumerate(self._point_ids) if pid is not None
+        }
+
+    def save(self, path: Path) -> None:
+        """Atomically write the map (temp file + os.replace)."""
+        self._compact()
+        size = len(self._point_ids)
+        hidden = {}
+        for branch in list(self._hidden):
+            bits = self._bitmap(branch)
+            if bits.any():
+                hidden[branch] = np.packbits(bits[:size], bitorder="little").tobytes()
+            else:
+                del self._hidden[branch]
+        data = {
+            "version": _FORMAT_VERSION,
+            "point_ids": self._point_ids,
+            "hidden": hidden,
+        }
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = path.with_suffix(".bin.tmp")
+        with open(temp_file, "wb") as f:
+            msgpack.dump(data, f)
+            f.flush()
+            nfs_safe_fsync(f.fileno())
+        os.replace(temp_file, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "BranchVisibilityMap":
+        """Load a map from disk (empty map if the file does not exist)."""
+        instance = cls()
+        if not path.exists():
+            return instance
+
+        with open(path, "rb") as f:
+            data = msgpack.load(f)
+
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported branch visibility format version "
+                f"{data.get('version')!r} in {path}"
+            )
+        instance._point_ids = list(data["point_ids"])
+        instance._ordinals = {
+            pid: o for o, pid in enumerate(instance._point_ids) if pid is not None
+        }
+        size = len(instance._point_ids)
+        for branch, packed in data["hidden"].items():
+            bits = np.unpackbits(
+                np.frombuffer(packed, dtype=np.uint8), count=size, bitorder="little"
+            )
+            instance._hidden[branch] = bits.astype(bool)
+        return instance
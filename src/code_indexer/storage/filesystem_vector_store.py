@@ -23,6 +23,14 @@ import numpy as np
 import logging
 import msgpack
 
+from .branch_visibility import BRANCH_VISIBILITY_FILENAME, BranchVisibilityMap
+from .hnsw_delta_log import (
+    DELTA_MERGE_THRESHOLD,
+    HNSW_DELTA_FILENAME,
+    HNSWDeltaLog,
+    merge_candidates,
+)
+from .quantized_index import QUANTIZED_INDEX_FILENAME, QuantizedVectorIndex
 from .vector_quantizer import VectorQuantizer
 from .projection_matrix_manager import ProjectionMatrixManager
 from .temporal_metadata_store import TemporalMetadataStore
@@ -49,10 +57,12 @@ class LocalIndexNotFoundError(RuntimeError):
 # imported, so ImportError is only expected in stripped unit-test environments.
 try:
     from code_indexer.server.services.governed_call import (
+        EmbeddingCacheMetadata,
         coalesced_query_embedding,
     )
 except ImportError:  # pragma: no cover
     coalesced_query_embedding = None  # type: ignore[assignment]
+    EmbeddingCacheMetadata = None  # type: ignore[assignment,misc]
 
 try:
     from code_indexer.server.services.embedding_cache_audit import (
@@ -322,6 +332,7 @@ class FilesystemVectorStore:
         id_index_cache: Optional[Any] = None,
         skip_staleness_check: bool = False,
         memory_governor: Optional[Any] = None,
+        vector_quantization: str = "none",
     ):
         """Initialize filesystem vector store.
 
@@ -336,6 +347,11 @@ class FilesystemVectorStore:
             memory_governor: Optional MemoryGovernor for Story #1213 Story 3. Server mode
                 passes get_memory_governor(); CLI leaves it None so eviction behavior is
                 byte-identical to Bug #1171.
+            vector_quantization: "int8" searches collections through a
+                QuantizedVectorIndex (int8 candidates + exact float re-scoring)
+                instead of the float HNSW index. Recorded in the metadata of
+                collections created by this store; a collection's own setting
+                wins over this default at query time.
         """
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
@@ -405,6 +421,33 @@ class FilesystemVectorStore:
         # Violation of this invariant causes ABBA deadlock.
         self._path_index_lock = threading.Lock()
 
+        # Branch visibility bitmaps (branch_visibility.bin sidecar per collection).
+        # Structure: {str(collection_path): ((mtime_ns, size), BranchVisibilityMap)}
+        # The sidecar's stat signature is re-checked on every lookup so a map
+        # written by another process (e.g. the indexer while a daemon serves
+        # queries) is picked up. Never held together with the other locks.
+        self._branch_visibility: Dict[
+            str, Tuple[Tuple[int, int], BranchVisibilityMap]
+        ] = {}
+        self._branch_visibility_lock = threading.Lock()
+
+        # int8 candidate indexes (quantized_index.npz per collection).
+        # Structure: {str(collection_path): QuantizedVectorIndex}; each entry
+        # carries the hnsw_index.bin stamp it was derived from.
+        self.vector_quantization = vector_quantization
+        self._quantized_indexes: Dict[str, QuantizedVectorIndex] = {}
+        self._quantized_index_lock = threading.Lock()
+
+        # HNSW delta segments (hnsw_delta.npz per collection), see hnsw_delta_log.
+        # Structure: {str(collection_path): ((mtime_ns, size), HNSWDeltaLog)};
+        # re-validated against the sidecar's stat signature and the index's
+        # rebuild UUID on every search.
+        self._hnsw_deltas: Dict[str, Tuple[Tuple[int, int], HNSWDeltaLog]] = {}
+        self._hnsw_delta_lock = threading.Lock()
+        # Serializes delta segment writes with merges into hnsw_index.bin
+        self._hnsw_merge_lock = threading.Lock()
+        self._hnsw_merge_thread: Optional[threading.Thread] = None
+
         # Story #669: Temporal metadata store for v2 format (lazy-initialized)
         self._temporal_metadata_store: Optional[TemporalMetadataStore] = None
         self._temporal_metadata_lock = threading.Lock()
@@ -497,6 +540,9 @@ class FilesystemVectorStore:
         if subdirectory:
             metadata["subdirectory"] = subdirectory
 
+        if self.vector_quantization != "none":
+            metadata["vector_quantization"] = self.vector_quantization
+
         metadata_path = collection_path / "collection_meta.json"
         self._atomic_write_json(metadata_path, metadata, fsync=True)
 
@@ -1397,6 +1443,13 @@ class FilesystemVectorStore:
             metadata_store.save_metadata_batch(temporal_batch_rows)
             metadata_store.checkpoint_wal()
 
+        # Rewritten payloads reset visibility; keep the bitmap in step
+        self._sync_branch_visibility(
+            collection_path,
+            points,
+            removed_ids=[orphan_id for _, orphan_id, _ in orphans_to_delete],
+        )
+
         # HNSW-001: Watch mode real-time HNSW update
         if watch_mode:
             # In watch mode, update HNSW immediately for all upserted points
@@ -1528,6 +1581,15 @@ class FilesystemVectorStore:
                     for file_path, point_id in path_index_removals:
                         path_idx.remove_point(file_path, point_id)
 
+        # Forget deleted points' ordinals in the branch visibility bitmap
+        collection_path = self._get_collection_path(
+            collection_name, self._active_subdirectories.get(collection_name)
+        )
+        with self._branch_visibility_lock:
+            visibility = self._load_branch_visibility(collection_path)
+            if visibility is not None and visibility.remove_points(point_ids):
+                self._save_branch_visibility(collection_path, visibility)
+
         return {"status": "ok", "deleted": deleted}
 
     def _prepare_vector_data(
@@ -2095,6 +2157,7 @@ class FilesystemVectorStore:
         Returns:
             Point data with id, vector, and payload, or None if not found
         """
+        visibility = self._get_branch_visibility(collection_name)
         with self._id_index_lock:
             if collection_name not in self._id_index:
                 self._id_index[collection_name] = self._load_id_index(collection_name)
@@ -2114,7 +2177,9 @@ class FilesystemVectorStore:
                     data = json.load(f)
 
                 # Payload should always exist in new format, but provide empty fallback
-                payload = data.get("payload", {})
+                payload = self._overlay_hidden_branches(
+                    visibility, data["id"], data.get("payload", {})
+                )
                 result = {
                     "id": data["id"],
                     "vector": data["vector"],
@@ -2466,6 +2531,227 @@ class FilesystemVectorStore:
         self._save_path_index(collection_name, path_index)
         return path_index
 
+    def _ensure_path_index(self, collection_name: str) -> PathIndex:
+        """Return the collection's PathIndex, loading or rebuilding it if needed."""
+        # Ensure path index is loaded (or lazily rebuilt if absent)
+        with self._path_index_lock:
+            if collection_name not in self._path_indexes:
+                loaded = PathIndex.load(
+                    self._get_collection_path(
+                        collection_name,
+                        self._active_subdirectories.get(collection_name),
+                    )
+                    / "path_index.bin"
+                )
+                self._path_indexes[collection_name] = loaded
+            path_index = self._path_indexes[collection_name]
+            # Detect legacy collection: PathIndex empty but collection may have files
+            needs_rebuild = not path_index._path_index
+
+        # Release lock before any I/O; rebuild walks disk only on first call
+        if needs_rebuild:
+            rebuilt = self._rebuild_path_index_from_disk(collection_name)
+            # M2 fix: merge rebuilt entries INTO the live index instead of
+            # replacing it.  Any upsert_points calls that ran concurrently
+            # during the rglob walk added to the live PathIndex; a swap
+            # would discard those additions.  merge_from uses add_point
+            # (set semantics) so re-adding existing entries is a no-op.
+            with self._path_index_lock:
+                live_index = self._path_indexes[collection_name]
+                live_index.merge_from(rebuilt)
+                path_index = live_index
+
+        return path_index
+
+    def get_indexed_paths(self, collection_name: str) -> Set[str]:
+        """Return every payload.path in the collection, read from the PathIndex.
+
+        Unlike get_all_indexed_files() this never parses vector JSON files
+        once path_index.bin exists.
+        """
+        if not self.collection_exists(collection_name):
+            return set()
+        path_index = self._ensure_path_index(collection_name)
+        with self._path_index_lock:
+            return set(path_index._path_index)
+
+    # --- Branch visibility ---------------------------------------------------
+
+    def _load_branch_visibility(
+        self, collection_path: Path
+    ) -> Optional[BranchVisibilityMap]:
+        """Return the collection's branch visibility map.
+
+        Returns None for collections without a sidecar, whose visibility still
+        lives in payload.hidden_branches. Caller holds _branch_visibility_lock.
+        """
+        key = str(collection_path)
+        sidecar = collection_path / BRANCH_VISIBILITY_FILENAME
+        try:
+            stat = sidecar.stat()
+        except FileNotFoundError:
+            self._branch_visibility.pop(key, None)
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._branch_visibility.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        visibility = BranchVisibilityMap.load(sidecar)
+        self._branch_visibility[key] = (signature, visibility)
+        return visibility
+
+    def _save_branch_visibility(
+        self, collection_path: Path, visibility: BranchVisibilityMap
+    ) -> None:
+        """Persist *visibility*. Caller holds _branch_visibility_lock."""
+        sidecar = collection_path / BRANCH_VISIBILITY_FILENAME
+        visibility.save(sidecar)
+        stat = sidecar.stat()
+        self._branch_visibility[str(collection_path)] = (
+            (stat.st_mtime_ns, stat.st_size),
+            visibility,
+        )
+
+    def _migrate_branch_visibility(self, collection_path: Path) -> BranchVisibilityMap:
+        """Seed a new map from legacy payload.hidden_branches (one full scan).
+
+        Runs once per collection, when the first bitmap update creates the
+        sidecar; afterwards the sidecar is authoritative.
+        """
+        visibility = BranchVisibilityMap()
+        for vector_file in collection_path.rglob("vector_*.json"):
+            try:
+                with open(vector_file) as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                continue
+            hidden = data.get("payload", {}).get("hidden_branches")
+            if hidden and data.get("id"):
+                visibility.set_hidden_branches(data["id"], hidden)
+        return visibility
+
+    def _get_branch_visibility(
+        self, collection_name: str
+    ) -> Optional[BranchVisibilityMap]:
+        """Branch visibility map for *collection_name*, or None (legacy)."""
+        collection_path = self._get_collection_path(
+            collection_name, self._active_subdirectories.get(collection_name)
+        )
+        with self._branch_visibility_lock:
+            return self._load_branch_visibility(collection_path)
+
+    @staticmethod
+    def _overlay_hidden_branches(
+        visibility: Optional[BranchVisibilityMap],
+        point_id: str,
+        payload: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Replace payload.hidden_branches with the bitmap's view of the point."""
+        if visibility is None:
+            return payload
+        hidden = visibility.hidden_branches(point_id)
+        if hidden or "hidden_branches" in payload:
+            payload["hidden_branches"] = hidden
+        return payload
+
+    def update_branch_visibility(
+        self,
+        collection_name: str,
+        branch: str,
+        hide_files: Optional[List[str]] = None,
+        show_files: Optional[List[str]] = None,
+    ) -> int:
+        """Hide or show every point of the given files on *branch*.
+
+        Updates the collection's branch visibility bitmap and writes its
+        sidecar once; no vector JSON file is read or rewritten (beyond the
+        one-time migration of legacy payload.hidden_branches).
+
+        Args:
+            collection_name: Name of the collection
+            branch: Branch whose visibility changes
+            hide_files: payload.path values to hide on *branch*
+            show_files: payload.path values to make visible on *branch*
+
+        Returns:
+            Number of points whose visibility changed
+        """
+        if not self.collection_exists(collection_name):
+            return 0
+        path_index = self._ensure_path_index(collection_name)
+        with self._path_index_lock:
+            hide_ids = sorted(
+                {pid for f in hide_files or () for pid in path_index.get_point_ids(f)}
+            )
+            show_ids = sorted(
+                {pid for f in show_files or () for pid in path_index.get_point_ids(f)}
+            )
+        if not hide_ids and not show_ids:
+            return 0
+
+        collection_path = self._get_collection_path(
+            collection_name, self._active_subdirectories.get(collection_name)
+        )
+        with self._branch_visibility_lock:
+            visibility = self._load_branch_visibility(collection_path)
+            created = visibility is None
+            if visibility is None:
+                visibility = self._migrate_branch_visibility(collection_path)
+            changed = visibility.hide(branch, hide_ids) + visibility.show(
+                branch, show_ids
+            )
+            if changed or created:
+                self._save_branch_visibility(collection_path, visibility)
+        return changed
+
+    def _sync_branch_visibility(
+        self,
+        collection_path: Path,
+        points: List[Dict[str, Any]],
+        removed_ids: Optional[List[str]] = None,
+    ) -> None:
+        """Mirror payload.hidden_branches of written points into the bitmap.
+
+        Writing a point replaces its payload, so its visibility becomes
+        whatever the new payload says (usually visible everywhere).
+        *removed_ids* (orphans deleted by the same write) are forgotten.
+        """
+        with self._branch_visibility_lock:
+            visibility = self._load_branch_visibility(collection_path)
+            if visibility is None:
+                return
+            changed = visibility.remove_points(removed_ids or ())
+            for point in points:
+                hidden = point.get("payload", {}).get("hidden_branches") or ()
+                changed |= visibility.set_hidden_branches(point["id"], hidden)
+            if changed:
+                self._save_branch_visibility(collection_path, visibility)
+
+    @staticmethod
+    def _extract_hidden_branch_exclusions(
+        filter_conditions: Optional[Dict[str, Any]],
+    ) -> List[str]:
+        """Branches from top-level ``must_not`` hidden_branches clauses.
+
+        Matches {"key": "hidden_branches", "match": {"any": [...]}} (or
+        "value"). Only top-level must_not clauses are AND-ed with the rest of
+        the filter, so only those can be pushed down into the HNSW query.
+        """
+        if not filter_conditions:
+            return []
+        branches: List[str] = []
+        for clause in filter_conditions.get("must_not") or []:
+            if not isinstance(clause, dict) or clause.get("key") != "hidden_branches":
+                continue
+            match = clause.get("match")
+            if not isinstance(match, dict):
+                continue
+            if "any" in match:
+                branches.extend(match["any"])
+            elif "value" in match:
+                branches.append(match["value"])
+        return branches
+
     def scroll_points(
         self,
         collection_name: str,
@@ -2504,33 +2790,7 @@ class FilesystemVectorStore:
         # --- Fast path: path equality filter via PathIndex ---
         target_path = self._extract_path_filter(filter_conditions)
         if target_path is not None:
-            # Ensure path index is loaded (or lazily rebuilt if absent)
-            with self._path_index_lock:
-                if collection_name not in self._path_indexes:
-                    loaded = PathIndex.load(
-                        self._get_collection_path(
-                            collection_name,
-                            self._active_subdirectories.get(collection_name),
-                        )
-                        / "path_index.bin"
-                    )
-                    self._path_indexes[collection_name] = loaded
-                path_index = self._path_indexes[collection_name]
-                # Detect legacy collection: PathIndex empty but collection may have files
-                needs_rebuild = not path_index._path_index
-
-            # Release lock before any I/O; rebuild walks disk only on first call
-            if needs_rebuild:
-                rebuilt = self._rebuild_path_index_from_disk(collection_name)
-                # M2 fix: merge rebuilt entries INTO the live index instead of
-                # replacing it.  Any upsert_points calls that ran concurrently
-                # during the rglob walk added to the live PathIndex; a swap
-                # would discard those additions.  merge_from uses add_point
-                # (set semantics) so re-adding existing entries is a no-op.
-                with self._path_index_lock:
-                    live_index = self._path_indexes[collection_name]
-                    live_index.merge_from(rebuilt)
-                    path_index = live_index
+            path_index = self._ensure_path_index(collection_name)
 
             # Get point IDs for the requested path (copy under lock for safety)
             with self._path_index_lock:
@@ -2592,6 +2852,7 @@ class FilesystemVectorStore:
         filter_func = None
         if filter_conditions:
             filter_func = self._parse_filter(filter_conditions)
+        visibility = self._get_branch_visibility(collection_name)
 
         # Load points
         points: List[Dict[str, Any]] = []
@@ -2602,16 +2863,18 @@ class FilesystemVectorStore:
 
                 point = {"id": data["id"]}
 
+                payload = self._overlay_hidden_branches(
+                    visibility, data["id"], data.get("payload", {})
+                )
                 if with_payload:
                     # Payload should always exist in new format
-                    point["payload"] = data.get("payload", {})
+                    point["payload"] = payload
 
                 if with_vectors:
                     point["vector"] = data["vector"]
 
                 # Apply pre-parsed filter (compiled once above)
                 if filter_func is not None:
-                    payload = point.get("payload", {})
                     if not filter_func(payload):
                         continue
 
@@ -2627,6 +2890,71 @@ class FilesystemVectorStore:
 
         return points, next_offset
 
+    def _get_quantized_index(
+        self, collection_path: Path, hnsw_manager: Any
+    ) -> Optional[QuantizedVectorIndex]:
+        """Return the int8 candidate index for a collection, (re)building it
+        from the HNSW index when missing or derived from an older .bin.
+
+        Returns:
+            None if the collection has no HNSW index.
+        """
+        index_file = collection_path / hnsw_manager.INDEX_FILENAME
+        try:
+            st = index_file.stat()
+        except FileNotFoundError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = str(collection_path)
+
+        with self._quantized_index_lock:
+            cached = self._quantized_indexes.get(key)
+            if cached is not None and cached.source_stamp == stamp:
+                return cached
+
+            quantized_file = collection_path / QUANTIZED_INDEX_FILENAME
+            quantized = QuantizedVectorIndex.load(quantized_file)
+            if quantized is None or quantized.source_stamp != stamp:
+                hnsw_index = hnsw_manager.load_index(
+                    collection_path, max_elements=100000
+                )
+                if hnsw_index is None:
+                    return None
+                quantized = QuantizedVectorIndex.from_hnsw(
+                    hnsw_index, hnsw_manager._load_id_mapping(collection_path), stamp
+                )
+                del hnsw_index
+                try:
+                    quantized.save(quantized_file)
+                except OSError as e:
+                    # Read-only snapshots still serve from the in-memory copy
+                    self.logger.debug(f"Could not persist quantized index: {e}")
+                self.logger.info(
+                    f"Built int8 quantized index for {collection_path.name}: "
+                    f"{len(quantized)} vectors, {quantized.nbytes} bytes"
+                )
+
+            self._quantized_indexes[key] = quantized
+            return quantized
+
+    @staticmethod
+    def _read_stored_vectors(
+        id_index: Dict[str, Path], point_ids: List[str]
+    ) -> List[Optional[np.ndarray]]:
+        """Full-precision vectors from the vector JSON files (None if missing)."""
+        vectors: List[Optional[np.ndarray]] = []
+        for point_id in point_ids:
+            vector_file = id_index.get(point_id)
+            vector = None
+            if vector_file is not None:
+                try:
+                    with open(vector_file) as f:
+                        vector = np.asarray(json.load(f)["vector"], dtype=np.float32)
+                except (OSError, json.JSONDecodeError, KeyError, ValueError):
+                    vector = None
+            vectors.append(vector)
+        return vectors
+
     def search(
         self,
         query: str,
@@ -2690,6 +3018,11 @@ class FilesystemVectorStore:
         import time
         from concurrent.futures import ThreadPoolExecutor
 
+        from ..services.query_embedding_disk_cache import (
+            get_query_embedding_disk_cache,
+            provider_cache_identity,
+        )
+
         timing: Dict[str, Any] = {}
 
         collection_path = self._get_collection_path(collection_name, subdirectory)
@@ -2736,6 +3069,11 @@ class FilesystemVectorStore:
                 "Querying existing index as-is. Run 'cidx index' to rebuild."
             )
 
+        # int8 mode: candidates come from the quantized index, not the float graph
+        use_quantized = (
+            metadata.get("vector_quantization", self.vector_quantization) == "int8"
+        )
+
         # === PARALLEL EXECUTION (always) ===
 
         def load_index():
@@ -2748,7 +3086,9 @@ class FilesystemVectorStore:
             t_hnsw = time.time()
 
             # Story #526: Use cache if available
-            if self.hnsw_index_cache is not None:
+            if use_quantized:
+                hnsw_index = self._get_quantized_index(collection_path, hnsw_manager)
+            elif self.hnsw_index_cache is not None:
                 # Cache key is collection_path (unique per repository)
                 cache_key = str(collection_path.resolve())
 
@@ -2826,6 +3166,9 @@ class FilesystemVectorStore:
 
             return hnsw_index, id_index, hnsw_load_ms, id_load_ms
 
+        # Filled by generate_embedding() when the disk cache is consulted
+        embedding_cache_timing: Dict[str, Any] = {}
+
         def generate_embedding():
             """Generate query embedding in parallel thread.
 
@@ -2836,9 +3179,37 @@ class FilesystemVectorStore:
             Story #1110 (S6 Chunk B): allocate _audit_ctx dict and thread it into
             coalesced_query_embedding.  On a sampled cache hit the function populates
             the dict in-place; the 3-tuple return carries it back to search().
+
+            CLI/daemon: when an on-disk query embedding cache is installed
+            (never on the server), it is consulted first and filled on a miss.
             """
             _audit_ctx: Dict[str, Any] = {}
             t0 = time.time()
+            disk_cache = (
+                None
+                if no_embedding_cache_shortcut
+                else get_query_embedding_disk_cache()
+            )
+            cache_identity = (
+                provider_cache_identity(embedding_provider)
+                if disk_cache is not None
+                else None
+            )
+            if disk_cache is not None and cache_identity is not None:
+                cached = disk_cache.get(*cache_identity, query)
+                embedding_cache_timing["embedding_cache_lookup_ms"] = (
+                    time.time() - t0
+                ) * 1000
+                if cached is not None:
+                    embedding_cache_timing["embedding_cache"] = "hit"
+                    return (
+                        cached,
+                        (time.time() - t0) * 1000,
+                        _audit_ctx,
+                        EmbeddingCacheMetadata(key_found=True, cache_mode="on"),
+                    )
+                embedding_cache_timing["embedding_cache"] = "miss"
+
             embedding, _embed_meta = coalesced_query_embedding(
                 embedding_provider,
                 query,
@@ -2846,6 +3217,8 @@ class FilesystemVectorStore:
                 audit_ctx=_audit_ctx,
             )
             embedding_time_ms = (time.time() - t0) * 1000
+            if disk_cache is not None and cache_identity is not None:
+                disk_cache.put(*cache_identity, query, embedding)
             # Story #1159: return _embed_meta so the MAIN THREAD can write to
             # _search_event_ctx.  ContextVar is not visible inside worker threads
             # (Python 3.9 ThreadPoolExecutor does not propagate context), so the
@@ -2939,6 +3312,7 @@ class FilesystemVectorStore:
         timing["index_load_ms"] = hnsw_load_ms  # HNSW index load time
         timing["id_index_load_ms"] = id_load_ms  # ID index load time
         timing["parallel_execution"] = True
+        timing.update(embedding_cache_timing)
 
         # Calculate threading overhead
         # Max concurrent work = max(embedding, index_loads_combined)
@@ -2969,22 +3343,65 @@ class FilesystemVectorStore:
         # Use prefetch_limit if provided (for over-fetching with filters), otherwise limit * 2
         hnsw_k = prefetch_limit if prefetch_limit is not None else limit * 2
 
+        # Branch visibility: overlay payloads from the bitmap and push
+        # must_not hidden_branches clauses down into hnswlib as a label filter,
+        # so hidden points do not consume the k candidates.
+        with self._branch_visibility_lock:
+            visibility = self._load_branch_visibility(collection_path)
+        excluded_ids: Optional[Set[str]] = None
+        if visibility is not None:
+            hidden_on = self._extract_hidden_branch_exclusions(filter_conditions)
+            if hidden_on:
+                excluded_ids = visibility.hidden_point_ids(hidden_on)
+
+        # Points changed since hnsw_index.bin was saved live in the delta
+        # segment; their (outdated or deleted) main-index entries are skipped.
+        delta = self._load_hnsw_delta(
+            collection_path,
+            vector_size,
+            metadata.get("hnsw_index", {}).get("index_rebuild_uuid"),
+        )
+        main_excluded_ids = excluded_ids
+        if delta is not None:
+            main_excluded_ids = (excluded_ids or set()) | delta.hidden_ids
+
         # Query HNSW index
         t0 = time.time()
-        candidate_ids, distances = hnsw_manager.query(
-            index=hnsw_index,
-            query_vector=query_vec,
-            collection_path=collection_path,
-            k=hnsw_k,  # Use prefetch_limit when provided for filter headroom
-            ef=ef,  # HNSW query parameter - passed from search method
-        )
+        if use_quantized:
+            timing["search_path"] = "quantized_int8"
+            candidate_ids, distances = hnsw_index.search(
+                query_vec,
+                k=hnsw_k,
+                excluded_ids=main_excluded_ids,
+                rescore=lambda ids: self._read_stored_vectors(id_index, ids),
+            )
+        else:
+            candidate_ids, distances = hnsw_manager.query(
+                index=hnsw_index,
+                query_vector=query_vec,
+                collection_path=collection_path,
+                k=hnsw_k,  # Use prefetch_limit when provided for filter headroom
+                ef=ef,  # HNSW query parameter - passed from search method
+                excluded_ids=main_excluded_ids,
+            )
+        if delta is not None:
+            candidate_ids, distances = merge_candidates(
+                (candidate_ids, distances),
+                delta.search(query_vec, hnsw_k, excluded_ids),
+                hnsw_k,
+            )
+            timing["hnsw_delta_entries"] = len(delta)
         timing["hnsw_search_ms"] = (time.time() - t0) * 1000
 
         # Story #1110 (S6 Chunk B): deep-fidelity audit hook (fail-open).
         # Fires only when the coalesced embedding path sampled this request.
         # _run_deep_fidelity_audit is already fail-open internally; we also
         # guard externally so a bug in the import or the call never breaks search.
-        if audit_ctx.get("sampled") and _run_deep_fidelity_audit is not None:
+        if (
+            audit_ctx.get("sampled")
+            and _run_deep_fidelity_audit is not None
+            and not use_quantized
+        ):
             try:
                 _run_deep_fidelity_audit(
                     audit_ctx=audit_ctx,
@@ -3043,7 +3460,9 @@ class FilesystemVectorStore:
                         {
                             "id": data["id"],
                             "score": similarity,
-                            "payload": data.get("payload", {}),
+                            "payload": self._overlay_hidden_branches(
+                                visibility, data["id"], data.get("payload", {})
+                            ),
                             "_vector_data": data,
                         }
                     )
@@ -3073,7 +3492,9 @@ class FilesystemVectorStore:
                         data = json.load(f)
 
                     # Apply filter conditions on payload
-                    payload = data.get("payload", {})
+                    payload = self._overlay_hidden_branches(
+                        visibility, data["id"], data.get("payload", {})
+                    )
                     if not filter_func(payload):
                         continue
 
@@ -3642,6 +4063,7 @@ class FilesystemVectorStore:
                     )
                 index = self._id_index[collection_name]
 
+            visibility_updates: List[Dict[str, Any]] = []
             for point in points:
                 point_id = point["id"]
                 new_payload_fields = point["payload"]
@@ -3668,6 +4090,17 @@ class FilesystemVectorStore:
 
                 # Direct JSON write (atomic via _atomic_write_json)
                 self._atomic_write_json(vector_file, data)
+                if "hidden_branches" in new_payload_fields:
+                    visibility_updates.append(point)
+
+            if visibility_updates:
+                self._sync_branch_visibility(
+                    self._get_collection_path(
+                        collection_name,
+                        self._active_subdirectories.get(collection_name),
+                    ),
+                    visibility_updates,
+                )
 
             return True
 
@@ -4052,12 +4485,16 @@ class FilesystemVectorStore:
 
         Note:
             HNSW-001: Real-time incremental updates for watch mode.
-            Updates HNSW immediately after each batch of file changes,
-            enabling queries without rebuild delays.
+            Changed points are appended to the collection's HNSW delta
+            segment, which queries search together with hnsw_index.bin, so
+            each batch costs proportionally to the change rather than the
+            index size. The segment is merged into the main index in the
+            background once it reaches DELTA_MERGE_THRESHOLD entries.
 
             AC2 (Concurrent Query Support): Uses readers-writer lock pattern
-            AC3 (Daemon Cache Updates): Detects daemon mode and updates cache in-memory
-            AC4 (Standalone Persistence): Falls back to disk persistence when no daemon
+            AC3 (Daemon Cache Updates): The cached in-memory index stays valid
+                (the .bin is unchanged); a merge swaps in the merged index
+            AC4 (Standalone Persistence): The delta segment is persisted to disk
         """
         if not changed_points:
             return
@@ -4069,157 +4506,59 @@ class FilesystemVectorStore:
 
         hnsw_manager = HNSWIndexManager(vector_dim=vector_size, space="cosine")
 
+        if not hnsw_manager.index_exists(collection_path):
+            # No existing index - mark as stale for query-time rebuild
+            self.logger.debug(
+                f"No existing HNSW index for watch mode update in '{collection_name}', "
+                f"marking as stale"
+            )
+            hnsw_manager.mark_stale(collection_path)
+            return
+
+        upserts = []
+        for point in changed_points:
+            try:
+                upserts.append(
+                    (point["id"], np.asarray(point["vector"], dtype=np.float32))
+                )
+            except (KeyError, ValueError) as e:
+                self.logger.warning(
+                    f"Failed to update HNSW for point '{point.get('id')}': {e}"
+                )
+
         # AC3: Detect daemon mode vs standalone mode
         daemon_mode = hasattr(self, "cache_entry") and self.cache_entry is not None
 
         if daemon_mode and self.cache_entry is not None:
-            # === DAEMON MODE: Update cache in-memory with locking ===
             cache_entry = self.cache_entry
 
-            # AC2: Acquire write lock for exclusive HNSW update
-            # ReaderWriterLock provides exclusive access (no concurrent readers or writers)
+            # AC2: Acquire write lock so queries never observe a half-swapped
+            # index while the delta is recorded or merged
             cache_entry.rw_lock.acquire_write()
             try:
-                # Load from cache or disk if not cached
-                if cache_entry.hnsw_index is None:
-                    # Cache not loaded - load from disk
-                    cache_entry.hnsw_index = hnsw_manager.load_index(
-                        collection_path, max_elements=100000
-                    )
-
-                    cache_entry.id_mapping = self._load_id_index(collection_name)
-
-                # Use cache references
-                index = cache_entry.hnsw_index
-                id_mapping = cache_entry.id_mapping
-
-                if index is None:
-                    # No existing index - mark as stale for query-time rebuild
-                    self.logger.debug(
-                        f"No existing HNSW index for watch mode update in '{collection_name}', "
-                        f"marking as stale"
-                    )
-                    hnsw_manager.mark_stale(collection_path)
-                    return
-
-                # Build ID-to-label and label-to-ID mappings
-                label_to_id = hnsw_manager._load_id_mapping(collection_path)
-                id_to_label = {v: k for k, v in label_to_id.items()}
-                next_label = max(label_to_id.keys()) + 1 if label_to_id else 0
-
-                # Process each changed point
-                processed = 0
-                for point in changed_points:
-                    point_id = point["id"]
-                    vector = np.array(point["vector"], dtype=np.float32)
-
-                    try:
-                        # Add or update in HNSW (updates cache index directly)
-                        old_count = len(id_to_label)
-                        label, id_to_label, label_to_id, next_label = (
-                            hnsw_manager.add_or_update_vector(
-                                index,
-                                point_id,
-                                vector,
-                                id_to_label,
-                                label_to_id,
-                                next_label,
-                            )
-                        )
-                        new_count = len(id_to_label)
-
-                        self.logger.debug(
-                            f"Daemon watch mode HNSW: added '{point_id}' with label {label}, "
-                            f"mappings: {old_count} -> {new_count}, next_label: {next_label}"
-                        )
-
-                        processed += 1
-
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Failed to update HNSW for point '{point_id}': {e}"
-                        )
-                        continue
-
-                # Save updated index to disk (also updates cache since index is same object)
-                total_vectors = len(id_to_label)
-                hnsw_manager.save_incremental_update(
-                    index, collection_path, id_to_label, label_to_id, total_vectors
+                delta_size = self._record_hnsw_delta(
+                    collection_path, hnsw_manager, upserts=upserts
                 )
-
-                # AC3: Update cache ID mapping (keep cache warm)
-                cache_entry.id_mapping = id_mapping
-
-                self.logger.debug(
-                    f"Daemon watch mode HNSW update complete for '{collection_name}': "
-                    f"{processed} points updated, total vectors: {total_vectors}, "
-                    f"cache remains warm"
-                )
-
+                if delta_size >= DELTA_MERGE_THRESHOLD:
+                    # Merge synchronously: labels in the cached index must
+                    # match the id_mapping the merge writes
+                    merged = self._merge_hnsw_delta(collection_path, vector_size)
+                    if merged is not None:
+                        cache_entry.hnsw_index = merged
             finally:
                 # AC2: Release write lock
                 cache_entry.rw_lock.release_write()
-
         else:
-            # === STANDALONE MODE: Load from disk, update, save to disk ===
-            # Load existing index for incremental update
-            index, id_to_label, label_to_id, next_label = (
-                hnsw_manager.load_for_incremental_update(collection_path)
-            )
-
-            if index is None:
-                # No existing index - mark as stale for query-time rebuild
-                self.logger.debug(
-                    f"No existing HNSW index for watch mode update in '{collection_name}', "
-                    f"marking as stale"
-                )
-                hnsw_manager.mark_stale(collection_path)
-                return
-
-            # Process each changed point
-            processed = 0
-            for point in changed_points:
-                point_id = point["id"]
-                vector = np.array(point["vector"], dtype=np.float32)
-
-                try:
-                    # Add or update in HNSW
-                    old_count = len(id_to_label)
-                    label, id_to_label, label_to_id, next_label = (
-                        hnsw_manager.add_or_update_vector(
-                            index,
-                            point_id,
-                            vector,
-                            id_to_label,
-                            label_to_id,
-                            next_label,
-                        )
-                    )
-                    new_count = len(id_to_label)
-
-                    self.logger.debug(
-                        f"Standalone watch mode HNSW: added '{point_id}' with label {label}, "
-                        f"mappings: {old_count} -> {new_count}, next_label: {next_label}"
-                    )
-
-                    processed += 1
-
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to update HNSW for point '{point_id}': {e}"
-                    )
-                    continue
-
-            # Save updated index to disk
-            total_vectors = len(id_to_label)
-            hnsw_manager.save_incremental_update(
-                index, collection_path, id_to_label, label_to_id, total_vectors
+            delta_size = self._record_hnsw_delta(
+                collection_path, hnsw_manager, upserts=upserts
             )
+            if delta_size >= DELTA_MERGE_THRESHOLD:
+                self._schedule_hnsw_delta_merge(collection_path, vector_size)
 
-            self.logger.debug(
-                f"Standalone watch mode HNSW update complete for '{collection_name}': "
-                f"{processed} points updated, total vectors: {total_vectors}"
-            )
+        self.logger.debug(
+            f"Watch mode HNSW update for '{collection_name}': "
+            f"{len(upserts)} points recorded, delta segment size: {delta_size}"
+        )
 
     def _apply_incremental_hnsw_batch_update(
         self,
@@ -4243,8 +4582,10 @@ class FilesystemVectorStore:
 
         Note:
             HNSW-002: Batch incremental updates at end of indexing session.
-            Applies all accumulated changes in one batch operation,
-            significantly faster than full rebuild.
+            While the HNSW delta segment stays below DELTA_MERGE_THRESHOLD
+            entries the changes are only recorded there; otherwise the
+            segment and the changes are applied to hnsw_index.bin in one
+            save, which is still significantly faster than a full rebuild.
         """
         collection_path = self.base_path / collection_name
         vector_size = self._get_vector_size(collection_name)
@@ -4253,25 +4594,6 @@ class FilesystemVectorStore:
 
         hnsw_manager = HNSWIndexManager(vector_dim=vector_size, space="cosine")
 
-        # DEBUG: Mark that we're entering incremental update path
-        self.logger.info(
-            f"⚡ ENTERING INCREMENTAL HNSW UPDATE PATH for '{collection_name}'"
-        )
-
-        # Load existing index for incremental update
-        index, id_to_label, label_to_id, next_label = (
-            hnsw_manager.load_for_incremental_update(collection_path)
-        )
-
-        if index is None:
-            # No existing index - return None to trigger full rebuild fallback
-            self.logger.info(
-                f"🔨 No existing HNSW index for '{collection_name}', "
-                f"falling back to FULL REBUILD"
-            )
-            return None
-
-        # Process additions and updates.
         # #941: Points that appear in both added/updated and deleted were added then
         # immediately removed in the same session — treat them as no-ops so they don't
         # trigger "Vector file not found" warnings.
@@ -4279,53 +4601,13 @@ class FilesystemVectorStore:
         effective_added = changes["added"] - deleted_set
         effective_updated = changes["updated"] - deleted_set
         total_changes = len(effective_added) + len(effective_updated) + len(deleted_set)
-        processed = 0
-
-        for point_id in effective_added | effective_updated:
-            # Load vector from disk
-            try:
-                vector_file = self._id_index[collection_name].get(point_id)
-                if not vector_file or not Path(vector_file).exists():
-                    self.logger.warning(
-                        f"Vector file not found for point '{point_id}', skipping"
-                    )
-                    continue
-
-                with open(vector_file) as f:
-                    data = json.load(f)
-
-                vector = np.array(data["vector"], dtype=np.float32)
-
-                # Add or update in HNSW
-                label, id_to_label, label_to_id, next_label = (
-                    hnsw_manager.add_or_update_vector(
-                        index, point_id, vector, id_to_label, label_to_id, next_label
-                    )
-                )
-
-                processed += 1
-
-                # Report progress periodically
-                if progress_callback and processed % 10 == 0:
-                    progress_callback(
-                        processed,
-                        total_changes,
-                        Path(""),
-                        info=f"🔄 Incremental HNSW update: {processed}/{total_changes} changes",
-                    )
-
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                self.logger.warning(
-                    f"Failed to process point '{point_id}': {e}, skipping"
-                )
-                continue
-
-        # Process deletions
-        for point_id in changes["deleted"]:
-            hnsw_manager.remove_vector(index, point_id, id_to_label, label_to_id)
-            processed += 1
+        changes_applied = {
+            "added": len(changes["added"]),
+            "updated": len(changes["updated"]),
+            "deleted": len(changes["deleted"]),
+        }
 
-            # Report progress periodically
+        def report_progress(processed: int) -> None:
             if progress_callback and processed % 10 == 0:
                 progress_callback(
                     processed,
@@ -4334,17 +4616,98 @@ class FilesystemVectorStore:
                     info=f"🔄 Incremental HNSW update: {processed}/{total_changes} changes",
                 )
 
-        # Save updated index
-        total_vectors = len(id_to_label)
-        hnsw_manager.save_incremental_update(
-            index,
-            collection_path,
-            id_to_label,
-            label_to_id,
-            total_vectors,
-            clear_stale=clear_stale,
+        def changed_vectors():
+            for processed, point_id in enumerate(
+                effective_added | effective_updated, start=1
+            ):
+                vector = self._read_point_vector(collection_name, point_id)
+                if vector is not None:
+                    yield point_id, vector
+                report_progress(processed)
+
+        # DEBUG: Mark that we're entering incremental update path
+        self.logger.info(
+            f"⚡ ENTERING INCREMENTAL HNSW UPDATE PATH for '{collection_name}'"
         )
 
+        with self._hnsw_merge_lock:
+            base_uuid = self._read_hnsw_rebuild_uuid(collection_path)
+
+            # Load existing index for incremental update; this also discards a
+            # corrupt .bin so the session falls back to a full rebuild
+            index, id_to_label, label_to_id, next_label = (
+                hnsw_manager.load_for_incremental_update(collection_path)
+            )
+
+            if index is None:
+                # No existing index - return None to trigger full rebuild fallback
+                self.logger.info(
+                    f"🔨 No existing HNSW index for '{collection_name}', "
+                    f"falling back to FULL REBUILD"
+                )
+                return None
+
+            delta = HNSWDeltaLog.load(collection_path, vector_size, base_uuid)
+            if len(delta) + total_changes < DELTA_MERGE_THRESHOLD:
+                # === SMALL SESSION: record in the delta segment only ===
+                for point_id, vector in changed_vectors():
+                    delta.upsert(point_id, vector)
+                for point_id in deleted_set:
+                    delta.delete(point_id)
+                delta.save(collection_path)
+                if clear_stale and hnsw_manager.is_stale(collection_path):
+                    hnsw_manager.clear_stale(collection_path)
+                result: Dict[str, Any] = {
+                    "status": "incremental_update_applied",
+                    "delta_entries": len(delta),
+                    "changes_applied": changes_applied,
+                }
+                summary = f"delta segment size: {len(delta)}"
+            else:
+                # Fold the pending delta segment in first; this session's
+                # changes are newer and applied on top of it.
+                id_to_label, label_to_id, next_label = self._apply_hnsw_delta(
+                    hnsw_manager,
+                    index,
+                    delta,
+                    id_to_label,
+                    label_to_id,
+                    next_label,
+                )
+                for point_id, vector in changed_vectors():
+                    _, id_to_label, label_to_id, next_label = (
+                        hnsw_manager.add_or_update_vector(
+                            index,
+                            point_id,
+                            vector,
+                            id_to_label,
+                            label_to_id,
+                            next_label,
+                        )
+                    )
+                for point_id in deleted_set:
+                    hnsw_manager.remove_vector(
+                        index, point_id, id_to_label, label_to_id
+                    )
+
+                # Save updated index
+                total_vectors = len(id_to_label)
+                hnsw_manager.save_incremental_update(
+                    index,
+                    collection_path,
+                    id_to_label,
+                    label_to_id,
+                    total_vectors,
+                    clear_stale=clear_stale,
+                )
+                HNSWDeltaLog.discard(collection_path)
+                result = {
+                    "status": "incremental_update_applied",
+                    "vectors": total_vectors,
+                    "changes_applied": changes_applied,
+                }
+                summary = f"total vectors: {total_vectors}"
+
         # Final progress report
         if progress_callback:
             progress_callback(
@@ -4357,15 +4720,183 @@ class FilesystemVectorStore:
         self.logger.info(
             f"Incremental HNSW update complete for '{collection_name}': "
             f"{len(changes['added'])} added, {len(changes['updated'])} updated, "
-            f"{len(changes['deleted'])} deleted, total vectors: {total_vectors}"
+            f"{len(changes['deleted'])} deleted, {summary}"
         )
 
-        return {
-            "status": "incremental_update_applied",
-            "vectors": total_vectors,
-            "changes_applied": {
-                "added": len(changes["added"]),
-                "updated": len(changes["updated"]),
-                "deleted": len(changes["deleted"]),
-            },
-        }
+        return result
+
+    # === HNSW DELTA SEGMENT (see hnsw_delta_log) ===
+
+    def _read_point_vector(
+        self, collection_name: str, point_id: str
+    ) -> Optional[np.ndarray]:
+        """Read a point's vector from its JSON file; None (logged) if unavailable."""
+        vector_file = self._id_index[collection_name].get(point_id)
+        if not vector_file or not Path(vector_file).exists():
+            self.logger.warning(
+                f"Vector file not found for point '{point_id}', skipping"
+            )
+            return None
+        try:
+            with open(vector_file) as f:
+                data = json.load(f)
+            return np.array(data["vector"], dtype=np.float32)
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            self.logger.warning(f"Failed to process point '{point_id}': {e}, skipping")
+            return None
+
+    @staticmethod
+    def _read_hnsw_rebuild_uuid(collection_path: Path) -> Optional[str]:
+        """Return the index_rebuild_uuid of the collection's hnsw_index.bin."""
+        try:
+            with open(collection_path / "collection_meta.json") as f:
+                metadata = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        rebuild_uuid: Optional[str] = metadata.get("hnsw_index", {}).get(
+            "index_rebuild_uuid"
+        )
+        return rebuild_uuid
+
+    def _load_hnsw_delta(
+        self, collection_path: Path, vector_size: int, base_uuid: Optional[str]
+    ) -> Optional[HNSWDeltaLog]:
+        """Return the collection's non-empty delta segment for *base_uuid*.
+
+        Returns None when there is no segment or it belongs to another index.
+        """
+        key = str(collection_path)
+        try:
+            stat = (collection_path / HNSW_DELTA_FILENAME).stat()
+        except FileNotFoundError:
+            with self._hnsw_delta_lock:
+                self._hnsw_deltas.pop(key, None)
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._hnsw_delta_lock:
+            cached = self._hnsw_deltas.get(key)
+            if (
+                cached is not None
+                and cached[0] == signature
+                and cached[1].base_uuid == base_uuid
+            ):
+                delta = cached[1]
+            else:
+                delta = HNSWDeltaLog.load(collection_path, vector_size, base_uuid)
+                self._hnsw_deltas[key] = (signature, delta)
+        return delta if len(delta) else None
+
+    def _record_hnsw_delta(
+        self,
+        collection_path: Path,
+        hnsw_manager: Any,
+        upserts: List[Tuple[str, np.ndarray]],
+    ) -> int:
+        """Append upserted vectors to the delta segment; returns its new size."""
+        with self._hnsw_merge_lock:
+            delta = HNSWDeltaLog.load(
+                collection_path,
+                hnsw_manager.vector_dim,
+                self._read_hnsw_rebuild_uuid(collection_path),
+            )
+            for point_id, vector in upserts:
+                try:
+                    delta.upsert(point_id, vector)
+                except ValueError as e:
+                    self.logger.warning(
+                        f"Failed to update HNSW for point '{point_id}': {e}"
+                    )
+            delta.save(collection_path)
+
+            # Like a saved incremental update, recording changes leaves the
+            # index fresh
+            if hnsw_manager.is_stale(collection_path):
+                hnsw_manager.clear_stale(collection_path)
+            return len(delta)
+
+    def _apply_hnsw_delta(
+        self,
+        hnsw_manager: Any,
+        index: Any,
+        delta: HNSWDeltaLog,
+        id_to_label: Dict[str, int],
+        label_to_id: Dict[int, str],
+        next_label: int,
+    ) -> Tuple[Dict[str, int], Dict[int, str], int]:
+        """Apply a delta segment's upserts and tombstones to a loaded index."""
+        for point_id, vector in delta.upserted():
+            _, id_to_label, label_to_id, next_label = hnsw_manager.add_or_update_vector(
+                index, point_id, vector, id_to_label, label_to_id, next_label
+            )
+        for point_id in delta.deleted:
+            hnsw_manager.remove_vector(index, point_id, id_to_label, label_to_id)
+        return id_to_label, label_to_id, next_label
+
+    def _merge_hnsw_delta(
+        self, collection_path: Path, vector_size: int, clear_stale: bool = True
+    ) -> Optional[Any]:
+        """Fold the delta segment into hnsw_index.bin and remove it.
+
+        Returns:
+            The merged hnswlib index, or None if there was nothing to merge
+            into (no index on disk; the collection is marked stale instead)
+        """
+        from .hnsw_index_manager import HNSWIndexManager
+
+        hnsw_manager = HNSWIndexManager(vector_dim=vector_size, space="cosine")
+
+        with self._hnsw_merge_lock:
+            base_uuid = self._read_hnsw_rebuild_uuid(collection_path)
+            index, id_to_label, label_to_id, next_label = (
+                hnsw_manager.load_for_incremental_update(collection_path)
+            )
+            if index is None:
+                HNSWDeltaLog.discard(collection_path)
+                hnsw_manager.mark_stale(collection_path)
+                return None
+
+            delta = HNSWDeltaLog.load(collection_path, vector_size, base_uuid)
+            id_to_label, label_to_id, next_label = self._apply_hnsw_delta(
+                hnsw_manager, index, delta, id_to_label, label_to_id, next_label
+            )
+            hnsw_manager.save_incremental_update(
+                index,
+                collection_path,
+                id_to_label,
+                label_to_id,
+                len(id_to_label),
+                clear_stale=clear_stale,
+            )
+            HNSWDeltaLog.discard(collection_path)
+
+        self.logger.info(
+            f"Merged {len(delta)} HNSW delta entries into {collection_path.name}, "
+            f"total vectors: {len(id_to_label)}"
+        )
+        return index
+
+    def _schedule_hnsw_delta_merge(
+        self, collection_path: Path, vector_size: int
+    ) -> None:
+        """Merge the delta segment on a background thread (one at a time).
+
+        The thread is non-daemon so interpreter shutdown waits for the merge
+        instead of abandoning a half-written index.
+        """
+        if self._hnsw_merge_thread is not None and self._hnsw_merge_thread.is_alive():
+            return
+
+        def merge() -> None:
+            try:
+                self._merge_hnsw_delta(collection_path, vector_size)
+            except Exception as e:
+                # The segment stays in place and is still searched; the next
+                # update past the threshold retries the merge
+                self.logger.warning(
+                    f"Background HNSW delta merge failed for {collection_path}: {e}"
+                )
+
+        self._hnsw_merge_thread = threading.Thread(
+            target=merge, name="hnsw-delta-merge"
+        )
+        self._hnsw_merge_thread.start()
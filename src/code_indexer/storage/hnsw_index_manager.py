@@ -7,9 +7,12 @@ algorithm for approximate nearest neighbor search with better query performance.
 import fcntl
 import json
 import logging
+import multiprocessing
 import os
 import sys
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -126,6 +129,86 @@ class HNSWRebuildAllInvalidError(RuntimeError):
     """
 
 
+# Rebuilds over at least this many vector files parse them in a process pool
+# (one task per shard directory); smaller collections parse serially, where
+# process start-up would cost more than it saves.
+PARALLEL_REBUILD_MIN_FILES = 5000
+
+
+def _parse_vector_file(
+    vector_file: Path,
+    expected_dim: int,
+    visible_files: Optional[Set[str]],
+    current_branch: Optional[str],
+    hidden_ids: Optional[Set[str]],
+) -> Optional[Tuple[str, np.ndarray]]:
+    """Parse one vector JSON file for rebuild_from_vectors.
+
+    Returns (point_id, vector), or None if the file is malformed, has the
+    wrong dimension, or is filtered out by visible_files / current_branch.
+    hidden_ids is the branch visibility sidecar's hidden set for
+    current_branch (None when there is no sidecar).
+    """
+    try:
+        with open(vector_file) as f:
+            data = json.load(f)
+
+        vector = np.array(data["vector"], dtype=np.float32)
+        point_id = data["id"]
+    except (OSError, json.JSONDecodeError, KeyError, ValueError):
+        # Skip malformed files
+        return None
+
+    # Validate dimension
+    if len(vector) != expected_dim:
+        return None
+
+    # Apply visibility filter: skip vectors for hidden files
+    if visible_files is not None:
+        if data.get("payload", {}).get("path") not in visible_files:
+            return None
+    elif current_branch is not None:
+        # Branch-aware filter: skip vectors hidden for current_branch
+        # (Bug #306: makes ALL rebuilds branch-aware via hidden_branches metadata)
+        if hidden_ids is not None:
+            # The bitmap sidecar is authoritative once it exists
+            if point_id in hidden_ids:
+                return None
+        elif current_branch in data.get("payload", {}).get("hidden_branches", []):
+            return None
+
+    return point_id, vector
+
+
+# Per-process filter state for _parse_vector_shard, set once by the pool
+# initializer so large visible_files / hidden_ids sets are not re-pickled
+# for every task.
+_parse_worker_args: Tuple[Any, ...] = ()
+
+
+def _init_parse_worker(
+    expected_dim: int,
+    visible_files: Optional[Set[str]],
+    current_branch: Optional[str],
+    hidden_ids: Optional[Set[str]],
+) -> None:
+    global _parse_worker_args
+    _parse_worker_args = (expected_dim, visible_files, current_branch, hidden_ids)
+
+
+def _parse_vector_shard(paths: List[str]) -> Tuple[List[str], np.ndarray]:
+    """Process-pool task: parse every vector file of one shard directory."""
+    ids: List[str] = []
+    vectors: List[np.ndarray] = []
+    for path in paths:
+        parsed = _parse_vector_file(Path(path), *_parse_worker_args)
+        if parsed is not None:
+            ids.append(parsed[0])
+            vectors.append(parsed[1])
+    dim = _parse_worker_args[0]
+    return ids, (np.stack(vectors) if vectors else np.empty((0, dim), dtype=np.float32))
+
+
 def _fsync_directory(path: Path) -> None:
     """Fsync a directory so entries created/replaced within it survive a
     crash/power-loss (precedent: id_index_manager.py's save_index()).
@@ -236,6 +319,8 @@ class HNSWIndexManager:
 
         self.vector_dim = vector_dim
         self.space = space
+        # Per-phase timings (ms) of the most recent rebuild_from_vectors call
+        self.last_rebuild_timings: Dict[str, float] = {}
 
     def _hnswlib_has_fork_capability(self) -> bool:
         """Return True iff hnswlib.Index has the custom fork's
@@ -514,6 +599,7 @@ class HNSWIndexManager:
         collection_path: Path,
         k: int = 10,
         ef: int = 50,
+        excluded_ids: Optional[Set[str]] = None,
     ) -> Tuple[List[str], List[float]]:
         """Query HNSW index for k nearest neighbors.
 
@@ -524,6 +610,9 @@ class HNSWIndexManager:
             k: Number of nearest neighbors to return
             ef: HNSW query parameter - size of dynamic candidate list
                 (higher = more accurate, slower)
+            excluded_ids: Optional vector IDs to skip inside the graph search
+                (hnswlib label filter), e.g. points hidden on the current
+                branch according to the branch visibility bitmap
 
         Returns:
             Tuple of (ids, distances) where ids are vector IDs and
@@ -546,6 +635,22 @@ class HNSWIndexManager:
         # Note: get_current_count() includes soft-deleted vectors, causing errors
         queryable_count = len(id_mapping) if id_mapping else index.get_current_count()
 
+        # Resolve excluded IDs to labels once; hnswlib raises if fewer than k
+        # labels pass the filter, so they also reduce the queryable count.
+        label_filter = None
+        if excluded_ids and id_mapping:
+            excluded_labels = {
+                label for label, vid in id_mapping.items() if vid in excluded_ids
+            }
+            if excluded_labels:
+                queryable_count -= len(excluded_labels)
+
+                def label_filter(label: int) -> bool:
+                    return label not in excluded_labels
+
+                if queryable_count <= 0:
+                    return [], []
+
         # Limit k to available queryable vectors.
         # Also cap at index.get_current_count() to prevent hnswlib crash when
         # id_mapping metadata diverges from the binary (e.g. transient mismatch
@@ -586,7 +691,12 @@ class HNSWIndexManager:
                     attempt_k,
                 )
             try:
-                labels, distances = index.knn_query(query_vector, k=attempt_k)
+                if label_filter is not None:
+                    labels, distances = index.knn_query(
+                        query_vector, k=attempt_k, filter=label_filter
+                    )
+                else:
+                    labels, distances = index.knn_query(query_vector, k=attempt_k)
                 break
             except RuntimeError as exc:
                 if "contiguous 2D array" not in str(exc):
@@ -650,12 +760,20 @@ class HNSWIndexManager:
         visible_files: Optional[Set[str]] = None,
         current_branch: Optional[str] = None,
         clear_stale: bool = True,
+        parse_workers: Optional[int] = None,
+        num_threads: Optional[int] = None,
     ) -> int:
         """Rebuild HNSW index by scanning all vector JSON files.
 
         Uses BackgroundIndexRebuilder for atomic file swapping with exclusive
         locking. Queries can continue using old index during rebuild.
 
+        Vector files are parsed in a process pool, one task per shard
+        directory, once the collection reaches PARALLEL_REBUILD_MIN_FILES;
+        add_items then inserts with an explicit thread count. Per-phase
+        timings (scan, parse, insert, save) are reported through
+        progress_callback and kept in ``self.last_rebuild_timings``.
+
         Args:
             collection_path: Path to collection directory
             progress_callback: Optional callback(current, total, file_path, info) for progress tracking
@@ -665,8 +783,9 @@ class HNSWIndexManager:
                           vector elimination during branch isolation.
                           When None (default), all vectors are included (backward compatible).
             current_branch: Optional current branch name. When provided and visible_files is None,
-                           vectors whose payload.hidden_branches contains current_branch are
-                           excluded. This makes all rebuilds branch-aware (Bug #306 fix).
+                           vectors hidden on current_branch are excluded, according to the
+                           branch visibility sidecar when present, else payload.hidden_branches.
+                           This makes all rebuilds branch-aware (Bug #306 fix).
                            Also stored in HNSW metadata when filtered=True for use by
                            query-time rebuilds after CoW snapshot.
             clear_stale: Bug #1407 Amendment 1 -- when True (default, today's
@@ -680,6 +799,12 @@ class HNSWIndexManager:
                          publishes vector_count=0 rather than a silent no-op,
                          and files-exist-but-all-invalid raises instead of a
                          silent no-op (never bless a stale index as fresh).
+            parse_workers: Processes for parsing vector files. None (default)
+                         uses one per CPU for collections of at least
+                         PARALLEL_REBUILD_MIN_FILES files and parses serially
+                         otherwise; 0 or 1 forces serial parsing.
+            num_threads: Threads for hnswlib add_items. None (default) uses
+                         one per CPU.
 
         Returns:
             Number of vectors indexed
@@ -715,9 +840,14 @@ class HNSWIndexManager:
                     e,
                 )
 
+        timings: Dict[str, float] = {}
+        self.last_rebuild_timings = timings
+
         # Scan all vector JSON files
+        phase_start = time.perf_counter()
         vector_files = list(collection_path.rglob("vector_*.json"))
         total_files_on_disk = len(vector_files)
+        timings["scan_ms"] = (time.perf_counter() - phase_start) * 1000
 
         if total_files_on_disk == 0:
             if visible_files is not None:
@@ -748,40 +878,44 @@ class HNSWIndexManager:
             progress_callback(0, 0, Path(""), info="🔧 Rebuilding HNSW index...")
 
         # Load all vectors and IDs, applying visibility filter if provided
-        vectors_list = []
-        ids_list = []
+        hidden_ids: Optional[Set[str]] = None
+        if visible_files is None and current_branch is not None:
+            from .branch_visibility import (
+                BRANCH_VISIBILITY_FILENAME,
+                BranchVisibilityMap,
+            )
 
-        for vector_file in vector_files:
-            try:
-                with open(vector_file) as f:
-                    data = json.load(f)
-
-                vector = np.array(data["vector"], dtype=np.float32)
-                point_id = data["id"]
-
-                # Validate dimension
-                if len(vector) != expected_dim:
-                    continue  # Skip mismatched dimensions
-
-                # Apply visibility filter: skip vectors for hidden files
-                if visible_files is not None:
-                    file_path = data.get("payload", {}).get("path")
-                    if file_path not in visible_files:
-                        continue  # Skip vectors not in visible set
-                elif current_branch is not None:
-                    # Branch-aware filter: skip vectors hidden for current_branch
-                    # (Bug #306: makes ALL rebuilds branch-aware via hidden_branches metadata)
-                    payload = data.get("payload", {})
-                    hidden_branches = payload.get("hidden_branches", [])
-                    if current_branch in hidden_branches:
-                        continue  # Skip vectors hidden for this branch
-
-                vectors_list.append(vector)
-                ids_list.append(point_id)
-
-            except (json.JSONDecodeError, KeyError, ValueError):
-                # Skip malformed files
-                continue
+            sidecar = collection_path / BRANCH_VISIBILITY_FILENAME
+            if sidecar.exists():
+                hidden_ids = BranchVisibilityMap.load(sidecar).hidden_point_ids(
+                    [current_branch]
+                )
+
+        phase_start = time.perf_counter()
+        cpu_count = os.cpu_count() or 1
+        if parse_workers is None:
+            parse_workers = (
+                cpu_count if total_files_on_disk >= PARALLEL_REBUILD_MIN_FILES else 1
+            )
+        if parse_workers > 1:
+            ids_list, vectors_list = self._parse_vector_files_parallel(
+                vector_files,
+                parse_workers,
+                expected_dim,
+                visible_files,
+                current_branch,
+                hidden_ids,
+            )
+        else:
+            ids_list, vectors_list = [], []
+            for vector_file in vector_files:
+                parsed = _parse_vector_file(
+                    vector_file, expected_dim, visible_files, current_branch, hidden_ids
+                )
+                if parsed is not None:
+                    ids_list.append(parsed[0])
+                    vectors_list.append(parsed[1])
+        timings["parse_ms"] = (time.perf_counter() - phase_start) * 1000
 
         if not vectors_list:
             # No vectors pass the filter - return 0 without building index
@@ -818,6 +952,7 @@ class HNSWIndexManager:
 
         # Convert to numpy array
         vectors = np.array(vectors_list, dtype=np.float32)
+        insert_threads = num_threads or cpu_count
 
         # Use BackgroundIndexRebuilder for atomic swap with locking
         rebuilder = BackgroundIndexRebuilder(collection_path)
@@ -838,7 +973,8 @@ class HNSWIndexManager:
             labels = np.arange(len(vectors))
             if progress_callback:
                 progress_callback(0, 0, Path(""), info="🔧 Building HNSW index...")
-            index.add_items(vectors, labels)
+            insert_start = time.perf_counter()
+            index.add_items(vectors, labels, num_threads=insert_threads)
 
             # Story #1359 AC1/AC2: detect + repair orphans BEFORE the index
             # is persisted. ONE shared code path serves regular, temporal,
@@ -847,9 +983,12 @@ class HNSWIndexManager:
                 index,
                 context=f"rebuild_from_vectors:{collection_path}",
             )
+            timings["insert_ms"] = (time.perf_counter() - insert_start) * 1000
 
             # Save to temp file
+            save_start = time.perf_counter()
             index.save_index(str(temp_file))
+            timings["save_ms"] = (time.perf_counter() - save_start) * 1000
 
             if progress_callback:
                 progress_callback(0, 0, Path(""), info="🔧 HNSW index built ✓")
@@ -857,6 +996,23 @@ class HNSWIndexManager:
         # Rebuild with lock (entire rebuild duration)
         rebuilder.rebuild_with_lock(build_hnsw_index_to_temp, index_file)
 
+        phase_summary = (
+            f"scan {timings['scan_ms']:.0f}ms, "
+            f"parse {timings['parse_ms']:.0f}ms ({parse_workers} proc), "
+            f"insert {timings['insert_ms']:.0f}ms ({insert_threads} threads), "
+            f"save {timings['save_ms']:.0f}ms"
+        )
+        logger.info(
+            "HNSW rebuild of %s (%d vectors): %s",
+            collection_path,
+            len(vectors),
+            phase_summary,
+        )
+        if progress_callback:
+            progress_callback(
+                0, 0, Path(""), info=f"⏱️  HNSW rebuild phases: {phase_summary}"
+            )
+
         # Update metadata AFTER atomic swap
         # When visible_files is provided, write filtered metadata fields
         if visible_files is not None:
@@ -886,6 +1042,39 @@ class HNSWIndexManager:
 
         return len(vectors)
 
+    @staticmethod
+    def _parse_vector_files_parallel(
+        vector_files: List[Path],
+        workers: int,
+        expected_dim: int,
+        visible_files: Optional[Set[str]],
+        current_branch: Optional[str],
+        hidden_ids: Optional[Set[str]],
+    ) -> Tuple[List[str], List[np.ndarray]]:
+        """Parse vector files in a process pool, one task per shard directory.
+
+        Uses the spawn start method: rebuilds run inside the threaded daemon
+        and server, where forking is unsafe.
+        """
+        shards: Dict[Path, List[str]] = {}
+        for vector_file in vector_files:
+            shards.setdefault(vector_file.parent, []).append(str(vector_file))
+
+        ids_list: List[str] = []
+        vectors_list: List[np.ndarray] = []
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_parse_worker,
+            initargs=(expected_dim, visible_files, current_branch, hidden_ids),
+        ) as executor:
+            for shard_ids, shard_vectors in executor.map(
+                _parse_vector_shard, shards.values()
+            ):
+                ids_list.extend(shard_ids)
+                vectors_list.extend(shard_vectors)
+        return ids_list, vectors_list
+
     def _publish_empty_rebuild_state(self, collection_path: Path) -> None:
         """Amendment 5 (Bug #1407): durably publish an empty index state for
         a legitimate empty shard (zero vector files on disk) under
@@ -0,0 +1,251 @@
+"""Scalar-quantized (int8) candidate index for memory-constrained search.
+
+A cached HNSW index holds every vector at full float32 precision plus the
+graph links; for 1024-2048 dim Voyage/Cohere models that is what pushes the
+MemoryGovernor into YELLOW/RED eviction. In int8 mode a collection is
+searched with a QuantizedVectorIndex instead:
+
+- Calibration: per-dimension ``[lo, hi]`` ranges are taken from the
+  collection's own (unit-normalized) vectors, clipped at a small percentile so
+  outliers do not waste code space. Each dimension maps linearly onto 256
+  levels stored as int8 - a quarter of float32, with no graph.
+- Candidate generation: a blocked scan scores every code against the float
+  query (asymmetric distance: the query is never quantized) and keeps the top
+  ``k * rescore_multiplier`` candidates.
+- Re-scoring: those candidates are re-ranked with exact cosine similarity
+  using the float vectors stored in the collection's JSON files, so returned
+  scores are exact and recall loss is confined to candidate generation.
+
+The index is derived from the HNSW index (same labels/ID mapping, including
+branch-filtered rebuilds) and records the ``hnsw_index.bin`` stamp it was
+built from, so any HNSW rebuild or incremental update invalidates it.
+
+See scripts/analysis/quantized_recall_benchmark.py for recall@k against the
+float HNSW index.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+QUANTIZED_INDEX_FILENAME = "quantized_index.npz"
+QUANTIZATION_MODES = ("none", "int8")
+
+# Float candidates re-scored per requested result
+DEFAULT_RESCORE_MULTIPLIER = 4
+
+# Percentile clipped at each end of every dimension during calibration
+DEFAULT_CLIP_PERCENTILE = 0.1
+
+# Rows scored per block, bounding the float32 temporary during the scan
+_SCAN_BLOCK_ROWS = 65536
+
+_FORMAT_VERSION = 1
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    normalized: np.ndarray = vectors / norms
+    return normalized
+
+
+class ScalarQuantizer:
+    """Per-dimension affine mapping between float32 and int8 codes."""
+
+    def __init__(self, offset: np.ndarray, scale: np.ndarray):
+        self.offset = offset.astype(np.float32)
+        self.scale = scale.astype(np.float32)
+
+    @classmethod
+    def calibrate(
+        cls, vectors: np.ndarray, clip_percentile: float = DEFAULT_CLIP_PERCENTILE
+    ) -> "ScalarQuantizer":
+        """Fit per-dimension ranges to *vectors* (rows are samples)."""
+        lo = np.percentile(vectors, clip_percentile, axis=0)
+        hi = np.percentile(vectors, 100.0 - clip_percentile, axis=0)
+        scale = (hi - lo) / 255.0
+        scale[scale <= 0] = 1.0
+        return cls(offset=lo, scale=scale)
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        levels = np.rint((vectors - self.offset) / self.scale)
+        codes: np.ndarray = (np.clip(levels, 0, 255) - 128).astype(np.int8)
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return (codes.astype(np.float32) + 128.0) * self.scale + self.offset
+
+
+class QuantizedVectorIndex:
+    """int8 codes for every live HNSW label, with their vector IDs."""
+
+    def __init__(
+        self,
+        quantizer: ScalarQuantizer,
+        codes: np.ndarray,
+        ids: Sequence[str],
+        source_stamp: Tuple[int, int],
+    ):
+        self.quantizer = quantizer
+        self.codes = codes
+        self.ids = list(ids)
+        self.source_stamp = source_stamp
+        self._positions = {vid: pos for pos, vid in enumerate(self.ids)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        return int(
+            self.codes.nbytes
+            + self.quantizer.offset.nbytes
+            + self.quantizer.scale.nbytes
+        )
+
+    # --- construction / persistence ------------------------------------
+
+    @classmethod
+    def from_vectors(
+        cls,
+        vectors: np.ndarray,
+        ids: Sequence[str],
+        source_stamp: Tuple[int, int] = (0, 0),
+        clip_percentile: float = DEFAULT_CLIP_PERCENTILE,
+    ) -> "QuantizedVectorIndex":
+        normalized = _normalize(np.asarray(vectors, dtype=np.float32))
+        quantizer = ScalarQuantizer.calibrate(normalized, clip_percentile)
+        return cls(quantizer, quantizer.encode(normalized), ids, source_stamp)
+
+    @classmethod
+    def from_hnsw(
+        cls, index: object, id_mapping: dict, source_stamp: Tuple[int, int]
+    ) -> "QuantizedVectorIndex":
+        """Quantize the live vectors of a loaded hnswlib index."""
+        labels = sorted(id_mapping)
+        if not labels:
+            return cls(
+                ScalarQuantizer(np.zeros(0), np.ones(0)),
+                np.zeros((0, 0), dtype=np.int8),
+                [],
+                source_stamp,
+            )
+        vectors = np.asarray(index.get_items(labels), dtype=np.float32)  # type: ignore[attr-defined]
+        return cls.from_vectors(
+            vectors, [id_mapping[lb] for lb in labels], source_stamp
+        )
+
+    def save(self, path: Path) -> None:
+        """Atomically write the index (temp file + os.replace)."""
+        temp_file = path.with_name(path.name + ".tmp")
+        with open(temp_file, "wb") as f:
+            np.savez(
+                f,
+                version=np.array(_FORMAT_VERSION),
+                offset=self.quantizer.offset,
+                scale=self.quantizer.scale,
+                codes=self.codes,
+                ids=np.asarray(self.ids, dtype=str),
+                source_stamp=np.asarray(self.source_stamp, dtype=np.int64),
+            )
+        os.replace(temp_file, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["QuantizedVectorIndex"]:
+        """Load an index from disk; None if missing or unreadable."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["version"]) != _FORMAT_VERSION:
+                    return None
+                return cls(
+                    ScalarQuantizer(data["offset"], data["scale"]),
+                    data["codes"],
+                    data["ids"].tolist(),
+                    tuple(int(x) for x in data["source_stamp"]),  # type: ignore[arg-type]
+                )
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"Could not load quantized index {path}: {e}")
+            return None
+
+    # --- search ---------------------------------------------------------
+
+    def approximate_scores(self, query_vector: np.ndarray) -> np.ndarray:
+        """Approximate cosine similarity of the query to every code.
+
+        With v ~= offset + scale * (c + 128):
+            q.v ~= q.offset + 128 * sum(q * scale) + (q * scale).c
+        """
+        query = _normalize(np.asarray(query_vector, dtype=np.float32))
+        weighted = query * self.quantizer.scale
+        bias = float(query @ self.quantizer.offset) + 128.0 * float(weighted.sum())
+        scores = np.empty(len(self.ids), dtype=np.float32)
+        for start in range(0, len(self.ids), _SCAN_BLOCK_ROWS):
+            block = self.codes[start : start + _SCAN_BLOCK_ROWS]
+            scores[start : start + len(block)] = block.astype(np.float32) @ weighted
+        return scores + bias
+
+    def search(
+        self,
+        query_vector: np.ndarray,
+        k: int,
+        excluded_ids: Optional[Set[str]] = None,
+        rescore: Optional[Callable[[List[str]], List[Optional[np.ndarray]]]] = None,
+        rescore_multiplier: int = DEFAULT_RESCORE_MULTIPLIER,
+    ) -> Tuple[List[str], List[float]]:
+        """Return (ids, cosine distances) of the k nearest vectors.
+
+        Args:
+            query_vector: Float query vector
+            k: Number of results
+            excluded_ids: Vector IDs to skip (e.g. hidden on the current branch)
+            rescore: Callable returning the stored float vector for each
+                candidate ID (None if unavailable). When given, the top
+                ``k * rescore_multiplier`` approximate candidates are
+                re-ranked by exact cosine similarity.
+            rescore_multiplier: Candidates re-scored per requested result
+
+        Returns:
+            Same shape as HNSWIndexManager.query: IDs and ``1 - similarity``
+            distances, nearest first.
+        """
+        if k <= 0 or not self.ids:
+            return [], []
+
+        scores = self.approximate_scores(query_vector)
+        if excluded_ids:
+            for vid in excluded_ids:
+                pos = self._positions.get(vid)
+                if pos is not None:
+                    scores[pos] = -np.inf
+
+        available = int(np.count_nonzero(np.isfinite(scores)))
+        n_candidates = min(k * max(rescore_multiplier, 1) if rescore else k, available)
+        if n_candidates <= 0:
+            return [], []
+
+        top = np.argpartition(-scores, n_candidates - 1)[:n_candidates]
+        candidate_ids = [self.ids[pos] for pos in top]
+        similarities = scores[top].astype(np.float64)
+
+        if rescore is not None:
+            query = _normalize(np.asarray(query_vector, dtype=np.float64))
+            exact: List[Tuple[str, float]] = []
+            for vid, vector in zip(candidate_ids, rescore(candidate_ids)):
+                if vector is None:
+                    continue
+                exact.append((vid, float(_normalize(np.asarray(vector)) @ query)))
+            exact.sort(key=lambda item: item[1], reverse=True)
+            exact = exact[:k]
+            return [vid for vid, _ in exact], [1.0 - sim for _, sim in exact]
+
+        order = np.argsort(-similarities)[:k]
+        return (
+            [candidate_ids[i] for i in order],
+            [1.0 - float(similarities[i]) for i in order],
+        )
@@ -0,0 +1,234 @@
+"""XRayFindingsCache: persistent per-file X-Ray evaluation result cache.
+
+Phase 2 of ``XRaySearchEngine.run`` sends every Phase 1 candidate to
+``RustNativeBackend.run_batch``, which re-parses and re-evaluates the file
+even when neither the evaluator nor the file changed since the last run.
+
+The Rust evaluator only sees the file (it is invoked with ``--files`` and
+never receives Phase 1 match positions), so its findings are a pure function
+of ``(evaluator source, toolchain, language, file content)``.  This cache stores the
+per-file match list under exactly that key:
+
+- ``evaluator_hash``: sha256 of the evaluator source plus the toolchain
+  identity (xray-cli binary hash and rustc version, see
+  ``RustNativeBackend.get_runtime_identity``), so a toolchain upgrade never
+  serves findings computed by the old evaluator runtime
+- ``lang``: tree-sitter language name
+- ``content_hash``: sha256 of the file bytes
+
+Only path-independent match fields are stored (line_number, pattern, snippet,
+line_content); ``file_path`` and ``language`` are re-attached on a hit, so the
+same blob in two repositories or two snapshots shares one entry.
+
+Files that produced evaluation errors are never cached.  Entries are pruned
+least-recently-used once the table exceeds ``max_entries``.  All public
+methods are exception-safe: a broken cache degrades to "everything is a miss".
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default LRU bound (rows).  A row is one (evaluator, file blob) pair and is
+# typically a few hundred bytes, so the default stays in the tens of MB.
+DEFAULT_MAX_ENTRIES = 200_000
+
+# Prune only every N inserts so steady-state writes stay cheap.
+_PRUNE_EVERY_N_INSERTS = 1_000
+
+# Fields of a match dict that depend only on file content (not on its path).
+_CACHED_MATCH_FIELDS = ("line_number", "pattern", "snippet", "line_content")
+
+# Lookup key: (lang, content_hash)
+FileKey = Tuple[str, str]
+
+
+def sha256_hex(data: bytes) -> str:
+    """Return the sha256 hex digest of data."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_content_hash(path: Path) -> Optional[str]:
+    """Return sha256 of the file bytes, or None when the file cannot be read."""
+    try:
+        return sha256_hex(path.read_bytes())
+    except OSError:
+        return None
+
+
+def strip_match(match: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the path-independent subset of a match dict for storage."""
+    return {k: match[k] for k in _CACHED_MATCH_FIELDS if k in match}
+
+
+def restore_match(stored: Dict[str, Any], file_path: str, lang: str) -> Dict[str, Any]:
+    """Rebuild a full match dict from a stored entry for a concrete file."""
+    match = {
+        "line_number": stored.get("line_number", 0),
+        "file_path": file_path,
+        "language": lang,
+        "pattern": stored.get("pattern", ""),
+        "snippet": stored.get("snippet", ""),
+        "line_content": stored.get("line_content", ""),
+    }
+    return match
+
+
+class XRayFindingsCache:
+    """SQLite-backed findings cache shared by all X-Ray jobs in a process."""
+
+    def __init__(self, db_path: Path, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be > 0, got {max_entries}")
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._inserts_since_prune = 0
+        self._hits = 0
+        self._misses = 0
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS xray_findings ("
+            " evaluator_hash TEXT NOT NULL,"
+            " lang TEXT NOT NULL,"
+            " content_hash TEXT NOT NULL,"
+            " matches_json TEXT NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " PRIMARY KEY (evaluator_hash, lang, content_hash))"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_xray_findings_last_used"
+            " ON xray_findings(last_used)"
+        )
+        self._conn.commit()
+
+    def get_many(
+        self, evaluator_hash: str, keys: List[FileKey]
+    ) -> Dict[FileKey, List[Dict[str, Any]]]:
+        """Return stored matches for every key that is present.
+
+        Args:
+            evaluator_hash: sha256 of the evaluator source and toolchain identity.
+            keys: (lang, content_hash) pairs to look up.
+
+        Returns:
+            Mapping of hit keys to their stored (path-independent) match lists.
+        """
+        if not keys:
+            return {}
+        found: Dict[FileKey, List[Dict[str, Any]]] = {}
+        try:
+            with self._lock:
+                now = time.time()
+                for lang, content_hash in set(keys):
+                    row = self._conn.execute(
+                        "SELECT matches_json FROM xray_findings"
+                        " WHERE evaluator_hash=? AND lang=? AND content_hash=?",
+                        (evaluator_hash, lang, content_hash),
+                    ).fetchone()
+                    if row is None:
+                        continue
+                    found[(lang, content_hash)] = json.loads(row[0])
+                if found:
+                    self._conn.executemany(
+                        "UPDATE xray_findings SET last_used=?"
+                        " WHERE evaluator_hash=? AND lang=? AND content_hash=?",
+                        [(now, evaluator_hash, lang, h) for lang, h in found],
+                    )
+                    self._conn.commit()
+                self._hits += sum(1 for k in keys if k in found)
+                self._misses += sum(1 for k in keys if k not in found)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("XRayFindingsCache: lookup failed: %s", exc)
+            return {}
+        return found
+
+    def put_many(
+        self,
+        evaluator_hash: str,
+        entries: List[Tuple[str, str, List[Dict[str, Any]]]],
+    ) -> None:
+        """Store match lists for (lang, content_hash, matches) entries."""
+        if not entries:
+            return
+        try:
+            with self._lock:
+                now = time.time()
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO xray_findings"
+                    " (evaluator_hash, lang, content_hash, matches_json, last_used)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (
+                            evaluator_hash,
+                            lang,
+                            content_hash,
+                            json.dumps([strip_match(m) for m in matches]),
+                            now,
+                        )
+                        for lang, content_hash, matches in entries
+                    ],
+                )
+                self._conn.commit()
+                self._inserts_since_prune += len(entries)
+                if self._inserts_since_prune >= _PRUNE_EVERY_N_INSERTS:
+                    self._prune_locked()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("XRayFindingsCache: store failed: %s", exc)
+
+    def prune(self) -> int:
+        """Evict least-recently-used rows beyond max_entries. Returns rows removed."""
+        try:
+            with self._lock:
+                return self._prune_locked()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("XRayFindingsCache: prune failed: %s", exc)
+            return 0
+
+    def _prune_locked(self) -> int:
+        self._inserts_since_prune = 0
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM xray_findings").fetchone()
+        excess = count - self.max_entries
+        if excess <= 0:
+            return 0
+        self._conn.execute(
+            "DELETE FROM xray_findings WHERE rowid IN ("
+            " SELECT rowid FROM xray_findings ORDER BY last_used ASC LIMIT ?)",
+            (excess,),
+        )
+        self._conn.commit()
+        return int(excess)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return process-lifetime hit/miss counters and current size."""
+        with self._lock:
+            try:
+                (entries,) = self._conn.execute(
+                    "SELECT COUNT(*) FROM xray_findings"
+                ).fetchone()
+            except Exception:  # noqa: BLE001
+                entries = -1
+            lookups = self._hits + self._misses
+            return {
+                "entries": entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+            }
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
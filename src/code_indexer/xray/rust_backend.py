@@ -176,6 +176,8 @@ class RustNativeBackend:
         self._xray_cli_path: Path = _XRAY_CLI_DEFAULT
         self._xray_cache: Optional[XrayCacheBackend] = xray_cache_backend
         self._rustc_version: Optional[str] = None
+        # (path, mtime_ns, size) -> sha256 of the xray-cli binary.
+        self._cli_identity: Optional[Tuple[Tuple[str, int, int], str]] = None
         # Side-channel populated by run_batch() — debug_log() messages from xray-cli JSON.
         # Read by XRaySearchEngine.run() to surface in result dict as debug_output[].
         self._last_debug_messages: List[str] = []
@@ -209,6 +211,29 @@ class RustNativeBackend:
                 self._rustc_version = "unknown"
         return self._rustc_version
 
+    def get_runtime_identity(self) -> str:
+        """Identity of the evaluation toolchain for result caching.
+
+        Combines the sha256 of the xray-cli binary (re-hashed only when its
+        mtime or size changes) with the rustc version, so upgrading either
+        invalidates findings computed by the previous toolchain.
+        """
+        path = self._xray_cli_path
+        try:
+            st = path.stat()
+        except OSError:
+            cli = "xray-cli:missing"
+        else:
+            stamp = (str(path), st.st_mtime_ns, st.st_size)
+            if self._cli_identity is None or self._cli_identity[0] != stamp:
+                digest = hashlib.sha256()
+                with open(path, "rb") as f:
+                    for block in iter(lambda: f.read(1 << 20), b""):
+                        digest.update(block)
+                self._cli_identity = (stamp, digest.hexdigest())
+            cli = f"xray-cli:{self._cli_identity[1]}"
+        return f"{cli};{self._get_rustc_version()}"
+
     @staticmethod
     def _get_cache_dir() -> Path:
         """Return the local xray cache directory.
@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
+    from code_indexer.xray.findings_cache import XRayFindingsCache
     from code_indexer.xray.rust_backend import XrayCacheBackend
 
 from code_indexer.global_repos.regex_search import (
@@ -36,6 +37,22 @@ _cluster_cache_singleton: Optional["XrayCacheBackend"] = None
 _cluster_cache_initialized: bool = False
 _cluster_cache_lock: threading.Lock = threading.Lock()
 
+# Module-level singleton for the persistent per-file findings cache, same
+# double-checked locking discipline as the cluster cache above.
+_findings_cache_singleton: Optional["XRayFindingsCache"] = None
+_findings_cache_initialized: bool = False
+_findings_cache_lock: threading.Lock = threading.Lock()
+
+# File name of the findings cache database inside the xray cache directory.
+_FINDINGS_CACHE_DB_NAME = "findings.db"
+
+# Phase 2 dispatches candidates to the Rust evaluator in chunks of this many
+# files so results accumulate incrementally: a timeout keeps every finished
+# chunk instead of losing one monolithic batch, and progress advances per chunk.
+# Phase 1 is not streamed: the full ripgrep candidate list is collected before
+# the first chunk is dispatched.
+_PHASE2_CHUNK_FILES = 500
+
 
 def _get_cluster_cache() -> Optional["XrayCacheBackend"]:
     """Return a shared XrayCachePostgresBackend when in cluster (postgres) mode.
@@ -102,6 +119,50 @@ def _get_cluster_cache() -> Optional["XrayCacheBackend"]:
             return None
 
 
+def _get_findings_cache() -> Optional["XRayFindingsCache"]:
+    """Return the shared XRayFindingsCache when enabled in server config.
+
+    Opt-in via ``xray_config.xray_findings_cache_enabled``.  The database lives
+    next to the compiled evaluator cache (``RustNativeBackend._get_cache_dir()``).
+
+    Definitive outcomes (disabled, or created) are cached for the process
+    lifetime; transient failures (config unavailable, unwritable directory)
+    leave the singleton uninitialized so the next engine retries.
+    """
+    global _findings_cache_singleton, _findings_cache_initialized
+    if _findings_cache_initialized:
+        return _findings_cache_singleton
+    with _findings_cache_lock:
+        if _findings_cache_initialized:
+            return _findings_cache_singleton
+        try:
+            from code_indexer.server.services.config_service import get_config_service
+
+            xray_config = getattr(
+                get_config_service().get_config(), "xray_config", None
+            )
+            if not getattr(xray_config, "xray_findings_cache_enabled", False):
+                _findings_cache_initialized = True
+                return None
+            from code_indexer.xray.findings_cache import XRayFindingsCache
+            from code_indexer.xray.rust_backend import RustNativeBackend
+
+            _findings_cache_singleton = XRayFindingsCache(
+                RustNativeBackend._get_cache_dir() / _FINDINGS_CACHE_DB_NAME,
+                max_entries=getattr(
+                    xray_config, "xray_findings_cache_max_entries", 200_000
+                ),
+            )
+            _findings_cache_initialized = True
+            logger.info("XRaySearchEngine: per-file findings cache enabled")
+            return _findings_cache_singleton
+        except Exception as exc:
+            logger.warning(
+                "XRaySearchEngine: findings cache setup failed — uncached: %s", exc
+            )
+            return None
+
+
 def _run_async_in_sync(coro: Any) -> Any:
     """Run an async coroutine from a synchronous context.
 
@@ -153,8 +214,13 @@ class XRaySearchEngine:
     parallel AST evaluation via RustNativeBackend.
     """
 
-    def __init__(self) -> None:
-        """Initialise the engine, importing tree-sitter at this point."""
+    def __init__(self, findings_cache: Optional["XRayFindingsCache"] = None) -> None:
+        """Initialise the engine, importing tree-sitter at this point.
+
+        Args:
+            findings_cache: Per-file evaluation result cache.  Defaults to the
+                process-wide cache when enabled in server config, else None.
+        """
         from code_indexer.xray.ast_engine import AstSearchEngine
         from code_indexer.xray.rust_backend import RustNativeBackend
         from code_indexer.xray.sandbox import PythonEvaluatorSandbox
@@ -162,6 +228,9 @@ class XRaySearchEngine:
         self.ast_engine = AstSearchEngine()
         self.rust_backend = RustNativeBackend(xray_cache_backend=_get_cluster_cache())
         self.sandbox = PythonEvaluatorSandbox()
+        self.findings_cache = (
+            findings_cache if findings_cache is not None else _get_findings_cache()
+        )
 
     @staticmethod
     def _serialize_ast(node: Any, max_nodes: int) -> Dict[str, Any]:
@@ -383,16 +452,45 @@ class XRaySearchEngine:
                 }
             )
 
-        if file_specs:
+        findings_cache_stats: Optional[Dict[str, int]] = None
+        debug_output: List[str] = []
+        for chunk_start in range(0, len(file_specs), _PHASE2_CHUNK_FILES):
+            if _timed_out():
+                timeout_hit = True
+                break
+            chunk = file_specs[chunk_start : chunk_start + _PHASE2_CHUNK_FILES]
             remaining = max(1, timeout_seconds - int(_elapsed()))
-            batch_results = self.rust_backend.run_batch(
-                evaluator_code=evaluator_code,
-                file_specs=file_specs,
-                worker_threads=worker_threads,
-                timeout_seconds=remaining,
-                on_process_spawned=on_process_spawned,
-                repo_path=str(repo_path),
-            )
+            if self.findings_cache is not None:
+                batch_results, chunk_stats = self._run_batch_cached(
+                    repo_path=repo_path,
+                    evaluator_code=evaluator_code,
+                    file_specs=chunk,
+                    worker_threads=worker_threads,
+                    timeout_seconds=remaining,
+                    on_process_spawned=on_process_spawned,
+                )
+                findings_cache_stats = {
+                    k: (findings_cache_stats or {}).get(k, 0) + v
+                    for k, v in chunk_stats.items()
+                }
+                backend_ran = chunk_stats["misses"] > 0
+            else:
+                batch_results = self.rust_backend.run_batch(
+                    evaluator_code=evaluator_code,
+                    file_specs=chunk,
+                    worker_threads=worker_threads,
+                    timeout_seconds=remaining,
+                    on_process_spawned=on_process_spawned,
+                    repo_path=str(repo_path),
+                )
+                backend_ran = True
+            if backend_ran:
+                # _last_debug_messages holds only the latest run_batch call;
+                # collect it per chunk. Fully cached chunks never reached the
+                # backend, so its messages would be stale.
+                debug_output.extend(
+                    getattr(self.rust_backend, "_last_debug_messages", [])
+                )
             for file_matches, file_errors, file_meta in batch_results:
                 if _timed_out():
                     timeout_hit = True
@@ -402,6 +500,18 @@ class XRaySearchEngine:
                 if file_meta is not None:
                     file_metadata.append(file_meta)
                 files_processed += 1
+            if timeout_hit or len(batch_results) < len(chunk):
+                # A short result list is the backend's deduplicated
+                # evaluator-level error (compile failure, crash): the remaining
+                # chunks would fail identically, so stop here.
+                break
+            if progress_callback and chunk_start + len(chunk) < len(file_specs):
+                done = chunk_start + len(chunk)
+                progress_callback(
+                    50 + (49 * done) // len(file_specs),
+                    "phase2_evaluator",
+                    f"evaluated {done}/{len(file_specs)} files",
+                )
 
         # Enrich matches with ast_debug and matched_node when requested.
         # Re-parses each matched file once; safe since include_ast_debug is a
@@ -451,10 +561,14 @@ class XRaySearchEngine:
             "files_total": files_total,
             "elapsed_seconds": elapsed,
             # AC3: debug_log() messages from the Rust evaluator (via _last_debug_messages
-            # side-channel). Empty list when no debug_log() calls were made (AC6).
-            "debug_output": getattr(self.rust_backend, "_last_debug_messages", []),
+            # side-channel), concatenated across Phase 2 chunks. Empty list when
+            # no debug_log() calls were made (AC6).
+            "debug_output": debug_output,
         }
 
+        if findings_cache_stats is not None:
+            result["findings_cache"] = findings_cache_stats
+
         # COMPLETED_PARTIAL contract: timeout takes precedence over max_files cap.
         if timeout_hit:
             result["partial"] = True
@@ -504,6 +618,91 @@ class XRaySearchEngine:
 
         return result
 
+    def _run_batch_cached(
+        self,
+        *,
+        repo_path: Path,
+        evaluator_code: str,
+        file_specs: List[Dict[str, Any]],
+        worker_threads: int,
+        timeout_seconds: int,
+        on_process_spawned: Optional[Callable],
+    ) -> Tuple[List[Tuple[Any, Any, Any]], Dict[str, int]]:
+        """Phase 2 through the findings cache: only misses reach the Rust backend.
+
+        Results are returned in ``file_specs`` order, matching the uncached
+        ``run_batch`` contract.  When the backend returns a deduplicated
+        evaluator-level error (one tuple instead of one per file), nothing is
+        stored and the error tuple is appended after the cached hits.
+
+        Returns:
+            Tuple of (batch_results, {"hits": int, "misses": int}).
+        """
+        from code_indexer.xray.findings_cache import (
+            file_content_hash,
+            restore_match,
+            sha256_hex,
+        )
+
+        cache = self.findings_cache
+        assert cache is not None
+        # The toolchain identity is part of the key: an xray-cli or rustc
+        # upgrade can change findings for the same evaluator source.
+        runtime_identity = self.rust_backend.get_runtime_identity()
+        evaluator_hash = sha256_hex(f"{evaluator_code}\0{runtime_identity}".encode())
+
+        content_hashes: List[Optional[str]] = [
+            file_content_hash(repo_path / spec["file_path"]) for spec in file_specs
+        ]
+        lookup_keys = [
+            (spec["lang"], h)
+            for spec, h in zip(file_specs, content_hashes)
+            if h is not None
+        ]
+        hits = cache.get_many(evaluator_hash, lookup_keys)
+
+        cached: Dict[int, Tuple[Any, Any, Any]] = {}
+        miss_indices: List[int] = []
+        for i, (spec, h) in enumerate(zip(file_specs, content_hashes)):
+            stored = hits.get((spec["lang"], h)) if h is not None else None
+            if stored is None:
+                miss_indices.append(i)
+                continue
+            cached[i] = (
+                [restore_match(m, spec["file_path"], spec["lang"]) for m in stored],
+                [],
+                None,
+            )
+
+        miss_results: List[Tuple[Any, Any, Any]] = []
+        if miss_indices:
+            miss_specs = [file_specs[i] for i in miss_indices]
+            miss_results = self.rust_backend.run_batch(
+                evaluator_code=evaluator_code,
+                file_specs=miss_specs,
+                worker_threads=worker_threads,
+                timeout_seconds=timeout_seconds,
+                on_process_spawned=on_process_spawned,
+                repo_path=str(repo_path),
+            )
+
+        stats = {"hits": len(cached), "misses": len(miss_indices)}
+        if len(miss_results) != len(miss_indices):
+            # Evaluator-level failure: keep hits, surface the error, store nothing.
+            return [cached[i] for i in sorted(cached)] + list(miss_results), stats
+
+        to_store = []
+        for i, res in zip(miss_indices, miss_results):
+            matches, errors, _meta = res
+            h = content_hashes[i]
+            if h is not None and not errors:
+                to_store.append((file_specs[i]["lang"], h, matches))
+        cache.put_many(evaluator_hash, to_store)
+
+        by_index = dict(zip(miss_indices, miss_results))
+        by_index.update(cached)
+        return [by_index[i] for i in range(len(file_specs))], stats
+
     # Lower-level single-file evaluation API used directly by unit tests (not dead code).
     def _evaluate_file(
         self,
@@ -844,6 +1043,11 @@ class XRaySearchEngine:
     ) -> List[Path]:
         """Content driver via RegexSearchService (ripgrep-backed, async-bridged).
 
+        RegexSearchService narrows the ripgrep scan through the repository's
+        trigram index (``.code-indexer/trigram_index/``) when one is present,
+        so Phase 1 only reads files that can contain the driver's required
+        trigrams; without an index it falls back to a full scan.
+
         Args:
             repo_path: Root directory to search.
             driver_regex: Regular expression applied to file content.
@@ -468,6 +468,81 @@ def _reset_config_service_singleton():
     _reset_config_service_singletons()
 
 
+@pytest.fixture(autouse=True)
+def _reset_rerank_score_cache_singleton():
+    """Reset the process-wide rerank score cache before/after each test.
+
+    Tests reuse the same query/document strings with different mocked
+    reranker scores; a score cached by one test must not be served to the
+    next. Only touches the module when something already imported it.
+    """
+    import sys
+
+    def _reset() -> None:
+        module = sys.modules.get("code_indexer.server.cache.rerank_score_cache")
+        if module is not None:
+            module.reset_global_rerank_score_cache()
+
+    _reset()
+    yield
+    _reset()
+
+
+@pytest.fixture(autouse=True)
+def _reset_dashboard_snapshots():
+    """Drop the shared dashboard snapshots before/after each test.
+
+    Web route tests drive the server-wide ``dashboard_service`` with
+    different mocked managers; a snapshot computed for one test must not be
+    served to the next. Only touches the module when something imported it.
+    """
+    import sys
+
+    def _reset() -> None:
+        for prefix in ("code_indexer", "src.code_indexer"):
+            module = sys.modules.get(f"{prefix}.server.services.dashboard_service")
+            if module is not None:
+                module.dashboard_service.invalidate_snapshots()
+
+    _reset()
+    yield
+    _reset()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_query_embedding_disk_cache(tmp_path_factory):
+    """Keep the CLI/daemon query embedding cache out of ~/.cache and per-test.
+
+    CLI query tests install the process-wide cache; a vector cached for one
+    test's mocked provider must not be served to the next.
+
+    The env var is set by hand rather than through ``monkeypatch``: an
+    autouse fixture requesting ``monkeypatch`` makes every test's patches
+    outlive that test's own fixtures during teardown.
+    """
+    import sys
+
+    env_var = "CIDX_QUERY_EMBEDDING_CACHE"
+    previous = os.environ.get(env_var)
+    os.environ[env_var] = str(
+        tmp_path_factory.mktemp("query_embedding_cache") / "cache.db"
+    )
+
+    def _reset() -> None:
+        for prefix in ("code_indexer", "src.code_indexer"):
+            module = sys.modules.get(f"{prefix}.services.query_embedding_disk_cache")
+            if module is not None:
+                module.clear_query_embedding_disk_cache()
+
+    _reset()
+    yield
+    _reset()
+    if previous is None:
+        os.environ.pop(env_var, None)
+    else:
+        os.environ[env_var] = previous
+
+
 # Bug #1370: module-level `rich.console.Console()` singletons that cache
 # color/terminal detection at import time. See
 # tests/unit/cli/test_console_singleton_test_isolation_bug1370.py for the
@@ -10,6 +10,8 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from code_indexer.daemon.result_codec import pack_response
+
 
 class TestExecuteViaDaemon:
     """Test lightweight daemon execution."""
@@ -19,9 +21,9 @@ class TestExecuteViaDaemon:
         """Test FTS query execution via daemon."""
         # Arrange
         mock_conn = Mock()
-        mock_conn.root.exposed_query_fts.return_value = [
-            {"payload": {"path": "test.py", "line_start": 10}, "score": 0.95}
-        ]
+        mock_conn.root.exposed_query_fts_packed.return_value = pack_response(
+            [{"payload": {"path": "test.py", "line_start": 10}, "score": 0.95}]
+        )
         mock_connect.return_value = mock_conn
 
         from code_indexer.cli_daemon_fast import execute_via_daemon
@@ -34,7 +36,7 @@ class TestExecuteViaDaemon:
 
         # Assert
         assert exit_code == 0
-        mock_conn.root.exposed_query_fts.assert_called_once()
+        mock_conn.root.exposed_query_fts_packed.assert_called_once()
         mock_conn.close.assert_called_once()
 
     @patch("code_indexer.cli_daemon_delegation._connect_to_daemon")
@@ -42,12 +44,14 @@ class TestExecuteViaDaemon:
         """Test semantic query execution via daemon."""
         # Arrange
         mock_conn = Mock()
-        mock_conn.root.exposed_query.return_value = {
-            "results": [
-                {"payload": {"path": "module.py", "line_start": 5}, "score": 0.88}
-            ],
-            "timing": {"search_ms": 150, "total_ms": 200},
-        }
+        mock_conn.root.exposed_query_packed.return_value = pack_response(
+            {
+                "results": [
+                    {"payload": {"path": "module.py", "line_start": 5}, "score": 0.88}
+                ],
+                "timing": {"search_ms": 150, "total_ms": 200},
+            }
+        )
         mock_connect.return_value = mock_conn
 
         from code_indexer.cli_daemon_fast import execute_via_daemon
@@ -60,20 +64,22 @@ class TestExecuteViaDaemon:
 
         # Assert
         assert exit_code == 0
-        mock_conn.root.exposed_query.assert_called_once()
+        mock_conn.root.exposed_query_packed.assert_called_once()
 
     @patch("code_indexer.cli_daemon_delegation._connect_to_daemon")
     def test_execute_query_hybrid_via_daemon(self, mock_connect):
         """Test hybrid search execution via daemon."""
         # Arrange
         mock_conn = Mock()
-        mock_conn.root.exposed_query_hybrid.return_value = [
-            {
-                "payload": {"path": "handler.py", "line_start": 20},
-                "score": 0.92,
-                "source": "fts",
-            }
-        ]
+        mock_conn.root.exposed_query_hybrid_packed.return_value = pack_response(
+            [
+                {
+                    "payload": {"path": "handler.py", "line_start": 20},
+                    "score": 0.92,
+                    "source": "fts",
+                }
+            ]
+        )
         mock_connect.return_value = mock_conn
 
         from code_indexer.cli_daemon_fast import execute_via_daemon
@@ -86,7 +92,7 @@ class TestExecuteViaDaemon:
 
         # Assert
         assert exit_code == 0
-        mock_conn.root.exposed_query_hybrid.assert_called_once()
+        mock_conn.root.exposed_query_hybrid_packed.assert_called_once()
 
     @patch("code_indexer.cli_daemon_delegation._connect_to_daemon")
     def test_handles_daemon_connection_error(self, mock_connect):
@@ -109,24 +115,26 @@ class TestExecuteViaDaemon:
         # Arrange
         mock_conn = Mock()
         # FTS returns list directly (not dict like semantic search)
-        mock_conn.root.exposed_query_fts.return_value = [
-            {
-                "payload": {
-                    "path": "src/module.py",
-                    "line_start": 42,
-                    "content": "def test_function():",
+        mock_conn.root.exposed_query_fts_packed.return_value = pack_response(
+            [
+                {
+                    "payload": {
+                        "path": "src/module.py",
+                        "line_start": 42,
+                        "content": "def test_function():",
+                    },
+                    "score": 0.95,
                 },
-                "score": 0.95,
-            },
-            {
-                "payload": {
-                    "path": "tests/test_module.py",
-                    "line_start": 10,
-                    "content": "test_function()",
+                {
+                    "payload": {
+                        "path": "tests/test_module.py",
+                        "line_start": 10,
+                        "content": "test_function()",
+                    },
+                    "score": 0.85,
                 },
-                "score": 0.85,
-            },
-        ]
+            ]
+        )
         mock_connect.return_value = mock_conn
 
         from code_indexer.cli_daemon_fast import execute_via_daemon
@@ -238,10 +246,12 @@ class TestDisplayFormatting:
         """Test that multiple filter values are displayed with comma separation."""
         # Arrange
         mock_conn = Mock()
-        mock_conn.root.exposed_query.return_value = {
-            "results": [],
-            "timing": {"search_ms": 100, "total_ms": 120},
-        }
+        mock_conn.root.exposed_query_packed.return_value = pack_response(
+            {
+                "results": [],
+                "timing": {"search_ms": 100, "total_ms": 120},
+            }
+        )
         mock_connect.return_value = mock_conn
 
         from code_indexer.cli_daemon_fast import execute_via_daemon
@@ -273,10 +283,12 @@ class TestDisplayFormatting:
         """Test that multiple path filters are displayed with comma separation."""
         # Arrange
         mock_conn = Mock()
-        mock_conn.root.exposed_query.return_value = {
-            "results": [],
-            "timing": {"search_ms": 100, "total_ms": 120},
-        }
+        mock_conn.root.exposed_query_packed.return_value = pack_response(
+            {
+                "results": [],
+                "timing": {"search_ms": 100, "total_ms": 120},
+            }
+        )
         mock_connect.return_value = mock_conn
 
         from code_indexer.cli_daemon_fast import execute_via_daemon
@@ -323,7 +335,7 @@ class TestLightweightDelegationPerformance:
         """Test that execute_via_daemon has minimal overhead."""
         # Arrange
         mock_conn = Mock()
-        mock_conn.root.exposed_query_fts.return_value = []
+        mock_conn.root.exposed_query_fts_packed.return_value = pack_response([])
         mock_connect.return_value = mock_conn
 
         from code_indexer.cli_daemon_fast import execute_via_daemon
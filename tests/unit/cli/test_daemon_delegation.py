@@ -9,6 +9,8 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 import pytest
 
+from code_indexer.daemon.result_codec import pack_response
+
 pytestmark = pytest.mark.slow
 
 
@@ -158,7 +160,9 @@ class TestCrashRecovery:
                 # First attempt: crash
                 # Second attempt: success
                 mock_conn = Mock()
-                mock_conn.root.exposed_query.return_value = {"results": []}
+                mock_conn.root.exposed_query_packed.return_value = pack_response(
+                    {"results": []}
+                )
                 mock_connect.side_effect = [ConnectionRefusedError(), mock_conn]
 
                 with patch(
@@ -344,7 +348,9 @@ class TestQueryDelegation:
                 "code_indexer.cli_daemon_delegation._connect_to_daemon"
             ) as mock_connect:
                 mock_conn = Mock()
-                mock_conn.root.exposed_query.return_value = {"results": []}
+                mock_conn.root.exposed_query_packed.return_value = pack_response(
+                    {"results": []}
+                )
                 mock_connect.return_value = mock_conn
 
                 with patch("code_indexer.cli_daemon_delegation._display_results"):
@@ -353,7 +359,7 @@ class TestQueryDelegation:
                     )
 
                     assert result == 0
-                    mock_conn.root.exposed_query.assert_called_once()
+                    mock_conn.root.exposed_query_packed.assert_called_once()
 
     def test_query_delegates_to_fts_search(self):
         """Test FTS query delegates to daemon exposed_query_fts."""
@@ -369,7 +375,9 @@ class TestQueryDelegation:
                 "code_indexer.cli_daemon_delegation._connect_to_daemon"
             ) as mock_connect:
                 mock_conn = Mock()
-                mock_conn.root.exposed_query_fts.return_value = {"results": []}
+                mock_conn.root.exposed_query_fts_packed.return_value = pack_response(
+                    {"results": []}
+                )
                 mock_connect.return_value = mock_conn
 
                 with patch("code_indexer.cli_daemon_delegation._display_results"):
@@ -378,7 +386,7 @@ class TestQueryDelegation:
                     )
 
                     assert result == 0
-                    mock_conn.root.exposed_query_fts.assert_called_once()
+                    mock_conn.root.exposed_query_fts_packed.assert_called_once()
 
     def test_query_delegates_to_hybrid_search(self):
         """Test hybrid query delegates to daemon exposed_query_hybrid."""
@@ -394,7 +402,9 @@ class TestQueryDelegation:
                 "code_indexer.cli_daemon_delegation._connect_to_daemon"
             ) as mock_connect:
                 mock_conn = Mock()
-                mock_conn.root.exposed_query_hybrid.return_value = {"results": []}
+                mock_conn.root.exposed_query_hybrid_packed.return_value = pack_response(
+                    {"results": []}
+                )
                 mock_connect.return_value = mock_conn
 
                 with patch("code_indexer.cli_daemon_delegation._display_results"):
@@ -403,7 +413,7 @@ class TestQueryDelegation:
                     )
 
                     assert result == 0
-                    mock_conn.root.exposed_query_hybrid.assert_called_once()
+                    mock_conn.root.exposed_query_hybrid_packed.assert_called_once()
 
 
 class TestLifecycleCommands:
@@ -0,0 +1,26 @@
+"""Tests for displaying streamed (iterator) FTS results."""
+
+from io import StringIO
+
+from rich.console import Console
+
+from code_indexer.cli import _display_fts_results
+
+
+def _render(results):
+    out = StringIO()
+    _display_fts_results(results, quiet=True, console=Console(file=out))
+    return out.getvalue()
+
+
+def test_iterator_results_are_numbered_as_they_stream():
+    results = ({"path": f"src/m{i}.py", "line": i, "column": 1} for i in (3, 7))
+
+    assert _render(results).splitlines() == ["1. src/m3.py:3:1", "2. src/m7.py:7:1"]
+
+
+def test_empty_iterator_reports_no_matches():
+    out = StringIO()
+    _display_fts_results(iter(()), console=Console(file=out))
+
+    assert "No matches found" in out.getvalue()
@@ -179,3 +179,68 @@ def mock_embedding_provider_for_staleness_tests(request):
         return_value=fake_provider,
     ):
         yield fake_provider
+
+
+@pytest.fixture
+def indexed_project_factory(tmp_path):
+    """Build projects with real on-disk HNSW, ID and Tantivy indexes.
+
+    Returns a callable ``build(name, files)`` where ``files`` maps relative
+    paths to contents. Each file becomes one semantic point (embedded with
+    FakeEmbeddingProvider, so querying a file's exact content returns that
+    file first) and one FTS document.
+    """
+    from code_indexer.services.tantivy_index_manager import TantivyIndexManager
+    from code_indexer.storage.filesystem_vector_store import FilesystemVectorStore
+
+    def build(name: str, files: Dict[str, str]):
+        root = tmp_path / name
+        provider = FakeEmbeddingProvider()
+        collection = provider.get_current_model()
+        store = FilesystemVectorStore(
+            base_path=root / ".code-indexer" / "index", project_root=root
+        )
+        store.create_collection(collection, vector_size=provider.VECTOR_DIM)
+        fts = TantivyIndexManager(root / ".code-indexer" / "tantivy_index")
+        fts.initialize_index(create_new=True)
+
+        points = []
+        for i, (rel_path, content) in enumerate(sorted(files.items())):
+            file_path = root / rel_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(content)
+            payload = {
+                "path": rel_path,
+                "content": content,
+                "language": "py",
+                "line_start": 1,
+                "line_end": 1,
+                "type": "content",
+            }
+            points.append(
+                {
+                    "id": f"{name}-{i}",
+                    "vector": provider.get_embedding(content),
+                    "payload": payload,
+                }
+            )
+            fts.add_document(
+                {
+                    "path": rel_path,
+                    "content": content,
+                    "content_raw": content,
+                    "identifiers": content.split(),
+                    "line_start": 1,
+                    "line_end": 1,
+                    "language": "python",
+                }
+            )
+
+        store.begin_indexing(collection)
+        store.upsert_points(collection_name=collection, points=points)
+        store.end_indexing(collection)
+        fts.commit()
+        fts.close()
+        return root
+
+    return build
@@ -0,0 +1,69 @@
+"""Tests for paged unlimited FTS queries through the daemon."""
+
+from unittest.mock import patch
+
+import pytest
+
+from code_indexer.cli_daemon_delegation import _iter_daemon_fts_results
+from code_indexer.daemon.result_codec import unpack_response
+from code_indexer.daemon.service import CIDXDaemonService
+from code_indexer.services.tantivy_index_manager import TantivyIndexManager
+
+
+@pytest.fixture
+def project_path(tmp_path):
+    manager = TantivyIndexManager(tmp_path / ".code-indexer" / "tantivy_index")
+    manager.initialize_index(create_new=True)
+    for i in range(25):
+        content = f"def handler_{i}():\n    return dispatch(event)\n"
+        manager.add_document(
+            {
+                "path": f"src/mod_{i}.py",
+                "content": content,
+                "content_raw": content,
+                "identifiers": [f"handler_{i}"],
+                "line_start": 1,
+                "line_end": 2,
+                "language": "py",
+            }
+        )
+    manager.commit()
+    manager.close()
+    return tmp_path
+
+
+@pytest.fixture
+def service():
+    service = CIDXDaemonService()
+    with patch.object(service, "_ensure_cache_loaded"):
+        yield service
+    service.eviction_thread.stop()
+    service.eviction_thread.join(timeout=1)
+
+
+def test_fts_page_returns_results_and_resume_cursor(service, project_path):
+    page = unpack_response(
+        service.exposed_query_fts_page(
+            str(project_path), "dispatch", page_size=10, snippet_lines=0
+        )
+    )
+
+    assert len(page["results"]) == 10
+    assert page["next_cursor"] is not None
+
+
+def test_client_streams_every_page(service, project_path):
+    with patch.object(
+        service, "exposed_query_fts_page", wraps=service.exposed_query_fts_page
+    ) as fetch_page:
+        results = list(
+            _iter_daemon_fts_results(
+                service, str(project_path), "dispatch", page_size=10, snippet_lines=0
+            )
+        )
+
+    assert fetch_page.call_count == 3
+
+    assert sorted(r["path"] for r in results) == sorted(
+        f"src/mod_{i}.py" for i in range(25)
+    )
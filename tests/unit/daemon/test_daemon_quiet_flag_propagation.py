@@ -15,6 +15,7 @@ from code_indexer.cli_daemon_fast import (
     parse_query_args,
     _display_results,
 )
+from code_indexer.daemon.result_codec import pack_response
 
 
 class TestDaemonQuietFlagParsing:
@@ -68,10 +69,12 @@ class TestDaemonQuietFlagPropagation:
         mock_socket_path.return_value = Path("/tmp/test.sock")
 
         mock_conn = MagicMock()
-        mock_conn.root.exposed_query.return_value = {
-            "results": [{"payload": {"content": "test"}, "score": 0.85}],
-            "timing": {"embedding_time_ms": 50},
-        }
+        mock_conn.root.exposed_query_packed.return_value = pack_response(
+            {
+                "results": [{"payload": {"content": "test"}, "score": 0.85}],
+                "timing": {"embedding_time_ms": 50},
+            }
+        )
         mock_connect.return_value = mock_conn
 
         mock_config_mgr.create_with_backtrack.return_value.get_daemon_config.return_value = {
@@ -15,6 +15,7 @@ import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from code_indexer.cli_daemon_fast import execute_via_daemon, parse_query_args
+from code_indexer.daemon.result_codec import pack_response
 
 
 class TestFastPathRPCSignatures:
@@ -84,16 +85,18 @@ class TestFastPathRPCSignatures:
         mock_unix_connect.return_value = mock_conn
 
         # Mock FTS query result
-        mock_root.exposed_query_fts.return_value = [
-            {
-                "score": 0.95,
-                "payload": {
-                    "path": "test.py",
-                    "line_start": 10,
-                    "content": "test content",
-                },
-            }
-        ]
+        mock_root.exposed_query_fts_packed.return_value = pack_response(
+            [
+                {
+                    "score": 0.95,
+                    "payload": {
+                        "path": "test.py",
+                        "line_start": 10,
+                        "content": "test content",
+                    },
+                }
+            ]
+        )
 
         # Create config path
         config_path = Path("/tmp/test/.code-indexer/config.json")
@@ -109,9 +112,9 @@ class TestFastPathRPCSignatures:
         # CRITICAL: Verify RPC call signature
         # Should be: exposed_query_fts(project_path, query, **kwargs)
         # NOT: exposed_query_fts(project_path, query, options_dict)
-        mock_root.exposed_query_fts.assert_called_once()
+        mock_root.exposed_query_fts_packed.assert_called_once()
 
-        call_args = mock_root.exposed_query_fts.call_args
+        call_args = mock_root.exposed_query_fts_packed.call_args
         assert len(call_args.args) == 2  # project_path, query (NO positional options)
         assert "limit" in call_args.kwargs  # limit passed as kwarg
 
@@ -125,7 +128,9 @@ class TestFastPathRPCSignatures:
         mock_unix_connect.return_value = mock_conn
 
         # Mock semantic query result (should return dict with results/timing)
-        mock_root.exposed_query.return_value = {"results": [], "timing": {}}
+        mock_root.exposed_query_packed.return_value = pack_response(
+            {"results": [], "timing": {}}
+        )
 
         # Create config path
         config_path = Path("/tmp/test/.code-indexer/config.json")
@@ -139,8 +144,8 @@ class TestFastPathRPCSignatures:
         assert exit_code == 0
 
         # Verify RPC call signature
-        mock_root.exposed_query.assert_called_once()
-        call_args = mock_root.exposed_query.call_args
+        mock_root.exposed_query_packed.assert_called_once()
+        call_args = mock_root.exposed_query_packed.call_args
 
         # Should be: exposed_query(project_path, query, limit, **kwargs)
         assert len(call_args.args) == 3  # project_path, query, limit
@@ -156,7 +161,7 @@ class TestFastPathRPCSignatures:
         mock_unix_connect.return_value = mock_conn
 
         # Mock hybrid query result
-        mock_root.exposed_query_hybrid.return_value = []
+        mock_root.exposed_query_hybrid_packed.return_value = pack_response([])
 
         # Create config path
         config_path = Path("/tmp/test/.code-indexer/config.json")
@@ -170,8 +175,8 @@ class TestFastPathRPCSignatures:
         assert exit_code == 0
 
         # Verify RPC call signature
-        mock_root.exposed_query_hybrid.assert_called_once()
-        call_args = mock_root.exposed_query_hybrid.call_args
+        mock_root.exposed_query_hybrid_packed.assert_called_once()
+        call_args = mock_root.exposed_query_hybrid_packed.call_args
 
         # Should be: exposed_query_hybrid(project_path, query, **kwargs)
         assert len(call_args.args) == 2  # project_path, query (NO positional options)
@@ -187,7 +192,7 @@ class TestFastPathRPCSignatures:
         mock_unix_connect.return_value = mock_conn
 
         # Mock FTS query result
-        mock_root.exposed_query_fts.return_value = []
+        mock_root.exposed_query_fts_packed.return_value = pack_response([])
 
         # Create config path
         config_path = Path("/tmp/test/.code-indexer/config.json")
@@ -210,8 +215,8 @@ class TestFastPathRPCSignatures:
         assert exit_code == 0
 
         # Verify RPC call signature includes language in kwargs
-        mock_root.exposed_query_fts.assert_called_once()
-        call_args = mock_root.exposed_query_fts.call_args
+        mock_root.exposed_query_fts_packed.assert_called_once()
+        call_args = mock_root.exposed_query_fts_packed.call_args
 
         assert len(call_args.args) == 2  # project_path, query
         assert call_args.kwargs["limit"] == 30
@@ -252,7 +257,7 @@ class TestFastPathPerformance:
         mock_unix_connect.return_value = mock_conn
 
         # Mock fast FTS query result
-        mock_root.exposed_query_fts.return_value = []
+        mock_root.exposed_query_fts_packed.return_value = pack_response([])
 
         # Create config path
         config_path = Path("/tmp/test/.code-indexer/config.json")
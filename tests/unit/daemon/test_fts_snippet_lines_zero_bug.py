@@ -1,7 +1,7 @@
 """Test that daemon mode respects --snippet-lines 0 for FTS queries."""
 
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 
 class TestDaemonFTSSnippetLinesZero:
@@ -73,6 +73,7 @@ class TestDaemonFTSSnippetLinesZero:
             mock_execute.assert_called_once_with(
                 str(test_project),
                 "voyage",
+                cache_entry=ANY,
                 snippet_lines=0,  # Should be passed through correctly
                 case_sensitive=False,
                 edit_distance=0,
@@ -14,6 +14,7 @@ Expected behavior: Both modes should produce identical output (no snippets).
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch, Mock
+from code_indexer.daemon.result_codec import pack_response
 from code_indexer.services.rpyc_daemon import CIDXDaemonService
 
 
@@ -222,11 +223,13 @@ class TestFTSSnippetLinesZeroDaemon:
             mock_connect.return_value = mock_conn
 
             # Mock daemon response
-            mock_conn.root.exposed_query_fts.return_value = {
-                "results": [],
-                "query": "test",
-                "total": 0,
-            }
+            mock_conn.root.exposed_query_fts_packed.return_value = pack_response(
+                {
+                    "results": [],
+                    "query": "test",
+                    "total": 0,
+                }
+            )
 
             # Call delegation function with snippet_lines=0
             daemon_config = {"enabled": True, "retry_delays_ms": [100]}
@@ -241,8 +244,8 @@ class TestFTSSnippetLinesZeroDaemon:
             )
 
             # Verify RPC call included snippet_lines
-            mock_conn.root.exposed_query_fts.assert_called_once()
-            call_kwargs = mock_conn.root.exposed_query_fts.call_args.kwargs
+            mock_conn.root.exposed_query_fts_packed.assert_called_once()
+            call_kwargs = mock_conn.root.exposed_query_fts_packed.call_args.kwargs
 
             # FAILING ASSERTION: snippet_lines should be in RPC call
             assert "snippet_lines" in call_kwargs, (
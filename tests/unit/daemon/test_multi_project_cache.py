@@ -0,0 +1,204 @@
+"""Unit tests for the daemon's multi-project LRU cache.
+
+The daemon keeps one CacheEntry per project, bounded by project count and
+estimated index bytes, so alternating between repositories hits warm indexes.
+"""
+
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from code_indexer.daemon.cache import CacheEntry, TTLEvictionThread
+from code_indexer.services.tantivy_index_manager import TantivyIndexManager
+from code_indexer.storage.hnsw_index_manager import HNSWIndexManager
+from code_indexer.storage.id_index_manager import IDIndexManager
+
+from .conftest import FakeEmbeddingProvider
+
+
+@pytest.fixture
+def service():
+    from code_indexer.daemon.service import CIDXDaemonService
+
+    service = CIDXDaemonService()
+    yield service
+    service.eviction_thread.stop()
+    service.eviction_thread.join(timeout=1)
+
+
+def _load(service, project: Path) -> None:
+    with patch.object(service, "_load_semantic_indexes"):
+        with patch.object(service, "_load_fts_indexes"):
+            service._ensure_cache_loaded(str(project))
+
+
+class TestMultiProjectLRU:
+    def test_alternating_projects_stay_warm(self, service, tmp_path: Path):
+        repo_a, repo_b = tmp_path / "a", tmp_path / "b"
+        with patch.object(service, "_load_semantic_indexes") as load:
+            with patch.object(service, "_load_fts_indexes"):
+                for project in (repo_a, repo_b, repo_a, repo_b, repo_a):
+                    service._ensure_cache_loaded(str(project))
+
+        assert load.call_count == 2
+        assert list(service.cache_entries) == [repo_b, repo_a]
+        assert service.cache_entry.project_path == repo_a
+
+    def test_evicts_least_recently_used_by_count(self, service, tmp_path: Path):
+        service.max_cached_projects = 2
+        repo_a, repo_b, repo_c = tmp_path / "a", tmp_path / "b", tmp_path / "c"
+        _load(service, repo_a)
+        _load(service, repo_b)
+        _load(service, repo_a)  # a is now most recently used
+        evicted = service.cache_entries[repo_b]
+        evicted.hnsw_index = object()
+
+        _load(service, repo_c)
+
+        assert list(service.cache_entries) == [repo_a, repo_c]
+        assert evicted.hnsw_index is None  # Retired after eviction
+
+    def test_evicts_by_estimated_bytes(self, service, tmp_path: Path):
+        service.max_cache_bytes = 150
+        repo_a, repo_b = tmp_path / "a", tmp_path / "b"
+        with patch.object(CacheEntry, "estimate_index_bytes", return_value=100):
+            _load(service, repo_a)
+            _load(service, repo_b)
+
+        assert list(service.cache_entries) == [repo_b]
+
+    def test_newest_entry_kept_even_when_over_budget(self, service, tmp_path: Path):
+        service.max_cache_bytes = 10
+        with patch.object(CacheEntry, "estimate_index_bytes", return_value=100):
+            _load(service, tmp_path / "big")
+
+        assert list(service.cache_entries) == [tmp_path / "big"]
+
+    def test_index_invalidates_only_that_project(self, service, tmp_path: Path):
+        repo_a, repo_b = tmp_path / "a", tmp_path / "b"
+        _load(service, repo_a)
+        _load(service, repo_b)
+
+        service._drop_cache_entry(str(repo_a), "Invalidating cache before indexing")
+
+        assert list(service.cache_entries) == [repo_b]
+
+
+class TestQueriesUseCachedIndexes:
+    def test_alternating_projects_search_without_reloading_indexes(
+        self, service, indexed_project_factory
+    ):
+        repo_a = indexed_project_factory(
+            "a", {"alpha.py": "def alpha_handler(): pass", "beta.py": "x = 1"}
+        )
+        repo_b = indexed_project_factory(
+            "b", {"gamma.py": "class GammaWidget: pass", "delta.py": "y = 2"}
+        )
+        calls = {"hnsw": 0, "id": 0, "fts_open": 0, "fts_init": 0}
+
+        def counting(name, original):
+            def wrapper(*args, **kwargs):
+                calls[name] += 1
+                return original(*args, **kwargs)
+
+            return wrapper
+
+        with (
+            patch(
+                "code_indexer.services.embedding_factory.EmbeddingProviderFactory.create",
+                return_value=FakeEmbeddingProvider(),
+            ),
+            patch.object(
+                HNSWIndexManager,
+                "load_index",
+                counting("hnsw", HNSWIndexManager.load_index),
+            ),
+            patch.object(
+                IDIndexManager, "load_index", counting("id", IDIndexManager.load_index)
+            ),
+            patch.object(
+                TantivyIndexManager,
+                "open_for_search",
+                counting("fts_open", TantivyIndexManager.open_for_search),
+            ),
+            patch.object(
+                TantivyIndexManager,
+                "initialize_index",
+                counting("fts_init", TantivyIndexManager.initialize_index),
+            ),
+        ):
+            for _ in range(3):
+                for project, query, term, expected in (
+                    (repo_a, "def alpha_handler(): pass", "alpha_handler", "alpha.py"),
+                    (repo_b, "class GammaWidget: pass", "GammaWidget", "gamma.py"),
+                ):
+                    semantic = service.exposed_query(str(project), query, limit=1)
+                    fts = service.exposed_query_fts(str(project), term, limit=1)
+                    assert semantic["results"][0]["payload"]["path"] == expected
+                    assert fts[0]["path"] == expected
+
+        # Each project's indexes were read from disk exactly once, at load
+        assert calls == {"hnsw": 2, "id": 2, "fts_open": 2, "fts_init": 0}
+
+
+class TestMultiProjectStatus:
+    def test_get_status_reports_every_entry(self, service, tmp_path: Path):
+        repo_a, repo_b = tmp_path / "a", tmp_path / "b"
+        _load(service, repo_a)
+        _load(service, repo_b)
+
+        status = service.exposed_get_status()
+
+        assert status["cache_loaded"] is True
+        assert status["cached_projects"] == 2
+        assert [e["project_path"] for e in status["cache_entries"]] == [
+            str(repo_b),
+            str(repo_a),
+        ]
+        assert "estimated_bytes" in status["cache_entries"][0]
+
+    def test_estimate_index_bytes_uses_loaded_index_files(self, tmp_path: Path):
+        collection = tmp_path / ".code-indexer" / "index" / "coll"
+        collection.mkdir(parents=True)
+        (collection / "hnsw_index.bin").write_bytes(b"x" * 100)
+        (collection / "id_index.bin").write_bytes(b"x" * 20)
+        tantivy = tmp_path / ".code-indexer" / "tantivy_index"
+        tantivy.mkdir()
+        (tantivy / "seg.store").write_bytes(b"x" * 5)
+
+        entry = CacheEntry(tmp_path)
+        assert entry.estimate_index_bytes() == 0
+
+        entry.set_semantic_indexes(object(), {})
+        entry.collection_name = "coll"
+        entry.set_fts_indexes(object(), object())
+        assert entry.estimate_index_bytes() == 125
+
+
+class TestMultiProjectEviction:
+    def test_ttl_evicts_expired_entries_independently(self, service, tmp_path: Path):
+        repo_a, repo_b = tmp_path / "a", tmp_path / "b"
+        _load(service, repo_a)
+        _load(service, repo_b)
+        service.cache_entries[repo_a].ttl_minutes = 0
+
+        TTLEvictionThread(service)._check_and_evict()
+
+        assert list(service.cache_entries) == [repo_b]
+
+    def test_watch_start_preloads_project(self, service, tmp_path: Path):
+        with patch.object(
+            service.watch_manager,
+            "start_watch",
+            return_value={"status": "success"},
+        ):
+            with patch.object(service, "_ensure_cache_loaded") as ensure:
+                service.exposed_watch_start(str(tmp_path))
+                for _ in range(50):
+                    if ensure.called:
+                        break
+                    time.sleep(0.02)
+
+        ensure.assert_called_once_with(str(tmp_path))
@@ -0,0 +1,87 @@
+"""Tests for the packed daemon query result transport."""
+
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import rpyc
+from rpyc.utils.factory import connect_thread
+
+from code_indexer.cli_daemon_delegation import _call_daemon_query
+from code_indexer.daemon.result_codec import pack_response, unpack_response
+
+
+def _results(n):
+    return [
+        {
+            "score": 0.9 - i / 1000,
+            "payload": {
+                "path": f"src/module_{i}.py",
+                "line_start": i,
+                "content": "def handler():\n    return 42\n" * 5,
+            },
+        }
+        for i in range(n)
+    ]
+
+
+def test_round_trip_preserves_plain_results():
+    response = {"results": _results(3), "timing": {"search_ms": 1.5}}
+
+    assert unpack_response(pack_response(response)) == response
+
+
+def test_non_native_values_are_packed_as_plain_data():
+    response = {
+        "score": np.float32(0.5),
+        "path": Path("src/a.py"),
+        "indexed_at": datetime(2024, 1, 2, 3, 4, 5),
+        "languages": {"py"},
+        "span": (1, 2),
+    }
+
+    assert unpack_response(pack_response(response)) == {
+        "score": 0.5,
+        "path": "src/a.py",
+        "indexed_at": "2024-01-02T03:04:05",
+        "languages": ["py"],
+        "span": [1, 2],
+    }
+
+
+class _PackedService(rpyc.Service):
+    def exposed_query_fts(self, project_path, query, limit=10):
+        return _results(limit)
+
+    def exposed_query_fts_packed(self, project_path, query, limit=10):
+        return pack_response(self.exposed_query_fts(project_path, query, limit))
+
+
+class _LegacyService(rpyc.Service):
+    def exposed_query_fts(self, project_path, query, limit=10):
+        return _results(limit)
+
+
+def test_packed_call_returns_local_objects_over_rpyc():
+    conn = connect_thread(remote_service=_PackedService)
+    try:
+        results = _call_daemon_query(
+            conn.root, "exposed_query_fts", "/repo", "handler", limit=50
+        )
+    finally:
+        conn.close()
+
+    assert type(results) is list
+    assert type(results[0]["payload"]) is dict
+    assert results == _results(50)
+
+
+def test_daemon_without_packed_methods_falls_back_to_plain_call():
+    conn = connect_thread(remote_service=_LegacyService)
+    try:
+        results = _call_daemon_query(
+            conn.root, "exposed_query_fts", "/repo", "handler", limit=2
+        )
+        assert [r["payload"]["line_start"] for r in results] == [0, 1]
+    finally:
+        conn.close()
@@ -5,11 +5,41 @@ Tests TTL-based cache eviction, auto-shutdown on idle, and background thread beh
 
 import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 
+class FakeDaemonService:
+    """Daemon double exposing the per-project cache API TTLEvictionThread uses."""
+
+    def __init__(self, *entries, auto_shutdown=False, cache_lock=None):
+        self.cache_entries = OrderedDict((e.project_path, e) for e in entries)
+        self.cache_lock = cache_lock or threading.Lock()
+        self.config = Mock(auto_shutdown_on_idle=auto_shutdown)
+
+    @property
+    def cache_entry(self):
+        return next(reversed(self.cache_entries.values()), None)
+
+    def evict_expired_cache_entries(self):
+        with self.cache_lock:
+            expired = [p for p, e in self.cache_entries.items() if e.is_expired()]
+            for path in expired:
+                del self.cache_entries[path]
+        return len(expired)
+
+
+def _expired_entry(path="/tmp/test"):
+    from code_indexer.daemon.cache import CacheEntry
+
+    entry = CacheEntry(Path(path), ttl_minutes=1)
+    # Backdate to simulate expiration
+    entry.last_accessed = datetime.now() - timedelta(minutes=2)
+    return entry
+
+
 class TestTTLEvictionThreadInitialization:
     """Test TTL eviction thread initialization."""
 
@@ -51,49 +81,49 @@ class TestTTLEvictionBasicBehavior:
         """Test _check_and_evict does nothing when cache is None."""
         from code_indexer.daemon.cache import TTLEvictionThread
 
-        mock_service = Mock()
-        mock_service.cache_entry = None
-        mock_service.cache_lock = threading.Lock()
+        service = FakeDaemonService()
 
-        thread = TTLEvictionThread(mock_service)
+        thread = TTLEvictionThread(service)
         thread._check_and_evict()
 
         # Should complete without errors, cache remains None
-        assert mock_service.cache_entry is None
+        assert service.cache_entry is None
 
     def test_check_and_evict_preserves_fresh_cache(self):
         """Test _check_and_evict preserves cache that hasn't expired."""
         from code_indexer.daemon.cache import CacheEntry, TTLEvictionThread
 
-        mock_service = Mock()
         fresh_entry = CacheEntry(Path("/tmp/test"), ttl_minutes=10)
-        mock_service.cache_entry = fresh_entry
-        mock_service.cache_lock = threading.Lock()
-        mock_service.config = Mock(auto_shutdown_on_idle=False)
+        service = FakeDaemonService(fresh_entry)
 
-        thread = TTLEvictionThread(mock_service)
+        thread = TTLEvictionThread(service)
         thread._check_and_evict()
 
         # Fresh cache should be preserved
-        assert mock_service.cache_entry is fresh_entry
+        assert service.cache_entry is fresh_entry
 
     def test_check_and_evict_removes_expired_cache(self):
         """Test _check_and_evict removes expired cache entry."""
-        from code_indexer.daemon.cache import CacheEntry, TTLEvictionThread
+        from code_indexer.daemon.cache import TTLEvictionThread
 
-        mock_service = Mock()
-        expired_entry = CacheEntry(Path("/tmp/test"), ttl_minutes=1)
-        # Backdate to simulate expiration
-        expired_entry.last_accessed = datetime.now() - timedelta(minutes=2)
-        mock_service.cache_entry = expired_entry
-        mock_service.cache_lock = threading.Lock()
-        mock_service.config = Mock(auto_shutdown_on_idle=False)
+        service = FakeDaemonService(_expired_entry())
 
-        thread = TTLEvictionThread(mock_service)
+        thread = TTLEvictionThread(service)
         thread._check_and_evict()
 
         # Expired cache should be evicted
-        assert mock_service.cache_entry is None
+        assert service.cache_entry is None
+
+    def test_check_and_evict_keeps_fresh_entries_of_other_projects(self):
+        """Each project's entry expires independently."""
+        from code_indexer.daemon.cache import CacheEntry, TTLEvictionThread
+
+        fresh_entry = CacheEntry(Path("/tmp/fresh"), ttl_minutes=10)
+        service = FakeDaemonService(_expired_entry("/tmp/old"), fresh_entry)
+
+        TTLEvictionThread(service)._check_and_evict()
+
+        assert list(service.cache_entries.values()) == [fresh_entry]
 
 
 class TestTTLEvictionAutoShutdown:
@@ -138,39 +168,44 @@ class TestTTLEvictionAutoShutdown:
     @patch("os._exit")
     def test_check_and_evict_triggers_shutdown_on_expired_idle(self, mock_exit):
         """Test _check_and_evict triggers shutdown when cache expires and auto-shutdown enabled."""
-        from code_indexer.daemon.cache import CacheEntry, TTLEvictionThread
+        from code_indexer.daemon.cache import TTLEvictionThread
 
-        mock_service = Mock()
-        expired_entry = CacheEntry(Path("/tmp/test"), ttl_minutes=1)
-        expired_entry.last_accessed = datetime.now() - timedelta(minutes=2)
-        mock_service.cache_entry = expired_entry
-        mock_service.cache_lock = threading.Lock()
-        mock_service.config = Mock(auto_shutdown_on_idle=True)
+        service = FakeDaemonService(_expired_entry(), auto_shutdown=True)
 
-        thread = TTLEvictionThread(mock_service)
+        thread = TTLEvictionThread(service)
         thread._check_and_evict()
 
         # Cache should be evicted and shutdown triggered
-        assert mock_service.cache_entry is None
+        assert service.cache_entry is None
         mock_exit.assert_called_once_with(0)
 
+    @patch("os._exit")
+    def test_check_and_evict_no_shutdown_while_other_projects_cached(self, mock_exit):
+        """Auto-shutdown waits until every project's entry has expired."""
+        from code_indexer.daemon.cache import CacheEntry, TTLEvictionThread
+
+        service = FakeDaemonService(
+            _expired_entry("/tmp/old"),
+            CacheEntry(Path("/tmp/fresh"), ttl_minutes=10),
+            auto_shutdown=True,
+        )
+
+        TTLEvictionThread(service)._check_and_evict()
+
+        mock_exit.assert_not_called()
+
     @patch("os._exit")
     def test_check_and_evict_no_shutdown_when_disabled(self, mock_exit):
         """Test _check_and_evict does not shutdown when auto-shutdown disabled."""
-        from code_indexer.daemon.cache import CacheEntry, TTLEvictionThread
+        from code_indexer.daemon.cache import TTLEvictionThread
 
-        mock_service = Mock()
-        expired_entry = CacheEntry(Path("/tmp/test"), ttl_minutes=1)
-        expired_entry.last_accessed = datetime.now() - timedelta(minutes=2)
-        mock_service.cache_entry = expired_entry
-        mock_service.cache_lock = threading.Lock()
-        mock_service.config = Mock(auto_shutdown_on_idle=False)
+        service = FakeDaemonService(_expired_entry(), auto_shutdown=False)
 
-        thread = TTLEvictionThread(mock_service)
+        thread = TTLEvictionThread(service)
         thread._check_and_evict()
 
         # Cache should be evicted but no shutdown
-        assert mock_service.cache_entry is None
+        assert service.cache_entry is None
         mock_exit.assert_not_called()
 
 
@@ -192,11 +227,9 @@ class TestTTLEvictionThreadLifecycle:
         """Test run loop exits when running is set to False."""
         from code_indexer.daemon.cache import TTLEvictionThread
 
-        mock_service = Mock()
-        mock_service.cache_entry = None
-        mock_service.cache_lock = threading.Lock()
+        service = FakeDaemonService()
 
-        thread = TTLEvictionThread(mock_service, check_interval=0.01)
+        thread = TTLEvictionThread(service, check_interval=0.01)
 
         # Start thread
         thread.start()
@@ -216,9 +249,7 @@ class TestTTLEvictionThreadLifecycle:
         """Test run loop sleeps for check_interval between eviction checks."""
         from code_indexer.daemon.cache import TTLEvictionThread
 
-        mock_service = Mock()
-        mock_service.cache_entry = None
-        mock_service.cache_lock = threading.Lock()
+        service = FakeDaemonService()
 
         # Mock sleep to prevent actual waiting and stop after first iteration
         def stop_after_sleep(duration):
@@ -226,7 +257,7 @@ class TestTTLEvictionThreadLifecycle:
 
         mock_sleep.side_effect = stop_after_sleep
 
-        thread = TTLEvictionThread(mock_service, check_interval=60)
+        thread = TTLEvictionThread(service, check_interval=60)
         thread.run()
 
         # Should have slept for check_interval
@@ -238,12 +269,7 @@ class TestTTLEvictionConcurrency:
 
     def test_check_and_evict_acquires_cache_lock(self):
         """Test _check_and_evict acquires cache lock before eviction."""
-        from code_indexer.daemon.cache import CacheEntry, TTLEvictionThread
-
-        mock_service = Mock()
-        expired_entry = CacheEntry(Path("/tmp/test"), ttl_minutes=1)
-        expired_entry.last_accessed = datetime.now() - timedelta(minutes=2)
-        mock_service.cache_entry = expired_entry
+        from code_indexer.daemon.cache import TTLEvictionThread
 
         # Track lock acquisition
         lock_acquired = []
@@ -257,10 +283,9 @@ class TestTTLEvictionConcurrency:
             def __exit__(self, *args):
                 return original_lock.__exit__(*args)
 
-        mock_service.cache_lock = TrackedLock()
-        mock_service.config = Mock(auto_shutdown_on_idle=False)
+        service = FakeDaemonService(_expired_entry(), cache_lock=TrackedLock())
 
-        thread = TTLEvictionThread(mock_service)
+        thread = TTLEvictionThread(service)
         thread._check_and_evict()
 
         # Lock should have been acquired
@@ -270,11 +295,7 @@ class TestTTLEvictionConcurrency:
         """Test eviction thread is safe with concurrent cache access."""
         from code_indexer.daemon.cache import CacheEntry, TTLEvictionThread
 
-        mock_service = Mock()
-        cache_entry = CacheEntry(Path("/tmp/test"), ttl_minutes=1)
-        mock_service.cache_entry = cache_entry
-        mock_service.cache_lock = threading.Lock()
-        mock_service.config = Mock(auto_shutdown_on_idle=False)
+        service = FakeDaemonService(CacheEntry(Path("/tmp/test"), ttl_minutes=1))
 
         # Simulate concurrent access
         access_errors = []
@@ -282,14 +303,14 @@ class TestTTLEvictionConcurrency:
         def concurrent_access():
             """Simulate concurrent cache access."""
             try:
-                with mock_service.cache_lock:
-                    if mock_service.cache_entry:
-                        mock_service.cache_entry.update_access()
+                with service.cache_lock:
+                    for entry in service.cache_entries.values():
+                        entry.update_access()
             except Exception as e:
                 access_errors.append(e)
 
         # Start eviction thread
-        thread = TTLEvictionThread(mock_service, check_interval=0.01)
+        thread = TTLEvictionThread(service, check_interval=0.01)
         thread.start()
 
         # Simulate concurrent access
@@ -0,0 +1,109 @@
+"""Tests for git-index-driven file discovery in FileFinder."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from code_indexer.config import Config, OverrideConfig
+from code_indexer.indexing.file_finder import FileFinder
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _write(repo: Path, relative: str, content: str = "x = 1\n") -> None:
+    path = repo / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init", "-q")
+    _write(tmp_path, ".gitignore", "generated/\n")
+    _write(tmp_path, "src/app.py")
+    _write(tmp_path, "src/deep/nested/.gitignore", "secret.py\n")
+    _write(tmp_path, "src/deep/nested/secret.py")
+    _write(tmp_path, "src/deep/nested/kept.py")
+    _write(tmp_path, "generated/out.py")
+    _write(tmp_path, "node_modules/lib/index.js")
+    _write(tmp_path, "README.bin")
+    _git(tmp_path, "add", "src/app.py", ".gitignore")
+    _git(tmp_path, "-c", "user.email=a@b", "-c", "user.name=a", "commit", "-qm", "i")
+    # Untracked-but-not-ignored file is discovered too
+    _write(tmp_path, "src/new.py")
+    return tmp_path
+
+
+def _relative(finder: FileFinder, repo: Path):
+    return sorted(str(p.relative_to(repo)) for p in finder.find_files())
+
+
+def test_git_discovery_matches_walk_rules(repo):
+    finder = FileFinder(Config(codebase_dir=repo))
+
+    with patch.object(finder, "_walk_files", wraps=finder._walk_files) as walk:
+        found = _relative(finder, repo)
+
+    walk.assert_not_called()
+    # Nested .gitignore rules deeper than one level are honoured by git
+    assert found == ["src/app.py", "src/deep/nested/kept.py", "src/new.py"]
+
+
+def test_deleted_tracked_file_is_skipped(repo):
+    (repo / "src/app.py").unlink()
+
+    assert "src/app.py" not in _relative(FileFinder(Config(codebase_dir=repo)), repo)
+
+
+def test_force_include_reaches_gitignored_files(repo):
+    config = Config(
+        codebase_dir=repo,
+        override_config=OverrideConfig(
+            add_extensions=[],
+            remove_extensions=[],
+            add_exclude_dirs=[],
+            add_include_dirs=[],
+            force_include_patterns=["generated/*.py"],
+            force_exclude_patterns=["src/new.py"],
+        ),
+    )
+
+    found = _relative(FileFinder(config), repo)
+
+    assert "generated/out.py" in found
+    assert "src/new.py" not in found
+
+
+def test_untracked_nested_repository_is_walked(repo):
+    nested = repo / "vendor_repo"
+    nested.mkdir()
+    _git(nested, "init", "-q")
+    _write(nested, "lib.py")
+
+    assert "vendor_repo/lib.py" in _relative(
+        FileFinder(Config(codebase_dir=repo)), repo
+    )
+
+
+def test_non_git_tree_falls_back_to_walk(tmp_path):
+    _write(tmp_path, "a.py")
+    finder = FileFinder(Config(codebase_dir=tmp_path))
+
+    with patch.object(finder, "_git_ls_files") as ls_files:
+        assert _relative(finder, tmp_path) == ["a.py"]
+
+    ls_files.assert_not_called()
+
+
+def test_git_failure_falls_back_to_walk(repo):
+    finder = FileFinder(Config(codebase_dir=repo))
+
+    with patch.object(finder, "_git_ls_files", return_value=None):
+        found = _relative(finder, repo)
+
+    assert "src/app.py" in found
+    assert "generated/out.py" not in found
@@ -0,0 +1,171 @@
+"""Unit tests for the in-process proxy query engine."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from code_indexer.proxy.cli_integration import _execute_query
+from code_indexer.proxy.native_query import (
+    NativeProxyQueryEngine,
+    NativeQueryArgs,
+    _RepoTarget,
+    build_filter_conditions,
+    parse_native_query_args,
+)
+from code_indexer.storage.filesystem_vector_store import FilesystemVectorStore
+
+DIM = 8
+COLLECTION = "voyage-code-3"
+
+
+class TestParseNativeQueryArgs:
+    def test_supported_options(self):
+        parsed = parse_native_query_args(
+            [
+                "auth flow",
+                "--limit",
+                "5",
+                "--quiet",
+                "--language",
+                "python",
+                "--path-filter=*/src/*",
+                "--min-score",
+                "0.5",
+            ]
+        )
+
+        assert parsed == NativeQueryArgs(
+            query_text="auth flow",
+            limit=5,
+            quiet=True,
+            min_score=0.5,
+            languages=["python"],
+            path_filters=["*/src/*"],
+        )
+
+    def test_unsupported_options_fall_back(self):
+        assert parse_native_query_args(["auth", "--fts"]) is None
+        assert parse_native_query_args(["auth", "--limit"]) is None
+        assert parse_native_query_args(["auth", "--limit", "many"]) is None
+        assert parse_native_query_args(["--quiet"]) is None
+
+    def test_filter_conditions_match_cli_shape(self):
+        conditions = build_filter_conditions(
+            NativeQueryArgs(query_text="q", path_filters=["*/a/*", "*/b/*"])
+        )
+
+        assert conditions == {
+            "must": [
+                {
+                    "should": [
+                        {"key": "path", "match": {"text": "*/a/*"}},
+                        {"key": "path", "match": {"text": "*/b/*"}},
+                    ]
+                }
+            ]
+        }
+
+
+def _make_repo(root: Path, name: str, seeds) -> FilesystemVectorStore:
+    repo = root / name
+    store = FilesystemVectorStore(repo / ".code-indexer" / "index", project_root=repo)
+    store.create_collection(COLLECTION, vector_size=DIM)
+    store.begin_indexing(COLLECTION)
+    store.upsert_points(
+        COLLECTION,
+        [
+            {
+                "id": f"{name}-{seed}",
+                "vector": np.random.default_rng(seed).standard_normal(DIM).tolist(),
+                "payload": {
+                    "path": f"file{seed}.py",
+                    "language": "py",
+                    "type": "content",
+                    "content": "def f():\n    pass",
+                    "line_start": 3,
+                    "line_end": 4,
+                },
+            }
+            for seed in seeds
+        ],
+    )
+    store.end_indexing(COLLECTION)
+    return store
+
+
+def _target(root: Path, name: str, store, provider) -> _RepoTarget:
+    return _RepoTarget(
+        repo_path=str(root / name),
+        config=SimpleNamespace(codebase_dir=root / name),
+        embedding_provider=provider,
+        vector_store=store,
+        collection_name=COLLECTION,
+        git_aware=False,
+        current_branch=None,
+    )
+
+
+class TestNativeProxyQueryEngine:
+    def test_embeds_once_and_merges_by_score(self, tmp_path):
+        provider = MagicMock()
+        provider.get_provider_name.return_value = "voyage-ai"
+        provider.get_current_model.return_value = COLLECTION
+        # Query vector equals repo2's point with seed 2
+        provider.get_embedding.return_value = (
+            np.random.default_rng(2).standard_normal(DIM).tolist()
+        )
+
+        engine = NativeProxyQueryEngine([])
+        engine._targets = [
+            _target(tmp_path, "repo1", _make_repo(tmp_path, "repo1", [1]), provider),
+            _target(tmp_path, "repo2", _make_repo(tmp_path, "repo2", [2, 3]), provider),
+        ]
+
+        results, errors = engine.execute(NativeQueryArgs(query_text="q", limit=2))
+
+        assert errors == {}
+        provider.get_embedding.assert_called_once_with("q", embedding_purpose="query")
+        assert len(results) == 2
+        assert results[0].file_path == "repo2/file2.py"
+        assert results[0].score == 1.0
+        assert results[0].line_range == (3, 4)
+        assert results[0].content == "  3: def f():\n  4:     pass"
+        assert results[0].score >= results[1].score
+
+    def test_repository_failure_is_reported(self, tmp_path):
+        provider = MagicMock()
+        provider.get_provider_name.return_value = "voyage-ai"
+        provider.get_current_model.return_value = COLLECTION
+        provider.get_embedding.return_value = [0.1] * DIM
+        broken = MagicMock()
+        broken.search.side_effect = RuntimeError("index corrupt")
+
+        engine = NativeProxyQueryEngine([])
+        engine._targets = [
+            _target(tmp_path, "repo1", _make_repo(tmp_path, "repo1", [1]), provider),
+            _target(tmp_path, "repo2", broken, provider),
+        ]
+
+        results, errors = engine.execute(NativeQueryArgs(query_text="q"))
+
+        assert [r.file_path for r in results] == ["repo1/file1.py"]
+        assert errors == {str(tmp_path / "repo2"): "index corrupt"}
+
+    def test_prepare_rejects_unconfigured_repository(self, tmp_path):
+        assert not NativeProxyQueryEngine([str(tmp_path)]).prepare()
+
+
+class TestExecuteQueryNativePath:
+    @patch("code_indexer.proxy.cli_integration.ParallelCommandExecutor")
+    @patch("code_indexer.proxy.cli_integration.NativeProxyQueryEngine")
+    def test_native_engine_skips_subprocesses(self, mock_engine, mock_executor):
+        engine = mock_engine.return_value
+        engine.prepare.return_value = True
+        engine.execute.return_value = ([], {"/repo2": "boom"})
+
+        exit_code = _execute_query(["auth", "--quiet"], ["/repo1", "/repo2"])
+
+        mock_executor.assert_not_called()
+        assert exit_code == 2
@@ -0,0 +1,102 @@
+"""Tests for the verified-principal / user cache on the auth hot path."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from code_indexer.server.auth.auth_cache import AuthCache, AuthCacheConfig
+from code_indexer.server.auth.mcp_credential_manager import MCPCredentialManager
+from code_indexer.server.auth.user_manager import UserManager, UserRole
+
+PASSWORD = "Correct-Horse-Battery-9!"
+
+
+@pytest.fixture
+def user_manager(tmp_path):
+    manager = UserManager(users_file_path=str(tmp_path / "users.json"))
+    manager.create_user("alice", PASSWORD, UserRole.NORMAL_USER)
+    return manager
+
+
+@pytest.fixture
+def credential(user_manager):
+    creds = MCPCredentialManager(user_manager=user_manager)
+    return creds, creds.generate_credential("alice", name="agent")
+
+
+class TestVerifiedPrincipalCache:
+    def test_second_verify_skips_hash_and_lookup(self, credential):
+        creds, cred = credential
+
+        with patch.object(
+            creds.password_manager,
+            "verify_password",
+            wraps=creds.password_manager.verify_password,
+        ) as verify:
+            for _ in range(3):
+                assert (
+                    creds.verify_credential(cred["client_id"], cred["client_secret"])
+                    == "alice"
+                )
+
+        assert verify.call_count == 1
+
+    def test_wrong_secret_is_never_served_from_cache(self, credential):
+        creds, cred = credential
+        creds.verify_credential(cred["client_id"], cred["client_secret"])
+
+        assert creds.verify_credential(cred["client_id"], "mcp_sec_wrong") is None
+
+    def test_revocation_evicts_principal(self, credential):
+        creds, cred = credential
+        creds.verify_credential(cred["client_id"], cred["client_secret"])
+
+        assert creds.revoke_credential("alice", cred["credential_id"])
+        assert creds.verify_credential(cred["client_id"], cred["client_secret"]) is None
+
+
+class TestUserCache:
+    def test_role_change_and_delete_invalidate(self, user_manager):
+        assert user_manager.get_user_cached("alice").role == UserRole.NORMAL_USER
+        with patch.object(user_manager, "get_user") as get_user:
+            user_manager.get_user_cached("alice")
+        get_user.assert_not_called()
+
+        user_manager.update_user_role("alice", UserRole.ADMIN)
+        assert user_manager.get_user_cached("alice").role == UserRole.ADMIN
+
+        user_manager.delete_user("alice")
+        assert user_manager.get_user_cached("alice") is None
+
+    def test_load_racing_an_invalidation_is_not_cached(self, user_manager):
+        cache = user_manager.auth_cache
+        generation = cache.generation()
+        stale = user_manager.get_user("alice")
+
+        user_manager.update_user_role("alice", UserRole.ADMIN)
+        cache.put_user(stale, generation)
+
+        assert cache.get_user("alice") is None
+
+    def test_entries_expire_after_ttl(self, user_manager):
+        user_manager.auth_cache = AuthCache(AuthCacheConfig(ttl_seconds=0.05))
+        user_manager.get_user_cached("alice")
+        assert user_manager.auth_cache.get_user("alice") is not None
+
+        time.sleep(0.1)
+        assert user_manager.auth_cache.get_user("alice") is None
+
+
+def test_stats_report_hits_and_auth_latency():
+    cache = AuthCache()
+    cache.get_user("nobody")
+    for ms in (1, 2, 3, 40):
+        cache.record_auth("jwt", ms / 1000)
+
+    stats = cache.get_stats()
+
+    assert stats.miss_count == 1 and stats.hit_ratio == 0.0
+    assert stats.auth_latency["jwt"]["count"] == 4
+    assert stats.auth_latency["jwt"]["p50_ms"] == pytest.approx(3)
+    assert stats.auth_latency["jwt"]["p95_ms"] == pytest.approx(40)
@@ -0,0 +1,241 @@
+"""
+Unit tests for RerankScoreCache and its use in _apply_reranking_sync.
+
+Verifies:
+- Scores round-trip per document position; keys include provider, model,
+  query and instruction
+- LRU eviction bounds the cache
+- A repeated rerank sends only uncached documents to the provider, and a
+  fully cached rerank never calls the provider
+- Merged cached + fresh scores are ordered by score and cut to top_k
+- cidx.cache.rerank.* OTEL gauges report the cache stats
+"""
+
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from code_indexer.server.cache.rerank_score_cache import (
+    RerankScoreCache,
+    RerankScoreCacheConfig,
+    get_global_rerank_score_cache,
+    reset_global_rerank_score_cache,
+)
+
+
+class TestRerankScoreCacheStorage:
+    def test_round_trip_by_document_position(self) -> None:
+        cache = RerankScoreCache()
+        cache.put_many("voyage", "rerank-2.5", "q", None, [("a", 0.9), ("c", 0.1)])
+
+        found = cache.get_many("voyage", "rerank-2.5", "q", None, ["a", "b", "c"])
+
+        assert found == {0: 0.9, 2: 0.1}
+        stats = cache.get_stats()
+        assert stats.hit_count == 2
+        assert stats.miss_count == 1
+        assert stats.entries == 2
+
+    def test_key_includes_provider_model_query_and_instruction(self) -> None:
+        cache = RerankScoreCache()
+        cache.put_many("voyage", "m1", "q", "inst", [("a", 0.5)])
+
+        assert cache.get_many("cohere", "m1", "q", "inst", ["a"]) == {}
+        assert cache.get_many("voyage", "m2", "q", "inst", ["a"]) == {}
+        assert cache.get_many("voyage", "m1", "q2", "inst", ["a"]) == {}
+        assert cache.get_many("voyage", "m1", "q", None, ["a"]) == {}
+        assert cache.get_many("voyage", "m1", "q", "inst", ["a"]) == {0: 0.5}
+
+    def test_lru_eviction(self) -> None:
+        cache = RerankScoreCache(RerankScoreCacheConfig(max_entries=2))
+        cache.put_many("voyage", "m", "q", None, [("old", 0.1), ("mid", 0.2)])
+        cache.get_many("voyage", "m", "q", None, ["old"])  # refresh "old"
+        cache.put_many("voyage", "m", "q", None, [("new", 0.3)])
+
+        assert cache.get_many("voyage", "m", "q", None, ["mid"]) == {}
+        assert cache.get_many("voyage", "m", "q", None, ["old", "new"]) == {
+            0: 0.1,
+            1: 0.3,
+        }
+        assert cache.get_stats().eviction_count == 1
+
+    def test_disabled_cache_stores_nothing(self) -> None:
+        cache = RerankScoreCache(RerankScoreCacheConfig(enabled=False))
+        cache.put_many("voyage", "m", "q", None, [("a", 0.5)])
+        assert cache.get_many("voyage", "m", "q", None, ["a"]) == {}
+        assert cache.get_stats().entries == 0
+
+
+class TestRerankScoreCacheConfig:
+    def test_rejects_non_positive_max_entries(self) -> None:
+        with pytest.raises(ValueError):
+            RerankScoreCacheConfig(max_entries=0)
+
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("CIDX_RERANK_SCORE_CACHE_ENABLED", "false")
+        monkeypatch.setenv("CIDX_RERANK_SCORE_CACHE_MAX_ENTRIES", "10")
+        config = RerankScoreCacheConfig.from_env()
+        assert config.enabled is False
+        assert config.max_entries == 10
+
+    def test_global_singleton_reset(self) -> None:
+        first = get_global_rerank_score_cache()
+        assert get_global_rerank_score_cache() is first
+        reset_global_rerank_score_cache()
+        assert get_global_rerank_score_cache() is not first
+
+
+# ---------------------------------------------------------------------------
+# _apply_reranking_sync integration
+# ---------------------------------------------------------------------------
+
+
+def _rerank_result(index: int, score: float) -> MagicMock:
+    obj = MagicMock()
+    obj.index = index
+    obj.relevance_score = score
+    return obj
+
+
+def _config_service(voyage_model: str = "rerank-2.5") -> MagicMock:
+    from code_indexer.server.utils.config_manager import RerankConfig
+
+    config = MagicMock()
+    config.rerank_config = RerankConfig(
+        voyage_reranker_model=voyage_model, cohere_reranker_model=""
+    )
+    config.search_timeouts_config = None
+    config_service = MagicMock()
+    config_service.get_config.return_value = config
+    return config_service
+
+
+def _fake_voyage_rerank(scores: Dict[str, float], calls: List[List[str]]):
+    """Score each document from ``scores`` and record the documents sent."""
+
+    def _rerank(*, query: str, documents: List[str], instruction: Any, top_k: Any):
+        calls.append(list(documents))
+        ranked = sorted(
+            (_rerank_result(i, scores[doc]) for i, doc in enumerate(documents)),
+            key=lambda r: r.relevance_score,
+            reverse=True,
+        )
+        return ranked[:top_k]
+
+    return _rerank
+
+
+def _rerank(contents: List[str], limit: int) -> List[dict]:
+    from code_indexer.server.mcp.reranking import _apply_reranking_sync
+
+    results = [{"content": c} for c in contents]
+    reranked, meta = _apply_reranking_sync(
+        results=results,
+        rerank_query="auth flow",
+        rerank_instruction=None,
+        content_extractor=lambda r: r["content"],
+        requested_limit=limit,
+        config_service=_config_service(),
+    )
+    assert meta["reranker_used"] is True
+    return reranked
+
+
+class TestApplyRerankingUsesScoreCache:
+    SCORES = {"a": 0.2, "b": 0.9, "c": 0.5, "d": 0.7}
+
+    @pytest.fixture
+    def voyage_calls(self):
+        calls: List[List[str]] = []
+        with (
+            patch(
+                "code_indexer.server.mcp.reranking.VoyageRerankerClient"
+            ) as MockVoyage,
+            patch(
+                "code_indexer.server.mcp.reranking.ProviderHealthMonitor"
+            ) as MockMonitor,
+        ):
+            MockVoyage.return_value.rerank.side_effect = _fake_voyage_rerank(
+                self.SCORES, calls
+            )
+            monitor = MockMonitor.get_instance.return_value
+            monitor.get_health.return_value = {}
+            monitor.is_sinbinned.return_value = False
+            yield calls
+
+    def test_only_uncached_documents_reach_provider(self, voyage_calls) -> None:
+        _rerank(["a", "b", "c"], limit=2)
+        reranked = _rerank(["a", "b", "c", "d"], limit=2)
+
+        assert voyage_calls == [["a", "b", "c"], ["d"]]
+        assert [r["content"] for r in reranked] == ["b", "d"]
+        assert [r["rerank_score"] for r in reranked] == [0.9, 0.7]
+
+    def test_fully_cached_rerank_skips_provider(self, voyage_calls) -> None:
+        first = _rerank(["a", "b", "c"], limit=3)
+        second = _rerank(["c", "a", "b"], limit=3)
+
+        assert len(voyage_calls) == 1
+        assert [r["content"] for r in second] == [r["content"] for r in first]
+        stats = get_global_rerank_score_cache().get_stats()
+        assert stats.hit_count == 3
+        assert stats.miss_count == 3
+
+    def test_disabled_cache_sends_every_document(
+        self, voyage_calls, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from code_indexer.server.cache import rerank_score_cache
+
+        monkeypatch.setattr(
+            rerank_score_cache,
+            "_global_rerank_score_cache_instance",
+            RerankScoreCache(RerankScoreCacheConfig(enabled=False)),
+        )
+        _rerank(["a", "b"], limit=2)
+        _rerank(["a", "b"], limit=2)
+
+        assert voyage_calls == [["a", "b"], ["a", "b"]]
+
+
+# ---------------------------------------------------------------------------
+# OTEL export
+# ---------------------------------------------------------------------------
+
+
+class _FakeMeter:
+    def __init__(self) -> None:
+        self.gauges: Dict[str, Any] = {}
+
+    def create_observable_gauge(self, name: str, callbacks, **kwargs) -> MagicMock:
+        self.gauges[name] = callbacks[0]
+        return MagicMock()
+
+
+class TestRerankCacheOtelMetrics:
+    def test_gauges_report_cache_stats(self) -> None:
+        pytest.importorskip("opentelemetry.metrics")
+        from code_indexer.server.services.rerank_cache_otel_metrics import (
+            RerankCacheOtelMetrics,
+        )
+
+        cache = RerankScoreCache()
+        cache.put_many("voyage", "m", "q", None, [("a", 0.5)])
+        cache.get_many("voyage", "m", "q", None, ["a", "b"])
+        meter = _FakeMeter()
+        RerankCacheOtelMetrics(meter, stats_fn=cache.get_stats)
+
+        def _value(name: str) -> float:
+            return [obs.value for obs in meter.gauges[name](None)][0]
+
+        assert _value("cidx.cache.rerank.total_entries") == 1
+        assert _value("cidx.cache.rerank.hits") == 1
+        assert _value("cidx.cache.rerank.misses") == 1
+        assert _value("cidx.cache.rerank.hit_rate") == 0.5
+
+    def test_none_meter_is_noop(self) -> None:
+        from code_indexer.server.services.rerank_cache_otel_metrics import (
+            RerankCacheOtelMetrics,
+        )
+
+        RerankCacheOtelMetrics(None)
@@ -0,0 +1,217 @@
+"""
+Unit tests for SCIPEngineCache (pooled, pre-warmed SCIPQueryEngine instances).
+
+Verifies:
+- Repeated leases on an unchanged database reuse the same engine (hit)
+- Pooled connections are switched to query_only mode and drop the parsed
+  protobuf; default limits bound the pool's page cache
+- A changed database signature (regeneration) drops stale engines
+- Concurrent leases get distinct engines
+- invalidate_prefix / LRU database limit close pooled connections
+- Stats report hits, misses and latency
+"""
+
+import os
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from code_indexer.server.cache.scip_engine_cache import (
+    SCIPEngineCache,
+    SCIPEngineCacheConfig,
+    get_global_scip_engine_cache,
+    reset_global_scip_engine_cache,
+)
+
+FIXTURE_DB = (
+    Path(__file__).parents[3] / "scip" / "fixtures" / "comprehensive_index.scip.db"
+)
+
+
+def _make_repo_db(root: Path, name: str) -> Path:
+    """Copy the fixture database into <root>/<name>/.code-indexer/scip/."""
+    scip_dir = root / name / ".code-indexer" / "scip"
+    scip_dir.mkdir(parents=True)
+    db_path = scip_dir / "index.scip.db"
+    shutil.copy(FIXTURE_DB, db_path)
+    return db_path
+
+
+@pytest.fixture
+def repo_db(tmp_path: Path) -> Path:
+    return _make_repo_db(tmp_path, "repo-a")
+
+
+class TestSCIPEngineCacheReuse:
+    def test_second_lease_reuses_engine(self, repo_db: Path) -> None:
+        cache = SCIPEngineCache()
+        with cache.lease(repo_db) as first:
+            first.find_definition("anything")
+        with cache.lease(repo_db) as second:
+            pass
+
+        assert second is first
+        stats = cache.get_stats()
+        assert stats.hit_count == 1
+        assert stats.miss_count == 1
+        assert stats.cached_databases == 1
+        assert stats.idle_engines == 1
+        assert stats.avg_setup_ms > 0.0
+        cache.clear()
+
+    def test_accepts_scip_path_without_db_suffix(self, repo_db: Path) -> None:
+        cache = SCIPEngineCache()
+        scip_path = Path(str(repo_db).removesuffix(".db"))
+        with cache.lease(repo_db) as first:
+            pass
+        with cache.lease(scip_path) as second:
+            pass
+        assert second is first
+        cache.clear()
+
+    def test_pooled_connection_is_query_only(self, repo_db: Path) -> None:
+        cache = SCIPEngineCache()
+        with cache.lease(repo_db) as engine:
+            (query_only,) = engine.db_conn.execute("PRAGMA query_only").fetchone()
+        assert query_only == 1
+        cache.clear()
+
+    def test_pooled_engine_drops_parsed_protobuf(
+        self, repo_db: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from code_indexer.scip.query import primitives
+
+        real_engine = primitives.SCIPQueryEngine
+
+        def engine_with_index(scip_file: Path):
+            engine = real_engine(scip_file)
+            engine.index = object()  # As if the .scip protobuf were loaded
+            return engine
+
+        monkeypatch.setattr(primitives, "SCIPQueryEngine", engine_with_index)
+        cache = SCIPEngineCache()
+        with cache.lease(repo_db) as engine:
+            assert engine.index is None
+        cache.clear()
+
+    def test_default_limits_bound_page_cache(self) -> None:
+        config = SCIPEngineCacheConfig()
+        page_cache_mb = (
+            config.max_databases * config.max_idle_per_database * config.cache_size_mb
+        )
+        assert page_cache_mb <= 512
+
+    def test_missing_database_raises_and_is_not_cached(self, tmp_path: Path) -> None:
+        cache = SCIPEngineCache()
+        with pytest.raises(FileNotFoundError):
+            with cache.lease(tmp_path / "nope" / "index.scip.db"):
+                pass
+        assert cache.get_stats().cached_databases == 0
+
+
+class TestSCIPEngineCacheInvalidation:
+    def test_regenerated_database_drops_stale_engine(self, repo_db: Path) -> None:
+        cache = SCIPEngineCache()
+        with cache.lease(repo_db) as first:
+            pass
+
+        # Simulate `cidx scip generate` replacing the database file.
+        replacement = repo_db.with_name("new.scip.db")
+        shutil.copy(FIXTURE_DB, replacement)
+        os.replace(replacement, repo_db)
+
+        with cache.lease(repo_db) as second:
+            pass
+
+        assert second is not first
+        stats = cache.get_stats()
+        assert stats.invalidation_count == 1
+        assert stats.miss_count == 2
+        cache.clear()
+
+    def test_invalidate_prefix_drops_repo_databases(self, tmp_path: Path) -> None:
+        cache = SCIPEngineCache()
+        db_a = _make_repo_db(tmp_path, "repo-a")
+        db_b = _make_repo_db(tmp_path, "repo-b")
+        with cache.lease(db_a):
+            pass
+        with cache.lease(db_b):
+            pass
+
+        assert cache.invalidate_prefix(str(tmp_path / "repo-a")) == 1
+        stats = cache.get_stats()
+        assert stats.cached_databases == 1
+        assert str(db_b.resolve()) in stats.per_database_stats
+        cache.clear()
+
+    def test_engine_leased_during_invalidation_is_not_returned(
+        self, repo_db: Path
+    ) -> None:
+        cache = SCIPEngineCache()
+        with cache.lease(repo_db) as leased:
+            cache.invalidate(repo_db)
+        with cache.lease(repo_db) as fresh:
+            pass
+        assert fresh is not leased
+        cache.clear()
+
+    def test_lru_database_limit(self, tmp_path: Path) -> None:
+        cache = SCIPEngineCache(SCIPEngineCacheConfig(max_databases=1))
+        db_a = _make_repo_db(tmp_path, "repo-a")
+        db_b = _make_repo_db(tmp_path, "repo-b")
+        with cache.lease(db_a):
+            pass
+        with cache.lease(db_b):
+            pass
+        stats = cache.get_stats()
+        assert stats.cached_databases == 1
+        assert stats.eviction_count == 1
+        assert str(db_b.resolve()) in stats.per_database_stats
+        cache.clear()
+
+
+class TestSCIPEngineCacheConcurrency:
+    def test_concurrent_leases_get_distinct_engines(self, repo_db: Path) -> None:
+        cache = SCIPEngineCache(SCIPEngineCacheConfig(max_idle_per_database=2))
+        barrier = threading.Barrier(2)
+        engines = []
+        errors = []
+
+        def worker() -> None:
+            try:
+                with cache.lease(repo_db) as engine:
+                    engines.append(engine)
+                    barrier.wait(timeout=5)
+                    engine.find_definition("anything")
+            except Exception as exc:  # pragma: no cover - surfaced via assert
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+
+        assert not errors
+        assert len(engines) == 2
+        assert engines[0] is not engines[1]
+        assert cache.get_stats().idle_engines == 2
+        cache.clear()
+
+
+class TestSCIPEngineCacheConfig:
+    def test_rejects_non_positive_limits(self) -> None:
+        with pytest.raises(ValueError):
+            SCIPEngineCacheConfig(max_databases=0)
+        with pytest.raises(ValueError):
+            SCIPEngineCacheConfig(max_idle_per_database=0)
+
+    def test_global_singleton_reset(self) -> None:
+        reset_global_scip_engine_cache()
+        first = get_global_scip_engine_cache()
+        assert get_global_scip_engine_cache() is first
+        reset_global_scip_engine_cache()
+        assert get_global_scip_engine_cache() is not first
+        reset_global_scip_engine_cache()
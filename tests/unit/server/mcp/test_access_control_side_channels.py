@@ -81,6 +81,16 @@ def _make_access_service(
 
         service.filter_repo_listing = Mock(side_effect=_filter)
 
+    # Omni fan-out pruning always normalizes the -global suffix.
+    if is_admin:
+        service.filter_repo_aliases = Mock(side_effect=lambda repos, username: repos)
+    else:
+        service.filter_repo_aliases = Mock(
+            side_effect=lambda repos, username: [
+                r for r in repos if r.removesuffix("-global") in accessible_repos
+            ]
+        )
+
     service.filter_cidx_meta_results = Mock(side_effect=lambda results, uid: results)
     service.calculate_over_fetch_limit = Mock(side_effect=lambda limit: limit * 2)
     service.filter_query_results = Mock(side_effect=lambda results, uid: results)
@@ -0,0 +1,90 @@
+"""Tests for concurrent execution of JSON-RPC batch requests."""
+
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from code_indexer.server.auth.user_manager import User, UserRole
+from code_indexer.server.mcp import protocol
+from code_indexer.server.mcp.protocol import process_batch_request
+
+
+def _user(name="alice"):
+    return User(
+        username=name,
+        password_hash="hashed_password",
+        role=UserRole.NORMAL_USER,
+        created_at=datetime.now(),
+    )
+
+
+class _FakeDispatch:
+    """Stands in for process_jsonrpc_request; tracks in-flight elements."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, request, user, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays[request["id"]])
+        finally:
+            self.in_flight -= 1
+        return {"jsonrpc": "2.0", "result": {}, "id": request["id"]}
+
+
+def _batch(ids):
+    return [{"jsonrpc": "2.0", "method": "tools/list", "id": i} for i in ids]
+
+
+@pytest.mark.asyncio
+async def test_batch_takes_about_as_long_as_slowest_element_and_keeps_order():
+    dispatch = _FakeDispatch({"a": 0.3, "b": 0.1, "c": 0.2, "d": 0.05})
+
+    with (
+        patch.object(protocol, "process_jsonrpc_request", dispatch),
+        patch.object(protocol, "_user_batch_concurrency", return_value=8),
+    ):
+        started = time.monotonic()
+        responses = await process_batch_request(_batch("abcd"), _user())
+        elapsed = time.monotonic() - started
+
+    assert [r["id"] for r in responses] == ["a", "b", "c", "d"]
+    assert elapsed < 0.5
+    assert dispatch.peak == 4
+
+
+@pytest.mark.asyncio
+async def test_user_share_is_enforced_across_concurrent_batches():
+    dispatch = _FakeDispatch({i: 0.02 for i in range(12)})
+
+    with (
+        patch.object(protocol, "process_jsonrpc_request", dispatch),
+        patch.object(protocol, "_user_batch_concurrency", return_value=3),
+    ):
+        first, second = await asyncio.gather(
+            process_batch_request(_batch(range(6)), _user()),
+            process_batch_request(_batch(range(6, 12)), _user()),
+        )
+
+    assert [r["id"] for r in first + second] == list(range(12))
+    assert dispatch.peak == 3
+    assert not protocol._user_batch_slots._slots
+
+
+def test_user_share_follows_narrowest_governor_lane():
+    class _Governor:
+        current_k = {"voyage:embed": 10, "cohere:embed": 6}
+
+    with patch(
+        "code_indexer.server.services.provider_concurrency_governor."
+        "ProviderConcurrencyGovernor.get_instance",
+        return_value=_Governor(),
+    ):
+        assert protocol._user_batch_concurrency() == 3
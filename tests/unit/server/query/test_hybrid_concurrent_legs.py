@@ -0,0 +1,154 @@
+"""Tests for concurrent hybrid FTS/semantic legs with per-leg deadlines."""
+
+import logging
+import threading
+import time
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from code_indexer.server.query.semantic_query_manager import (
+    QueryMetadata,
+    QueryResult,
+    SemanticQueryManager,
+)
+
+
+def _make_manager() -> SemanticQueryManager:
+    manager = SemanticQueryManager.__new__(SemanticQueryManager)
+    manager.logger = logging.getLogger(__name__)
+    manager.activated_repo_manager = MagicMock()
+    manager.background_job_manager = MagicMock()
+    return manager
+
+
+def _result(path: str, line: int = 1, score: float = 0.5) -> QueryResult:
+    return QueryResult(
+        file_path=path,
+        line_number=line,
+        code_snippet=f"snippet {path}",
+        similarity_score=score,
+        repository_alias="repo",
+    )
+
+
+def _leg(results: List[QueryResult], delay: float = 0.0, error=None):
+    def run() -> List[QueryResult]:
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return results
+
+    return run
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_executor():
+    with patch(
+        "code_indexer.server.services.search_service._get_query_executor",
+        return_value=None,
+    ):
+        yield
+
+
+class TestExecuteHybridSearch:
+    def test_legs_run_concurrently(self):
+        manager = _make_manager()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def leg(results):
+            def run():
+                barrier.wait()  # deadlocks unless both legs run at once
+                time.sleep(0.2)
+                return results
+
+            return run
+
+        start = time.monotonic()
+        merged = manager._execute_hybrid_search(
+            fts_leg=leg([_result("a.py")]),
+            semantic_leg=leg([_result("b.py")]),
+            repository_alias="repo",
+            limit=10,
+        )
+
+        assert time.monotonic() - start < 0.39
+        assert {r.file_path for r in merged} == {"a.py", "b.py"}
+
+    def test_leg_missing_deadline_returns_partial_results(self):
+        manager = _make_manager()
+        partial: List[str] = []
+
+        start = time.monotonic()
+        merged = manager._execute_hybrid_search(
+            fts_leg=_leg([_result("a.py")]),
+            semantic_leg=_leg([_result("b.py")], delay=2.0),
+            repository_alias="repo",
+            limit=10,
+            semantic_deadline_seconds=0.2,
+            _hybrid_partial_out=partial,
+        )
+
+        assert time.monotonic() - start < 1.0
+        assert [r.file_path for r in merged] == ["a.py"]
+        assert partial == ["repo:semantic"]
+
+    def test_failed_leg_is_partial_and_both_failing_raises(self):
+        manager = _make_manager()
+        partial: List[str] = []
+
+        merged = manager._execute_hybrid_search(
+            fts_leg=_leg([], error=RuntimeError("FTS index not available")),
+            semantic_leg=_leg([_result("b.py")]),
+            repository_alias="repo",
+            limit=10,
+            _hybrid_partial_out=partial,
+        )
+        assert [r.file_path for r in merged] == ["b.py"]
+        assert partial == ["repo:fts"]
+
+        with pytest.raises(RuntimeError, match="FTS index"):
+            manager._execute_hybrid_search(
+                fts_leg=_leg([], error=RuntimeError("FTS index not available")),
+                semantic_leg=_leg([], error=RuntimeError("embedding failed")),
+                repository_alias="repo",
+                limit=10,
+            )
+
+    def test_both_legs_missing_deadline_times_out(self):
+        with pytest.raises(TimeoutError):
+            _make_manager()._execute_hybrid_search(
+                fts_leg=_leg([], delay=1.0),
+                semantic_leg=_leg([], delay=1.0),
+                repository_alias="repo",
+                limit=10,
+                fts_deadline_seconds=0.1,
+                semantic_deadline_seconds=0.1,
+            )
+
+
+def test_merge_keeps_rrf_order_and_prefers_fts_content():
+    fts = [_result("a.py"), _result("shared.py")]
+    semantic = [_result("shared.py"), _result("c.py")]
+    semantic[0].code_snippet = "semantic content"
+
+    merged = _make_manager()._merge_hybrid_results(fts, semantic, limit=2)
+
+    assert [r.file_path for r in merged] == ["shared.py", "a.py"]
+    assert merged[0].code_snippet == "snippet shared.py"
+    assert merged[0].similarity_score == pytest.approx(1 / 62 + 1 / 61)
+
+
+def test_metadata_flags_partial_results():
+    metadata = QueryMetadata(
+        query_text="q",
+        execution_time_ms=1,
+        repositories_searched=1,
+        timeout_occurred=False,
+        missing_hybrid_legs=["repo:semantic"],
+    )
+
+    assert metadata.to_dict()["partial_results"] is True
+    assert metadata.to_dict()["missing_hybrid_legs"] == ["repo:semantic"]
+    assert "partial_results" not in QueryMetadata("q", 1, 1, False).to_dict()
@@ -0,0 +1,99 @@
+"""Tests for materialized repository statistics (full walk + git-diff updates)."""
+
+import json
+import subprocess
+
+import pytest
+
+from code_indexer.server.repositories.repository_stats import (
+    compute_repository_stats,
+    get_repository_stats,
+    load_repository_stats,
+    materialize_repository_stats,
+    update_repository_stats,
+)
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+
+
+def _commit_all(repo, message):
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / "repo"
+    path.mkdir()
+    _git(path, "init", "-q")
+    _git(path, "config", "user.email", "test@example.com")
+    _git(path, "config", "user.name", "Test")
+    (path / "src").mkdir()
+    (path / "src" / "main.py").write_text("print('hello')\n")
+    (path / "src" / "util.js").write_text("export const x = 1;\n")
+    (path / "README.md").write_text("# Readme\n")
+    (path / ".github").mkdir()
+    (path / ".github" / "ci.yml").write_text("on: push\n")
+    _commit_all(path, "initial")
+    return path
+
+
+def _comparable(stats):
+    data = stats.to_dict()
+    for key in ("stats_as_of", "metadata_size_bytes", "total_size_bytes"):
+        data.pop(key)
+    return data
+
+
+def test_full_walk_excludes_metadata_dirs(repo):
+    stats = compute_repository_stats(str(repo))
+
+    assert stats.file_count == 4
+    assert stats.indexable_file_count == 2
+    assert stats.by_language == {
+        "python": 1,
+        "javascript": 1,
+        "markdown": 1,
+        "yaml": 1,
+    }
+    assert stats.total_size_bytes > stats.working_size_bytes
+    assert stats.commit is not None and stats.stats_as_of
+
+
+def test_incremental_update_matches_full_recompute(repo):
+    materialize_repository_stats(str(repo))
+
+    (repo / "src" / "main.py").write_text("print('hello, world')\n" * 50)
+    (repo / "src" / "util.js").unlink()
+    (repo / "src" / "new.go").write_text("package main\n")
+    (repo / "docs").mkdir()
+    (repo / "docs" / "guide.md").write_text("guide\n")
+    _commit_all(repo, "change")
+
+    updated = update_repository_stats(str(repo))
+
+    assert _comparable(updated) == _comparable(compute_repository_stats(str(repo)))
+    assert load_repository_stats(str(repo)).commit == updated.commit
+    assert "javascript" not in updated.by_language
+
+
+def test_update_without_usable_record_recomputes(repo):
+    stored = materialize_repository_stats(str(repo))
+    stored.commit = "0" * 40
+    stored.file_count = 999
+    (repo / ".code-indexer" / "repo_stats.json").write_text(
+        json.dumps(stored.to_dict())
+    )
+
+    updated = update_repository_stats(str(repo))
+
+    assert updated.file_count == 4
+
+
+def test_get_materializes_once(repo):
+    first = get_repository_stats(str(repo))
+    (repo / "untracked.py").write_text("x = 1\n")
+
+    assert get_repository_stats(str(repo)).file_count == first.file_count == 4
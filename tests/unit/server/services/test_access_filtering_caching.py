@@ -356,3 +356,100 @@ class TestGroupAccessManagerCallbackPattern:
         assert call_count[0] == 1, (
             f"Expected callback count to stay at 1 (no duplicate fire), got {call_count[0]}"
         )
+
+
+# ---------------------------------------------------------------------------
+# Per-user access cache and fan-out pruning
+# ---------------------------------------------------------------------------
+
+
+class TestPerUserAccessCache:
+    """Per-user (is_admin, accessible repos) is cached and invalidated on change."""
+
+    def _count_user_group_lookups(self, group_access_manager):
+        call_count = [0]
+        original = group_access_manager.get_user_group
+
+        def counting(user_id):
+            call_count[0] += 1
+            return original(user_id)
+
+        group_access_manager.get_user_group = counting
+        return call_count
+
+    def test_repeated_checks_resolve_membership_once(
+        self, service, group_access_manager
+    ):
+        powerusers = group_access_manager.get_group_by_name("powerusers")
+        group_access_manager.assign_user_to_group("alice", powerusers.id, "admin")
+        call_count = self._count_user_group_lookups(group_access_manager)
+
+        assert not service.is_admin_user("alice")
+        assert service.get_accessible_repos("alice") == {
+            "cidx-meta",
+            "repo-a",
+            "repo-b",
+        }
+        service.filter_query_results([{"repository_alias": "repo-a"}], "alice")
+
+        assert call_count[0] == 1
+
+    def test_membership_change_invalidates_immediately(
+        self, service, group_access_manager
+    ):
+        users = group_access_manager.get_group_by_name("users")
+        admins = group_access_manager.get_group_by_name("admins")
+        group_access_manager.assign_user_to_group("bob", users.id, "admin")
+        assert not service.is_admin_user("bob")
+
+        group_access_manager.assign_user_to_group("bob", admins.id, "admin")
+
+        assert service.is_admin_user("bob")
+
+    def test_revoke_invalidates_immediately(self, service, group_access_manager):
+        powerusers = group_access_manager.get_group_by_name("powerusers")
+        group_access_manager.assign_user_to_group("carol", powerusers.id, "admin")
+        assert "repo-b" in service.get_accessible_repos("carol")
+
+        group_access_manager.revoke_repo_access("repo-b", powerusers.id)
+
+        assert "repo-b" not in service.get_accessible_repos("carol")
+
+    def test_entry_expires_after_ttl(self, service, group_access_manager):
+        powerusers = group_access_manager.get_group_by_name("powerusers")
+        group_access_manager.assign_user_to_group("dave", powerusers.id, "admin")
+        call_count = self._count_user_group_lookups(group_access_manager)
+        service.is_admin_user("dave")
+
+        real_monotonic = __import__("time").monotonic
+        with patch(
+            "code_indexer.server.services.access_filtering_service.time.monotonic",
+            return_value=real_monotonic() + service.ACCESS_CACHE_TTL + 1,
+        ):
+            service.is_admin_user("dave")
+
+        assert call_count[0] == 2
+
+
+class TestFilterRepoAliases:
+    """filter_repo_aliases prunes omni/multi-search targets before fan-out."""
+
+    def test_restricted_user_keeps_only_accessible_targets(
+        self, service, group_access_manager
+    ):
+        powerusers = group_access_manager.get_group_by_name("powerusers")
+        group_access_manager.assign_user_to_group("erin", powerusers.id, "admin")
+
+        pruned = service.filter_repo_aliases(
+            ["repo-c-global", "repo-a-global", "cidx-meta-global", "repo-b"],
+            "erin",
+        )
+
+        assert pruned == ["repo-a-global", "cidx-meta-global", "repo-b"]
+
+    def test_admin_keeps_all_targets(self, service, group_access_manager):
+        admins = group_access_manager.get_group_by_name("admins")
+        group_access_manager.assign_user_to_group("root", admins.id, "system")
+        aliases = ["repo-c-global", "unknown-global"]
+
+        assert service.filter_repo_aliases(aliases, "root") == aliases
@@ -0,0 +1,91 @@
+"""Tests for shared dashboard snapshots."""
+
+import threading
+import time
+from unittest.mock import patch
+
+from code_indexer.server.services.dashboard_service import (
+    DashboardService,
+    JobCounts,
+    RepoCounts,
+)
+from code_indexer.server.services.dashboard_snapshot import DashboardSnapshotCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_snapshot_is_shared_until_refresh_interval_elapses():
+    clock = _Clock()
+    cache = DashboardSnapshotCache(refresh_seconds=5, clock=clock)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get("k", compute) == 1
+    clock.now = 4.9
+    assert cache.get("k", compute) == 1
+    clock.now = 5.0
+    assert cache.get("k", compute) == 2
+
+    stats = cache.get_stats()
+    assert (stats.hit_count, stats.compute_count) == (1, 2)
+
+
+def test_concurrent_polls_compute_once():
+    cache = DashboardSnapshotCache(refresh_seconds=60)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.1)
+        return "snapshot"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("k", compute)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["snapshot"] * 8
+    assert len(calls) == 1
+
+
+def test_zero_interval_disables_caching():
+    cache = DashboardSnapshotCache(refresh_seconds=0)
+    values = iter(range(3))
+
+    assert [cache.get("k", lambda: next(values)) for _ in range(3)] == [0, 1, 2]
+
+
+def test_dashboard_pollers_share_caller_independent_aggregates():
+    service = DashboardService(snapshots=DashboardSnapshotCache(refresh_seconds=60))
+
+    with (
+        patch.object(service, "_get_job_counts", return_value=JobCounts(running=2)),
+        patch.object(
+            service, "_get_repo_counts", return_value=RepoCounts(golden=3)
+        ) as repo_counts,
+        patch.object(service, "_get_recent_jobs", return_value=[]) as recent_jobs,
+    ):
+        for username in ("alice", "bob", "carol"):
+            service.get_stats_partial(username, user_role="admin")
+        service.get_stats_partial("dave", user_role="user")
+        service.invalidate_snapshots()
+        data = service.get_dashboard_data("alice", user_role="admin")
+
+    # Admins share one repo-count snapshot; a normal user gets their own.
+    assert repo_counts.call_count == 3
+    assert recent_jobs.call_count == 2
+    assert data.job_counts.running == 2
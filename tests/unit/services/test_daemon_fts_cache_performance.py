@@ -19,6 +19,8 @@ import json
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from code_indexer.daemon.result_codec import pack_response
+
 
 @pytest.fixture
 def test_project_with_fts(tmp_path):
@@ -208,11 +210,13 @@ def test_daemon_routing_fts_queries():
 
     # Mock the daemon connection and response
     mock_conn = MagicMock()
-    mock_conn.root.exposed_query_fts.return_value = {
-        "results": [{"path": "test.py", "line": 1, "score": 0.9}],
-        "query": "hello",
-        "total": 1,
-    }
+    mock_conn.root.exposed_query_fts_packed.return_value = pack_response(
+        {
+            "results": [{"path": "test.py", "line": 1, "score": 0.9}],
+            "query": "hello",
+            "total": 1,
+        }
+    )
 
     with (
         patch("code_indexer.cli_daemon_delegation._find_config_file") as mock_find,
@@ -231,8 +235,8 @@ def test_daemon_routing_fts_queries():
         )
 
         # Verify exposed_query_fts was called
-        mock_conn.root.exposed_query_fts.assert_called_once()
-        call_args = mock_conn.root.exposed_query_fts.call_args
+        mock_conn.root.exposed_query_fts_packed.assert_called_once()
+        call_args = mock_conn.root.exposed_query_fts_packed.call_args
 
         # Verify correct parameters
         assert call_args[0][1] == "hello", "Query text should be passed"
@@ -0,0 +1,214 @@
+"""
+Unit tests for batched, debounced FTS commits in watch mode.
+
+FTSWatchHandler accumulates file events over a debounce window and applies
+them through TantivyIndexManager.apply_batch(), which replaces/deletes every
+path in one writer transaction with a single commit.
+"""
+
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from code_indexer.services.fts_watch_handler import (
+    MAX_RETRY_DELAY_SECONDS,
+    FTSWatchHandler,
+)
+from code_indexer.services.tantivy_index_manager import TantivyIndexManager
+
+
+def _doc(path: str, content: str) -> dict:
+    return {
+        "path": path,
+        "content": content,
+        "content_raw": content,
+        "identifiers": content.split(),
+        "line_start": 1,
+        "line_end": 1,
+        "language": "python",
+    }
+
+
+@pytest.fixture
+def tantivy_manager(tmp_path: Path):
+    manager = TantivyIndexManager(tmp_path / "tantivy_index")
+    manager.initialize_index(create_new=True)
+    return manager
+
+
+@pytest.fixture
+def handler(tantivy_manager, tmp_path: Path):
+    config = SimpleNamespace(codebase_dir=tmp_path, file_extensions=["py"])
+    handler = FTSWatchHandler(tantivy_manager, config, debounce_seconds=60)
+    with patch.object(handler, "_should_include_file", return_value=True):
+        yield handler
+    if handler._flush_timer is not None:
+        handler._flush_timer.cancel()
+
+
+def _event(path: Path, dest: Path = None) -> SimpleNamespace:
+    return SimpleNamespace(is_directory=False, src_path=str(path), dest_path=dest)
+
+
+class TestApplyBatch:
+    @pytest.mark.slow
+    def test_updates_and_deletes_in_one_commit(self, tantivy_manager):
+        tantivy_manager.apply_batch({"/a.py": _doc("/a.py", "alpha")})
+        with patch.object(
+            tantivy_manager, "_commit_inner", wraps=tantivy_manager._commit_inner
+        ) as commit:
+            result = tantivy_manager.apply_batch(
+                {
+                    "/b.py": _doc("/b.py", "bravo"),
+                    "/c.py": _doc("/c.py", "charlie"),
+                },
+                ["/a.py"],
+            )
+
+        assert commit.call_count == 1
+        assert result["documents_updated"] == 2
+        assert result["documents_deleted"] == 1
+        assert result["commit_ms"] >= 0
+        assert result["segment_count"] >= 1
+        assert tantivy_manager.get_document_count() == 2
+        assert tantivy_manager.search("alpha", limit=5) == []
+
+    @pytest.mark.slow
+    def test_update_replaces_existing_document(self, tantivy_manager):
+        tantivy_manager.apply_batch({"/a.py": _doc("/a.py", "alpha")})
+        tantivy_manager.apply_batch({"/a.py": _doc("/a.py", "omega")})
+
+        assert tantivy_manager.get_document_count() == 1
+        assert [r["path"] for r in tantivy_manager.search("omega", limit=5)] == [
+            "/a.py"
+        ]
+
+    def test_invalid_document_rejected_before_writing(self, tantivy_manager):
+        with pytest.raises(ValueError):
+            tantivy_manager.apply_batch({"/a.py": {"path": "/a.py"}})
+        assert tantivy_manager.get_document_count() == 0
+
+
+class TestDebouncedWatchHandler:
+    def test_events_accumulate_until_flush(self, handler, tmp_path: Path):
+        files = [tmp_path / f"f{i}.py" for i in range(5)]
+        for i, f in enumerate(files):
+            f.write_text(f"def func_{i}(): pass")
+            handler.on_modified(_event(f))
+            handler.on_modified(_event(f))  # Repeated saves coalesce
+
+        assert handler.tantivy_manager.get_document_count() == 0
+
+        with patch.object(
+            handler.tantivy_manager,
+            "_commit_inner",
+            wraps=handler.tantivy_manager._commit_inner,
+        ) as commit:
+            handler.flush()
+
+        assert commit.call_count == 1
+        assert handler.tantivy_manager.get_document_count() == 5
+        stats = handler.get_statistics()
+        assert stats["fts_files_updated"] == 5
+        assert stats["fts_commits"] == 1
+        assert stats["fts_last_batch_size"] == 5
+        assert stats["fts_segment_count"] >= 1
+
+    def test_delete_after_modify_wins(self, handler, tmp_path: Path):
+        f = tmp_path / "gone.py"
+        f.write_text("x = 1")
+        handler.on_modified(_event(f))
+        f.unlink()
+        handler.on_deleted(_event(f))
+
+        assert handler.pending_updates == set()
+        assert handler.pending_deletes == {f}
+
+    def test_vanished_file_is_deleted(self, handler, tmp_path: Path):
+        manager = MagicMock()
+        manager.apply_batch.return_value = {
+            "documents_updated": 0,
+            "documents_deleted": 1,
+            "commit_ms": 1.0,
+            "segment_count": 1,
+        }
+        handler.tantivy_manager = manager
+        handler.on_modified(_event(tmp_path / "missing.py"))
+
+        handler.flush()
+
+        manager.apply_batch.assert_called_once_with({}, [str(tmp_path / "missing.py")])
+
+    def test_timer_flushes_after_debounce(self, handler, tmp_path: Path):
+        handler.debounce_seconds = 0.05
+        f = tmp_path / "a.py"
+        f.write_text("def a(): pass")
+        handler.on_modified(_event(f))
+
+        for _ in range(100):
+            if handler.commits_count:
+                break
+            time.sleep(0.05)
+
+        assert handler.commits_count == 1
+        assert handler.tantivy_manager.get_document_count() == 1
+
+    def test_failed_batch_is_requeued(self, handler, tmp_path: Path):
+        f = tmp_path / "a.py"
+        f.write_text("def a(): pass")
+        handler.on_modified(_event(f))
+
+        with patch.object(
+            handler.tantivy_manager, "apply_batch", side_effect=RuntimeError("boom")
+        ):
+            handler.flush()
+
+        assert handler.pending_updates == {f}
+        assert handler.commits_count == 0
+
+    def test_failed_batch_is_retried_with_backoff(self, handler, tmp_path: Path):
+        handler.debounce_seconds = 0.2
+        f = tmp_path / "a.py"
+        f.write_text("def a(): pass")
+        handler.on_modified(_event(f))
+        handler._flush_timer.cancel()
+
+        with patch.object(
+            handler.tantivy_manager, "apply_batch", side_effect=RuntimeError("boom")
+        ):
+            handler.flush()
+            first_retry = handler._flush_timer
+            assert first_retry is not None
+            assert first_retry.interval == pytest.approx(0.4)
+            first_retry.cancel()
+
+            handler.flush()
+            second_retry = handler._flush_timer
+            assert second_retry.interval == pytest.approx(0.8)
+
+        # No further file events: the re-armed timer alone commits the batch
+        for _ in range(100):
+            if handler.commits_count:
+                break
+            time.sleep(0.05)
+
+        assert handler.commits_count == 1
+        assert handler.pending_updates == set()
+        assert handler._failed_flushes == 0
+
+    def test_retry_delay_is_capped(self, handler, tmp_path: Path):
+        f = tmp_path / "a.py"
+        f.write_text("def a(): pass")
+        handler.on_modified(_event(f))
+
+        with patch.object(
+            handler.tantivy_manager, "apply_batch", side_effect=RuntimeError("boom")
+        ):
+            for _ in range(5):
+                handler.flush()
+
+        assert handler._failed_flushes == 5
+        assert handler._flush_timer.interval == MAX_RETRY_DELAY_SECONDS
@@ -0,0 +1,135 @@
+"""Tests for the CLI/daemon on-disk query embedding cache."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from code_indexer.config import Config, QueryEmbeddingDiskCacheConfig
+from code_indexer.services.query_embedding_disk_cache import (
+    QueryEmbeddingDiskCache,
+    get_query_embedding_disk_cache,
+    install_query_embedding_cache,
+)
+from code_indexer.storage.filesystem_vector_store import FilesystemVectorStore
+
+DIM = 8
+COLLECTION = "voyage-code-3"
+
+
+class TestQueryEmbeddingDiskCache:
+    def test_round_trip_with_whitespace_normalization(self, tmp_path):
+        cache = QueryEmbeddingDiskCache(tmp_path / "cache.db")
+        cache.put("voyage-ai", "voyage-code-3", 4, "auth  flow\n", [0.5, 1, 2, 3])
+
+        assert cache.get("voyage-ai", "voyage-code-3", 4, " auth flow") == [
+            0.5,
+            1.0,
+            2.0,
+            3.0,
+        ]
+        assert cache.get("voyage-ai", "voyage-code-3", 4, "Auth flow") is None
+        assert cache.get("cohere", "voyage-code-3", 4, "auth flow") is None
+        assert cache.get("voyage-ai", "voyage-code-3", 8, "auth flow") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = QueryEmbeddingDiskCache(tmp_path / "cache.db", max_entries=2)
+        cache.put("p", "m", 1, "a", [1.0])
+        cache.put("p", "m", 1, "b", [2.0])
+        cache.get("p", "m", 1, "a")  # refresh "a"
+        cache.put("p", "m", 1, "c", [3.0])
+
+        assert len(cache) == 2
+        assert cache.get("p", "m", 1, "b") is None
+        assert cache.get("p", "m", 1, "a") == [1.0]
+
+    def test_persists_across_instances(self, tmp_path):
+        QueryEmbeddingDiskCache(tmp_path / "cache.db").put("p", "m", 1, "q", [7.0])
+
+        assert QueryEmbeddingDiskCache(tmp_path / "cache.db").get("p", "m", 1, "q") == [
+            7.0
+        ]
+
+    def test_install_respects_config(self, tmp_path):
+        config = Config(
+            codebase_dir=tmp_path,
+            query_embedding_cache=QueryEmbeddingDiskCacheConfig(
+                path=str(tmp_path / "c.db")
+            ),
+        )
+        cache = install_query_embedding_cache(config)
+        assert cache is get_query_embedding_disk_cache()
+        assert cache is not None and cache.db_path == tmp_path / "c.db"
+
+        config.query_embedding_cache.enabled = False
+        assert install_query_embedding_cache(config) is None
+        assert get_query_embedding_disk_cache() is None
+
+
+def _provider(vector) -> MagicMock:
+    provider = MagicMock()
+    provider.get_provider_name.return_value = "voyage-ai"
+    provider.get_current_model.return_value = COLLECTION
+    provider.get_model_info.return_value = {"dimensions": DIM}
+    provider.get_embedding.return_value = vector
+    return provider
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> FilesystemVectorStore:
+    store = FilesystemVectorStore(tmp_path / "index", project_root=tmp_path)
+    store.create_collection(COLLECTION, vector_size=DIM)
+    store.begin_indexing(COLLECTION)
+    store.upsert_points(
+        COLLECTION,
+        [
+            {
+                "id": f"p{i}",
+                "vector": np.random.default_rng(i).standard_normal(DIM).tolist(),
+                "payload": {"path": f"f{i}.py", "type": "content"},
+            }
+            for i in range(5)
+        ],
+    )
+    store.end_indexing(COLLECTION)
+    return store
+
+
+def _search(store, provider, **kwargs):
+    return store.search(
+        query="find auth",
+        embedding_provider=provider,
+        collection_name=COLLECTION,
+        limit=2,
+        return_timing=True,
+        **kwargs,
+    )
+
+
+class TestStoreUsesDiskCache:
+    def test_second_query_skips_provider(self, store, tmp_path):
+        install_query_embedding_cache(Config(codebase_dir=tmp_path))
+        provider = _provider(np.random.default_rng(3).standard_normal(DIM).tolist())
+
+        first, first_timing = _search(store, provider)
+        second, second_timing = _search(store, provider)
+
+        provider.get_embedding.assert_called_once()
+        assert first_timing["embedding_cache"] == "miss"
+        assert second_timing["embedding_cache"] == "hit"
+        assert "embedding_cache_lookup_ms" in second_timing
+        assert [r["id"] for r in second] == [r["id"] for r in first]
+        assert first[0]["id"] == "p3"
+
+    def test_not_consulted_without_install_or_with_shortcut_off(self, store, tmp_path):
+        provider = _provider([0.1] * DIM)
+
+        _, timing = _search(store, provider)
+        assert "embedding_cache" not in timing
+
+        install_query_embedding_cache(Config(codebase_dir=tmp_path))
+        _search(store, provider)
+        _search(store, provider, no_embedding_cache_shortcut=True)
+
+        assert provider.get_embedding.call_count == 3
@@ -0,0 +1,84 @@
+"""Tests for streaming (iter_search) and cursor-paged (search_page) FTS search."""
+
+from unittest.mock import patch
+
+import pytest
+
+from code_indexer.services import tantivy_index_manager as tim
+from code_indexer.services.tantivy_index_manager import TantivyIndexManager
+
+
+@pytest.fixture
+def populated_index(tmp_path):
+    manager = TantivyIndexManager(tmp_path / "tantivy_index")
+    manager.initialize_index(create_new=True)
+    for i in range(60):
+        content = f"def handler_{i}():\n    return dispatch(event)\n"
+        manager.add_document(
+            {
+                "path": f"src/{'tests' if i % 3 == 0 else 'app'}/mod_{i}.py",
+                "content": content,
+                "content_raw": content,
+                "identifiers": [f"handler_{i}", "dispatch"],
+                "line_start": 1,
+                "line_end": 2,
+                "language": "py",
+            }
+        )
+    manager.commit()
+    return manager
+
+
+def _keys(results):
+    return [(r["path"], r["line"], r["column"]) for r in results]
+
+
+def test_iter_search_yields_same_results_as_unlimited_search(populated_index):
+    with patch.object(tim, "STREAM_FIRST_BATCH", 7):
+        streamed = list(
+            populated_index.iter_search("dispatch", snippet_lines=0, cursor=0)
+        )
+
+    assert _keys(streamed) == _keys(populated_index.search("dispatch", limit=0))
+    assert len(streamed) == 60
+
+
+def test_iter_search_extracts_snippets_only_for_consumed_hits(populated_index):
+    with patch.object(
+        TantivyIndexManager,
+        "_extract_snippet",
+        autospec=True,
+        side_effect=TantivyIndexManager._extract_snippet,
+    ) as extract:
+        results = populated_index.iter_search("dispatch", snippet_lines=2)
+        first = next(results)
+
+    assert "dispatch" in first["snippet"]
+    assert extract.call_count == 1
+
+
+def test_search_page_cursor_walks_filtered_results(populated_index):
+    expected = _keys(
+        populated_index.search("dispatch", limit=0, exclude_paths=["*/tests/*"])
+    )
+
+    pages, cursor = [], 0
+    while cursor is not None:
+        page, cursor = populated_index.search_page(
+            "dispatch",
+            page_size=15,
+            cursor=cursor,
+            snippet_lines=0,
+            exclude_paths=["*/tests/*"],
+        )
+        pages.append(page)
+
+    assert [len(p) for p in pages] == [15, 15, 10]
+    assert _keys([r for p in pages for r in p]) == expected
+
+
+def test_streaming_apis_validate_before_iterating(populated_index):
+    with pytest.raises(ValueError):
+        populated_index.iter_search("dispatch", edit_distance=5)
+    with pytest.raises(ValueError):
+        populated_index.search_page("dispatch", page_size=0)
@@ -0,0 +1,245 @@
+"""Tests for the branch visibility bitmap sidecar.
+
+BranchVisibilityMap keeps per-branch "hidden" bitmaps over point ordinals so
+branch switches do not rewrite payload.hidden_branches in every vector JSON
+file. FilesystemVectorStore overlays the bitmap on reads, keeps it in step on
+writes/deletes, and pushes must_not hidden_branches filters into hnswlib.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from code_indexer.services.high_throughput_processor import HighThroughputProcessor
+from code_indexer.storage.branch_visibility import (
+    BRANCH_VISIBILITY_FILENAME,
+    BranchVisibilityMap,
+)
+from code_indexer.storage.filesystem_vector_store import FilesystemVectorStore
+from code_indexer.storage.hnsw_index_manager import HNSWIndexManager
+
+DIM = 16
+COLLECTION = "coll"
+
+
+class TestBranchVisibilityMap:
+    def test_hide_show_and_hidden_branches(self):
+        vis = BranchVisibilityMap()
+        assert vis.hide("main", ["a", "b"]) == 2
+        assert vis.hide("main", ["a"]) == 0
+        vis.hide("dev", ["a"])
+
+        assert vis.hidden_branches("a") == ["dev", "main"]
+        assert vis.is_hidden("main", "b")
+        assert vis.show("main", ["b", "unknown"]) == 1
+        assert not vis.is_hidden("main", "b")
+        assert vis.hidden_point_ids(["main", "dev"]) == {"a"}
+
+    def test_set_hidden_branches_replaces_exact_set(self):
+        vis = BranchVisibilityMap()
+        vis.hide("main", ["a"])
+        assert vis.set_hidden_branches("a", ["dev"])
+        assert vis.hidden_branches("a") == ["dev"]
+        assert not vis.set_hidden_branches("a", ["dev"])
+
+    def test_round_trip_and_compaction(self, tmp_path: Path):
+        vis = BranchVisibilityMap()
+        ids = [f"p{i}" for i in range(10)] + [""]
+        vis.hide("main", ids)
+        vis.remove_points([f"p{i}" for i in range(8)])
+
+        path = tmp_path / BRANCH_VISIBILITY_FILENAME
+        vis.save(path)
+        loaded = BranchVisibilityMap.load(path)
+
+        # Removed points were compacted away; falsy-but-valid ids survive
+        assert loaded._point_ids == ["p8", "p9", ""]
+        assert loaded.hidden_point_ids(["main"]) == {"p8", "p9", ""}
+        assert loaded.is_hidden("main", "")
+
+    def test_load_rejects_unknown_version(self, tmp_path: Path):
+        path = tmp_path / BRANCH_VISIBILITY_FILENAME
+        import msgpack
+
+        path.write_bytes(msgpack.packb({"version": 99, "point_ids": [], "hidden": {}}))
+        with pytest.raises(ValueError, match="Unsupported"):
+            BranchVisibilityMap.load(path)
+
+
+def _point(point_id: str, path: str, seed: int, hidden=None) -> dict:
+    payload = {"path": path, "type": "content", "language": "py"}
+    if hidden is not None:
+        payload["hidden_branches"] = hidden
+    return {
+        "id": point_id,
+        "vector": np.random.default_rng(seed).standard_normal(DIM).tolist(),
+        "payload": payload,
+        "chunk_text": f"text of {point_id}",
+    }
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> FilesystemVectorStore:
+    store = FilesystemVectorStore(tmp_path / "index", project_root=tmp_path)
+    store.create_collection(COLLECTION, vector_size=DIM)
+    store.begin_indexing(COLLECTION)
+    store.upsert_points(
+        COLLECTION,
+        [
+            _point("a1", "a.py", 1),
+            _point("a2", "a.py", 2),
+            _point("b1", "b.py", 3),
+            _point("c1", "c.py", 4),
+        ],
+    )
+    store.end_indexing(COLLECTION)
+    return store
+
+
+def _json_payload(store: FilesystemVectorStore, point_id: str) -> dict:
+    vector_file = store._id_index[COLLECTION][point_id]
+    return json.loads(vector_file.read_text())["payload"]
+
+
+class TestStoreBranchVisibility:
+    def test_update_hides_files_without_rewriting_vectors(self, store):
+        with patch.object(store, "_atomic_write_json") as write_json:
+            changed = store.update_branch_visibility(
+                COLLECTION, "main", hide_files=["a.py"]
+            )
+
+        assert changed == 2
+        write_json.assert_not_called()
+        assert "hidden_branches" not in _json_payload(store, "a1")
+        assert store.get_point("a1", COLLECTION)["payload"]["hidden_branches"] == [
+            "main"
+        ]
+        assert "hidden_branches" not in store.get_point("b1", COLLECTION)["payload"]
+
+        store.update_branch_visibility(COLLECTION, "main", show_files=["a.py"])
+        assert "hidden_branches" not in store.get_point("a1", COLLECTION)["payload"]
+
+    def test_sidecar_is_shared_between_store_instances(self, store, tmp_path):
+        store.update_branch_visibility(COLLECTION, "main", hide_files=["b.py"])
+
+        other = FilesystemVectorStore(tmp_path / "index", project_root=tmp_path)
+        points, _ = other.scroll_points(COLLECTION, limit=10)
+        hidden = {p["id"]: p["payload"].get("hidden_branches") for p in points}
+        assert hidden["b1"] == ["main"]
+        assert hidden["a1"] is None
+
+    def test_migrates_legacy_payload_hidden_branches(self, store):
+        store._batch_update_payload_only(
+            [{"id": "c1", "payload": {"hidden_branches": ["old"]}}], COLLECTION
+        )
+
+        store.update_branch_visibility(COLLECTION, "main", hide_files=["a.py"])
+
+        assert store.get_point("c1", COLLECTION)["payload"]["hidden_branches"] == [
+            "old"
+        ]
+        store.update_branch_visibility(COLLECTION, "old", show_files=["c.py"])
+        assert store.get_point("c1", COLLECTION)["payload"]["hidden_branches"] == []
+
+    def test_rewriting_a_point_resets_its_visibility(self, store):
+        store.update_branch_visibility(COLLECTION, "main", hide_files=["a.py"])
+
+        store.upsert_points(COLLECTION, [_point("a1", "a.py", 1)])
+
+        assert "hidden_branches" not in store.get_point("a1", COLLECTION)["payload"]
+        # a2 was dropped as an orphan of a.py and is forgotten by the bitmap
+        vis = store._get_branch_visibility(COLLECTION)
+        assert vis.hidden_point_ids(["main"]) == set()
+
+    def test_delete_forgets_points(self, store):
+        store.update_branch_visibility(COLLECTION, "main", hide_files=["a.py"])
+
+        store.delete_points(COLLECTION, ["a1"])
+
+        vis = store._get_branch_visibility(COLLECTION)
+        assert vis.hidden_point_ids(["main"]) == {"a2"}
+
+    def test_search_pushes_hidden_filter_into_hnsw(self, store):
+        store.update_branch_visibility(COLLECTION, "main", hide_files=["a.py"])
+        query = _point("q", "q.py", 1)["vector"]  # identical to a1
+
+        query_kwargs = []
+        real_query = HNSWIndexManager.query
+
+        def spy_query(self, *args, **kwargs):
+            query_kwargs.append(kwargs)
+            return real_query(self, *args, **kwargs)
+
+        with patch.object(HNSWIndexManager, "query", spy_query):
+            results = store.search(
+                query="q",
+                embedding_provider=MagicMock(),
+                collection_name=COLLECTION,
+                limit=10,
+                filter_conditions={
+                    "must_not": [{"key": "hidden_branches", "match": {"any": ["main"]}}]
+                },
+                precomputed_query_vector=query,
+            )
+
+        assert query_kwargs[0]["excluded_ids"] == {"a1", "a2"}
+        assert sorted(r["id"] for r in results) == ["b1", "c1"]
+
+    def test_unfiltered_search_overlays_payload(self, store):
+        store.update_branch_visibility(COLLECTION, "main", hide_files=["a.py"])
+
+        results = store.search(
+            query="q",
+            embedding_provider=MagicMock(),
+            collection_name=COLLECTION,
+            limit=10,
+            precomputed_query_vector=_point("q", "q.py", 1)["vector"],
+        )
+
+        hidden = {r["id"]: r["payload"].get("hidden_branches") for r in results}
+        assert hidden["a1"] == ["main"]
+        assert hidden["b1"] is None
+
+    def test_branch_aware_rebuild_reads_bitmap(self, store, tmp_path):
+        store.update_branch_visibility(COLLECTION, "main", hide_files=["a.py"])
+
+        manager = HNSWIndexManager(vector_dim=DIM, space="cosine")
+        count = manager.rebuild_from_vectors(
+            tmp_path / "index" / COLLECTION, current_branch="main"
+        )
+
+        assert count == 2
+
+
+class TestHighThroughputProcessorUsesBitmap:
+    def _processor(self, store: FilesystemVectorStore) -> HighThroughputProcessor:
+        processor = HighThroughputProcessor.__new__(HighThroughputProcessor)
+        processor.vector_store_client = store
+        processor.config = MagicMock(codebase_dir=Path("/nonexistent"))
+        import threading
+
+        processor._visibility_lock = threading.Lock()
+        processor._database_lock = threading.Lock()
+        return processor
+
+    def test_branch_isolation_skips_content_point_scan(self, store):
+        processor = self._processor(store)
+
+        with (
+            patch.object(processor, "_fetch_all_content_points") as fetch,
+            patch.object(store, "_batch_update_payload_only") as payload,
+        ):
+            processor.hide_files_not_in_branch_thread_safe(
+                "feature", ["a.py"], COLLECTION
+            )
+            processor._batch_ensure_files_visible_in_branch(
+                ["b.py"], "feature", COLLECTION, []
+            )
+
+        fetch.assert_not_called()
+        payload.assert_not_called()
+        vis = store._get_branch_visibility(COLLECTION)
+        assert vis.hidden_point_ids(["feature"]) == {"c1"}
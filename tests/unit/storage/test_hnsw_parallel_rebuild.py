@@ -0,0 +1,90 @@
+"""Tests for process-pool parsing and phase timings in rebuild_from_vectors."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from code_indexer.storage.hnsw_index_manager import HNSWIndexManager
+
+DIM = 16
+
+
+def _write_vectors(collection: Path, count: int) -> None:
+    collection.mkdir(parents=True, exist_ok=True)
+    (collection / "collection_meta.json").write_text(json.dumps({"vector_size": DIM}))
+    rng = np.random.default_rng(0)
+    for i in range(count):
+        shard = collection / f"{i % 4:02x}"
+        shard.mkdir(exist_ok=True)
+        payload = {"path": f"f{i}.py"}
+        if i % 5 == 0:
+            payload["hidden_branches"] = ["feature"]
+        (shard / f"vector_p{i}.json").write_text(
+            json.dumps(
+                {
+                    "id": f"p{i}",
+                    "vector": rng.standard_normal(DIM).tolist(),
+                    "payload": payload,
+                }
+            )
+        )
+    # Malformed and wrong-dimension files are skipped in both modes
+    (collection / "00" / "vector_bad.json").write_text("{not json")
+    (collection / "01" / "vector_short.json").write_text(
+        json.dumps({"id": "short", "vector": [0.1], "payload": {}})
+    )
+
+
+def _indexed_ids(manager: HNSWIndexManager, collection: Path) -> set:
+    _, id_to_label, _, _ = manager.load_for_incremental_update(collection)
+    return set(id_to_label)
+
+
+@pytest.fixture
+def collection(tmp_path: Path) -> Path:
+    path = tmp_path / "coll"
+    _write_vectors(path, 40)
+    return path
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"visible_files": {f"f{i}.py" for i in range(10)}},
+        {"current_branch": "feature"},
+    ],
+)
+def test_parallel_parse_matches_serial(collection, kwargs):
+    manager = HNSWIndexManager(vector_dim=DIM)
+
+    serial_count = manager.rebuild_from_vectors(collection, parse_workers=1, **kwargs)
+    serial_ids = _indexed_ids(manager, collection)
+    parallel_count = manager.rebuild_from_vectors(
+        collection, parse_workers=2, num_threads=2, **kwargs
+    )
+
+    assert parallel_count == serial_count
+    assert _indexed_ids(manager, collection) == serial_ids
+    if "current_branch" in kwargs:
+        assert "p5" not in serial_ids and "p6" in serial_ids
+
+
+def test_phase_timings_are_reported(collection):
+    manager = HNSWIndexManager(vector_dim=DIM)
+    messages = []
+
+    manager.rebuild_from_vectors(
+        collection,
+        progress_callback=lambda *args, info=None: messages.append(info),
+    )
+
+    assert set(manager.last_rebuild_timings) == {
+        "scan_ms",
+        "parse_ms",
+        "insert_ms",
+        "save_ms",
+    }
+    assert any(m and "HNSW rebuild phases" in m for m in messages)
@@ -0,0 +1,155 @@
+"""Tests for the int8 quantized candidate index and its search integration."""
+
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from code_indexer.storage.filesystem_vector_store import FilesystemVectorStore
+from code_indexer.storage.quantized_index import (
+    QUANTIZED_INDEX_FILENAME,
+    QuantizedVectorIndex,
+    ScalarQuantizer,
+)
+
+DIM = 32
+COLLECTION = "coll"
+
+_SCRIPT_PATH = (
+    Path(__file__).parents[3] / "scripts" / "analysis" / "quantized_recall_benchmark.py"
+)
+
+
+def _vectors(n: int, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).standard_normal((n, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class TestQuantizedVectorIndex:
+    def test_round_trip_error_is_within_one_level(self):
+        vectors = _vectors(500)
+        quantizer = ScalarQuantizer.calibrate(vectors, clip_percentile=0.0)
+
+        decoded = quantizer.decode(quantizer.encode(vectors))
+
+        assert np.all(np.abs(decoded - vectors) <= quantizer.scale * 0.5 + 1e-6)
+
+    def test_rescored_search_returns_exact_scores(self):
+        vectors = _vectors(300)
+        ids = [f"p{i}" for i in range(300)]
+        index = QuantizedVectorIndex.from_vectors(vectors, ids)
+
+        found, distances = index.search(
+            vectors[7], k=5, rescore=lambda c: [vectors[int(v[1:])] for v in c]
+        )
+
+        exact = 1.0 - vectors @ vectors[7]
+        assert found == [ids[i] for i in np.argsort(exact)[:5]]
+        assert distances == pytest.approx(sorted(exact)[:5], abs=1e-5)
+
+    def test_excluded_ids_are_skipped(self):
+        vectors = _vectors(50)
+        index = QuantizedVectorIndex.from_vectors(vectors, [f"p{i}" for i in range(50)])
+
+        found, _ = index.search(vectors[3], k=3, excluded_ids={"p3"})
+        assert "p3" not in found
+
+        everything = {f"p{i}" for i in range(50)}
+        assert index.search(vectors[3], k=3, excluded_ids=everything) == ([], [])
+
+    def test_save_and_load(self, tmp_path):
+        index = QuantizedVectorIndex.from_vectors(
+            _vectors(20), [f"p{i}" for i in range(20)], source_stamp=(5, 6)
+        )
+        path = tmp_path / QUANTIZED_INDEX_FILENAME
+        index.save(path)
+
+        loaded = QuantizedVectorIndex.load(path)
+
+        assert loaded is not None
+        assert loaded.ids == index.ids
+        assert loaded.source_stamp == (5, 6)
+        assert np.array_equal(loaded.codes, index.codes)
+        assert QuantizedVectorIndex.load(tmp_path / "missing.npz") is None
+
+    def test_benchmark_recall_against_float_hnsw(self):
+        spec = importlib.util.spec_from_file_location(
+            "quantized_recall_benchmark", _SCRIPT_PATH
+        )
+        assert spec is not None and spec.loader is not None
+        module: Any = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+
+        report = module.run_benchmark(
+            module.synthetic_corpus(2000, 64), n_queries=50, k=10
+        )
+
+        assert report.recall_int8_rescored >= 0.95
+        assert report.recall_int8_rescored >= report.recall_int8
+        assert report.int8_index_bytes * 3 < report.float_index_bytes
+
+
+def _point(i: int, vector: np.ndarray) -> dict:
+    return {
+        "id": f"p{i}",
+        "vector": vector.tolist(),
+        "payload": {"path": f"f{i}.py", "type": "content", "language": "py"},
+    }
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> FilesystemVectorStore:
+    store = FilesystemVectorStore(
+        tmp_path / "index", project_root=tmp_path, vector_quantization="int8"
+    )
+    store.create_collection(COLLECTION, vector_size=DIM)
+    store.begin_indexing(COLLECTION)
+    store.upsert_points(
+        COLLECTION, [_point(i, v) for i, v in enumerate(_vectors(40, seed=1))]
+    )
+    store.end_indexing(COLLECTION)
+    return store
+
+
+def _search(store: FilesystemVectorStore, vector: np.ndarray):
+    return store.search(
+        query="q",
+        embedding_provider=MagicMock(),
+        collection_name=COLLECTION,
+        limit=3,
+        return_timing=True,
+        precomputed_query_vector=vector.tolist(),
+    )
+
+
+class TestStoreQuantizedSearch:
+    def test_collection_records_mode_and_searches_int8(self, store, tmp_path):
+        vectors = _vectors(40, seed=1)
+        assert store.get_collection_info(COLLECTION)["vector_quantization"] == "int8"
+
+        results, timing = _search(store, vectors[11])
+
+        assert timing["search_path"] == "quantized_int8"
+        assert results[0]["id"] == "p11"
+        assert results[0]["score"] == pytest.approx(1.0, abs=1e-5)
+        assert (tmp_path / "index" / COLLECTION / QUANTIZED_INDEX_FILENAME).exists()
+
+    def test_hnsw_rebuild_invalidates_quantized_index(self, store, tmp_path):
+        _search(store, _vectors(40, seed=1)[0])
+        new_vector = _vectors(1, seed=99)[0]
+
+        store.begin_indexing(COLLECTION)
+        store.upsert_points(COLLECTION, [_point(100, new_vector)])
+        store.end_indexing(COLLECTION)
+
+        # A fresh store instance must not serve the stale persisted codes either
+        other = FilesystemVectorStore(tmp_path / "index", project_root=tmp_path)
+        results, timing = _search(other, new_vector)
+
+        assert timing["search_path"] == "quantized_int8"
+        assert results[0]["id"] == "p100"
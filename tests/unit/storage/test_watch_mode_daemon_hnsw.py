@@ -9,6 +9,7 @@ import threading
 from pathlib import Path
 from code_indexer.storage.filesystem_vector_store import FilesystemVectorStore
 from code_indexer.daemon.cache import CacheEntry
+from code_indexer.storage.hnsw_delta_log import HNSWDeltaLog
 
 
 @pytest.fixture
@@ -122,13 +123,12 @@ class TestDaemonModeDetection:
 class TestDaemonCacheInMemoryUpdates:
     """Test AC3: Daemon cache in-memory updates (no invalidation)."""
 
-    def test_cache_hnsw_updated_in_memory(
+    def test_cached_index_stays_valid_and_point_lands_in_delta(
         self, temp_store: FilesystemVectorStore, cache_entry: CacheEntry, sample_points
     ):
         """
-        AC3: Update cache_entry.hnsw_index directly via add_items().
-
-        RED: Will fail because current implementation doesn't update cache.
+        AC3: Watch updates go to the HNSW delta segment; the cached index
+        (still matching hnsw_index.bin) is neither mutated nor reloaded.
         """
         collection_name = "test_collection"
         temp_store.create_collection(collection_name, vector_size=128)
@@ -159,9 +159,14 @@ class TestDaemonCacheInMemoryUpdates:
         new_point = [sample_points[5]]
         temp_store.upsert_points(collection_name, new_point, watch_mode=True)
 
-        # Verify: cache HNSW index should have new vector
-        updated_count = cache_entry.hnsw_index.get_current_count()
-        assert updated_count > initial_count, "Cache HNSW should have new vector added"
+        # Verify: cached index untouched, new vector recorded in the delta
+        assert cache_entry.hnsw_index.get_current_count() == initial_count
+        delta = HNSWDeltaLog.load(
+            collection_path,
+            128,
+            FilesystemVectorStore._read_hnsw_rebuild_uuid(collection_path),
+        )
+        assert delta.hidden_ids == {sample_points[5]["id"]}
 
     def test_cache_not_invalidated_during_watch_update(
         self, temp_store: FilesystemVectorStore, cache_entry: CacheEntry, sample_points
@@ -252,11 +257,16 @@ class TestConcurrentQuerySupport:
         new_point = [sample_points[5]]
         temp_store.upsert_points(collection_name, new_point, watch_mode=True)
 
-        # Verify: cache was updated (functional verification)
+        # Verify: cache remains loaded and the update is searchable
         assert cache_entry.hnsw_index is not None, "Cache should remain loaded"
-        assert cache_entry.hnsw_index.get_current_count() == 6, (
-            "Cache should have 6 vectors"
+        results = temp_store.search(
+            collection_name=collection_name,
+            query="",
+            embedding_provider=None,
+            limit=1,
+            precomputed_query_vector=sample_points[5]["vector"],
         )
+        assert results[0]["id"] == sample_points[5]["id"]
 
     def test_query_waits_for_write_completion(
         self, temp_store: FilesystemVectorStore, cache_entry: CacheEntry, sample_points
@@ -0,0 +1,242 @@
+"""Unit tests for XRayFindingsCache and its use in XRaySearchEngine.run().
+
+Verifies:
+- get_many/put_many round-trip path-independent match lists
+- Entries are keyed by evaluator hash, language and content hash
+- LRU prune bounds the table
+- run() sends only cache misses to rust_backend.run_batch, preserves spec
+  order, and does not store files that produced evaluation errors
+- Changing a file's content makes it a miss again
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from unittest.mock import patch
+
+from code_indexer.xray.findings_cache import (
+    XRayFindingsCache,
+    restore_match,
+    sha256_hex,
+)
+
+EVALUATOR = 'return {"matches": [{"line_number": 1}], "value": None}'
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    c = XRayFindingsCache(tmp_path / "cache" / "findings.db")
+    yield c
+    c.close()
+
+
+class TestXRayFindingsCacheStorage:
+    def test_round_trip_strips_path_fields(self, cache: XRayFindingsCache) -> None:
+        match = {
+            "line_number": 3,
+            "file_path": "a/b.py",
+            "language": "python",
+            "pattern": "p",
+            "snippet": "s",
+            "line_content": "x = 1",
+        }
+        cache.put_many("ev", [("python", "h1", [match])])
+
+        found = cache.get_many("ev", [("python", "h1"), ("python", "h2")])
+
+        assert list(found) == [("python", "h1")]
+        stored = found[("python", "h1")]
+        assert "file_path" not in stored[0]
+        restored = restore_match(stored[0], "other/c.py", "python")
+        assert restored == {**match, "file_path": "other/c.py"}
+
+    def test_key_includes_evaluator_and_language(
+        self, cache: XRayFindingsCache
+    ) -> None:
+        cache.put_many("ev1", [("python", "h", [])])
+        assert cache.get_many("ev2", [("python", "h")]) == {}
+        assert cache.get_many("ev1", [("java", "h")]) == {}
+        assert cache.get_many("ev1", [("python", "h")]) == {("python", "h"): []}
+
+    def test_prune_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        c = XRayFindingsCache(tmp_path / "f.db", max_entries=2)
+        c.put_many("ev", [("python", "old", [])])
+        c.put_many("ev", [("python", "mid", [])])
+        c.put_many("ev", [("python", "new", [])])
+        c.get_many("ev", [("python", "old")])  # refresh "old"
+
+        assert c.prune() == 1
+        assert c.get_many("ev", [("python", "mid")]) == {}
+        assert c.get_stats()["entries"] == 2
+        c.close()
+
+    def test_rejects_non_positive_max_entries(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            XRayFindingsCache(tmp_path / "f.db", max_entries=0)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    root.mkdir()
+    (root / "a.py").write_text("needle = 1\n")
+    (root / "b.py").write_text("needle = 2\n")
+    return root
+
+
+@pytest.fixture
+def engine(cache: XRayFindingsCache):
+    pytest.importorskip("tree_sitter_languages", reason="xray extras not installed")
+    from code_indexer.xray.search_engine import XRaySearchEngine
+
+    return XRaySearchEngine(findings_cache=cache)
+
+
+def _recording_run_batch(calls: List[List[str]], errors_for: tuple = ()):
+    def _run_batch(*, evaluator_code: str, file_specs: List[Dict[str, Any]], **kw):
+        calls.append([s["file_path"] for s in file_specs])
+        results = []
+        for spec in file_specs:
+            if spec["file_path"] in errors_for:
+                results.append(([], [{"file_path": spec["file_path"]}], None))
+                continue
+            match = {
+                "line_number": 1,
+                "file_path": spec["file_path"],
+                "language": spec["lang"],
+                "pattern": "",
+                "snippet": "",
+                "line_content": "needle",
+            }
+            results.append(([match], [], None))
+        return results
+
+    return _run_batch
+
+
+def _run(engine, repo: Path) -> Dict[str, Any]:
+    return engine.run(
+        repo_path=repo,
+        driver_regex="needle",
+        evaluator_code=EVALUATOR,
+        search_target="content",
+    )
+
+
+class TestXRaySearchEngineFindingsCache:
+    def test_second_run_skips_rust_backend(self, engine, repo: Path) -> None:
+        calls: List[List[str]] = []
+        with patch.object(
+            engine.rust_backend, "run_batch", side_effect=_recording_run_batch(calls)
+        ):
+            first = _run(engine, repo)
+            second = _run(engine, repo)
+
+        assert len(calls) == 1
+        assert sorted(calls[0]) == ["a.py", "b.py"]
+        assert first["findings_cache"] == {"hits": 0, "misses": 2}
+        assert second["findings_cache"] == {"hits": 2, "misses": 0}
+        assert second["matches"] == first["matches"]
+        assert second["files_processed"] == 2
+
+    def test_changed_file_is_re_evaluated(self, engine, repo: Path) -> None:
+        calls: List[List[str]] = []
+        with patch.object(
+            engine.rust_backend, "run_batch", side_effect=_recording_run_batch(calls)
+        ):
+            _run(engine, repo)
+            (repo / "b.py").write_text("needle = 3\n")
+            result = _run(engine, repo)
+
+        assert calls[1] == ["b.py"]
+        assert result["findings_cache"] == {"hits": 1, "misses": 1}
+        assert sorted(m["file_path"] for m in result["matches"]) == ["a.py", "b.py"]
+
+    def test_files_with_errors_are_not_cached(self, engine, repo: Path) -> None:
+        calls: List[List[str]] = []
+        with patch.object(
+            engine.rust_backend,
+            "run_batch",
+            side_effect=_recording_run_batch(calls, errors_for=("a.py",)),
+        ):
+            first = _run(engine, repo)
+            _run(engine, repo)
+
+        assert len(first["evaluation_errors"]) == 1
+        assert calls[1] == ["a.py"]
+
+    def test_different_evaluator_misses(self, engine, repo: Path) -> None:
+        calls: List[List[str]] = []
+        with patch.object(
+            engine.rust_backend, "run_batch", side_effect=_recording_run_batch(calls)
+        ):
+            _run(engine, repo)
+            engine.run(
+                repo_path=repo,
+                driver_regex="needle",
+                evaluator_code=EVALUATOR + "\n",
+                search_target="content",
+            )
+        assert len(calls) == 2
+        identity = engine.rust_backend.get_runtime_identity()
+        assert engine.findings_cache.get_many(
+            sha256_hex(f"{EVALUATOR}\0{identity}".encode()),
+            [("python", sha256_hex(b"needle = 1\n"))],
+        )
+
+    def test_toolchain_change_misses(self, engine, repo: Path) -> None:
+        calls: List[List[str]] = []
+        with patch.object(
+            engine.rust_backend, "run_batch", side_effect=_recording_run_batch(calls)
+        ):
+            _run(engine, repo)
+            with patch.object(
+                engine.rust_backend,
+                "get_runtime_identity",
+                return_value="xray-cli:upgraded;rustc 9.9.9",
+            ):
+                result = _run(engine, repo)
+
+        assert len(calls) == 2
+        assert result["findings_cache"] == {"hits": 0, "misses": 2}
+
+
+class TestRuntimeIdentity:
+    def test_tracks_xray_cli_binary_contents(self, tmp_path: Path) -> None:
+        from code_indexer.xray.rust_backend import RustNativeBackend
+
+        backend = RustNativeBackend()
+        backend._rustc_version = "rustc 1.0.0"
+        backend._xray_cli_path = tmp_path / "xray-cli"
+        missing = backend.get_runtime_identity()
+
+        backend._xray_cli_path.write_bytes(b"v1")
+        v1 = backend.get_runtime_identity()
+        backend._xray_cli_path.write_bytes(b"v2-longer")
+        v2 = backend.get_runtime_identity()
+
+        assert len({missing, v1, v2}) == 3
+        assert v2.endswith(";rustc 1.0.0")
+
+
+class TestDebugOutputWithFindingsCache:
+    def test_cached_run_does_not_report_stale_debug_messages(
+        self, engine, repo: Path
+    ) -> None:
+        calls: List[List[str]] = []
+        inner = _recording_run_batch(calls)
+
+        def with_debug(**kwargs):
+            engine.rust_backend._last_debug_messages = ["evaluated"]
+            return inner(**kwargs)
+
+        with patch.object(engine.rust_backend, "run_batch", side_effect=with_debug):
+            first = _run(engine, repo)
+            second = _run(engine, repo)
+
+        assert first["debug_output"] == ["evaluated"]
+        assert second["findings_cache"] == {"hits": 2, "misses": 0}
+        assert second["debug_output"] == []
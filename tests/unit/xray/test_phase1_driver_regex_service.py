@@ -10,6 +10,7 @@ has no filename-search mode (content-only service).
 from __future__ import annotations
 
 import asyncio
+import shutil
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -229,3 +230,35 @@ class TestPhase1FilenameTargetRetainsInlineBehavior:
         MockService.assert_not_called()
         assert len(candidates) == 1
         assert candidates[0].name == "password_utils.py"
+
+
+class TestPhase1TrigramPrefilter:
+    """Content Phase 1 is narrowed by the repository's trigram index."""
+
+    @pytest.mark.skipif(shutil.which("rg") is None, reason="ripgrep not installed")
+    def test_phase1_uses_trigram_index_candidates(self, search_engine, tmp_path):
+        from code_indexer.global_repos.regex_search import RegexSearchService
+        from code_indexer.global_repos.trigram_index_manager import (
+            TrigramIndexManager,
+        )
+
+        (tmp_path / "hit.py").write_text("password = 1\n")
+        (tmp_path / "miss.py").write_text("unrelated = 2\n")
+        index = TrigramIndexManager(tmp_path / ".code-indexer" / "trigram_index")
+        index.build(tmp_path, file_list=["hit.py", "miss.py"])
+
+        original = RegexSearchService._prefilter_candidate_files
+        seen = []
+
+        def spy(self, *args, **kwargs):
+            result = original(self, *args, **kwargs)
+            seen.append(result)
+            return result
+
+        with patch.object(RegexSearchService, "_prefilter_candidate_files", spy):
+            candidates = search_engine._run_phase1_driver(
+                tmp_path, "password", "content", [], []
+            )
+
+        assert [p.name for p in seen[0]] == ["hit.py"]
+        assert [p.name for p in candidates] == ["hit.py"]
@@ -1408,3 +1408,95 @@ class TestXRaySearchEngineDebugOutput:
         assert result.get("debug_output") == ["evaluator step 1", "evaluator step 2"], (
             f"debug_output must propagate from _last_debug_messages: {result.get('debug_output')}"
         )
+
+
+class TestXRaySearchEnginePhase2Chunking:
+    """Phase 2 dispatches candidates to the Rust backend in chunks."""
+
+    def _repo(self, tmp_path: Path, n: int) -> Path:
+        for i in range(n):
+            (tmp_path / f"f{i}.py").write_text("prepareStatement(x)\n")
+        return tmp_path
+
+    def test_candidates_split_into_chunks(self, search_engine, tmp_path):
+        repo = self._repo(tmp_path, 5)
+        chunk_sizes: List[int] = []
+        inner = _rust_batch_side_effect()
+
+        def recording(**kwargs):
+            chunk_sizes.append(len(kwargs["file_specs"]))
+            return inner(**kwargs)
+
+        progress: List[Tuple[int, str]] = []
+        with (
+            patch("code_indexer.xray.search_engine._PHASE2_CHUNK_FILES", 2),
+            patch.object(
+                search_engine.rust_backend, "run_batch", side_effect=recording
+            ),
+        ):
+            result = search_engine.run(
+                repo_path=repo,
+                driver_regex=r"prepareStatement",
+                evaluator_code='return {"matches": [{"line_number": 1}], "value": None}',
+                search_target="content",
+                progress_callback=lambda pct, phase, _msg: progress.append(
+                    (pct, phase)
+                ),
+            )
+
+        assert chunk_sizes == [2, 2, 1]
+        assert result["files_processed"] == 5
+        assert len(result["matches"]) == 5
+        assert [p for p in progress if p[1] == "phase2_evaluator"][1:] == [
+            (69, "phase2_evaluator"),
+            (89, "phase2_evaluator"),
+        ]
+
+    def test_evaluator_level_error_stops_remaining_chunks(
+        self, search_engine, tmp_path
+    ):
+        repo = self._repo(tmp_path, 4)
+        calls = [0]
+
+        def compile_error(**kwargs):
+            calls[0] += 1
+            err = {"file_path": "", "error_type": "CompileError"}
+            return [([], [err], None)]
+
+        with (
+            patch("code_indexer.xray.search_engine._PHASE2_CHUNK_FILES", 2),
+            patch.object(
+                search_engine.rust_backend, "run_batch", side_effect=compile_error
+            ),
+        ):
+            result = search_engine.run(
+                repo_path=repo,
+                driver_regex=r"prepareStatement",
+                evaluator_code='return {"matches": [], "value": None}',
+                search_target="content",
+            )
+
+        assert calls[0] == 1
+        assert len(result["evaluation_errors"]) == 1
+
+    def test_debug_output_concatenated_across_chunks(self, search_engine, tmp_path):
+        repo = self._repo(tmp_path, 3)
+        inner = _rust_batch_side_effect()
+        backend = search_engine.rust_backend
+
+        def with_debug(**kwargs):
+            backend._last_debug_messages = [f"chunk of {len(kwargs['file_specs'])}"]
+            return inner(**kwargs)
+
+        with (
+            patch("code_indexer.xray.search_engine._PHASE2_CHUNK_FILES", 2),
+            patch.object(backend, "run_batch", side_effect=with_debug),
+        ):
+            result = search_engine.run(
+                repo_path=repo,
+                driver_regex=r"prepareStatement",
+                evaluator_code='return {"matches": [], "value": None}',
+                search_target="content",
+            )
+
+        assert result["debug_output"] == ["chunk of 2", "chunk of 1"]